@@ -8,12 +8,16 @@ except Exception:
     # Fallback for development environments or when package not installed
     __version__ = "0.0.2-dev"
 
-__all__ = [
-    "__version__",
-]
+from typing import Any
 
-# Import CLI after setting __version__ to avoid circular imports
-from .cli import app, main
 
+def __getattr__(name: str) -> Any:
+    """Lazy load the CLI app and entry point on first access."""
+    if name in ("app", "main"):
+        from glovebox import cli
 
-__all__ += ["app", "main"]
+        return getattr(cli, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["__version__", "app", "main"]
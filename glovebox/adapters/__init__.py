@@ -13,7 +13,13 @@ from .compilation_progress_middleware import (
     CompilationProgressMiddleware,
     create_compilation_progress_middleware,
 )
-from .docker_adapter import DockerAdapter, create_docker_adapter
+from .docker_adapter import (
+    DockerAdapter,
+    DockerStateCache,
+    create_docker_adapter,
+    get_docker_state_cache,
+)
+from .docker_session import DockerSessionAdapter, create_docker_session_adapter
 from .file_adapter import FileAdapter, create_file_adapter
 from .template_adapter import TemplateAdapter, create_template_adapter
 from .usb_adapter import USBAdapter, create_usb_adapter
@@ -26,6 +32,10 @@ __all__ = [
     "DockerAdapterProtocol",
     "DockerAdapter",
     "create_docker_adapter",
+    "DockerStateCache",
+    "get_docker_state_cache",
+    "DockerSessionAdapter",
+    "create_docker_session_adapter",
     "FileAdapterProtocol",
     "FileAdapter",
     "create_file_adapter",
@@ -1,9 +1,13 @@
 """Compilation progress middleware for Docker output parsing."""
 
-import re
 from typing import TYPE_CHECKING
 
 from glovebox.core.structlog_logger import get_struct_logger
+from glovebox.utils.line_classifier import (
+    LineClassification,
+    LineClassifier,
+    get_build_line_classifier,
+)
 from glovebox.utils.stream_process import OutputMiddleware
 
 
@@ -32,6 +36,7 @@ class CompilationProgressMiddleware(OutputMiddleware[str]):
         progress_context: "ProgressContextProtocol",
         progress_patterns: "ProgressPhasePatterns | None" = None,
         skip_west_update: bool = False,  # Set to True if compilation starts directly with building
+        classifier: LineClassifier | None = None,
     ) -> None:
         """Initialize the compilation progress middleware.
 
@@ -40,42 +45,14 @@ class CompilationProgressMiddleware(OutputMiddleware[str]):
             progress_patterns: Regex patterns for phase detection (defaults to standard patterns)
             skip_west_update: Whether to skip west update phase and start with building
             progress_context: Progress context for UI updates
+            classifier: Line classifier with the build output rules (defaults
+                to the shared build line classifier for progress_patterns)
         """
         self.progress_context = progress_context
         self.skip_west_update = skip_west_update
 
-        # Use provided patterns or create default ones
-        if progress_patterns is None:
-            from glovebox.compilation.models.compilation_config import (
-                ProgressPhasePatterns,
-            )
-
-            progress_patterns = ProgressPhasePatterns()
-
-        # Compile patterns for parsing different types of output
-        self.repo_download_pattern = re.compile(progress_patterns.repo_download_pattern)
-        self.build_start_pattern = re.compile(progress_patterns.build_start_pattern)
-        self.build_progress_pattern = re.compile(
-            progress_patterns.build_progress_pattern
-        )
-        self.build_complete_pattern = re.compile(
-            progress_patterns.build_complete_pattern
-        )
-        # Board-specific patterns
-        self.board_detection_pattern = re.compile(
-            progress_patterns.board_detection_pattern
-        )
-        self.board_complete_pattern = re.compile(
-            progress_patterns.board_complete_pattern
-        )
-
-        # Enhanced git clone progress patterns
-        self.git_objects_pattern = re.compile(
-            r"Receiving objects:\s+(\d+)%\s+\((\d+)/(\d+)\),?\s*(?:(\d+(?:\.\d+)?)\s*(KiB|MiB|GiB)/s)?"
-        )
-        self.git_deltas_pattern = re.compile(
-            r"Resolving deltas:\s+(\d+)%\s+\((\d+)/(\d+)\)"
-        )
+        # Lines are classified once for all middlewares sharing the classifier
+        self.classifier = classifier or get_build_line_classifier(progress_patterns)
 
         # Current repository being processed (for detailed progress)
         self._current_repository = ""
@@ -95,10 +72,11 @@ class CompilationProgressMiddleware(OutputMiddleware[str]):
         if not line_stripped:
             return line
 
+        classification = self.classifier.classify(line_stripped)
+
         try:
             # Initialization detection for cache vs west init
-            init_type = self._detect_initialization_type(line_stripped)
-            package_count = self._extract_package_count(line_stripped)
+            init_type = self._detect_initialization_type(classification)
 
             if init_type == "cache_restore":
                 self.progress_context.log("Restoring cached workspace")
@@ -106,6 +84,7 @@ class CompilationProgressMiddleware(OutputMiddleware[str]):
                     {"docker_status": "cache_restore"}
                 )
             elif init_type == "west_init":
+                package_count = self._extract_package_count(classification)
                 if package_count:
                     msg = f"Downloading dependencies ({package_count} packages)"
                     self.progress_context.set_status_info(
@@ -120,8 +99,8 @@ class CompilationProgressMiddleware(OutputMiddleware[str]):
                 self.progress_context.log(msg)
 
             # Check for build start patterns to detect phase transitions
-            build_match = self.build_start_pattern.search(line_stripped)
-            build_progress_match = self.build_progress_pattern.search(line_stripped)
+            build_match = classification.match("build_start")
+            build_progress_match = classification.match("build_progress")
 
             # If we detect build activity, update progress context
             if build_match or build_progress_match:
@@ -129,7 +108,7 @@ class CompilationProgressMiddleware(OutputMiddleware[str]):
                 self.progress_context.set_status_info({"docker_status": "building"})
 
             # Parse repository downloads during west update
-            repo_match = self.repo_download_pattern.match(line_stripped)
+            repo_match = classification.match("repo_download")
             if repo_match:
                 repository_name = repo_match.group(1)
                 self._current_repository = repository_name
@@ -137,8 +116,12 @@ class CompilationProgressMiddleware(OutputMiddleware[str]):
                 self.progress_context.set_status_info({"current_file": repository_name})
 
             # Enhanced git clone progress tracking
-            objects_match = self.git_objects_pattern.search(line_stripped)
-            if objects_match and self._current_repository:
+            objects_match = (
+                classification.match("git_objects")
+                if self._current_repository
+                else None
+            )
+            if objects_match:
                 try:
                     percent = int(objects_match.group(1))
                     current_objects = int(objects_match.group(2))
@@ -171,8 +154,10 @@ class CompilationProgressMiddleware(OutputMiddleware[str]):
                     logger.debug("git_objects_progress_parse_error", error=str(e))
 
             # Parse "Resolving deltas" progress
-            deltas_match = self.git_deltas_pattern.search(line_stripped)
-            if deltas_match and self._current_repository:
+            deltas_match = (
+                classification.match("git_deltas") if self._current_repository else None
+            )
+            if deltas_match:
                 try:
                     percent = int(deltas_match.group(1))
                     current_deltas = int(deltas_match.group(2))
@@ -190,7 +175,7 @@ class CompilationProgressMiddleware(OutputMiddleware[str]):
 
             # Parse build progress during building phase
             # Detect board start
-            board_match = self.board_detection_pattern.search(line_stripped)
+            board_match = classification.match("board_detection")
             if board_match:
                 board_name = board_match.group(1)
                 self.progress_context.log(f"Building {board_name}")
@@ -203,33 +188,21 @@ class CompilationProgressMiddleware(OutputMiddleware[str]):
                 self.progress_context.update_progress(current_step, total_steps)
 
             # Check for individual board completion using multiple patterns
-            board_completion_indicators = [
-                self.board_complete_pattern.search(line_stripped),
-                # Additional patterns for different ZMK output formats
-                re.search(r"Memory region.*Used Size", line_stripped),
-                re.search(r"Generating zephyr/merged\.hex", line_stripped),
-                re.search(r"west build.*completed", line_stripped, re.IGNORECASE),
-                re.search(r"Build complete", line_stripped, re.IGNORECASE),
-            ]
-
-            if any(board_completion_indicators):
+            # Additional patterns cover the different ZMK output formats
+            if (
+                "board_complete" in classification
+                or "board_complete_output" in classification
+                or "board_complete_status" in classification
+            ):
                 logger.debug("board_completion_detected", line=line_stripped)
                 self.progress_context.log("Board build completed")
 
             # Check for overall build completion with improved patterns
-            build_completion_indicators = [
-                self.build_complete_pattern.search(line_stripped),
-                # Additional completion patterns
-                re.search(r"Memory region\s+Used Size", line_stripped),
-                re.search(r"FLASH.*region.*overlaps", line_stripped),
-                re.search(
-                    r"west build.*completed.*successfully",
-                    line_stripped,
-                    re.IGNORECASE,
-                ),
-            ]
-
-            if any(build_completion_indicators):
+            if (
+                "build_complete" in classification
+                or "build_complete_output" in classification
+                or "build_complete_status" in classification
+            ):
                 logger.info("all_builds_completed")
                 self.progress_context.log("Compilation completed successfully")
 
@@ -243,9 +216,9 @@ class CompilationProgressMiddleware(OutputMiddleware[str]):
         # Forward interesting Docker output to the progress display
         # This captures build tool output (west, cmake, gcc) that doesn't go through glovebox loggers
         try:
-            if self._should_forward_docker_output(line_stripped):
+            if self._should_forward_docker_output(classification):
                 # Determine log level based on content
-                log_level = self._determine_log_level(line_stripped)
+                log_level = self._determine_log_level(classification)
                 if log_level == "error":
                     self.progress_context.log(f"ERROR: {line_stripped}")
                 elif log_level == "warning":
@@ -258,112 +231,36 @@ class CompilationProgressMiddleware(OutputMiddleware[str]):
 
         return line
 
-    def _should_forward_docker_output(self, line: str) -> bool:
+    def _should_forward_docker_output(self, classification: LineClassification) -> bool:
         """Check if a Docker output line should be forwarded to the log display."""
-        if not line.strip():
-            return False
-
-        # Filter out common Docker/infrastructure noise
-        noise_filters = [
-            # Docker noise
-            "WARNING: The requested image's platform",
-            "Unable to find image",
-            "Pulling from",
-            "Pull complete",
-            "Digest: sha256:",
-            "Status: Downloaded",
-            # Git noise that's not useful
-            "remote: Enumerating objects:",
-            "remote: Counting objects:",
-            "remote: Compressing objects:",
-            "Receiving objects:",
-            "Resolving deltas:",
-            # Very verbose build system output
-            "-- Cache files will be written to:",
-            "-- Configuring done",
-            "-- Generating done",
-        ]
-
-        for noise in noise_filters:
-            if noise in line:
-                return False
-
-        # Filter very short lines (probably not useful)
-        if len(line.strip()) < 8:
+        # Filter out Docker/infrastructure noise and very short lines
+        if "docker_noise" in classification or len(classification.line) < 8:
             return False
 
         # Forward lines that look like interesting build output
-        interesting_patterns = [
-            # Build progress indicators
-            "[",  # Like [150/200] Building...
-            "Building",
-            "Compiling",
-            "Linking",
-            # Build tools
-            "west ",
-            "cmake",
-            "ninja",
-            "make",
-            "gcc",
-            "clang",
-            # Status messages
-            "✓",
-            "✗",
-            "Error",
-            "Warning",
-            "Failed",
-            "Success",
-            # Memory/size info
-            "Memory region",
-            "FLASH:",
-            "SRAM:",
-            # west specific
-            "Updating",
-            "From https://",
-            # West init patterns for package counting
-            "west init",
-            "Initialized",
-            "Importing projects",
-            "projects:",
-            "revision",
-            "manifest:",
-            "Cloning",
-            "repository",
-            # Cache operations
-            "Restoring",
-            "cached",
-            "cache",
-        ]
-
-        return any(pattern in line for pattern in interesting_patterns)
-
-    def _determine_log_level(self, line: str) -> str:
+        return "build_tool_output" in classification
+
+    def _determine_log_level(self, classification: LineClassification) -> str:
         """Determine the appropriate log level for a Docker output line.
 
         Args:
-            line: The Docker output line
+            classification: Classification of the Docker output line
 
         Returns:
             Log level string (error, warning, info, debug)
         """
-        line_lower = line.lower()
-
-        # Error indicators
-        if any(keyword in line_lower for keyword in ["error", "failed", "✗", "fatal"]):
+        if "error_keyword" in classification:
             return "error"
-
-        # Warning indicators
-        if any(keyword in line_lower for keyword in ["warning", "warn", "deprecated"]):
+        if "warning_keyword" in classification:
             return "warning"
-
-        # Debug indicators (very verbose output)
-        if any(keyword in line_lower for keyword in ["debug", "verbose", "trace"]):
+        # Very verbose output
+        if "debug_keyword" in classification:
             return "debug"
-
-        # Default to info level
         return "info"
 
-    def _detect_initialization_type(self, line: str) -> str | None:
+    def _detect_initialization_type(
+        self, classification: LineClassification
+    ) -> str | None:
         """Detect whether the initialization is cache restore or west init.
 
         Returns:
@@ -371,59 +268,27 @@ class CompilationProgressMiddleware(OutputMiddleware[str]):
             "west_init" if west init is being performed
             None if neither is detected
         """
-        line_lower = line.lower()
-
-        # Cache restore patterns
-        cache_patterns = [
-            "restoring cached",
-            "copying cached",
-            "cache restoration",
-            "cached workspace",
-            "loading cached",
-        ]
-
-        # West init patterns
-        west_init_patterns = [
-            "west init",
-            "initialized empty",
-            "importing projects",
-            "manifest repository",
-            "cloning into",
-            "--- zmk (path: zmk, revision:",
-            "updating zmk",
-        ]
-
-        if any(pattern in line_lower for pattern in cache_patterns):
+        if "cache_restore" in classification:
             return "cache_restore"
-        elif any(pattern in line_lower for pattern in west_init_patterns):
+        elif "west_init" in classification:
             return "west_init"
 
         return None
 
-    def _extract_package_count(self, line: str) -> int | None:
+    def _extract_package_count(self, classification: LineClassification) -> int | None:
         """Extract package/project count from west init output.
 
         Returns:
             Number of packages/projects if detected, None otherwise
         """
-        # Look for patterns like "=== (X projects) ===" or "X projects:"
-        import re
-
-        patterns = [
-            r"=== \((\d+) projects?\) ===",
-            r"(\d+) projects?:",
-            r"importing (\d+) projects?",
-            r"processing (\d+) projects?",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
-            if match:
-                try:
-                    return int(match.group(1))
-                except (ValueError, IndexError):
-                    continue
-
+        # Patterns like "=== (X projects) ===" or "X projects:"
+        match = classification.match("package_count")
+        if match is None:
+            return None
+
+        for count in match.groups():
+            if count is not None:
+                return int(count)
         return None
 
 
@@ -431,6 +296,7 @@ def create_compilation_progress_middleware(
     progress_context: "ProgressContextProtocol",
     progress_patterns: "ProgressPhasePatterns | None" = None,
     skip_west_update: bool = False,
+    classifier: LineClassifier | None = None,
 ) -> CompilationProgressMiddleware:
     """Factory function to create compilation progress middleware.
 
@@ -439,6 +305,8 @@ def create_compilation_progress_middleware(
         progress_patterns: Regex patterns for phase detection (defaults to standard patterns)
         skip_west_update: Whether to skip west update phase and start with building
         progress_context: Progress context for UI updates
+        classifier: Line classifier with the build output rules (defaults to
+            the shared build line classifier for progress_patterns)
 
     Returns:
         Configured CompilationProgressMiddleware instance
@@ -447,4 +315,5 @@ def create_compilation_progress_middleware(
         progress_context=progress_context,
         progress_patterns=progress_patterns,
         skip_west_update=skip_west_update,
+        classifier=classifier,
     )
@@ -1,8 +1,14 @@
 """Docker adapter for container operations."""
 
+import json
 import logging
+import os
 import shlex
 import subprocess
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
@@ -17,16 +23,23 @@ from glovebox.utils.error_utils import create_docker_error
 from glovebox.utils.stream_process import (
     OutputMiddleware,
     ProcessResult,
+    StreamPipelineOptions,
     T,
     create_chained_middleware,
 )
 
 
 if TYPE_CHECKING:
+    from glovebox.protocols.metrics_protocol import MetricsProtocol
     from glovebox.protocols.progress_context_protocol import ProgressContextProtocol
 
 logger = get_struct_logger(__name__)
 
+# Seconds Docker state is trusted before it is checked again
+DOCKER_STATE_TTL = 60.0
+
+DEFAULT_DOCKER_SOCKET = Path("/var/run/docker.sock")
+
 
 class LoggerOutputMiddleware(OutputMiddleware[str]):
     """Simple middleware that prints output with optional prefixes.
@@ -68,9 +81,182 @@ class LoggerOutputMiddleware(OutputMiddleware[str]):
         return line
 
 
+@dataclass
+class ImageState:
+    """Cached result of a local image lookup.
+
+    Attributes:
+        exists: Whether the image exists locally
+        image_id: Image ID (content digest) if the image exists
+        checked_at: Clock time of the lookup
+    """
+
+    exists: bool
+    image_id: str | None
+    checked_at: float
+
+
+def _docker_socket_path() -> Path | None:
+    """Get the local daemon socket, None for remote daemons."""
+    docker_host = os.environ.get("DOCKER_HOST", "")
+    if not docker_host:
+        return DEFAULT_DOCKER_SOCKET
+    if docker_host.startswith("unix://"):
+        return Path(docker_host.removeprefix("unix://"))
+    return None
+
+
+class DockerStateCache:
+    """Docker daemon and image state shared by the adapters of a process.
+
+    Remembers whether Docker is available, whether commands need sudo and
+    which images exist locally, so a batch of compiles checks each image
+    once instead of once per compile. Entries expire after a TTL. All
+    entries are dropped when the daemon socket is replaced, which happens
+    when the daemon restarts, so a restart is noticed without waiting for
+    the TTL.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DOCKER_STATE_TTL,
+        socket_path: Path | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry is trusted
+            socket_path: Daemon socket to watch, from DOCKER_HOST if None
+            clock: Time source, for tests
+        """
+        self.ttl = ttl
+        self.socket_path = socket_path or _docker_socket_path()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._available: tuple[bool, float] | None = None
+        self._use_sudo: bool | None = None
+        self._images: dict[str, ImageState] = {}
+        self._socket_fingerprint = self._fingerprint()
+
+    def _fingerprint(self) -> tuple[int, int] | None:
+        if self.socket_path is None:
+            return None
+        try:
+            stat = self.socket_path.stat()
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_ctime_ns
+
+    def _check_daemon(self) -> None:
+        """Drop all state if the daemon socket changed, lock held."""
+        fingerprint = self._fingerprint()
+        if fingerprint != self._socket_fingerprint:
+            logger.debug("docker_daemon_changed_clearing_state")
+            self._socket_fingerprint = fingerprint
+            self._available = None
+            self._use_sudo = None
+            self._images.clear()
+
+    def _fresh(self, checked_at: float) -> bool:
+        return self._clock() - checked_at < self.ttl
+
+    def get_available(self) -> bool | None:
+        """Get cached Docker availability, None if unknown."""
+        with self._lock:
+            self._check_daemon()
+            if self._available is None or not self._fresh(self._available[1]):
+                return None
+            return self._available[0]
+
+    def set_available(self, available: bool) -> None:
+        """Record Docker availability."""
+        with self._lock:
+            self._available = (available, self._clock())
+
+    @property
+    def use_sudo(self) -> bool | None:
+        """Whether Docker commands need sudo, None if unknown."""
+        with self._lock:
+            self._check_daemon()
+            return self._use_sudo
+
+    @use_sudo.setter
+    def use_sudo(self, value: bool | None) -> None:
+        with self._lock:
+            self._use_sudo = value
+
+    def get_image(self, image: str) -> ImageState | None:
+        """Get the cached lookup of an image, None if unknown or expired."""
+        with self._lock:
+            self._check_daemon()
+            state = self._images.get(image)
+            if state is None or not self._fresh(state.checked_at):
+                return None
+            return state
+
+    def set_image(self, image: str, exists: bool, image_id: str | None = None) -> None:
+        """Record the lookup of an image."""
+        with self._lock:
+            self._images[image] = ImageState(exists, image_id, self._clock())
+
+    def forget_image(self, image: str) -> None:
+        """Drop the cached lookup of an image after it changed."""
+        with self._lock:
+            self._images.pop(image, None)
+
+    def clear(self) -> None:
+        """Drop all cached state."""
+        with self._lock:
+            self._available = None
+            self._use_sudo = None
+            self._images.clear()
+
+
+_shared_state_cache: DockerStateCache | None = None
+_shared_state_lock = threading.Lock()
+
+
+def get_docker_state_cache() -> DockerStateCache:
+    """Get the Docker state cache shared within this process."""
+    global _shared_state_cache
+    with _shared_state_lock:
+        if _shared_state_cache is None:
+            _shared_state_cache = DockerStateCache()
+        return _shared_state_cache
+
+
+def _parse_image_id(inspect_output: Any) -> str | None:
+    """Get the image ID from `docker inspect` JSON output."""
+    try:
+        return str(json.loads(inspect_output)[0]["Id"])
+    except (TypeError, ValueError, LookupError):
+        return None
+
+
 class DockerAdapter:
     """Implementation of Docker adapter."""
 
+    def __init__(
+        self,
+        session_metrics: "MetricsProtocol | None" = None,
+        stream_options: StreamPipelineOptions | None = None,
+        state_cache: DockerStateCache | None = None,
+    ) -> None:
+        """Initialize the Docker adapter.
+
+        Args:
+            session_metrics: Optional session metrics receiving output
+                pipeline statistics of container runs
+            stream_options: Buffering and overflow behavior for container
+                output; lossless defaults if None
+            state_cache: Cache of Docker availability, invocation mode and
+                image lookups; every call asks Docker if None
+        """
+        self.session_metrics = session_metrics
+        self.stream_options = stream_options
+        self.state_cache = state_cache
+
     def _needs_sudo(self) -> bool:
         """Check if Docker requires sudo by testing docker info command."""
         try:
@@ -90,6 +276,17 @@ class DockerAdapter:
 
     def is_available(self) -> bool:
         """Check if Docker is available on the system."""
+        if self.state_cache is not None:
+            cached = self.state_cache.get_available()
+            if cached is not None:
+                return cached
+
+        available = self._check_available()
+        if self.state_cache is not None:
+            self.state_cache.set_available(available)
+        return available
+
+    def _check_available(self) -> bool:
         docker_cmd = ["docker", "--version"]
         cmd_str = " ".join(docker_cmd)
 
@@ -120,9 +317,19 @@ class DockerAdapter:
         """Run docker command with automatic sudo fallback if needed."""
         from glovebox.utils import stream_process
 
+        if self.state_cache is not None and self.state_cache.use_sudo:
+            return stream_process.run_command(
+                ["sudo"] + docker_cmd,
+                middleware,
+                self.stream_options,
+                self.session_metrics,
+            )
+
         # Try without sudo first
         try:
-            result = stream_process.run_command(docker_cmd, middleware)
+            result = stream_process.run_command(
+                docker_cmd, middleware, self.stream_options, self.session_metrics
+            )
             return result
         except subprocess.SubprocessError as e:
             # Check if this might be a permission error
@@ -138,7 +345,15 @@ class DockerAdapter:
                 ):
                     logger.info("docker_permission_denied_trying_sudo")
                     sudo_cmd = ["sudo"] + docker_cmd
-                    return stream_process.run_command(sudo_cmd, middleware)
+                    result = stream_process.run_command(
+                        sudo_cmd,
+                        middleware,
+                        self.stream_options,
+                        self.session_metrics,
+                    )
+                    if self.state_cache is not None:
+                        self.state_cache.use_sudo = True
+                    return result
             # Re-raise if not a permission error
             raise
 
@@ -238,6 +453,111 @@ class DockerAdapter:
             logger.error("docker_container_run_failed", error=str(e), exc_info=exc_info)
             raise error from e
 
+    def start_container(
+        self,
+        image: str,
+        volumes: list[DockerVolume],
+        environment: DockerEnv,
+        user_context: DockerUserContext | None = None,
+    ) -> str:
+        """Start a detached container idling until it is removed."""
+        docker_cmd = ["docker", "run", "--detach", "--rm", "--init"]
+
+        if user_context and user_context.should_use_user_mapping():
+            docker_cmd.extend(["--user", user_context.get_docker_user_flag()])
+
+        for host_path, container_path in volumes:
+            docker_cmd.extend(["-v", f"{host_path}:{container_path}"])
+
+        for key, value in environment.items():
+            docker_cmd.extend(["-e", f"{key}={value}"])
+
+        # Keep the container alive without relying on the image's entrypoint
+        docker_cmd.extend(["--entrypoint", "tail", image, "-f", "/dev/null"])
+
+        cmd_str = " ".join(shlex.quote(arg) for arg in docker_cmd)
+        logger.debug("docker_command", command=cmd_str)
+
+        try:
+            return_code, stdout, stderr = self._run_with_sudo_fallback(
+                docker_cmd, LoggerOutputMiddleware(logger)
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            raise create_docker_error(
+                f"Failed to start Docker container: {e}", cmd_str, e
+            ) from e
+
+        container_id = stdout[-1].strip() if stdout else ""
+        if return_code != 0 or not container_id:
+            raise create_docker_error(
+                f"Failed to start Docker container: {' '.join(stderr)}",
+                cmd_str,
+                None,
+                {"image": image, "return_code": return_code},
+            )
+
+        logger.debug("docker_container_started", image=image, container=container_id)
+        return container_id
+
+    def exec_in_container(
+        self,
+        container_id: str,
+        command: list[str],
+        environment: DockerEnv,
+        middleware: OutputMiddleware[T] | None = None,
+        user_context: DockerUserContext | None = None,
+    ) -> ProcessResult[T]:
+        """Run a command in a running container."""
+        docker_cmd = ["docker", "exec"]
+
+        if user_context and user_context.should_use_user_mapping():
+            docker_cmd.extend(["--user", user_context.get_docker_user_flag()])
+
+        for key, value in environment.items():
+            docker_cmd.extend(["-e", f"{key}={value}"])
+
+        docker_cmd.append(container_id)
+        docker_cmd.extend(command)
+
+        cmd_str = " ".join(shlex.quote(arg) for arg in docker_cmd)
+        logger.debug("docker_command", command=cmd_str)
+
+        if middleware is None:
+            # Cast is needed because T is unbound at this point
+            middleware = cast(OutputMiddleware[T], LoggerOutputMiddleware(logger))
+
+        try:
+            return self._run_with_sudo_fallback(docker_cmd, middleware)
+        except (OSError, subprocess.SubprocessError) as e:
+            raise create_docker_error(
+                f"Failed to run command in Docker container: {e}",
+                cmd_str,
+                e,
+                {"container": container_id},
+            ) from e
+
+    def remove_container(self, container_id: str) -> None:
+        """Stop and remove a container started with start_container."""
+        docker_cmd = ["docker", "rm", "--force", container_id]
+        try:
+            return_code, _, stderr = self._run_with_sudo_fallback(
+                docker_cmd, LoggerOutputMiddleware(logger)
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning(
+                "docker_container_remove_failed", container=container_id, error=str(e)
+            )
+            return
+
+        if return_code != 0:
+            logger.warning(
+                "docker_container_remove_failed",
+                container=container_id,
+                error=" ".join(stderr),
+            )
+        else:
+            logger.debug("docker_container_removed", container=container_id)
+
     def build_image(
         self,
         dockerfile_dir: Path,
@@ -318,6 +638,8 @@ class DockerAdapter:
                 middleware = cast(OutputMiddleware[T], LoggerOutputMiddleware(logger))
 
             result = self._run_with_sudo_fallback(docker_cmd, middleware)
+            if self.state_cache is not None:
+                self.state_cache.forget_image(image_full_name)
 
             # Update progress on successful build
             progress_context.log(f"Successfully built image: {image_full_name}")
@@ -371,6 +693,16 @@ class DockerAdapter:
         """Check if a Docker image exists locally."""
         image_full_name = f"{image_name}:{image_tag}"
 
+        if self.state_cache is not None:
+            cached = self.state_cache.get_image(image_full_name)
+            if cached is not None:
+                logger.debug(
+                    "docker_image_state_cached",
+                    image=image_full_name,
+                    exists=cached.exists,
+                )
+                return cached.exists
+
         # Check Docker availability
         if not self.is_available():
             logger.warning(
@@ -380,7 +712,8 @@ class DockerAdapter:
 
         # Build the Docker command to check image existence
         docker_cmd = ["docker", "inspect", image_full_name]
-        cmd_str = " ".join(shlex.quote(arg) for arg in docker_cmd)
+        if self.state_cache is not None and self.state_cache.use_sudo:
+            docker_cmd = ["sudo"] + docker_cmd
 
         try:
             # Run Docker inspect command
@@ -389,23 +722,33 @@ class DockerAdapter:
             )
 
             logger.debug("docker_image_exists", image=image_full_name)
+            self._record_image(image_full_name, True, result.stdout)
             return True
 
         except subprocess.CalledProcessError as e:
             # Check if this is a permission error, try with sudo
-            if e.stderr and any(
-                phrase in e.stderr.lower()
-                for phrase in [
-                    "permission denied",
-                    "dial unix",
-                    "connect: permission denied",
-                ]
+            if (
+                docker_cmd[0] != "sudo"
+                and e.stderr
+                and any(
+                    phrase in e.stderr.lower()
+                    for phrase in [
+                        "permission denied",
+                        "dial unix",
+                        "connect: permission denied",
+                    ]
+                )
             ):
                 try:
                     logger.debug("docker_permission_denied_trying_sudo_for_image_check")
                     sudo_cmd = ["sudo"] + docker_cmd
-                    subprocess.run(sudo_cmd, check=True, capture_output=True, text=True)
+                    result = subprocess.run(
+                        sudo_cmd, check=True, capture_output=True, text=True
+                    )
                     logger.debug("docker_image_exists_with_sudo", image=image_full_name)
+                    if self.state_cache is not None:
+                        self.state_cache.use_sudo = True
+                    self._record_image(image_full_name, True, result.stdout)
                     return True
                 except subprocess.CalledProcessError:
                     # Image doesn't exist even with sudo
@@ -414,6 +757,7 @@ class DockerAdapter:
             else:
                 # Image doesn't exist (inspect returns non-zero exit code)
                 logger.debug("docker_image_does_not_exist", image=image_full_name)
+                self._record_image(image_full_name, False)
                 return False
 
         except FileNotFoundError:
@@ -424,6 +768,26 @@ class DockerAdapter:
             logger.warning("docker_image_existence_check_failed", error=str(e))
             return False
 
+    def image_id(self, image_name: str, image_tag: str = "latest") -> str | None:
+        """Get the ID of a local image as recorded by the last lookup.
+
+        Returns:
+            Image ID, or None if the image is missing or no state cache
+            is used
+        """
+        if not self.image_exists(image_name, image_tag) or self.state_cache is None:
+            return None
+        state = self.state_cache.get_image(f"{image_name}:{image_tag}")
+        return state.image_id if state else None
+
+    def _record_image(
+        self, image_full_name: str, exists: bool, inspect_output: Any = None
+    ) -> None:
+        if self.state_cache is not None:
+            self.state_cache.set_image(
+                image_full_name, exists, _parse_image_id(inspect_output)
+            )
+
     def pull_image(
         self,
         image_name: str,
@@ -466,6 +830,8 @@ class DockerAdapter:
                 middleware = cast(OutputMiddleware[T], LoggerOutputMiddleware(logger))
 
             result = self._run_with_sudo_fallback(docker_cmd, middleware)
+            if self.state_cache is not None:
+                self.state_cache.forget_image(image_full_name)
 
             # Update progress on successful pull
             progress_context.log(f"Successfully pulled image: {image_full_name}")
@@ -583,10 +949,21 @@ def create_chained_docker_middleware(
     return create_chained_middleware(final_chain)
 
 
-def create_docker_adapter() -> DockerAdapterProtocol:
+def create_docker_adapter(
+    session_metrics: "MetricsProtocol | None" = None,
+    stream_options: StreamPipelineOptions | None = None,
+    state_cache: DockerStateCache | None = None,
+) -> DockerAdapterProtocol:
     """
     Factory function to create a DockerAdapter instance.
 
+    Args:
+        session_metrics: Optional session metrics receiving output pipeline
+            statistics of container runs
+        stream_options: Buffering and overflow behavior for container output
+        state_cache: Docker state cache, the one shared within the process
+            if None
+
     Returns:
         Configured DockerAdapter instance
 
@@ -595,4 +972,8 @@ def create_docker_adapter() -> DockerAdapterProtocol:
         >>> if adapter.is_available():
         ...     adapter.run_container("ubuntu:latest", [], {})
     """
-    return DockerAdapter()
+    return DockerAdapter(
+        session_metrics=session_metrics,
+        stream_options=stream_options,
+        state_cache=state_cache or get_docker_state_cache(),
+    )
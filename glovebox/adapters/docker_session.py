@@ -0,0 +1,521 @@
+"""Warm Docker containers reused across the phases of a build.
+
+Every `docker run --rm` pays for creating a container and setting up its
+bind mounts. DockerSessionAdapter implements DockerAdapterProtocol on top of
+a Docker backend and runs containers through one long-lived container per
+image, volume set and user instead, using `docker exec` for each command.
+Containers are removed once idle for idle_timeout seconds, when their
+workspace is released and when the interpreter exits.
+
+FakeDockerBackend implements the backend in memory so that the session
+layer, and services using it, can be tested without a Docker daemon.
+"""
+
+import atexit
+import itertools
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from glovebox.adapters.docker_adapter import DockerAdapter
+from glovebox.core.structlog_logger import get_struct_logger
+from glovebox.models.docker import DockerUserContext
+from glovebox.protocols.docker_adapter_protocol import (
+    DockerContainerBackendProtocol,
+    DockerEnv,
+    DockerVolume,
+)
+from glovebox.utils.error_utils import create_docker_error
+from glovebox.utils.stream_process import OutputMiddleware, ProcessResult, T
+
+
+if TYPE_CHECKING:
+    from glovebox.protocols.progress_context_protocol import ProgressContextProtocol
+
+
+logger = get_struct_logger(__name__)
+
+SessionKey = tuple[str, tuple[DockerVolume, ...], str | None]
+
+# Session adapters with running containers, closed when the interpreter exits
+_open_adapters: "weakref.WeakSet[DockerSessionAdapter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_adapters() -> None:
+    for adapter in list(_open_adapters):
+        adapter.close()
+
+
+@dataclass
+class ContainerSession:
+    """A long-lived container and its use.
+
+    Attributes:
+        container_id: ID of the running container
+        image: Image the container runs
+        volumes: Volume mounts of the container
+        started_at: Monotonic time the container was started
+        last_used: Monotonic time the last command finished
+        active: Number of commands currently running in the container
+        exec_count: Number of commands run in the container
+    """
+
+    container_id: str
+    image: str
+    volumes: tuple[DockerVolume, ...]
+    started_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    active: int = 0
+    exec_count: int = 0
+
+    def uses_host_path(self, host_path: str) -> bool:
+        """Check if a host path is mounted into the container."""
+        return any(volume[0] == host_path for volume in self.volumes)
+
+
+class DockerSessionAdapter:
+    """Docker adapter running containers as commands in warm containers."""
+
+    def __init__(
+        self,
+        backend: DockerContainerBackendProtocol,
+        idle_timeout: float = 300.0,
+    ) -> None:
+        """Initialize the session adapter.
+
+        Args:
+            backend: Docker backend starting and running commands in
+                containers, e.g. DockerAdapter or FakeDockerBackend
+            idle_timeout: Seconds a container may stay unused before it is
+                removed
+        """
+        self.backend = backend
+        self.idle_timeout = idle_timeout
+        self._sessions: dict[SessionKey, ContainerSession] = {}
+        self._lock = threading.Lock()
+        self._reaper: threading.Thread | None = None
+        self._reaper_wakeup = threading.Condition(self._lock)
+        self._closed = False
+        self.containers_started = 0
+
+    @property
+    def sessions(self) -> list[ContainerSession]:
+        """Containers currently kept warm."""
+        with self._lock:
+            return list(self._sessions.values())
+
+    def is_available(self) -> bool:
+        """Check if Docker is available on the system."""
+        return self.backend.is_available()
+
+    def run_container(
+        self,
+        image: str,
+        volumes: list[DockerVolume],
+        environment: DockerEnv,
+        progress_context: "ProgressContextProtocol",
+        command: list[str] | None = None,
+        middleware: OutputMiddleware[T] | None = None,
+        user_context: DockerUserContext | None = None,
+        entrypoint: str | None = None,
+    ) -> ProcessResult[T]:
+        """Run a command in the warm container for the image and volumes.
+
+        Commands with a custom entrypoint or without a command depend on how
+        the container is started and are run in a new container.
+        """
+        if entrypoint is not None or not command:
+            return self.backend.run_container(
+                image,
+                volumes,
+                environment,
+                progress_context,
+                command=command,
+                middleware=middleware,
+                user_context=user_context,
+                entrypoint=entrypoint,
+            )
+
+        session = self._acquire(image, volumes, user_context)
+        progress_context.log(f"Running in warm container: {image}")
+        progress_context.set_status_info(
+            {"docker_status": "exec_in_container", "component": image}
+        )
+
+        try:
+            result = self.backend.exec_in_container(
+                session.container_id,
+                command,
+                environment,
+                middleware=middleware,
+                user_context=user_context,
+            )
+        except Exception:
+            # The container may be gone, start a new one next time
+            self._release(session, discard=True)
+            raise
+
+        self._release(session)
+        progress_context.log(f"Container command completed: {image}")
+        progress_context.set_status_info(
+            {"docker_status": "container_completed", "component": image}
+        )
+        return result
+
+    def build_image(
+        self,
+        dockerfile_dir: Path,
+        image_name: str,
+        progress_context: "ProgressContextProtocol",
+        image_tag: str = "latest",
+        no_cache: bool = False,
+        middleware: OutputMiddleware[T] | None = None,
+    ) -> ProcessResult[T]:
+        """Build a Docker image from a Dockerfile."""
+        return self.backend.build_image(
+            dockerfile_dir,
+            image_name,
+            progress_context,
+            image_tag=image_tag,
+            no_cache=no_cache,
+            middleware=middleware,
+        )
+
+    def image_exists(self, image_name: str, image_tag: str = "latest") -> bool:
+        """Check if a Docker image exists locally."""
+        return self.backend.image_exists(image_name, image_tag)
+
+    def image_id(self, image_name: str, image_tag: str = "latest") -> str | None:
+        """Get the ID of a local image."""
+        return self.backend.image_id(image_name, image_tag)
+
+    def pull_image(
+        self,
+        image_name: str,
+        progress_context: "ProgressContextProtocol",
+        image_tag: str = "latest",
+        middleware: OutputMiddleware[T] | None = None,
+    ) -> ProcessResult[T]:
+        """Pull a Docker image from registry."""
+        return self.backend.pull_image(
+            image_name, progress_context, image_tag=image_tag, middleware=middleware
+        )
+
+    def close_sessions(self, host_path: str | Path | None = None) -> None:
+        """Remove warm containers.
+
+        Args:
+            host_path: Only remove containers mounting this host path, e.g. a
+                workspace about to be deleted; None removes all containers
+        """
+        with self._lock:
+            closing = [
+                (key, session)
+                for key, session in self._sessions.items()
+                if host_path is None or session.uses_host_path(str(host_path))
+            ]
+            for key, _ in closing:
+                del self._sessions[key]
+        for _, session in closing:
+            self._remove(session)
+
+    def close(self) -> None:
+        """Remove all warm containers and stop the reaper."""
+        with self._lock:
+            self._closed = True
+            self._reaper_wakeup.notify_all()
+        self.close_sessions()
+        _open_adapters.discard(self)
+
+    def _session_key(
+        self,
+        image: str,
+        volumes: list[DockerVolume],
+        user_context: DockerUserContext | None,
+    ) -> SessionKey:
+        user_flag = None
+        if user_context and user_context.should_use_user_mapping():
+            user_flag = user_context.get_docker_user_flag()
+        return (image, tuple(volumes), user_flag)
+
+    def _acquire(
+        self,
+        image: str,
+        volumes: list[DockerVolume],
+        user_context: DockerUserContext | None,
+    ) -> ContainerSession:
+        """Get the warm container for a command, starting it if needed."""
+        key = self._session_key(image, volumes, user_context)
+        with self._lock:
+            if self._closed:
+                raise create_docker_error(
+                    "Docker session adapter is closed", None, None, {"image": image}
+                )
+            session = self._sessions.get(key)
+            if session is None:
+                # Container environment is passed to each command instead
+                container_id = self.backend.start_container(
+                    image, volumes, {}, user_context=user_context
+                )
+                session = ContainerSession(container_id, image, tuple(volumes))
+                self._sessions[key] = session
+                self.containers_started += 1
+                logger.debug(
+                    "warm_container_started", image=image, container=container_id
+                )
+                self._start_reaper()
+            session.active += 1
+            session.exec_count += 1
+            return session
+
+    def _release(self, session: ContainerSession, discard: bool = False) -> None:
+        with self._lock:
+            session.active -= 1
+            session.last_used = time.monotonic()
+            if discard:
+                key = next((k for k, s in self._sessions.items() if s is session), None)
+                if key is None:
+                    return
+                del self._sessions[key]
+        if discard:
+            self._remove(session)
+
+    def _remove(self, session: ContainerSession) -> None:
+        logger.debug(
+            "warm_container_removed",
+            image=session.image,
+            container=session.container_id,
+            exec_count=session.exec_count,
+        )
+        self.backend.remove_container(session.container_id)
+
+    def _start_reaper(self) -> None:
+        """Start the thread removing idle containers; the caller holds the lock."""
+        _open_adapters.add(self)
+        if self._reaper is None:
+            self._reaper = threading.Thread(
+                target=self._reap_idle_sessions,
+                name="docker-session-reaper",
+                daemon=True,
+            )
+            self._reaper.start()
+
+    def _reap_idle_sessions(self) -> None:
+        while True:
+            with self._lock:
+                if self._closed or not self._sessions:
+                    self._reaper = None
+                    return
+                now = time.monotonic()
+                idle = [
+                    (key, session)
+                    for key, session in self._sessions.items()
+                    if not session.active
+                    and now - session.last_used >= self.idle_timeout
+                ]
+                for key, _ in idle:
+                    del self._sessions[key]
+                if not idle:
+                    # Busy containers are checked again a full timeout later
+                    next_check = min(
+                        (
+                            session.last_used + self.idle_timeout - now
+                            for session in self._sessions.values()
+                            if not session.active
+                        ),
+                        default=self.idle_timeout,
+                    )
+                    self._reaper_wakeup.wait(max(next_check, 0.01))
+            for _, session in idle:
+                logger.debug("warm_container_idle", container=session.container_id)
+                self._remove(session)
+
+    def __enter__(self) -> "DockerSessionAdapter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+@dataclass
+class FakeContainer:
+    """Container of a FakeDockerBackend.
+
+    Attributes:
+        container_id: ID of the container
+        image: Image the container runs
+        volumes: Volume mounts of the container
+        environment: Environment variables of the container
+        user_flag: Docker --user flag of the container, if any
+        running: Whether the container has not been removed
+        commands: Commands run in the container
+    """
+
+    container_id: str
+    image: str
+    volumes: list[DockerVolume]
+    environment: DockerEnv
+    user_flag: str | None
+    running: bool = True
+    commands: list[list[str]] = field(default_factory=list)
+
+
+FakeCommandHandler = Callable[[FakeContainer, list[str], DockerEnv], tuple[int, str]]
+
+
+class FakeDockerBackend:
+    """In-memory Docker backend for testing without a Docker daemon.
+
+    Commands are answered by a handler returning the exit code and output
+    of a command; by default every command succeeds without output.
+    """
+
+    def __init__(self, handler: FakeCommandHandler | None = None) -> None:
+        """Initialize the fake backend.
+
+        Args:
+            handler: Called with the container, command and environment of
+                each command, returns (return_code, output)
+        """
+        self.handler = handler
+        self.containers: dict[str, FakeContainer] = {}
+        self.runs = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> list[FakeContainer]:
+        """Containers that have not been removed."""
+        return [c for c in self.containers.values() if c.running]
+
+    def is_available(self) -> bool:
+        """The fake backend is always available."""
+        return True
+
+    def start_container(
+        self,
+        image: str,
+        volumes: list[DockerVolume],
+        environment: DockerEnv,
+        user_context: DockerUserContext | None = None,
+    ) -> str:
+        """Create a fake container."""
+        user_flag = None
+        if user_context and user_context.should_use_user_mapping():
+            user_flag = user_context.get_docker_user_flag()
+        with self._lock:
+            container_id = f"fake{next(self._ids):04d}"
+            self.containers[container_id] = FakeContainer(
+                container_id, image, list(volumes), dict(environment), user_flag
+            )
+        return container_id
+
+    def exec_in_container(
+        self,
+        container_id: str,
+        command: list[str],
+        environment: DockerEnv,
+        middleware: OutputMiddleware[T] | None = None,
+        user_context: DockerUserContext | None = None,
+    ) -> ProcessResult[T]:
+        """Answer a command with the handler, passing output to middleware."""
+        container = self.containers.get(container_id)
+        if container is None or not container.running:
+            raise create_docker_error(
+                f"No such container: {container_id}",
+                ["docker", "exec", container_id, *command],
+            )
+        container.commands.append(list(command))
+
+        return_code, output = 0, ""
+        if self.handler is not None:
+            return_code, output = self.handler(
+                container, command, {**container.environment, **environment}
+            )
+
+        stdout: list[Any] = []
+        for line in output.splitlines():
+            stdout.append(
+                middleware.process(line, "stdout") if middleware is not None else line
+            )
+        return return_code, stdout, []
+
+    def remove_container(self, container_id: str) -> None:
+        """Mark a fake container as removed."""
+        container = self.containers.get(container_id)
+        if container is not None:
+            container.running = False
+
+    def run_container(
+        self,
+        image: str,
+        volumes: list[DockerVolume],
+        environment: DockerEnv,
+        progress_context: "ProgressContextProtocol",
+        command: list[str] | None = None,
+        middleware: OutputMiddleware[T] | None = None,
+        user_context: DockerUserContext | None = None,
+        entrypoint: str | None = None,
+    ) -> ProcessResult[T]:
+        """Run a command in a new fake container and remove it."""
+        self.runs += 1
+        container_id = self.start_container(image, volumes, environment, user_context)
+        try:
+            return self.exec_in_container(
+                container_id, command or [], {}, middleware, user_context
+            )
+        finally:
+            self.remove_container(container_id)
+
+    def build_image(
+        self,
+        dockerfile_dir: Path,
+        image_name: str,
+        progress_context: "ProgressContextProtocol",
+        image_tag: str = "latest",
+        no_cache: bool = False,
+        middleware: OutputMiddleware[T] | None = None,
+    ) -> ProcessResult[T]:
+        """Pretend to build an image."""
+        return 0, [], []
+
+    def image_exists(self, image_name: str, image_tag: str = "latest") -> bool:
+        """All images exist."""
+        return True
+
+    def image_id(self, image_name: str, image_tag: str = "latest") -> str | None:
+        """Fake images have no ID."""
+        return None
+
+    def pull_image(
+        self,
+        image_name: str,
+        progress_context: "ProgressContextProtocol",
+        image_tag: str = "latest",
+        middleware: OutputMiddleware[T] | None = None,
+    ) -> ProcessResult[T]:
+        """Pretend to pull an image."""
+        return 0, [], []
+
+
+def create_docker_session_adapter(
+    backend: DockerContainerBackendProtocol | None = None,
+    idle_timeout: float = 300.0,
+) -> DockerSessionAdapter:
+    """Create a Docker adapter reusing warm containers.
+
+    Args:
+        backend: Docker backend, a DockerAdapter if None
+        idle_timeout: Seconds a container may stay unused before it is removed
+
+    Returns:
+        Configured DockerSessionAdapter instance
+    """
+    if backend is None:
+        backend = DockerAdapter()
+    return DockerSessionAdapter(backend, idle_timeout=idle_timeout)
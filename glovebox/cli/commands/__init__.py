@@ -1,53 +1,157 @@
-"""CLI command modules with lazy loading for improved startup performance."""
+"""CLI command modules with lazy loading for improved startup performance.
 
+Command names and help texts come from the static COMMAND_REGISTRY, so
+``glovebox --help`` and shell completion of command names never import a
+command package. A command's module is imported only when the command is
+actually invoked (or when completion descends into it).
+"""
+
+import importlib
+from typing import NamedTuple
+
+import click
 import typer
+from typer.core import TyperGroup
+
+
+class LazyCommand(NamedTuple):
+    """Static description of a top-level command."""
+
+    module: str
+    register: str
+    help: str
+
+
+# Top-level commands in display order. Help texts must match the first
+# paragraph of each command's own help (checked by the CLI tests).
+COMMAND_REGISTRY: dict[str, LazyCommand] = {
+    "layout": LazyCommand(
+        "glovebox.cli.commands.layout",
+        "register_commands",
+        "Layout management commands.",
+    ),
+    "library": LazyCommand(
+        "glovebox.cli.commands.library",
+        "register_commands",
+        "Manage layout library for fetching and organizing layouts",
+    ),
+    "firmware": LazyCommand(
+        "glovebox.cli.commands.firmware",
+        "register_commands",
+        "Firmware management commands.",
+    ),
+    "config": LazyCommand(
+        "glovebox.cli.commands.config",
+        "register_commands",
+        "Configuration management commands",
+    ),
+    "profile": LazyCommand(
+        "glovebox.cli.commands.profile",
+        "register_commands",
+        "Profile configuration and firmware management commands",
+    ),
+    "status": LazyCommand(
+        "glovebox.cli.commands.status",
+        "register_commands",
+        "Show system status and diagnostics.",
+    ),
+    "moergo": LazyCommand(
+        "glovebox.cli.commands.moergo",
+        "register_commands",
+        "MoErgo API operations for authentication and credential management.",
+    ),
+    "cloud": LazyCommand(
+        "glovebox.cli.commands.cloud",
+        "register_commands",
+        "Essential cloud operations for Glove80 layouts",
+    ),
+    "metrics": LazyCommand(
+        "glovebox.cli.commands.metrics",
+        "register_commands",
+        "Metrics management commands",
+    ),
+    "cache": LazyCommand(
+        "glovebox.cli.commands.cache",
+        "register_cache_commands",
+        "Cache management commands",
+    ),
+    "serve": LazyCommand(
+        "glovebox.cli.commands.serve",
+        "register_commands",
+        "Run a compile server that keeps profiles and parsers warm.",
+    ),
+}
+
+# Click commands built from imported command modules, shared by all groups
+# so each module registers its commands once per process
+_loaded_commands: dict[str, click.Command] = {}
+
+
+def load_command(name: str) -> click.Command:
+    """Import a registered command's module and build its click command.
+
+    Args:
+        name: Top-level command name from COMMAND_REGISTRY
+
+    Returns:
+        The click command (or group) for name
+    """
+    if name not in _loaded_commands:
+        spec = COMMAND_REGISTRY[name]
+        module = importlib.import_module(spec.module)
+
+        # Let the module register itself on a scratch app, then take the
+        # click command it produced
+        scratch_app = typer.Typer(add_completion=False)
+        getattr(module, spec.register)(scratch_app)
+        command = typer.main.get_command(scratch_app)
+        if isinstance(command, click.Group):
+            command = command.commands[name]
+        _loaded_commands[name] = command
+
+    return _loaded_commands[name]
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that imports registered commands only when invoked."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List registered commands first, then any eagerly added ones."""
+        eager = [
+            name for name in super().list_commands(ctx) if name not in COMMAND_REGISTRY
+        ]
+        return [*COMMAND_REGISTRY, *eager]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Get a command without importing it.
+
+        Commands that were not imported yet are returned as placeholders
+        carrying the registry help text, which is all help output and name
+        completion need.
+        """
+        if cmd_name in self.commands or cmd_name not in COMMAND_REGISTRY:
+            return super().get_command(ctx, cmd_name)
+        if cmd_name in _loaded_commands:
+            return _loaded_commands[cmd_name]
+        return click.Command(cmd_name, help=COMMAND_REGISTRY[cmd_name].help)
+
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        """Import the command being invoked before click resolves it."""
+        if args and args[0] in COMMAND_REGISTRY and args[0] not in self.commands:
+            self.add_command(load_command(args[0]), args[0])
+        return super().resolve_command(ctx, args)
 
 
 def register_all_commands(app: typer.Typer) -> None:
     """Register all CLI commands with the main app using lazy loading.
 
-    Commands are only imported when this function is called, not at module import time.
-    This reduces initial import overhead.
+    No command module is imported here. The app's click group resolves
+    commands from COMMAND_REGISTRY and imports a command's module on first
+    invocation.
 
     Args:
         app: The main Typer app
     """
-    # Import and register each command module
-    # The imports happen inside the function, so they're deferred until this is called
-    from glovebox.cli.commands.cache import register_cache_commands
-    from glovebox.cli.commands.cloud import register_commands as register_cloud_commands
-    from glovebox.cli.commands.config import (
-        register_commands as register_config_commands,
-    )
-    from glovebox.cli.commands.firmware import (
-        register_commands as register_firmware_commands,
-    )
-    from glovebox.cli.commands.layout import (
-        register_commands as register_layout_commands,
-    )
-    from glovebox.cli.commands.library import (
-        register_commands as register_library_commands,
-    )
-    from glovebox.cli.commands.metrics import (
-        register_commands as register_metrics_commands,
-    )
-    from glovebox.cli.commands.moergo import (
-        register_commands as register_moergo_commands,
-    )
-    from glovebox.cli.commands.profile import (
-        register_commands as register_profile_commands,
-    )
-    from glovebox.cli.commands.status import (
-        register_commands as register_status_commands,
-    )
-
-    register_layout_commands(app)
-    register_library_commands(app)
-    register_firmware_commands(app)
-    register_config_commands(app)
-    register_profile_commands(app)
-    register_status_commands(app)
-    register_moergo_commands(app)
-    register_cloud_commands(app)
-    register_metrics_commands(app)
-    register_cache_commands(app)
+    app.info.cls = LazyTyperGroup
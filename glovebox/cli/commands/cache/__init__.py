@@ -2,6 +2,7 @@
 
 import typer
 
+from .nix import register_nix_commands
 from .workspace import register_workspace_commands
 
 
@@ -21,11 +22,13 @@ def register_cache_commands(app: typer.Typer) -> None:
 
     # Register workspace commands as subcommand
     register_workspace_commands(cache_app)
+    register_nix_commands(cache_app)
 
     # Import individual command functions from modules
     from .clear import cache_clear
     from .debug import cache_debug
     from .delete import cache_delete
+    from .gc import cache_gc
     from .keys import cache_keys
     from .show import cache_show
 
@@ -33,6 +36,7 @@ def register_cache_commands(app: typer.Typer) -> None:
     cache_app.command("keys")(cache_keys)
     cache_app.command("delete")(cache_delete)
     cache_app.command("clear")(cache_clear)
+    cache_app.command("gc")(cache_gc)
 
     # Register management commands directly to cache app
     cache_app.command("show")(cache_show)
@@ -0,0 +1,128 @@
+"""Cache garbage collection CLI command."""
+
+from typing import Annotated
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from glovebox.cli.core.command_base import IOCommand
+from glovebox.cli.decorators.error_handling import handle_errors
+from glovebox.config.user_config import create_user_config
+from glovebox.core.cache.gc import GC_POLICIES, create_cache_gc
+from glovebox.core.cache.models import CacheGCResult
+from glovebox.core.structlog_logger import get_struct_logger
+
+from .utils import format_icon_with_message, format_size_display
+
+
+logger = get_struct_logger(__name__)
+console = Console()
+
+
+class CacheGCCommand(IOCommand):
+    """Command to enforce the global cache size budget."""
+
+    def execute(
+        self,
+        max_size_gb: float | None = None,
+        policy: str | None = None,
+        vacuum: bool = False,
+        dry_run: bool = False,
+    ) -> None:
+        """Execute the cache gc command."""
+        try:
+            if policy is not None and policy not in GC_POLICIES:
+                console.print(
+                    f"[red]Invalid policy '{policy}'. Valid policies: {', '.join(GC_POLICIES)}[/red]"
+                )
+                raise typer.Exit(1)
+
+            user_config = create_user_config()
+            collector = create_cache_gc(
+                user_config,
+                max_total_bytes=(
+                    int(max_size_gb * 1024 * 1024 * 1024)
+                    if max_size_gb is not None
+                    else None
+                ),
+                policy=policy,
+                vacuum=vacuum,
+            )
+            result = collector.collect(dry_run=dry_run)
+            self._show_result(result)
+
+        except typer.Exit:
+            raise
+        except Exception as e:
+            self.handle_service_error(e, "collect cache garbage")
+
+    def _show_result(self, result: CacheGCResult) -> None:
+        """Display GC summary."""
+        title = "Cache GC (dry run)" if result.dry_run else "Cache GC"
+        table = Table(title=title, show_header=False)
+        table.add_column("Field", style="cyan")
+        table.add_column("Value")
+
+        table.add_row("Policy", result.policy)
+        table.add_row("Budget", format_size_display(result.budget_bytes))
+        table.add_row("Size before", format_size_display(result.total_bytes_before))
+        table.add_row("Size after", format_size_display(result.total_bytes_after))
+        table.add_row("Expired entries removed", str(result.expired_entries))
+        table.add_row("Entries evicted", str(result.evicted_entries))
+        table.add_row("Directories evicted", str(result.evicted_directories))
+        table.add_row("Reclaimed", format_size_display(result.reclaimed_bytes))
+        if not result.dry_run:
+            table.add_row("Databases compacted", str(result.vacuumed_databases))
+        console.print(table)
+
+        if result.dry_run and result.evicted_directories:
+            console.print("\n[bold]Directories that would be evicted:[/bold]")
+            for candidate in result.evicted:
+                if candidate.key is None:
+                    console.print(
+                        f"  {candidate.location} ({format_size_display(candidate.size_bytes)})"
+                    )
+
+        if result.total_bytes_after > result.budget_bytes:
+            console.print(
+                "[yellow]Cache is still over budget: remaining entries were used "
+                "too recently to evict[/yellow]"
+            )
+        elif not result.dry_run:
+            console.print(
+                format_icon_with_message("SUCCESS", "Cache is within budget", "emoji")
+            )
+
+
+@handle_errors
+def cache_gc(
+    max_size_gb: Annotated[
+        float | None,
+        typer.Option(
+            "--max-size",
+            help="Byte budget in GB (default: cache_gc_max_size_gb from config)",
+            min=0,
+        ),
+    ] = None,
+    policy: Annotated[
+        str | None,
+        typer.Option(
+            "--policy",
+            help="Eviction policy: lru, lfu or size (default: cache_gc_policy from config)",
+        ),
+    ] = None,
+    vacuum: Annotated[
+        bool,
+        typer.Option("--vacuum", help="Compact every cache database with VACUUM"),
+    ] = False,
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help="Show what would be evicted without deleting"),
+    ] = False,
+) -> None:
+    """Evict cache entries, builds and workspaces to fit the cache size budget."""
+    command = CacheGCCommand()
+    command.execute(
+        max_size_gb=max_size_gb, policy=policy, vacuum=vacuum, dry_run=dry_run
+    )
@@ -136,6 +136,9 @@ class CacheKeysCommand(IOCommand):
             "keys": [],
         }
 
+        # Fetch all values in one batch instead of one cache read per key
+        cached_values = module_cache.get_many(cache_keys) if values else {}
+
         for key in sorted(cache_keys):
             key_data: dict[str, Any] = {"key": key}
 
@@ -154,7 +157,7 @@ class CacheKeysCommand(IOCommand):
 
             if values:
                 try:
-                    cached_value = module_cache.get(key)
+                    cached_value = cached_values.get(key)
                     # Handle different types of cached values safely
                     if cached_value is not None:
                         if isinstance(
@@ -267,6 +270,8 @@ class CacheKeysCommand(IOCommand):
         if values:
             table.add_column("Cached Value", style=Colors.SUCCESS)
 
+        cached_values = module_cache.get_many(cache_keys) if values else {}
+
         for key in sorted(cache_keys):
             row_data = [key]
 
@@ -304,7 +309,7 @@ class CacheKeysCommand(IOCommand):
 
             if values:
                 try:
-                    cached_value = module_cache.get(key)
+                    cached_value = cached_values.get(key)
                     if cached_value is not None:
                         # Truncate very long values for display
                         value_str = str(cached_value)
@@ -326,10 +331,12 @@ class CacheKeysCommand(IOCommand):
         self, cache_keys: list[str], module_cache: "CacheManager", values: bool
     ) -> None:
         """Display cache keys in simple list format."""
+        cached_values = module_cache.get_many(cache_keys) if values else {}
+
         for i, key in enumerate(sorted(cache_keys), 1):
             if values:
                 try:
-                    cached_value = module_cache.get(key)
+                    cached_value = cached_values.get(key)
                     if cached_value is not None:
                         # For simple format, show a brief preview of the value
                         value_str = str(cached_value)
@@ -0,0 +1,125 @@
+"""Nix binary cache CLI commands for MoErgo builds."""
+
+from typing import Annotated
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from glovebox.cli.core.command_base import IOCommand
+from glovebox.cli.decorators.error_handling import handle_errors
+from glovebox.compilation.cache.nix_binary_cache import NixBinaryCache
+from glovebox.config.user_config import create_user_config
+from glovebox.core.structlog_logger import get_struct_logger
+
+from .utils import format_icon_with_message, format_size_display
+
+
+logger = get_struct_logger(__name__)
+console = Console()
+
+nix_app = typer.Typer(help="Nix binary cache of MoErgo builds")
+
+
+def _get_nix_cache() -> tuple[NixBinaryCache, bool]:
+    """Get the Nix binary cache of the user config and whether it is enabled."""
+    user_config = create_user_config()
+    nix_config = user_config._config.firmware.nix_cache
+    cache = NixBinaryCache(
+        user_config._config.cache_path / "nix-cache",
+        max_size_mb=nix_config.max_size_mb,
+    )
+    return cache, nix_config.enabled
+
+
+class NixCacheShowCommand(IOCommand):
+    """Command to show the size of the Nix binary cache."""
+
+    def execute(self) -> None:
+        """Execute the cache nix show command."""
+        try:
+            cache, enabled = _get_nix_cache()
+            entries, size_bytes = cache.usage()
+
+            table = Table(title="Nix Binary Cache", show_header=False)
+            table.add_column("Field", style="cyan")
+            table.add_column("Value")
+            table.add_row("Enabled", "yes" if enabled else "no")
+            table.add_row("Location", str(cache.root))
+            table.add_row("Store paths", str(entries))
+            table.add_row("Size", format_size_display(size_bytes))
+            table.add_row("Limit", format_size_display(cache.max_size_mb * 1024 * 1024))
+            console.print(table)
+
+            if not enabled:
+                console.print(
+                    "[dim]Enable with: glovebox config edit --set "
+                    "firmware.nix_cache.enabled=true[/dim]"
+                )
+        except Exception as e:
+            self.handle_service_error(e, "show Nix binary cache")
+
+
+class NixCachePruneCommand(IOCommand):
+    """Command to remove least recently used store paths from the Nix cache."""
+
+    def execute(self, max_size_mb: int | None = None, clear: bool = False) -> None:
+        """Execute the cache nix prune command."""
+        try:
+            cache, _ = _get_nix_cache()
+            limit_mb = 0 if clear else max_size_mb
+            if limit_mb is None:
+                limit_mb = cache.max_size_mb
+            _, size_before = cache.usage()
+            removed = cache.collect_garbage(limit_mb)
+            _, size_after = cache.usage()
+
+            if size_after > limit_mb * 1024 * 1024:
+                console.print(
+                    "[yellow]Nix cache is in use by a build, try again after it "
+                    "finishes[/yellow]"
+                )
+                return
+
+            message = (
+                f"Removed {removed} store paths "
+                f"({format_size_display(size_before - size_after)}), "
+                f"{format_size_display(size_after)} remaining"
+            )
+            console.print(format_icon_with_message("SUCCESS", message, "emoji"))
+        except Exception as e:
+            self.handle_service_error(e, "prune Nix binary cache")
+
+
+@nix_app.command(name="show")
+@handle_errors
+def nix_show() -> None:
+    """Show the size and limit of the Nix binary cache."""
+    command = NixCacheShowCommand()
+    command.execute()
+
+
+@nix_app.command(name="prune")
+@handle_errors
+def nix_prune(
+    max_size_mb: Annotated[
+        int | None,
+        typer.Option(
+            "--max-size",
+            help="Size limit in MB (default: firmware.nix_cache.max_size_mb)",
+            min=0,
+        ),
+    ] = None,
+    clear: Annotated[
+        bool,
+        typer.Option("--clear", help="Remove every cached store path"),
+    ] = False,
+) -> None:
+    """Remove least recently used store paths beyond the size limit."""
+    command = NixCachePruneCommand()
+    command.execute(max_size_mb=max_size_mb, clear=clear)
+
+
+def register_nix_commands(app: typer.Typer) -> None:
+    """Register Nix cache commands with the main cache app."""
+    app.add_typer(nix_app, name="nix")
@@ -135,6 +135,7 @@ class CacheShowCommand(IOCommand):
                 diskcache_data: dict[str, Any] = {
                     "location": str(diskcache_root),
                     "cache_strategy": user_config._config.cache_strategy,
+                    "cache_backend": user_config._config.cache_backend,
                     "cached_modules_count": len(cache_subdirs),
                     "total_size_bytes": sum(
                         get_directory_size_bytes(d) for d in cache_subdirs
@@ -429,6 +430,9 @@ class CacheShowCommand(IOCommand):
                 console.print(
                     f"[bold]Cache Strategy:[/bold] {user_config._config.cache_strategy}"
                 )
+                console.print(
+                    f"[bold]Cache Backend:[/bold] {user_config._config.cache_backend}"
+                )
                 console.print(f"[bold]Cached Modules:[/bold] {len(cache_subdirs)}")
                 console.print(
                     f"[bold]Total Size:[/bold] {format_size_display(total_diskcache_size)}"
@@ -506,7 +506,7 @@ def workspace_add(
                         source_path.exists()
                         and source_path.is_file()
                         and source_path.suffix.lower()
-                        in [".zip", ".tar", ".gz", ".bz2", ".xz"]
+                        in [".zip", ".tar", ".gz", ".bz2", ".xz", ".zst"]
                     )
                     is_url_archive = workspace_source.startswith(
                         ("http://", "https://")
@@ -600,7 +600,7 @@ def workspace_add(
                     source_path.exists()
                     and source_path.is_file()
                     and source_path.suffix.lower()
-                    in [".zip", ".tar", ".gz", ".bz2", ".xz"]
+                    in [".zip", ".tar", ".gz", ".bz2", ".xz", ".zst"]
                     and not workspace_source.startswith(("http://", "https://"))
                 )
 
@@ -717,7 +717,7 @@ def workspace_export(
         str,
         typer.Option(
             "--format",
-            help="Archive format (zip, tar, tar.gz, tar.bz2, tar.xz)",
+            help="Archive format (zip, tar, tar.gz, tar.bz2, tar.xz, tar.zst)",
         ),
     ] = "zip",
     compression_level: Annotated[
@@ -752,11 +752,15 @@ def workspace_export(
 
     This command exports a cached ZMK workspace to various archive formats:
     - ZIP with configurable compression levels
-    - TAR with optional compression (gzip, bzip2, xz)
+    - TAR with optional compression (gzip, bzip2, xz, zstd)
+
+    Files are compressed in parallel and the archive includes a manifest
+    of file hashes.
 
     Examples:
         glovebox cache workspace export zmkfirmware/zmk main
         glovebox cache workspace export zmkfirmware/zmk --format tar.gz
+        glovebox cache workspace export zmkfirmware/zmk --format tar.zst
         glovebox cache workspace export zmkfirmware/zmk main -o my_workspace.zip
     """
     try:
@@ -779,7 +783,7 @@ def workspace_export(
                 f"[{Colors.ERROR}]Invalid archive format: {format}[/{Colors.ERROR}]"
             )
             console.print(
-                f"[{Colors.MUTED}]Supported formats: zip, tar, tar.gz, tar.bz2, tar.xz[/{Colors.MUTED}]"
+                f"[{Colors.MUTED}]Supported formats: zip, tar, tar.gz, tar.bz2, tar.xz, tar.zst[/{Colors.MUTED}]"
             )
             raise typer.Exit(1) from None
 
@@ -4,7 +4,6 @@ import json
 import shutil
 import tarfile
 import tempfile
-import time
 import urllib.request
 import zipfile
 from pathlib import Path
@@ -23,7 +22,7 @@ if TYPE_CHECKING:
         ArchiveFormat,
         WorkspaceCacheMetadata,
     )
-    from glovebox.core.file_operations import CopyProgressCallback
+    from glovebox.core.file_operations import CopyProgress, CopyProgressCallback
     from glovebox.protocols.progress_context_protocol import (
         ProgressContextProtocol,
     )
@@ -251,11 +250,14 @@ def extract_local_zip(
         #         "Processing Files", "active", f"Extracting zip file {zip_path.name}"
         #     )
 
-        # Copy zip to temp directory for extraction
-        temp_zip = temp_dir / zip_path.name
-        shutil.copy2(zip_path, temp_zip)
-
-        workspace_path = extract_zip_file(temp_zip, progress, console, progress_context)
+        # Extract straight from the source zip, without copying it first
+        workspace_path = extract_zip_file(
+            zip_path,
+            progress,
+            console,
+            progress_context,
+            extract_dir=temp_dir / "extracted",
+        )
 
         # Return both workspace path and temp directory for cleanup
         return workspace_path, temp_dir
@@ -271,6 +273,7 @@ def extract_zip_file(
     progress: bool,
     console: Console,
     progress_context: "ProgressContextProtocol | None" = None,
+    extract_dir: Path | None = None,
 ) -> Path:
     """Extract zip file and find workspace directory with enhanced progress tracking.
 
@@ -279,84 +282,63 @@ def extract_zip_file(
         progress: Whether to show progress bar
         console: Rich console for output
         progress_context: Optional progress context for tracking
+        extract_dir: Directory to extract into, "extracted" next to the zip
+            file if None
 
     Returns:
         Path to workspace directory
     """
-    import time
+    from glovebox.compilation.cache.models import ArchiveFormat
+    from glovebox.compilation.cache.workspace_archive import extract_workspace_archive
 
     if progress_context is None:
         progress_context = get_noop_progress_context()
 
-    extract_dir = zip_path.parent / "extracted"
+    if extract_dir is None:
+        extract_dir = zip_path.parent / "extracted"
     extract_dir.mkdir(exist_ok=True)
 
     try:
         progress_context.start_checkpoint("Extracting Files")
         progress_context.log(f"Extracting {zip_path.name}...", "info")
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            file_list = zip_ref.namelist()
-
-            # Calculate total uncompressed size for byte-level progress
-            total_uncompressed_size = sum(info.file_size for info in zip_ref.infolist())
-            archive_name = zip_path.name
-
-            # Set ZIP extraction task as active if coordinator available
-            # TODO: Enable after refactoring
-            # if progress_coordinator and hasattr(
-            #     progress_coordinator, "set_enhanced_task_status"
-            # ):
-            #     progress_coordinator.set_enhanced_task_status(
-            #         "Extracting Files", "active", "Extracting ZIP archive"
-            #     )
-
-            # Enhanced extraction with byte-level tracking - only use coordinator, no separate progress bar
-            extracted_bytes = 0
-            start_time = time.time()
-
-            for i, file_info in enumerate(zip_ref.infolist()):
-                # Extract file
-                zip_ref.extract(file_info, extract_dir)
-                extracted_bytes += file_info.file_size
-
-                # Calculate extraction speed
-                elapsed_time = time.time() - start_time
-                extraction_speed_mb_s = 0.0
-                eta_seconds = 0.0
-
-                if elapsed_time > 0 and extracted_bytes > 0:
-                    extraction_speed_mb_s = (
-                        extracted_bytes / (1024 * 1024)
-                    ) / elapsed_time
-
-                    if extraction_speed_mb_s > 0:
-                        remaining_bytes = total_uncompressed_size - extracted_bytes
-                        eta_seconds = remaining_bytes / (
-                            extraction_speed_mb_s * 1024 * 1024
-                        )
-
-                # Update progress every 10 files or for last file to avoid too many updates
-                if (i + 1) % 10 == 0 or (i + 1) == len(file_list):
-                    progress_context.update_progress(
-                        current=extracted_bytes,
-                        total=total_uncompressed_size,
-                        status=f"Extracting {file_info.filename}",
-                    )
-
-                    # Update status info with extraction details
-                    progress_context.set_status_info(
-                        {
-                            "current_file": file_info.filename,
-                            "transfer_speed": extraction_speed_mb_s,
-                            "eta_seconds": eta_seconds,
-                            "files_remaining": len(file_list) - (i + 1),
-                        }
-                    )
+
+        def report_progress(copy_progress: "CopyProgress") -> None:
+            eta_seconds = 0.0
+            if copy_progress.speed_mbps > 0:
+                remaining_bytes = copy_progress.total_bytes - copy_progress.bytes_copied
+                eta_seconds = remaining_bytes / (copy_progress.speed_mbps * 1024 * 1024)
+
+            progress_context.update_progress(
+                current=copy_progress.bytes_copied,
+                total=copy_progress.total_bytes,
+                status=f"Extracting {copy_progress.current_file}",
+            )
+            progress_context.set_status_info(
+                {
+                    "current_file": copy_progress.current_file,
+                    "transfer_speed": copy_progress.speed_mbps,
+                    "eta_seconds": eta_seconds,
+                    "files_remaining": max(
+                        copy_progress.total_files - copy_progress.files_processed, 0
+                    ),
+                }
+            )
+
+        # Members are extracted concurrently and checked against path
+        # traversal and, for exported workspaces, the archive manifest
+        import_stats = extract_workspace_archive(
+            zip_path,
+            extract_dir,
+            ArchiveFormat.ZIP,
+            progress_callback=report_progress,
+        )
 
         # Complete extraction checkpoint
         progress_context.complete_checkpoint("Extracting Files")
         progress_context.log(
-            f"Extracted {len(file_list)} files from {archive_name}", "info"
+            f"Extracted {import_stats.files} files from {zip_path.name} "
+            f"({import_stats.throughput_mb_s:.1f} MB/s)",
+            "info",
         )
 
         # Find workspace directory in extracted content
@@ -455,6 +437,9 @@ def create_zip_archive(
 ) -> None:
     """Create ZIP archive from workspace directory.
 
+    Members are deflated in parallel and a manifest of file hashes is added
+    (see glovebox.compilation.cache.workspace_archive).
+
     Args:
         workspace_path: Path to workspace directory to archive
         output_path: Path for output archive file
@@ -464,66 +449,18 @@ def create_zip_archive(
         progress_callback: Optional progress callback
         progress_context: Optional progress context
     """
-    # Calculate total files for progress tracking
-    total_files = sum(
-        1
-        for file_path in workspace_path.rglob("*")
-        if file_path.is_file() and (include_git or ".git" not in file_path.parts)
-    )
-
-    processed_files = 0
-    start_time = time.time()
+    from glovebox.compilation.cache.models import ArchiveFormat
+    from glovebox.compilation.cache.workspace_archive import create_workspace_archive
 
-    with zipfile.ZipFile(
+    create_workspace_archive(
+        workspace_path,
         output_path,
-        "w",
-        compression=zipfile.ZIP_DEFLATED,
-        compresslevel=compression_level,
-    ) as zipf:
-        # Add workspace metadata as JSON
-        metadata_json = json.dumps(metadata.model_dump(mode="json"), indent=2)
-        zipf.writestr(".glovebox_export_metadata.json", metadata_json)
-
-        # Add all workspace files
-        for file_path in workspace_path.rglob("*"):
-            if file_path.is_file():
-                # Skip .git files if not included
-                if not include_git and ".git" in file_path.parts:
-                    continue
-
-                # Calculate relative path for archive
-                rel_path = file_path.relative_to(workspace_path)
-                archive_path = f"workspace/{rel_path}"
-
-                # Add file to zip
-                zipf.write(file_path, archive_path)
-                processed_files += 1
-
-                # Update progress
-                # TODO: Enable after refactoring
-                # if progress_coordinator and hasattr(
-                #     progress_coordinator, "update_export_progress"
-                # ):
-                #     elapsed = time.time() - start_time
-                #     speed_mb_s = 0.0
-                #     eta_seconds = 0.0
-                #
-                #     if elapsed > 0 and processed_files > 0:
-                #         files_per_second = processed_files / elapsed
-                #         if files_per_second > 0:
-                #             eta_seconds = (
-                #                 total_files - processed_files
-                #             ) / files_per_second
-                #
-                #     progress_coordinator.update_export_progress(
-                #         files_processed=processed_files,
-                #         total_files=total_files,
-                #         current_file=str(rel_path),
-                #         archive_format="zip",
-                #         compression_level=compression_level,
-                #         speed_mb_s=speed_mb_s,
-                #         eta_seconds=eta_seconds,
-                #     )
+        ArchiveFormat.ZIP,
+        compression_level,
+        include_git,
+        metadata,
+        progress_callback,
+    )
 
 
 def create_tar_archive(
@@ -538,87 +475,27 @@ def create_tar_archive(
 ) -> None:
     """Create TAR archive from workspace directory.
 
+    Files are read and hashed in parallel and a manifest of file hashes is
+    added (see glovebox.compilation.cache.workspace_archive).
+
     Args:
         workspace_path: Path to workspace directory to archive
         output_path: Path for output archive file
-        archive_format: Archive format (TAR, TAR_GZ, TAR_BZ2, TAR_XZ)
-        compression_level: Compression level (0-9)
+        archive_format: Archive format (TAR, TAR_GZ, TAR_BZ2, TAR_XZ, TAR_ZST)
+        compression_level: Compression level for the format
         include_git: Whether to include .git folders
         metadata: Workspace metadata to include in archive
         progress_callback: Optional progress callback
         progress_context: Optional progress context
     """
-    # Map archive format to tarfile mode
-    mode_map = {
-        "tar": "w",
-        "tar.gz": "w:gz",
-        "tar.bz2": "w:bz2",
-        "tar.xz": "w:xz",
-    }
-
-    mode: str = mode_map.get(archive_format.value, "w")
-
-    # Calculate total files for progress tracking
-    total_files = sum(
-        1
-        for file_path in workspace_path.rglob("*")
-        if file_path.is_file() and (include_git or ".git" not in file_path.parts)
-    )
+    from glovebox.compilation.cache.workspace_archive import create_workspace_archive
 
-    processed_files = 0
-    start_time = time.time()
-
-    with tarfile.open(output_path, mode=mode) as tar:  # type: ignore[call-overload]
-        # Add workspace metadata as JSON
-        metadata_json = json.dumps(metadata.model_dump(mode="json"), indent=2)
-        metadata_bytes = metadata_json.encode("utf-8")
-
-        # Create tarinfo for metadata file
-        metadata_info = tarfile.TarInfo(name=".glovebox_export_metadata.json")
-        metadata_info.size = len(metadata_bytes)
-        metadata_info.mtime = int(time.time())
-
-        import io
-
-        tar.addfile(metadata_info, io.BytesIO(metadata_bytes))
-
-        # Add all workspace files
-        for file_path in workspace_path.rglob("*"):
-            if file_path.is_file():
-                # Skip .git files if not included
-                if not include_git and ".git" in file_path.parts:
-                    continue
-
-                # Calculate relative path for archive
-                rel_path = file_path.relative_to(workspace_path)
-                archive_path = f"workspace/{rel_path}"
-
-                # Add file to tar with custom arcname
-                tar.add(file_path, arcname=archive_path)
-                processed_files += 1
-
-                # Update progress
-                # TODO: Enable after refactoring
-                # if progress_coordinator and hasattr(
-                #     progress_coordinator, "update_export_progress"
-                # ):
-                #     elapsed = time.time() - start_time
-                #     speed_mb_s = 0.0
-                #     eta_seconds = 0.0
-                #
-                #     if elapsed > 0 and processed_files > 0:
-                #         files_per_second = processed_files / elapsed
-                #         if files_per_second > 0:
-                #             eta_seconds = (
-                #                 total_files - processed_files
-                #             ) / files_per_second
-                #
-                #     progress_coordinator.update_export_progress(
-                #         files_processed=processed_files,
-                #         total_files=total_files,
-                #         current_file=str(rel_path),
-                #         archive_format=archive_format.value,
-                #         compression_level=compression_level,
-                #         speed_mb_s=speed_mb_s,
-                #         eta_seconds=eta_seconds,
-                #     )
+    create_workspace_archive(
+        workspace_path,
+        output_path,
+        archive_format,
+        compression_level,
+        include_git,
+        metadata,
+        progress_callback,
+    )
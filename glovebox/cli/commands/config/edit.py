@@ -22,8 +22,12 @@ from glovebox.cli.helpers.parameters import (
     UnsetConfigFieldOption,
 )
 from glovebox.config.models.firmware import (
+    FirmwareBuildCacheConfig,
+    FirmwareBuildLogConfig,
     FirmwareDockerConfig,
     FirmwareFlashConfig,
+    FirmwareGitMirrorConfig,
+    FirmwareNixCacheConfig,
 )
 from glovebox.config.models.user import UserConfigData
 from glovebox.core.structlog_logger import get_struct_logger
@@ -252,6 +256,14 @@ def get_field_info(key: str) -> tuple[Any, str]:
                 field_info = FirmwareFlashConfig.model_fields.get(parts[2])
             elif parts[1] == "docker":
                 field_info = FirmwareDockerConfig.model_fields.get(parts[2])
+            elif parts[1] == "build_log":
+                field_info = FirmwareBuildLogConfig.model_fields.get(parts[2])
+            elif parts[1] == "build_cache":
+                field_info = FirmwareBuildCacheConfig.model_fields.get(parts[2])
+            elif parts[1] == "git_mirrors":
+                field_info = FirmwareGitMirrorConfig.model_fields.get(parts[2])
+            elif parts[1] == "nix_cache":
+                field_info = FirmwareNixCacheConfig.model_fields.get(parts[2])
             else:
                 field_info = None
         else:
@@ -13,8 +13,12 @@ from glovebox.cli.helpers import (
 from glovebox.cli.helpers.parameters import GetConfigFieldOption
 from glovebox.cli.helpers.theme import Colors, get_themed_console
 from glovebox.config.models.firmware import (
+    FirmwareBuildCacheConfig,
+    FirmwareBuildLogConfig,
     FirmwareDockerConfig,
     FirmwareFlashConfig,
+    FirmwareGitMirrorConfig,
+    FirmwareNixCacheConfig,
 )
 from glovebox.config.models.user import UserConfigData
 from glovebox.core.structlog_logger import get_struct_logger
@@ -167,6 +171,18 @@ def _show_all_config(
         for field_name in FirmwareDockerConfig.model_fields:
             keys.append(f"firmware.docker.{field_name}")
 
+        for field_name in FirmwareBuildLogConfig.model_fields:
+            keys.append(f"firmware.build_log.{field_name}")
+
+        for field_name in FirmwareBuildCacheConfig.model_fields:
+            keys.append(f"firmware.build_cache.{field_name}")
+
+        for field_name in FirmwareGitMirrorConfig.model_fields:
+            keys.append(f"firmware.git_mirrors.{field_name}")
+
+        for field_name in FirmwareNixCacheConfig.model_fields:
+            keys.append(f"firmware.nix_cache.{field_name}")
+
         return keys
 
     display_keys = get_all_display_keys()
@@ -183,6 +199,14 @@ def _show_all_config(
                     field_info = FirmwareFlashConfig.model_fields.get(parts[2])
                 elif parts[1] == "docker":
                     field_info = FirmwareDockerConfig.model_fields.get(parts[2])
+                elif parts[1] == "build_log":
+                    field_info = FirmwareBuildLogConfig.model_fields.get(parts[2])
+                elif parts[1] == "build_cache":
+                    field_info = FirmwareBuildCacheConfig.model_fields.get(parts[2])
+                elif parts[1] == "git_mirrors":
+                    field_info = FirmwareGitMirrorConfig.model_fields.get(parts[2])
+                elif parts[1] == "nix_cache":
+                    field_info = FirmwareNixCacheConfig.model_fields.get(parts[2])
                 else:
                     field_info = None
             else:
@@ -287,11 +287,16 @@ class CompileFirmwareCommand(FirmwareOutputCommand):
         build_service: "CompilationBuildCacheService",
     ) -> "BuildResult":
         """Execute JSON file compilation."""
-        from glovebox.adapters import create_docker_adapter, create_file_adapter
+        from glovebox.adapters import create_file_adapter
+        from glovebox.cli.commands.firmware.helpers import (
+            create_firmware_docker_adapter,
+        )
         from glovebox.compilation import create_compilation_service
 
         # Create adapters directly
-        docker_adapter = create_docker_adapter()
+        docker_adapter = create_firmware_docker_adapter(
+            user_config, ctx.obj.session_metrics
+        )
         file_adapter = create_file_adapter()
 
         # Create compilation service directly
@@ -332,11 +337,16 @@ class CompileFirmwareCommand(FirmwareOutputCommand):
         build_service: "CompilationBuildCacheService",
     ) -> "BuildResult":
         """Execute keymap file compilation."""
-        from glovebox.adapters import create_docker_adapter, create_file_adapter
+        from glovebox.adapters import create_file_adapter
+        from glovebox.cli.commands.firmware.helpers import (
+            create_firmware_docker_adapter,
+        )
         from glovebox.compilation import create_compilation_service
 
         # Create adapters directly
-        docker_adapter = create_docker_adapter()
+        docker_adapter = create_firmware_docker_adapter(
+            user_config, ctx.obj.session_metrics
+        )
         file_adapter = create_file_adapter()
 
         # Create compilation service directly
@@ -432,6 +442,13 @@ def compile(
             help="Config flags to add to build (e.g., -D CONFIG_ZMK_SLEEP=y -D CONFIG_BT_CTLR_TX_PWR_PLUS_8=y)",
         ),
     ] = None,
+    watch: Annotated[
+        bool,
+        typer.Option(
+            "--watch",
+            help="Rebuild whenever the keymap, layout or config file is saved",
+        ),
+    ] = False,
 ) -> None:
     """Build ZMK firmware from keymap/config files or JSON layout.
 
@@ -489,20 +506,35 @@ def compile(
 
         # JSON output for automation
         glovebox firmware compile layout.json --profile glove80/v25.05 --output-format json
+
+        # Rebuild every time the layout is saved
+        glovebox firmware compile layout.json --output build/ --watch
     """
     keyboard_profile = get_keyboard_profile_from_context(ctx)
 
-    command = CompileFirmwareCommand()
-    command.execute(
-        ctx=ctx,
-        input_file=input_file,
-        config_file=config_file,
-        profile=keyboard_profile,
-        strategy=strategy,
-        output_format=output_format,
-        progress=progress,
-        show_logs=show_logs,
-        debug=debug,
-        output=output,
-        config_flags=config_flags,
-    )
+    def build() -> None:
+        command = CompileFirmwareCommand()
+        command.execute(
+            ctx=ctx,
+            input_file=input_file,
+            config_file=config_file,
+            profile=keyboard_profile,
+            strategy=strategy,
+            output_format=output_format,
+            progress=progress,
+            show_logs=show_logs,
+            debug=debug,
+            output=output,
+            config_flags=config_flags,
+        )
+
+    if not watch:
+        build()
+        return
+
+    from glovebox.cli.commands.firmware.watch import watch_firmware_compile
+
+    if not input_file or input_file == "-" or not Path(input_file).is_file():
+        raise typer.BadParameter("--watch needs a keymap or layout file path")
+    watched = [Path(input_file)] + ([config_file] if config_file else [])
+    watch_firmware_compile(watched, build)
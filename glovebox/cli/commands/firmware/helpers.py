@@ -10,6 +10,9 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from glovebox.config.profile import KeyboardProfile
+    from glovebox.config.user_config import UserConfig
+    from glovebox.protocols import DockerAdapterProtocol
+    from glovebox.protocols.metrics_protocol import MetricsProtocol
 
 import typer
 
@@ -381,6 +384,34 @@ def get_cache_services_with_fallback(
         return create_compilation_cache_service(user_config)
 
 
+def create_firmware_docker_adapter(
+    user_config: "UserConfig",
+    session_metrics: "MetricsProtocol | None" = None,
+) -> "DockerAdapterProtocol":
+    """Create the Docker adapter for firmware builds.
+
+    Args:
+        user_config: User configuration with the build output overflow policy
+        session_metrics: Optional session metrics receiving output pipeline
+            statistics
+
+    Returns:
+        Docker adapter streaming build output as configured
+    """
+    from glovebox.adapters import create_docker_adapter
+    from glovebox.config.models.firmware import FirmwareDockerConfig
+    from glovebox.utils.stream_process import StreamPipelineOptions
+
+    config_data = getattr(user_config, "_config", None)
+    docker_config = getattr(getattr(config_data, "firmware", None), "docker", None)
+    stream_options = None
+    if isinstance(docker_config, FirmwareDockerConfig):
+        stream_options = StreamPipelineOptions(overflow=docker_config.output_overflow)
+    return create_docker_adapter(
+        session_metrics=session_metrics, stream_options=stream_options
+    )
+
+
 def get_build_output_dir(output: Path | None, ctx: typer.Context) -> tuple[Path, bool]:
     """Get build output directory with proper cleanup tracking.
 
@@ -541,10 +572,10 @@ def compile_json_to_firmware(
             )
 
             # Create compilation service directly
-            from glovebox.adapters import create_docker_adapter, create_file_adapter
+            from glovebox.adapters import create_file_adapter
             from glovebox.compilation import create_compilation_service
 
-            docker_adapter = create_docker_adapter()
+            docker_adapter = create_firmware_docker_adapter(user_config)
             file_adapter = create_file_adapter()
 
             compilation_service = create_compilation_service(
@@ -0,0 +1,59 @@
+"""Watch mode for the firmware compile command."""
+
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import typer
+
+from glovebox.cli.helpers.theme import get_themed_console
+from glovebox.core.structlog_logger import get_struct_logger
+
+
+logger = get_struct_logger(__name__)
+
+
+def watch_firmware_compile(paths: list[Path], build: Callable[[], None]) -> None:
+    """Run a firmware build, then rebuild whenever the input files change.
+
+    Saves that leave the content of every input unchanged do not trigger a
+    build. A failed build is reported and watching continues. The keyboard
+    profile, user config and cache services are created once by the caller
+    and shared by every build, so each rebuild starts from the cached ZMK
+    workspace.
+
+    Args:
+        paths: Keymap, layout and config files to watch
+        build: Runs one build; raises typer.Exit on failure
+    """
+    from glovebox.core.file_watcher import content_digest, watch_files
+
+    console = get_themed_console()
+    last_digest = content_digest(paths)
+
+    def run_build() -> None:
+        stamp = time.strftime("%H:%M:%S")
+        console.print_info(f"[{stamp}] Building firmware")
+        try:
+            build()
+        except typer.Exit as e:
+            if e.exit_code:
+                logger.debug("watch_firmware_build_failed", exit_code=e.exit_code)
+
+    def on_change(changed: set[Path]) -> None:
+        nonlocal last_digest
+        digest = content_digest(paths)
+        if digest == last_digest:
+            logger.debug("watch_firmware_inputs_unchanged")
+            return
+        last_digest = digest
+        run_build()
+
+    run_build()
+    console.print_info(
+        f"Watching {', '.join(str(path) for path in paths)} (Ctrl+C to stop)"
+    )
+    try:
+        watch_files(paths, on_change)
+    except KeyboardInterrupt:
+        console.print_info("Stopped watching")
@@ -10,6 +10,7 @@ def register_commands(app: typer.Typer) -> None:
         app: The main Typer app
     """
     # Import commands only when this function is called
+    from .batch import compile_batch
     from .comparison import diff, patch
     from .core import compile_layout, show, validate
     from .edit import edit
@@ -28,6 +29,7 @@ manage file operations, handle version upgrades, and compare layouts.
 
 Core Operations:
   compile     - Convert JSON layout to ZMK files
+  compile-batch - Compile many JSON layouts with a worker pool
   validate    - Validate layout syntax and structure
   show        - Display layout in terminal
 
@@ -52,6 +54,7 @@ Comparison:
 
     # Register core operations
     layout_app.command(name="compile")(compile_layout)
+    layout_app.command(name="compile-batch")(compile_batch)
     layout_app.command()(validate)
     layout_app.command()(show)
 
@@ -2,11 +2,12 @@
 
 from abc import abstractmethod
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 import typer
 
 from glovebox.cli.core.command_base import IOCommand
+from glovebox.server.client import RemoteLayoutService, get_server_client
 
 
 if TYPE_CHECKING:
@@ -36,6 +37,10 @@ class BaseLayoutCommand(IOCommand):
 class ProfileAwareLayoutCommand(BaseLayoutCommand):
     """Base class for layout commands that need keyboard profile resolution."""
 
+    # Set by commands that only call service.compile() or service.validate(),
+    # which a running compile server can answer instead of a local service
+    server_capable = False
+
     def get_keyboard_profile(
         self, ctx: typer.Context, layout_data: dict[str, Any], no_auto: bool
     ) -> "KeyboardProfile":
@@ -97,6 +102,23 @@ class ProfileAwareLayoutCommand(BaseLayoutCommand):
         try:
             layout_data = self.load_json_input(input)
             keyboard_profile = self.get_keyboard_profile(ctx, layout_data, no_auto)
+
+            # Skip building the local service when a compile server can run it
+            client = None
+            if self.server_capable:
+                from glovebox.cli.helpers.profile import get_user_config_from_context
+
+                client = get_server_client(
+                    user_config=get_user_config_from_context(ctx)
+                )
+            if client is not None:
+                with client:
+                    service = cast("LayoutService", RemoteLayoutService(client))
+                    self.execute_command(
+                        layout_data, keyboard_profile, service, **kwargs
+                    )
+                return
+
             service = self.create_layout_service()
 
             # Call abstract method for specific command logic
@@ -0,0 +1,103 @@
+"""Batch layout compilation CLI command."""
+
+import json
+import time
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from glovebox.cli.decorators import handle_errors, with_metrics, with_profile
+from glovebox.cli.helpers.profile import (
+    get_keyboard_profile_from_context_hard,
+    get_user_config_from_context,
+)
+from glovebox.core.structlog_logger import get_struct_logger
+
+
+logger = get_struct_logger(__name__)
+
+
+@handle_errors
+@with_profile(required=True, firmware_optional=False, support_auto_detection=False)
+@with_metrics("compile_batch")
+def compile_batch(
+    ctx: typer.Context,
+    source: Annotated[
+        str,
+        typer.Argument(
+            help="Directory of JSON layouts, glob pattern (quoted), or a file listing one layout path per line"
+        ),
+    ],
+    output: Annotated[
+        Path,
+        typer.Option(
+            "--output",
+            "-o",
+            help="Directory receiving <layout>.keymap and <layout>.conf for each layout",
+        ),
+    ],
+    profile: Annotated[
+        str | None,
+        typer.Option(
+            "--profile",
+            "-p",
+            help="Keyboard profile in format 'keyboard' or 'keyboard/firmware'",
+        ),
+    ] = None,
+    jobs: Annotated[
+        int,
+        typer.Option("--jobs", "-j", min=1, help="Number of worker processes"),
+    ] = 1,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental",
+            help="Reuse cached keymap sections and only regenerate changed ones",
+        ),
+    ] = False,
+) -> None:
+    """Compile many JSON layouts against one keyboard profile.
+
+    The profile, behavior registry and templates are loaded once per worker.
+    Each result is printed as a JSON line as soon as it finishes, followed by
+    a summary line with throughput. Exits with status 1 if any layout failed.
+
+    Examples:
+        glovebox layout compile-batch layouts/ -o build/ --profile glove80/v25.05
+        glovebox layout compile-batch "layouts/**/*.json" -o build/ -j 4
+        glovebox layout compile-batch layouts.txt -o build/ --incremental
+    """
+    from glovebox.cli.commands.layout.dependencies import create_full_layout_service
+    from glovebox.layout.batch import (
+        BatchLayoutCompiler,
+        collect_batch_inputs,
+        summarize_batch,
+    )
+
+    keyboard_profile = get_keyboard_profile_from_context_hard(ctx)
+    user_config = get_user_config_from_context(ctx)
+    layouts = collect_batch_inputs(source)
+
+    compiler = BatchLayoutCompiler(
+        keyboard_name=keyboard_profile.keyboard_name,
+        firmware_version=keyboard_profile.firmware_version,
+        output_dir=output,
+        service_factory=create_full_layout_service,
+        jobs=jobs,
+        incremental=incremental,
+        config_file=user_config.config_file_path if user_config else None,
+        profile=keyboard_profile,
+    )
+
+    start = time.perf_counter()
+    results = []
+    for result in compiler.run(layouts):
+        results.append(result)
+        typer.echo(json.dumps({"type": "result", **result.model_dump(mode="json")}))
+
+    summary = summarize_batch(results, time.perf_counter() - start)
+    typer.echo(json.dumps({"type": "summary", **summary}))
+
+    if summary["failed"]:
+        raise typer.Exit(1)
@@ -187,6 +187,19 @@ class DiffLayoutCommand(IOCommand):
         import json
         import tempfile
 
+        from glovebox.server.client import get_server_client
+
+        client = get_server_client()
+        if client is not None:
+            with client:
+                return client.diff_layouts(
+                    layout1_data,
+                    layout2_data,
+                    output_format=format,
+                    include_dtsi=include_dtsi,
+                    detailed=detailed,
+                )
+
         with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f1:
             f1.write(json.dumps(layout1_data))
             temp_path1 = Path(f1.name)
@@ -29,6 +29,8 @@ logger = get_struct_logger(__name__)
 class CompileLayoutCommand(ProfileAwareLayoutCommand):
     """Command to compile ZMK keymap and config files from JSON layout."""
 
+    server_capable = True
+
     def get_operation_name(self) -> str:
         """Get the operation name for error reporting."""
         return "compile layout"
@@ -42,10 +44,17 @@ class CompileLayoutCommand(ProfileAwareLayoutCommand):
         no_auto: bool,
         force: bool,
         format: str,
+        incremental: bool = False,
     ) -> None:
         """Execute the compile layout command."""
         self.execute_with_profile(
-            ctx, input, no_auto, output=output, force=force, format=format
+            ctx,
+            input,
+            no_auto,
+            output=output,
+            force=force,
+            format=format,
+            incremental=incremental,
         )
 
     def execute_command(
@@ -56,11 +65,14 @@ class CompileLayoutCommand(ProfileAwareLayoutCommand):
         output: str | None = None,
         force: bool = False,
         format: str = "text",
+        incremental: bool = False,
         **kwargs: Any,
     ) -> None:
         """Execute the specific compilation logic."""
         # Compile layout with profile information
-        result = service.compile(layout_data, profile=keyboard_profile)
+        result = service.compile(
+            layout_data, profile=keyboard_profile, incremental=incremental
+        )
 
         if result.success:
             # Write output using OutputHandler if output specified
@@ -96,6 +108,8 @@ class CompileLayoutCommand(ProfileAwareLayoutCommand):
 class ValidateLayoutCommand(ProfileAwareLayoutCommand):
     """Command to validate keymap syntax and structure."""
 
+    server_capable = True
+
     def get_operation_name(self) -> str:
         """Get the operation name for error reporting."""
         return "validate layout"
@@ -350,6 +364,17 @@ def compile_layout(
         str,
         typer.Option("--format", help="Output format: text, json"),
     ] = "text",
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental",
+            help="Reuse cached keymap sections and only regenerate changed ones",
+        ),
+    ] = False,
+    watch: Annotated[
+        bool,
+        typer.Option("--watch", help="Recompile whenever the layout is saved"),
+    ] = False,
 ) -> None:
     """Compile ZMK keymap and config files from a JSON keymap file.
 
@@ -358,9 +383,16 @@ def compile_layout(
         glovebox layout compile @my-gaming-layout
         cat layout.json | glovebox layout compile -
         glovebox layout compile - --profile glove80/v25.05 < layout.json
+        glovebox layout compile layout.json -o output/glove80 --incremental
+        glovebox layout compile layout.json -o output/glove80 --watch
     """
     command = CompileLayoutCommand()
-    command.execute(ctx, input, output, profile, no_auto, force, format)
+    if watch:
+        from glovebox.cli.commands.layout.watch import watch_compile
+
+        watch_compile(ctx, command, input, output, no_auto, incremental)
+        return
+    command.execute(ctx, input, output, profile, no_auto, force, format, incremental)
 
 
 @handle_errors
@@ -73,7 +73,10 @@ class ParseKeymapCommand(BaseLayoutCommand):
                 raise typer.Exit(1)
 
             # Get profile from context
-            from glovebox.cli.helpers.profile import get_keyboard_profile_from_context
+            from glovebox.cli.helpers.profile import (
+                get_keyboard_profile_from_context,
+                get_user_config_from_context,
+            )
 
             keyboard_profile = get_keyboard_profile_from_context(ctx)
             if verbose and keyboard_profile:
@@ -81,12 +84,8 @@ class ParseKeymapCommand(BaseLayoutCommand):
                     f"Using keyboard profile: {keyboard_profile.keyboard_name}"
                 )
 
-            # Create keymap parser
-            from glovebox.layout import create_zmk_keymap_parser
             from glovebox.layout.parsers.keymap_parser import ParsingMethod, ParsingMode
 
-            keymap_parser = create_zmk_keymap_parser()
-
             if verbose:
                 self.console.print_info(f"Parsing mode: {mode}, method: {method}")
                 self.console.print_info(f"Input file: {keymap_file}")
@@ -100,13 +99,28 @@ class ParseKeymapCommand(BaseLayoutCommand):
                 ParsingMethod.AST if method == "ast" else ParsingMethod.REGEX
             )
 
-            # Parse keymap file
-            result = keymap_parser.parse_keymap(
-                keymap_file=keymap_file,
-                mode=parsing_mode,
-                profile=keyboard_profile,
-                method=parsing_method,
-            )
+            # Parse on a running compile server, which keeps the grammar built
+            from glovebox.server.client import get_server_client
+
+            client = get_server_client(user_config=get_user_config_from_context(ctx))
+            if client is not None:
+                with client:
+                    result = client.parse_keymap(
+                        keymap_file,
+                        mode=parsing_mode.value,
+                        method=parsing_method.value,
+                        profile=keyboard_profile,
+                    )
+            else:
+                from glovebox.layout import create_zmk_keymap_parser
+
+                keymap_parser = create_zmk_keymap_parser()
+                result = keymap_parser.parse_keymap(
+                    keymap_file=keymap_file,
+                    mode=parsing_mode,
+                    profile=keyboard_profile,
+                    method=parsing_method,
+                )
 
             if not result.success:
                 self.console.print_error("Keymap parsing failed:")
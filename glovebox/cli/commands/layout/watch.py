@@ -0,0 +1,90 @@
+"""Watch mode for the layout compile command."""
+
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import typer
+
+from glovebox.core.structlog_logger import get_struct_logger
+
+
+if TYPE_CHECKING:
+    from glovebox.cli.commands.layout.core import CompileLayoutCommand
+    from glovebox.layout.models import LayoutResult
+    from glovebox.layout.watch import LayoutWatchCompiler
+
+
+logger = get_struct_logger(__name__)
+
+
+def watch_compile(
+    ctx: typer.Context,
+    command: "CompileLayoutCommand",
+    input: str,
+    output: str | None,
+    no_auto: bool,
+    incremental: bool,
+) -> None:
+    """Compile a layout file and recompile it every time it is saved.
+
+    The keyboard profile and layout service are created once and reused for
+    every compile. Runs until interrupted with Ctrl+C.
+
+    Args:
+        ctx: Typer context with profile information
+        command: Compile command providing profile and service resolution
+        input: Path to the JSON layout file
+        output: Output base path for .keymap and .conf files
+        no_auto: Whether to disable automatic profile detection
+        incremental: Reuse cached keymap sections between compiles
+    """
+    from glovebox.core.file_watcher import watch_files
+    from glovebox.layout.watch import LayoutWatchCompiler
+
+    layout_path = Path(input)
+    if not layout_path.is_file():
+        command.console.print_error(f"--watch needs a layout file, got: {input}")
+        raise typer.Exit(1)
+    if not output:
+        command.console.print_error("--watch requires --output")
+        raise typer.Exit(1)
+
+    layout_data = command.load_json_input(layout_path)
+    keyboard_profile = command.get_keyboard_profile(ctx, layout_data, no_auto)
+    compiler = LayoutWatchCompiler(
+        layout_path,
+        Path(output),
+        keyboard_profile,
+        command.create_layout_service(),
+        incremental=incremental,
+    )
+
+    def on_change(changed: set[Path]) -> None:
+        _report(command, compiler, compiler.compile_if_changed())
+
+    _report(command, compiler, compiler.compile_if_changed())
+    command.console.print_info(f"Watching {layout_path} (Ctrl+C to stop)")
+    try:
+        watch_files([layout_path], on_change)
+    except KeyboardInterrupt:
+        command.console.print_info("Stopped watching")
+
+
+def _report(
+    command: "CompileLayoutCommand",
+    compiler: "LayoutWatchCompiler",
+    result: "LayoutResult | None",
+) -> None:
+    """Print the outcome of one watch compile."""
+    if result is None:
+        return
+    stamp = time.strftime("%H:%M:%S")
+    if result.success:
+        command.console.print_success(f"[{stamp}] Compiled {compiler.layout_path}")
+        command.console.print_info(f"  keymap: {compiler.keymap_path}")
+        command.console.print_info(f"  config: {compiler.conf_path}")
+    else:
+        command.console.print_error(f"[{stamp}] Compilation failed")
+        for error in result.errors:
+            command.console.print_error(f"  - {error}")
@@ -17,6 +17,7 @@ def register_commands(app: typer.Typer) -> None:
     from .list_cmd import list_app
     from .remove import remove_app
     from .search import search_app
+    from .similar import similar_app
 
     # Create main library app
     library_app = typer.Typer(
@@ -33,6 +34,7 @@ def register_commands(app: typer.Typer) -> None:
     library_app.add_typer(remove_app, name="remove")
     library_app.add_typer(export_app, name="export")
     library_app.add_typer(copy_app, name="copy")
+    library_app.add_typer(similar_app, name="similar")
 
     # Register with main app
     app.add_typer(library_app, name="library")
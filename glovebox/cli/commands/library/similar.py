@@ -0,0 +1,140 @@
+"""Library similar command for finding layouts close to a given layout."""
+
+import json
+from pathlib import Path
+from typing import Annotated, Any
+
+import typer
+
+from glovebox.cli.core.command_base import BaseCommand
+from glovebox.cli.decorators import handle_errors, with_metrics
+from glovebox.cli.helpers.theme import Icons, get_icon_mode_from_context
+from glovebox.config import create_user_config
+from glovebox.library import create_library_service
+
+
+# Options may follow the layout argument of the default command
+similar_app = typer.Typer(
+    help="Find library layouts similar to a layout",
+    context_settings={"allow_interspersed_args": True},
+)
+
+
+class SimilarLayoutCommand(BaseCommand):
+    """Command to rank library layouts by similarity to a layout."""
+
+    def execute(
+        self,
+        ctx: typer.Context,
+        identifier: str,
+        limit: int,
+        format_type: str,
+    ) -> None:
+        """Execute the similar layout command."""
+        icon_mode = get_icon_mode_from_context(ctx)
+
+        try:
+            user_config = create_user_config()
+            library_service = create_library_service(user_config._config)
+
+            # A layout file, or a library layout by UUID or name
+            content: dict[str, Any] | None = None
+            exclude_uuid = None
+            layout_path = Path(identifier)
+            if layout_path.is_file():
+                content = json.loads(layout_path.read_text(encoding="utf-8"))
+            else:
+                entry = library_service.get_layout_entry(
+                    identifier
+                ) or library_service.get_layout_entry_by_name(identifier)
+                if entry is not None:
+                    exclude_uuid = entry.uuid
+                    content = library_service.get_layout_content(entry.uuid)
+
+            if content is None:
+                self.console.print_error(f"Layout not found: {identifier}")
+                self.console.print_info(
+                    "Pass a layout file, or see 'glovebox library list'"
+                )
+                raise typer.Exit(1)
+
+            matches = library_service.find_similar_layouts(
+                content, limit=limit, exclude_uuid=exclude_uuid
+            )
+
+            if format_type == "json":
+                output_data = []
+                for match in matches:
+                    data = match.model_dump(mode="json")
+                    entry = library_service.get_layout_entry(match.uuid)
+                    data["name"] = entry.name if entry else None
+                    output_data.append(data)
+                typer.echo(json.dumps(output_data, indent=2))
+                return
+
+            if not matches:
+                self.console.print_info("No other layouts in library to compare")
+                return
+
+            self.console.print_success(f"Layouts most similar to {identifier}:")
+            typer.echo("")
+            for match in matches:
+                entry = library_service.get_layout_entry(match.uuid)
+                icon = Icons.get_icon("LAYOUT", icon_mode)
+                name = entry.name if entry else match.uuid
+                typer.echo(f"   {icon} {match.score:.0%}  {name}")
+                self.print_operation_info(
+                    f"Bindings: {match.binding_similarity:.0%}, "
+                    f"base layer: {match.position_similarity:.0%}, "
+                    f"behaviors: {match.behavior_similarity:.0%}"
+                )
+                self.print_operation_info(f"UUID: {match.uuid}")
+
+        except Exception as e:
+            self.handle_service_error(e, "find similar layouts")
+
+
+@similar_app.command()
+@handle_errors
+@with_metrics("library_similar")
+def similar(
+    ctx: typer.Context,
+    identifier: Annotated[
+        str, typer.Argument(help="Layout file, or library layout UUID or name")
+    ],
+    limit: Annotated[
+        int, typer.Option("--limit", "-l", help="Maximum number of results")
+    ] = 10,
+    format_type: Annotated[
+        str, typer.Option("--format", "-f", help="Output format")
+    ] = "table",
+) -> None:
+    """Rank library layouts by similarity to a layout.
+
+    Layouts are compared on the bindings of all layers, the base layer key
+    by key, and the behaviors they use.
+
+    Examples:
+        glovebox library similar my-layout
+        glovebox library similar layout.json --limit 5
+        glovebox library similar my-layout --format json
+    """
+    command = SimilarLayoutCommand()
+    command.execute(ctx, identifier, limit, format_type)
+
+
+# Make similar the default command
+@similar_app.callback(invoke_without_command=True)
+def similar_default(
+    ctx: typer.Context,
+    identifier: Annotated[str | None, typer.Argument()] = None,
+    limit: Annotated[int, typer.Option("--limit", "-l")] = 10,
+    format_type: Annotated[str, typer.Option("--format", "-f")] = "table",
+) -> None:
+    """Rank library layouts by similarity to a layout."""
+    if ctx.invoked_subcommand is None:
+        if identifier is None:
+            typer.echo("Error: Missing layout identifier")
+            raise typer.Exit(1)
+
+        similar(ctx, identifier, limit, format_type)
@@ -103,6 +103,14 @@ def _complete_session_uuid(incomplete: str) -> list[str]:
         return []
 
 
+def _parse_timestamp(iso_timestamp: str) -> float | None:
+    """Convert ISO timestamp to POSIX time, or None if it cannot be parsed."""
+    try:
+        return datetime.fromisoformat(iso_timestamp.replace("Z", "+00:00")).timestamp()
+    except (ValueError, AttributeError):
+        return None
+
+
 def _format_timestamp(iso_timestamp: str) -> str:
     """Format ISO timestamp for display."""
     try:
@@ -146,12 +154,13 @@ class ListSessionsCommand(BaseCommand):
     ) -> list[dict[str, Any]]:
         """Build session data from cache keys."""
         sessions = []
+        # Fetch all sessions in one batch instead of one cache read per key
+        session_data = cache_manager.get_many(session_keys)
         for key in session_keys:
             try:
-                data = cache_manager.get(key)
+                data = session_data.get(key)
                 if data and isinstance(data, dict) and "session_info" in data:
                     session_info = data["session_info"]
-                    metadata = cache_manager.get_metadata(key)
 
                     session = {
                         "uuid": key,
@@ -162,7 +171,9 @@ class ListSessionsCommand(BaseCommand):
                         "exit_code": session_info.get("exit_code"),
                         "success": session_info.get("success"),
                         "cli_args": session_info.get("cli_args", []),
-                        "created_at": metadata.created_at if metadata else None,
+                        "created_at": _parse_timestamp(
+                            session_info.get("start_time", "")
+                        ),
                         "metrics_count": {
                             "counters": len(data.get("counters", {})),
                             "gauges": len(data.get("gauges", {})),
@@ -552,10 +563,11 @@ class CleanSessionsCommand(BaseCommand):
         """Find sessions older than the threshold."""
         cutoff_time = datetime.now() - timedelta(days=self.older_than)
         old_sessions = []
+        session_data = cache_manager.get_many(session_keys)
 
         for key in session_keys:
             try:
-                data = cache_manager.get(key)
+                data = session_data.get(key)
                 if data and isinstance(data, dict) and "session_info" in data:
                     start_time_str = data["session_info"].get("start_time")
                     if start_time_str:
@@ -592,17 +604,8 @@ class CleanSessionsCommand(BaseCommand):
         old_sessions: list[tuple[str, datetime, dict[str, Any]]],
     ) -> int:
         """Remove the old sessions and return count of removed sessions."""
-        removed_count = 0
-        for key, _, _ in old_sessions:
-            try:
-                cache_manager.delete(key)
-                removed_count += 1
-            except Exception as e:
-                exc_info = self.logger.isEnabledFor(logging.DEBUG)
-                self.logger.error(
-                    "Failed to remove session %s: %s", key, e, exc_info=exc_info
-                )
-        return removed_count
+        # delete_many logs its own errors and reports what it deleted
+        return cache_manager.delete_many([key for key, _, _ in old_sessions])
 
     def execute(self) -> None:
         """Execute the clean sessions command."""
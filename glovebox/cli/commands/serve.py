@@ -0,0 +1,121 @@
+"""Serve command for running the glovebox compile server."""
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from glovebox.cli.app import AppContext
+from glovebox.cli.core.command_base import BaseCommand
+from glovebox.cli.decorators import handle_errors
+from glovebox.core.structlog_logger import get_struct_logger
+
+
+logger = get_struct_logger(__name__)
+
+
+class ServeCommand(BaseCommand):
+    """Command class for starting, stopping and querying the compile server."""
+
+    def execute(
+        self, ctx: typer.Context, socket_path: Path | None, stop: bool, status: bool
+    ) -> None:
+        """Execute the serve command.
+
+        Args:
+            ctx: Typer context with app configuration
+            socket_path: Socket to listen on or talk to
+            stop: Stop a running server instead of starting one
+            status: Report whether a server is running
+        """
+        from glovebox.core.errors import ServerError
+        from glovebox.server import ServerClient, get_default_socket_path
+
+        path = socket_path or get_default_socket_path()
+
+        if stop or status:
+            try:
+                with ServerClient(path, timeout=5.0) as client:
+                    info = client.ping()
+                    if stop:
+                        client.shutdown()
+            except ServerError:
+                self.console.print_info(f"No glovebox server running on {path}")
+                if status:
+                    raise typer.Exit(1) from None
+                return
+
+            if stop:
+                self.console.print_success(
+                    f"Stopped glovebox server (pid {info['pid']})"
+                )
+            else:
+                self.console.print_success(
+                    f"Glovebox server {info['version']} running on {path} "
+                    f"(pid {info['pid']}, {info['requests']} requests, "
+                    f"up {info['uptime_seconds']:.0f}s)"
+                )
+            return
+
+        self._serve(ctx, path)
+
+    def _serve(self, ctx: typer.Context, path: Path) -> None:
+        """Run the server in the foreground until it is stopped."""
+        from glovebox.cli.commands.layout.dependencies import create_full_layout_service
+        from glovebox.server import GloveboxServer, ServerHandlers
+
+        app_ctx: AppContext = ctx.obj
+        handlers = ServerHandlers(app_ctx.user_config, create_full_layout_service)
+        server = GloveboxServer(path, handlers)
+        server.bind()
+
+        self.console.print_success(f"Glovebox server listening on {path}")
+        self.console.print_info("Press Ctrl+C or run 'glovebox serve --stop' to stop")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            server.close()
+            self.console.print_info("Glovebox server stopped")
+
+
+@handle_errors
+def serve(
+    ctx: typer.Context,
+    socket_path: Annotated[
+        Path | None,
+        typer.Option(
+            "--socket",
+            help="Unix socket path (default: $GLOVEBOX_SERVER_SOCKET or server.sock in $XDG_RUNTIME_DIR/glovebox)",
+        ),
+    ] = None,
+    stop: Annotated[
+        bool, typer.Option("--stop", help="Stop the running server")
+    ] = False,
+    status: Annotated[
+        bool, typer.Option("--status", help="Show whether a server is running")
+    ] = False,
+) -> None:
+    """Run a compile server that keeps profiles and parsers warm.
+
+    The server listens on a Unix socket and answers newline-delimited
+    JSON-RPC 2.0 requests for layout.compile, layout.validate, layout.parse
+    and layout.diff. While it runs, 'glovebox layout compile', 'validate',
+    'parse keymap' and 'diff' send their work to it automatically; set
+    GLOVEBOX_NO_SERVER=1 to compile locally instead.
+
+    Examples:
+        glovebox serve
+        glovebox serve --status
+        glovebox serve --stop
+    """
+    command = ServeCommand()
+    command.execute(ctx, socket_path, stop, status)
+
+
+def register_commands(app: typer.Typer) -> None:
+    """Register serve command with the main app.
+
+    Args:
+        app: The main Typer app
+    """
+    app.command(name="serve")(serve)
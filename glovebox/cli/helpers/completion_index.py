@@ -0,0 +1,279 @@
+"""Build and maintain the persistent shell completion index.
+
+The index is a JSON file holding everything tab completion needs: profiles
+with their firmwares, library references, layout field paths, the command
+tree and field paths of recently edited layouts. The ``glovebox-complete``
+entry point (glovebox.fast_completion) serves completions from it without
+loading the CLI, and the regular completion callbacks read it instead of
+loading keyboard configurations on every key press.
+
+The index records the modification times of its sources (keyboard
+configuration files and directories, user configuration files, the library
+index and the command definitions) and is rebuilt when any of them changes.
+The command tree needs every command module imported, so completion
+callbacks never build it themselves: they rebuild the rest of the index and
+leave the command tree to a detached ``python -m`` process.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from glovebox.core.structlog_logger import get_struct_logger
+from glovebox.fast_completion import (
+    INDEX_VERSION,
+    get_completion_index_path,
+    is_index_fresh,
+    load_completion_index,
+    request_rebuild,
+    source_stamp,
+    write_completion_index,
+)
+
+
+if TYPE_CHECKING:
+    import click
+
+    from glovebox.config.user_config import UserConfig
+
+
+logger = get_struct_logger(__name__)
+
+# Number of recently completed layouts whose field paths are kept
+MAX_RECENT_LAYOUTS = 20
+
+
+def build_completion_index(
+    user_config: "UserConfig | None" = None,
+    previous: dict[str, Any] | None = None,
+    include_commands: bool = True,
+) -> dict[str, Any]:
+    """Build completion index data from the current configuration.
+
+    Args:
+        user_config: User configuration (created when None)
+        previous: Previous index whose still-current recent layouts and
+            command tree are kept
+        include_commands: Build the command tree, which imports all command
+            modules. When False, the previous command tree is kept if the
+            command definitions did not change, otherwise it is left empty.
+
+    Returns:
+        Index data ready to be written
+    """
+    from glovebox.config import create_user_config
+    from glovebox.config.keyboard_profile import (
+        get_available_firmwares,
+        get_available_keyboards,
+        initialize_search_paths,
+    )
+
+    if user_config is None:
+        user_config = create_user_config()
+
+    profiles: dict[str, list[str]] = {}
+    for keyboard in get_available_keyboards(user_config):
+        try:
+            profiles[keyboard] = list(get_available_firmwares(keyboard, user_config))
+        except Exception as e:
+            logger.debug(
+                "completion_index_firmwares_failed", keyboard=keyboard, error=str(e)
+            )
+            profiles[keyboard] = []
+
+    source_paths = _source_paths(user_config, initialize_search_paths(user_config))
+    sources = {str(path): source_stamp(path) for path in source_paths}
+
+    layouts = {}
+    if previous:
+        layouts = {
+            path: layout
+            for path, layout in previous.get("layouts", {}).items()
+            if source_stamp(Path(path)) == layout.get("mtime_ns")
+        }
+
+    # The command definitions are a source only while the command tree built
+    # from them is in the index
+    commands_file = _commands_source()
+    commands_stamp = source_stamp(commands_file)
+    commands: dict[str, Any] = {}
+    if include_commands:
+        commands = _command_tree()
+    elif (
+        previous
+        and previous.get("commands")
+        and previous.get("sources", {}).get(str(commands_file)) == commands_stamp
+    ):
+        commands = previous["commands"]
+    if commands:
+        sources[str(commands_file)] = commands_stamp
+
+    return {
+        "version": INDEX_VERSION,
+        "generated_at": time.time(),
+        "keyboard_path_env": os.environ.get("GLOVEBOX_KEYBOARD_PATH", ""),
+        "sources": sources,
+        "profiles": profiles,
+        "library": _library_references(),
+        "fields": _layout_fields(),
+        "commands": commands,
+        "layouts": layouts,
+    }
+
+
+def get_completion_index(user_config: "UserConfig | None" = None) -> dict[str, Any]:
+    """Get current completion index data, rebuilding it if stale.
+
+    The command tree is not rebuilt here; if it is missing or outdated, a
+    background rebuild is requested instead.
+
+    Returns:
+        Index data, empty if it could neither be loaded nor built
+    """
+    index_path = get_completion_index_path()
+    index = load_completion_index(index_path)
+    if index is not None and is_index_fresh(index):
+        return index
+
+    try:
+        index = build_completion_index(
+            user_config, previous=index, include_commands=False
+        )
+        write_completion_index(index, index_path)
+        logger.debug("completion_index_rebuilt", index_path=str(index_path))
+        if not index["commands"]:
+            request_rebuild(index_path)
+        return index
+    except Exception as e:
+        logger.debug("completion_index_rebuild_failed", error=str(e))
+        return index or {}
+
+
+def record_layout_completions(json_file: str | Path) -> None:
+    """Add field paths and layer names of a layout to the index.
+
+    Called when completing against a layout, so later completions for the
+    same file can be served by glovebox-complete.
+
+    Args:
+        json_file: Layout JSON file path
+    """
+    import json
+
+    try:
+        path = Path(json_file).expanduser().resolve()
+        mtime_ns = source_stamp(path)
+        index_path = get_completion_index_path()
+        index = load_completion_index(index_path)
+        if index is None or mtime_ns is None:
+            return
+
+        layouts: dict[str, dict[str, Any]] = index.setdefault("layouts", {})
+        if layouts.get(str(path), {}).get("mtime_ns") == mtime_ns:
+            return
+
+        from glovebox.cli.helpers.parameters import _get_dynamic_field_completions
+
+        data = json.loads(path.read_text())
+        layouts[str(path)] = {
+            "mtime_ns": mtime_ns,
+            "used_at": time.time(),
+            "layer_names": [n for n in data.get("layer_names", []) if n and n.strip()],
+            "fields": _get_dynamic_field_completions(str(path), "layers["),
+        }
+
+        # Keep only the most recently used layouts
+        recent = sorted(layouts.items(), key=lambda item: -item[1].get("used_at", 0))
+        index["layouts"] = dict(recent[:MAX_RECENT_LAYOUTS])
+        write_completion_index(index, index_path)
+    except Exception as e:
+        logger.debug("completion_index_layout_record_failed", error=str(e))
+
+
+def _source_paths(user_config: "UserConfig", search_paths: list[Path]) -> list[Path]:
+    """List files and directories whose changes invalidate the index."""
+    from glovebox.utils.xdg import get_xdg_config_dir
+
+    paths: list[Path] = []
+    for search_path in search_paths:
+        # Directory mtimes catch added and removed keyboard files
+        paths.append(search_path)
+        for pattern in ("*.yaml", "*.yml"):
+            for file_path in sorted(search_path.rglob(pattern)):
+                paths.append(file_path)
+                if file_path.parent != search_path and file_path.parent not in paths:
+                    paths.append(file_path.parent)
+
+    config_dir = get_xdg_config_dir()
+    paths.extend([config_dir / "config.yaml", config_dir / "config.yml"])
+    if user_config.config_file_path:
+        paths.append(user_config.config_file_path)
+
+    paths.append(user_config._config.library_path / "index.yaml")
+    return list(dict.fromkeys(paths))
+
+
+def _commands_source() -> Path:
+    """Command registry module, whose changes invalidate the command tree."""
+    import glovebox.cli.commands
+
+    return Path(glovebox.cli.commands.__file__)
+
+
+def _library_references() -> list[str]:
+    """Library references (@name and @uuid) for completion."""
+    from glovebox.cli.helpers.library_resolver import (
+        get_library_entries_for_completion,
+    )
+
+    return [reference for reference, _ in get_library_entries_for_completion()]
+
+
+def _layout_fields() -> list[str]:
+    """Layout field paths derived from the LayoutData model."""
+    from glovebox.cli.helpers.parameters import _build_layout_field_completions
+
+    return _build_layout_field_completions()
+
+
+def _command_tree() -> dict[str, Any]:
+    """Describe all commands with their subcommands and options."""
+    import typer
+
+    from glovebox.cli.app import app
+    from glovebox.cli.commands import COMMAND_REGISTRY, load_command
+
+    root = typer.main.get_command(app)
+    tree = _command_node(root)
+    tree["commands"] = {
+        name: _command_node(load_command(name)) for name in COMMAND_REGISTRY
+    }
+    return tree
+
+
+def _command_node(command: "click.Command") -> dict[str, Any]:
+    """Describe one command: option names mapped to whether they take a value."""
+    import click
+
+    options: dict[str, bool] = {}
+    for param in command.params:
+        if isinstance(param, click.Option) and not param.hidden:
+            takes_value = not param.is_flag and not param.count
+            for name in [*param.opts, *param.secondary_opts]:
+                options[name] = takes_value
+
+    node: dict[str, Any] = {"options": options}
+    if isinstance(command, click.Group):
+        node["commands"] = {
+            name: _command_node(subcommand)
+            for name, subcommand in command.commands.items()
+            if not subcommand.hidden
+        }
+    return node
+
+
+if __name__ == "__main__":
+    # Background rebuild started by glovebox-complete
+    index = build_completion_index(previous=load_completion_index())
+    write_completion_index(index)
@@ -14,9 +14,6 @@ from glovebox.core.structlog_logger import get_struct_logger
 logger = get_struct_logger(__name__)
 
 # Cache keys and TTL settings for completion data
-PROFILE_COMPLETION_CACHE_KEY = "profile_completion_data_v1"
-PROFILE_COMPLETION_TTL = 300  # 5 minutes
-
 LAYER_NAMES_CACHE_KEY_PREFIX = "layer_names_"
 LAYER_NAMES_TTL = 60  # 1 minute
 
@@ -28,68 +25,29 @@ FIELD_COMPLETION_TTL = 3600  # 1 hour
 
 
 def _get_cached_profile_data() -> tuple[list[str], dict[str, list[str]]]:
-    """Get cached profile data using persistent filesystem cache."""
-    try:
-        from glovebox.config import create_user_config
-        from glovebox.config.keyboard_profile import (
-            get_available_firmwares,
-            get_available_keyboards,
-        )
-        from glovebox.core.cache import create_default_cache
-
-        # Get user config and create appropriate cache
-        user_config = create_user_config()
+    """Get profile data from the persistent completion index.
 
-        # Create cache using default settings for profile completion performance
-        # Tab completion always uses cache for performance, even if general caching is disabled
-        cache = create_default_cache(tag="cli_completion")
-
-        # Try to get cached data first
-        cached_data = cache.get(PROFILE_COMPLETION_CACHE_KEY)
-        if cached_data is not None:
-            logger.debug("Profile completion cache hit")
-            return cached_data["keyboards"], cached_data["keyboards_with_firmwares"]
-
-        # Cache miss - need to build the data
-        logger.debug("Profile completion cache miss - building data")
-        keyboards = get_available_keyboards(user_config)
+    The index is rebuilt only when a keyboard configuration, user
+    configuration or command definition changed since it was written.
+    """
+    try:
+        from glovebox.cli.helpers.completion_index import get_completion_index
 
-        # Pre-build keyboard/firmware combinations with optimized error handling
-        keyboards_with_firmwares = {}
-        for keyboard in keyboards:
-            try:
-                firmwares = get_available_firmwares(keyboard, user_config)
-                # Convert to list once to avoid repeated conversions
-                keyboards_with_firmwares[keyboard] = (
-                    list(firmwares) if firmwares else []
-                )
-            except Exception as e:
-                # On error, provide empty list instead of failing completely
-                logger.debug("Failed to get firmwares for %s: %s", keyboard, e)
-                keyboards_with_firmwares[keyboard] = []
-
-        # Cache the data with TTL
-        cache_data = {
-            "keyboards": keyboards,
-            "keyboards_with_firmwares": keyboards_with_firmwares,
-        }
-        cache.set(PROFILE_COMPLETION_CACHE_KEY, cache_data, ttl=PROFILE_COMPLETION_TTL)
-        logger.debug(
-            "Profile completion data cached for %d seconds", PROFILE_COMPLETION_TTL
+        keyboards_with_firmwares: dict[str, list[str]] = get_completion_index().get(
+            "profiles", {}
         )
-
-        return keyboards, keyboards_with_firmwares
+        return list(keyboards_with_firmwares), keyboards_with_firmwares
     except Exception as e:
-        # If cache operations fail, return empty data but don't crash
-        logger.debug("Profile completion cache failed: %s", e)
+        # If the index cannot be read or built, return empty data but don't crash
+        logger.debug("Profile completion index failed: %s", e)
         return [], {}
 
 
 def complete_profile_names(incomplete: str) -> list[str]:
     """Fast tab completion for profile names (keyboard/firmware format).
 
-    Uses caching to avoid repeated expensive config loading and firmware lookups.
-    Cache expires after 30 seconds to balance performance and freshness.
+    Reads the persistent completion index, so keyboard configurations are
+    only loaded again after they change.
 
     Args:
         incomplete: Partial profile string being typed
@@ -455,6 +413,7 @@ def complete_layer_names(ctx: typer.Context, incomplete: str) -> list[str]:
             return []
 
         layer_names = _get_cached_layer_names(json_file)
+        _record_layout_completions(json_file)
 
         if not layer_names:
             return []
@@ -508,6 +467,7 @@ def complete_field_paths(ctx: typer.Context, incomplete: str) -> list[str]:
             # Add dynamic completions based on actual layout content
             dynamic_completions = _get_dynamic_field_completions(json_file, incomplete)
             field_completions.extend(dynamic_completions)
+            _record_layout_completions(json_file)
 
         # Handle comma-separated field completion
         if "," in incomplete:
@@ -591,6 +551,13 @@ def _extract_json_file_from_context(ctx: typer.Context) -> str | None:
         return None
 
 
+def _record_layout_completions(json_file: str) -> None:
+    """Remember a layout's fields so glovebox-complete can serve them."""
+    from glovebox.cli.helpers.completion_index import record_layout_completions
+
+    record_layout_completions(json_file)
+
+
 def _get_cached_layer_names(json_file: str) -> list[str]:
     """Get cached layer names for a JSON file."""
     try:
@@ -1102,8 +1069,12 @@ def _build_config_field_completions() -> list[str]:
     """Build comprehensive field completion list from config models."""
     try:
         from glovebox.config.models.firmware import (
+            FirmwareBuildCacheConfig,
+            FirmwareBuildLogConfig,
             FirmwareDockerConfig,
             FirmwareFlashConfig,
+            FirmwareGitMirrorConfig,
+            FirmwareNixCacheConfig,
         )
         from glovebox.config.models.user import UserConfigData
 
@@ -1122,6 +1093,22 @@ def _build_config_field_completions() -> list[str]:
         for field_name in FirmwareDockerConfig.model_fields:
             completions.append(f"firmware.docker.{field_name}")
 
+        # Add firmware build log fields
+        for field_name in FirmwareBuildLogConfig.model_fields:
+            completions.append(f"firmware.build_log.{field_name}")
+
+        # Add firmware build cache fields
+        for field_name in FirmwareBuildCacheConfig.model_fields:
+            completions.append(f"firmware.build_cache.{field_name}")
+
+        # Add firmware git mirror fields
+        for field_name in FirmwareGitMirrorConfig.model_fields:
+            completions.append(f"firmware.git_mirrors.{field_name}")
+
+        # Add firmware Nix cache fields
+        for field_name in FirmwareNixCacheConfig.model_fields:
+            completions.append(f"firmware.nix_cache.{field_name}")
+
         return completions
     except Exception:
         # Fallback to basic completions
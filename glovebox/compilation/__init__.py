@@ -77,6 +77,7 @@ def create_compilation_service(
             file_adapter=file_adapter,
             session_metrics=session_metrics,
             default_progress_callback=progress_callback,
+            user_config=user_config,
         )
     else:
         raise ValueError(
@@ -130,6 +131,7 @@ def create_moergo_nix_service(
     file_adapter: "FileAdapterProtocol",
     session_metrics: "SessionMetrics",
     default_progress_callback: Any | None = None,
+    user_config: "UserConfig | None" = None,
 ) -> CompilationServiceProtocol:
     r"""Create simplified Moergo compilation service with explicit dependencies.
 
@@ -138,6 +140,7 @@ def create_moergo_nix_service(
         file_adapter: Required FileAdapter instance
         session_metrics: SessionMetrics instance for metrics integration
         default_progress_callback: Optional default progress callback for compilation tracking
+        user_config: Optional UserConfig with the Nix cache settings
 
     Returns:
         CompilationServiceProtocol: Moergo compilation service
@@ -147,7 +150,11 @@ def create_moergo_nix_service(
     )
 
     return create_moergo_nix_service(
-        docker_adapter, file_adapter, session_metrics, default_progress_callback
+        docker_adapter,
+        file_adapter,
+        session_metrics,
+        default_progress_callback,
+        user_config=user_config,
     )
 
 
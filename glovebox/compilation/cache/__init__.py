@@ -14,7 +14,19 @@ from glovebox.core.cache import create_cache_from_user_config
 from glovebox.core.cache.cache_manager import CacheManager
 
 from .compilation_build_cache_service import CompilationBuildCacheService
+from .git_mirror_store import GitMirrorStore, create_git_mirror_store
+from .incremental_build_cache import (
+    IncrementalBuildCache,
+    create_incremental_build_cache,
+)
 from .models import WorkspaceCacheMetadata, WorkspaceCacheResult
+from .nix_binary_cache import NixBinaryCache, create_nix_binary_cache
+from .workspace_archive import (
+    ArchiveExportStats,
+    ArchiveImportStats,
+    create_workspace_archive,
+    extract_workspace_archive,
+)
 from .workspace_cache_service import ZmkWorkspaceCacheService
 
 
@@ -101,11 +113,21 @@ def create_compilation_cache_service(
 
 
 __all__ = [
+    "ArchiveExportStats",
+    "ArchiveImportStats",
     "WorkspaceCacheMetadata",
     "WorkspaceCacheResult",
     "ZmkWorkspaceCacheService",
     "CompilationBuildCacheService",
+    "GitMirrorStore",
+    "IncrementalBuildCache",
+    "NixBinaryCache",
     "create_zmk_workspace_cache_service",
     "create_compilation_build_cache_service",
     "create_compilation_cache_service",
+    "create_git_mirror_store",
+    "create_workspace_archive",
+    "extract_workspace_archive",
+    "create_incremental_build_cache",
+    "create_nix_binary_cache",
 ]
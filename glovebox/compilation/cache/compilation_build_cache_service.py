@@ -1,5 +1,6 @@
 """Compilation build cache service for ZMK build artifacts."""
 
+import contextlib
 import logging
 import shutil
 from datetime import datetime
@@ -8,6 +9,7 @@ from typing import Any
 
 from glovebox.config.user_config import UserConfig
 from glovebox.core.cache.cache_manager import CacheManager
+from glovebox.core.cache.locking import create_staging_directory, publish_directory
 from glovebox.core.cache.models import CacheKey
 
 
@@ -110,6 +112,7 @@ class CompilationBuildCacheService:
         Returns:
             True if caching was successful, False otherwise
         """
+        staging_dir: Path | None = None
         try:
             self.logger.debug(
                 "Caching build result with key: %s from dir: %s", cache_key, build_dir
@@ -122,12 +125,15 @@ class CompilationBuildCacheService:
             # Create cache directory structure
             cache_base_dir = self.get_cache_directory()
             cached_build_dir = cache_base_dir / cache_key
-            cached_build_dir.mkdir(parents=True, exist_ok=True)
 
-            self.logger.debug("Created cache directory: %s", cached_build_dir)
+            # Copy build artifacts into a staging directory and publish it
+            # atomically so concurrent readers never see a partial build
+            staging_dir = create_staging_directory(cached_build_dir)
+            self._copy_build_artifacts(build_dir, staging_dir)
+            publish_directory(staging_dir, cached_build_dir)
+            staging_dir = None
 
-            # Copy build artifacts to cache
-            self._copy_build_artifacts(build_dir, cached_build_dir)
+            self.logger.debug("Published cache directory: %s", cached_build_dir)
 
             # Create cache metadata
             cache_data = {
@@ -151,6 +157,8 @@ class CompilationBuildCacheService:
         except Exception as e:
             exc_info = self.logger.isEnabledFor(logging.DEBUG)
             self.logger.error("Failed to cache build result: %s", e, exc_info=exc_info)
+            if staging_dir is not None:
+                shutil.rmtree(staging_dir, ignore_errors=True)
             return False
 
     def get_cached_build(self, cache_key: str) -> Path | None:
@@ -179,6 +187,10 @@ class CompilationBuildCacheService:
                 self.cache_manager.delete(cache_key)
                 return None
 
+            # Mark as recently used for cache GC
+            with contextlib.suppress(OSError):
+                cached_path.touch()
+
             self.logger.info("Cache hit for build: %s -> %s", cache_key, cached_path)
             return cached_path
 
@@ -0,0 +1,429 @@
+"""Shared store of bare git mirrors for ZMK workspaces.
+
+Every new workspace clones the zmk-config repository, and `west update`
+clones ZMK, Zephyr and every Zephyr module from the network, although
+almost all objects are the same for every workspace. GitMirrorStore keeps
+one bare repository per remote URL:
+
+- mirrors/<name>-<hash>.git: bare mirror of a remote URL
+- paths/<project path>: link to the mirror of the west project last found
+  at that path, for `west update --path-cache`
+
+West clones projects found in the path cache from the local mirror
+before fetching from their remotes. Mirrors are filled from finished
+workspaces, so they follow the manifests without extra network traffic,
+and the zmk-config repository is fetched incrementally before it is
+cloned. Clones copy the objects they need (a local clone, or --reference
+with --dissociate), so cached workspaces never depend on the store and
+least recently used mirrors can be removed beyond a size limit.
+"""
+
+import hashlib
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+from glovebox.config.models.firmware import FirmwareGitMirrorConfig
+from glovebox.core.cache.locking import (
+    STAGING_PREFIX,
+    CacheLock,
+    create_staging_directory,
+    directory_lock,
+)
+from glovebox.core.errors import GitMirrorError
+from glovebox.core.structlog_logger import get_struct_logger
+from glovebox.protocols.docker_adapter_protocol import DockerVolume
+
+
+logger = get_struct_logger(__name__)
+
+# Where build containers see the store
+CONTAINER_MIRROR_DIR = "/git-mirrors"
+
+# Marker of the last fetch from the remote, inside each mirror
+_FETCHED_STAMP = "glovebox-fetched"
+
+# Directories searched for west projects below a workspace
+_MAX_PROJECT_DEPTH = 4
+
+
+def mirror_name(url: str) -> str:
+    """Get the directory name of the mirror of a remote URL."""
+    normalized = url.strip().rstrip("/").removesuffix(".git")
+    base = re.sub(r"[^A-Za-z0-9._-]", "_", normalized.rsplit("/", 1)[-1]) or "repo"
+    digest = hashlib.sha256(normalized.encode()).hexdigest()[:12]
+    return f"{base}-{digest}.git"
+
+
+def find_repositories(root: Path, max_depth: int = _MAX_PROJECT_DEPTH) -> list[Path]:
+    """Find git repositories below a workspace without entering them.
+
+    Hidden directories such as .west and CMake build directories are
+    skipped.
+    """
+    repositories: list[Path] = []
+    pending = [(root, 0)]
+    while pending:
+        directory, depth = pending.pop()
+        try:
+            entries = [
+                Path(entry.path)
+                for entry in os.scandir(directory)
+                if entry.is_dir(follow_symlinks=False)
+                and not entry.name.startswith(".")
+            ]
+        except OSError:
+            continue
+        for path in entries:
+            if (path / ".git").exists():
+                repositories.append(path)
+            elif depth + 1 < max_depth and not (path / "CMakeCache.txt").exists():
+                pending.append((path, depth + 1))
+    return sorted(repositories)
+
+
+def _directory_size(path: Path) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += Path(root, name).lstat().st_size
+            except OSError:
+                continue
+    return total
+
+
+class GitMirrorStore:
+    """Bare git mirrors keyed by remote URL, shared by all workspaces."""
+
+    def __init__(
+        self,
+        root: Path,
+        max_size_mb: int = 8192,
+        refresh_interval: float = 3600.0,
+        git: str = "git",
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            root: Directory holding mirrors and the path cache
+            max_size_mb: Size limit of all mirrors
+            refresh_interval: Seconds before a mirror is fetched again
+            git: Git executable on the host
+        """
+        self.root = root
+        self.max_size_mb = max_size_mb
+        self.refresh_interval = refresh_interval
+        self.git = git
+
+    @property
+    def mirrors_dir(self) -> Path:
+        """Directory of the bare mirrors."""
+        return self.root / "mirrors"
+
+    @property
+    def paths_dir(self) -> Path:
+        """Directory of links from west project paths to mirrors."""
+        return self.root / "paths"
+
+    @property
+    def volume(self) -> DockerVolume:
+        """Volume mounting the store into build containers."""
+        return (str(self.root), CONTAINER_MIRROR_DIR)
+
+    @property
+    def container_path_cache(self) -> str:
+        """Path cache for `west update --path-cache` inside containers."""
+        return f"{CONTAINER_MIRROR_DIR}/paths"
+
+    def mirror_path(self, url: str) -> Path:
+        """Get the host path of the mirror of a remote URL."""
+        return self.mirrors_dir / mirror_name(url)
+
+    def container_mirror_path(self, url: str) -> str:
+        """Get the path of the mirror of a remote URL inside containers."""
+        return f"{CONTAINER_MIRROR_DIR}/mirrors/{mirror_name(url)}"
+
+    def in_use(self) -> CacheLock:
+        """Get the lock to hold while containers may clone from the store.
+
+        Garbage collection is skipped while any process holds it.
+        """
+        return directory_lock(self.root, shared=True)
+
+    def _git(
+        self, *args: str, cwd: Path | None = None
+    ) -> subprocess.CompletedProcess[str]:
+        try:
+            return subprocess.run(
+                [self.git, *args],
+                cwd=cwd,
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+        except FileNotFoundError as e:
+            raise GitMirrorError(f"Git executable not found: {self.git}") from e
+        except subprocess.CalledProcessError as e:
+            raise GitMirrorError(
+                f"git {args[0]} failed: {(e.stderr or '').strip()}"
+            ) from e
+
+    def sync_remote(self, url: str) -> Path:
+        """Create or incrementally refresh the mirror of a remote URL.
+
+        Args:
+            url: Remote repository URL
+
+        Returns:
+            Host path of the mirror
+
+        Raises:
+            GitMirrorError: If the remote cannot be fetched
+        """
+        mirror = self.mirror_path(url)
+        with directory_lock(mirror):
+            if not mirror.is_dir():
+                self._create_mirror(url, mirror, fetch=True)
+            elif self._is_stale(mirror):
+                logger.debug("git_mirror_fetching", url=url)
+                self._git("fetch", "--quiet", "origin", cwd=mirror)
+                (mirror / _FETCHED_STAMP).touch()
+                self._git("gc", "--auto", "--quiet", cwd=mirror)
+            os.utime(mirror)
+        return mirror
+
+    def add_repository(self, repository: Path, url: str) -> Path:
+        """Add the checked out revision of a local clone to its mirror.
+
+        Only objects missing from the mirror are copied, and nothing is
+        fetched when the revision is already mirrored.
+
+        Args:
+            repository: Local clone, e.g. a west project of a workspace
+            url: Remote URL of the clone
+
+        Returns:
+            Host path of the mirror
+
+        Raises:
+            GitMirrorError: If git fails
+        """
+        head = self._git("rev-parse", "HEAD", cwd=repository).stdout.strip()
+        mirror = self.mirror_path(url)
+        with directory_lock(mirror):
+            if not mirror.is_dir():
+                self._create_mirror(url, mirror, fetch=False)
+            if not self._has_commit(mirror, head):
+                self._git(
+                    "fetch",
+                    "--quiet",
+                    "--no-tags",
+                    str(repository),
+                    f"+HEAD:refs/glovebox/{head}",
+                    cwd=mirror,
+                )
+                if not self._has_commit(mirror, "HEAD"):
+                    # Clones from the mirror need a HEAD to check out
+                    self._git("update-ref", "refs/heads/glovebox", head, cwd=mirror)
+                    self._git("symbolic-ref", "HEAD", "refs/heads/glovebox", cwd=mirror)
+                self._git("gc", "--auto", "--quiet", cwd=mirror)
+            os.utime(mirror)
+        return mirror
+
+    def add_workspace(self, workspace_path: Path) -> int:
+        """Add the west projects of a finished workspace to the store.
+
+        Each project is also linked into the path cache under its path
+        in the workspace. Projects that cannot be added are skipped.
+
+        Args:
+            workspace_path: Workspace with cloned west projects
+
+        Returns:
+            Number of projects added
+        """
+        added = 0
+        for repository in find_repositories(workspace_path):
+            try:
+                url = self._remote_url(repository)
+                if url is None:
+                    continue
+                mirror = self.add_repository(repository, url)
+            except GitMirrorError as e:
+                logger.warning(
+                    "git_mirror_add_failed", repository=str(repository), error=str(e)
+                )
+                continue
+            self._link_path(repository.relative_to(workspace_path), mirror)
+            added += 1
+
+        logger.debug("git_mirror_workspace_added", projects=added)
+        return added
+
+    def clone_command(self, url: str, destination: str) -> str:
+        """Get the shell command cloning a remote URL inside a container.
+
+        The clone borrows objects from the mirror if one exists and
+        copies them (--dissociate), so it does not depend on the store.
+        """
+        command = ["git", "clone"]
+        if self.mirror_path(url).is_dir():
+            command += [
+                "--reference-if-able",
+                self.container_mirror_path(url),
+                "--dissociate",
+            ]
+        return shlex.join([*command, url, destination])
+
+    def collect_garbage(self, max_size_mb: int | None = None) -> int:
+        """Remove least recently used mirrors beyond the size limit.
+
+        Nothing is removed while a process holds in_use(). Links of the
+        path cache to removed mirrors are deleted.
+
+        Args:
+            max_size_mb: Size limit, the configured limit if None
+
+        Returns:
+            Number of removed mirrors
+        """
+        store_lock = directory_lock(self.root)
+        if not store_lock.acquire(blocking=False):
+            logger.debug("git_mirror_gc_skipped_store_in_use")
+            return 0
+        try:
+            removed = self._remove_least_recently_used(
+                (self.max_size_mb if max_size_mb is None else max_size_mb) * 1024 * 1024
+            )
+            self._remove_dangling_links()
+        finally:
+            store_lock.release()
+        return removed
+
+    def _remove_least_recently_used(self, limit: int) -> int:
+        if not self.mirrors_dir.is_dir():
+            return 0
+
+        entries = [
+            (mirror.stat().st_mtime, _directory_size(mirror), mirror)
+            for mirror in self.mirrors_dir.iterdir()
+            if mirror.is_dir() and not mirror.name.startswith(".")
+        ]
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, mirror in sorted(entries):
+            if total <= limit:
+                break
+            lock = directory_lock(mirror)
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                shutil.rmtree(mirror, ignore_errors=True)
+            finally:
+                lock.release()
+            total -= size
+            removed += 1
+            logger.debug("git_mirror_evicted", mirror=mirror.name)
+
+        if removed:
+            logger.info(
+                "git_mirrors_pruned",
+                removed=removed,
+                remaining_mb=round(total / 1024 / 1024, 1),
+            )
+        return removed
+
+    def _remove_dangling_links(self) -> None:
+        if not self.paths_dir.is_dir():
+            return
+        for root, dirs, files in os.walk(self.paths_dir):
+            for name in [*dirs, *files]:
+                link = Path(root, name)
+                if link.is_symlink() and not link.exists():
+                    link.unlink()
+
+    def _create_mirror(self, url: str, mirror: Path, fetch: bool) -> None:
+        """Create the mirror of a URL, lock held."""
+        self.mirrors_dir.mkdir(parents=True, exist_ok=True)
+        staging = create_staging_directory(mirror)
+        try:
+            if fetch:
+                logger.info("git_mirror_cloning", url=url)
+                self._git("clone", "--quiet", "--mirror", url, str(staging))
+                (staging / _FETCHED_STAMP).touch()
+            else:
+                self._git("init", "--quiet", "--bare", str(staging))
+                self._git("remote", "add", "--mirror=fetch", "origin", url, cwd=staging)
+            staging.rename(mirror)
+        finally:
+            if staging.exists():
+                shutil.rmtree(staging, ignore_errors=True)
+
+    def _is_stale(self, mirror: Path) -> bool:
+        try:
+            fetched = (mirror / _FETCHED_STAMP).stat().st_mtime
+        except OSError:
+            return True
+        return time.time() - fetched >= self.refresh_interval
+
+    def _has_commit(self, mirror: Path, revision: str) -> bool:
+        try:
+            self._git(
+                "rev-parse", "--quiet", "--verify", f"{revision}^{{commit}}", cwd=mirror
+            )
+        except GitMirrorError:
+            return False
+        return True
+
+    def _remote_url(self, repository: Path) -> str | None:
+        """Get the fetch URL of a clone's first remote."""
+        try:
+            output = self._git(
+                "config", "--get-regexp", r"^remote\..*\.url$", cwd=repository
+            ).stdout
+        except GitMirrorError:
+            return None
+        for line in output.splitlines():
+            _, _, url = line.partition(" ")
+            if url and not url.startswith(CONTAINER_MIRROR_DIR):
+                return url
+        return None
+
+    def _link_path(self, project_path: Path, mirror: Path) -> None:
+        """Link a west project path of the path cache to a mirror."""
+        link = self.paths_dir / project_path
+        link.parent.mkdir(parents=True, exist_ok=True)
+        # Relative, so the link resolves inside containers too
+        target = os.path.relpath(mirror, link.parent)
+        if link.is_symlink() and str(link.readlink()) == target:
+            return
+        temporary = link.with_name(f"{STAGING_PREFIX}{link.name}")
+        temporary.unlink(missing_ok=True)
+        temporary.symlink_to(target)
+        temporary.replace(link)
+
+
+def create_git_mirror_store(
+    cache_root: Path, config: FirmwareGitMirrorConfig
+) -> GitMirrorStore | None:
+    """Create the git mirror store below a cache root if enabled.
+
+    Args:
+        cache_root: Glovebox cache root directory
+        config: Git mirror settings from the user config
+
+    Returns:
+        GitMirrorStore instance, or None if git mirrors are disabled
+    """
+    if not config.enabled:
+        return None
+    return GitMirrorStore(
+        cache_root / "git-mirrors",
+        max_size_mb=config.max_size_mb,
+        refresh_interval=config.refresh_interval,
+    )
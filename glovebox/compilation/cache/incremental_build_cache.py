@@ -0,0 +1,416 @@
+"""Compiler cache and preserved build directories for ZMK builds.
+
+A fresh ZMK workspace starts without build directories, so every compile
+configures and builds all of Zephyr again even when only the keymap
+changed. IncrementalBuildCache keeps two things between compiles:
+
+- a ccache store, mounted into the build container at /ccache and bounded
+  by ccache itself through CCACHE_MAXSIZE
+- optionally, the west build directory of each build target, keyed by the
+  workspace (repository, branch and image ID) and the target's board,
+  shield and CMake arguments, mounted over the target's build directory in the
+  workspace. Least recently used directories are removed beyond a size limit.
+
+With both, a keymap change makes ninja rebuild only the objects depending
+on it, and objects that must be rebuilt are usually served from ccache.
+"""
+
+import hashlib
+import os
+import shutil
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from glovebox.compilation.models.build_matrix import BuildTarget
+from glovebox.config.models.firmware import FirmwareBuildCacheConfig
+from glovebox.core.cache.locking import CacheLock, directory_lock
+from glovebox.core.structlog_logger import get_struct_logger
+from glovebox.firmware.models import BuildCacheStats
+from glovebox.protocols.docker_adapter_protocol import DockerEnv, DockerVolume
+
+
+logger = get_struct_logger(__name__)
+
+CCACHE_CONTAINER_DIR = "/ccache"
+
+# Build outputs removed from a preserved directory before it is reused, so
+# a failed build never leaves the previous firmware to be collected
+BUILD_OUTPUTS = ("zmk.uf2", "zmk.hex", "zmk.bin", "zmk.elf")
+
+# Files of a build directory that artifact collection copies, below zephyr/
+COLLECTED_FILES = (
+    *BUILD_OUTPUTS,
+    ".config",
+    "zephyr.dts",
+    "zephyr.dts.pre",
+    "include/generated/devicetree_generated.h",
+)
+
+# ccache --print-stats counters (ccache 4.x)
+_HIT_COUNTERS = ("direct_cache_hit", "preprocessed_cache_hit")
+_MISS_COUNTERS = ("cache_miss",)
+
+
+def workspace_cache_key(repository: str, branch: str, image: str) -> str:
+    """Get the key of preserved build directories for a workspace.
+
+    Args:
+        repository: ZMK repository of the workspace
+        branch: Branch of the repository
+        image: ID of the build image, or its name if the ID is unknown
+    """
+    data = f"{repository}@{branch}#{image}"
+    return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+
+def target_cache_key(target: BuildTarget) -> str:
+    """Get the name of a target's preserved build directory."""
+    data = "|".join(
+        [
+            target.board,
+            target.shield or "",
+            target.snippet or "",
+            *target.cmake_args,
+        ]
+    )
+    digest = hashlib.sha256(data.encode()).hexdigest()[:8]
+    return f"{target.artifact_name}-{digest}"
+
+
+def parse_ccache_stats(text: str) -> dict[str, int]:
+    """Parse the tab separated output of `ccache --print-stats`."""
+    counters: dict[str, int] = {}
+    for line in text.splitlines():
+        name, _, value = line.partition("\t")
+        if value.strip().isdigit():
+            counters[name.strip()] = int(value)
+    return counters
+
+
+def _directory_size(path: Path) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += Path(root, name).lstat().st_size
+            except OSError:
+                continue
+    return total
+
+
+@dataclass
+class IncrementalBuild:
+    """Mounts, environment and commands of one incremental build.
+
+    Attributes:
+        workspace_path: Host workspace mounted at /workspace
+        workspace_key: Key of the workspace's preserved build directories
+        targets: Targets being built
+        volumes: Volume mounts to add to the build container
+        environment: Environment variables for the build container
+        before_commands: Shell commands to run before building
+        after_commands: Shell commands to run after building
+        cmake_args: CMake arguments to add to each west build
+        reused_targets: Targets building in a previously used directory
+        fresh_targets: Targets building in a new preserved directory
+        stats_files: Host files of the ccache counters before and after
+        locks: Locks held on the preserved build directories
+    """
+
+    workspace_path: Path
+    workspace_key: str
+    targets: list[BuildTarget]
+    volumes: list[DockerVolume] = field(default_factory=list)
+    environment: DockerEnv = field(default_factory=dict)
+    before_commands: list[str] = field(default_factory=list)
+    after_commands: list[str] = field(default_factory=list)
+    cmake_args: list[str] = field(default_factory=list)
+    reused_targets: list[str] = field(default_factory=list)
+    fresh_targets: list[str] = field(default_factory=list)
+    stats_files: tuple[Path, Path] | None = None
+    locks: list[CacheLock] = field(default_factory=list)
+
+
+class IncrementalBuildCache:
+    """Managed ccache store and preserved build directories."""
+
+    def __init__(
+        self,
+        root: Path,
+        ccache: bool = True,
+        ccache_max_size_mb: int = 2048,
+        preserve_build_dirs: bool = False,
+        build_dirs_max_size_mb: int = 4096,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            root: Directory holding the ccache store and build directories
+            ccache: Mount a ccache store into build containers
+            ccache_max_size_mb: Size limit of the ccache store
+            preserve_build_dirs: Keep build directories between compiles
+            build_dirs_max_size_mb: Size limit of preserved build directories
+        """
+        self.root = root
+        self.ccache = ccache
+        self.ccache_max_size_mb = ccache_max_size_mb
+        self.preserve_build_dirs = preserve_build_dirs
+        self.build_dirs_max_size_mb = build_dirs_max_size_mb
+
+    @property
+    def ccache_dir(self) -> Path:
+        """Host directory of the ccache store."""
+        return self.root / "ccache"
+
+    @property
+    def build_dirs_root(self) -> Path:
+        """Host directory of preserved build directories."""
+        return self.root / "build-dirs"
+
+    def build_dir_for(self, workspace_key: str, target: BuildTarget) -> Path:
+        """Get the preserved build directory of a target."""
+        return self.build_dirs_root / workspace_key / target_cache_key(target)
+
+    def prepare(
+        self,
+        workspace_path: Path,
+        workspace_key: str,
+        targets: list[BuildTarget],
+    ) -> IncrementalBuild:
+        """Set up the cache for a build of the given targets.
+
+        Preserved build directories in use by another compile are skipped
+        and that target builds in the workspace as before.
+
+        Args:
+            workspace_path: Host workspace mounted at /workspace
+            workspace_key: Key from workspace_cache_key
+            targets: Targets to be built
+
+        Returns:
+            Build setup; pass it to finish() once the build is done
+        """
+        build = IncrementalBuild(workspace_path, workspace_key, targets)
+
+        if self.ccache:
+            self.ccache_dir.mkdir(parents=True, exist_ok=True)
+            build.volumes.append((str(self.ccache_dir), CCACHE_CONTAINER_DIR))
+            build.environment.update(
+                {
+                    "CCACHE_DIR": CCACHE_CONTAINER_DIR,
+                    "CCACHE_MAXSIZE": f"{self.ccache_max_size_mb}M",
+                    # Hash source paths relative to the workspace
+                    "CCACHE_BASEDIR": "/workspace",
+                }
+            )
+            build.cmake_args.append("-DUSE_CCACHE=1")
+
+            # Counters are snapshotted rather than zeroed so concurrent
+            # builds sharing the store do not reset each other's stats
+            stats_id = uuid.uuid4().hex[:8]
+            before = f".stats-{stats_id}-before"
+            after = f".stats-{stats_id}-after"
+            build.stats_files = (self.ccache_dir / before, self.ccache_dir / after)
+            build.before_commands.append(
+                f"(ccache --print-stats > {CCACHE_CONTAINER_DIR}/{before} 2>/dev/null"
+                " || true)"
+            )
+            build.after_commands.append(
+                f"(ccache --print-stats > {CCACHE_CONTAINER_DIR}/{after} 2>/dev/null"
+                " || true)"
+            )
+
+        if self.preserve_build_dirs:
+            for target in targets:
+                self._mount_build_dir(build, target)
+
+        logger.debug(
+            "incremental_build_prepared",
+            ccache=self.ccache,
+            reused=build.reused_targets,
+            fresh=build.fresh_targets,
+        )
+        return build
+
+    def _mount_build_dir(self, build: IncrementalBuild, target: BuildTarget) -> None:
+        build_dir = self.build_dir_for(build.workspace_key, target)
+        lock = directory_lock(build_dir)
+        if not lock.acquire(blocking=False):
+            logger.info("preserved_build_dir_busy", target=target.artifact_name)
+            return
+        build.locks.append(lock)
+
+        if build_dir.is_dir():
+            build.reused_targets.append(target.artifact_name)
+            for name in BUILD_OUTPUTS:
+                (build_dir / "zephyr" / name).unlink(missing_ok=True)
+        else:
+            build_dir.mkdir(parents=True)
+            build.fresh_targets.append(target.artifact_name)
+        # Mark as used for least recently used eviction
+        os.utime(build_dir)
+
+        # Created here so Docker does not create the mount point as root
+        mount_point = build.workspace_path / target.artifact_name
+        mount_point.mkdir(parents=True, exist_ok=True)
+        build.volumes.append((str(build_dir), f"/workspace/{target.artifact_name}"))
+
+    def finish(self, build: IncrementalBuild) -> BuildCacheStats:
+        """Collect statistics, copy outputs into the workspace and prune.
+
+        The workspace only sees mounted build directories through the
+        container, so their outputs are copied to the workspace mount
+        points where artifact collection and the build cache look for them.
+
+        Args:
+            build: Setup returned by prepare()
+
+        Returns:
+            Cache statistics of the build
+        """
+        try:
+            stats = BuildCacheStats(
+                reused_build_dirs=len(build.reused_targets),
+                fresh_build_dirs=len(build.fresh_targets),
+            )
+            if build.stats_files is not None:
+                self._read_ccache_stats(build.stats_files, stats)
+
+            mounted = set(build.reused_targets) | set(build.fresh_targets)
+            for target in build.targets:
+                if target.artifact_name in mounted:
+                    self._copy_outputs(
+                        self.build_dir_for(build.workspace_key, target),
+                        build.workspace_path / target.artifact_name,
+                    )
+        finally:
+            for lock in build.locks:
+                lock.release()
+            build.locks.clear()
+
+        if self.preserve_build_dirs:
+            self.prune_build_dirs()
+
+        logger.info(
+            "incremental_build_stats",
+            ccache_hits=stats.compiler_cache_hits,
+            ccache_misses=stats.compiler_cache_misses,
+            reused_build_dirs=stats.reused_build_dirs,
+        )
+        return stats
+
+    def _read_ccache_stats(
+        self, stats_files: tuple[Path, Path], stats: BuildCacheStats
+    ) -> None:
+        before_file, after_file = stats_files
+        try:
+            before = parse_ccache_stats(before_file.read_text())
+            after = parse_ccache_stats(after_file.read_text())
+        except OSError:
+            # ccache is missing in the image or the build stopped early
+            return
+        finally:
+            before_file.unlink(missing_ok=True)
+            after_file.unlink(missing_ok=True)
+
+        if not after:
+            return
+        # Counters go down when someone zeroes the store during the build
+        stats.compiler_cache_hits = max(
+            0, sum(after.get(name, 0) - before.get(name, 0) for name in _HIT_COUNTERS)
+        )
+        stats.compiler_cache_misses = max(
+            0,
+            sum(after.get(name, 0) - before.get(name, 0) for name in _MISS_COUNTERS),
+        )
+
+    def _copy_outputs(self, build_dir: Path, mount_point: Path) -> None:
+        """Copy what artifact collection needs out of a preserved directory."""
+        for name in COLLECTED_FILES:
+            source = build_dir / "zephyr" / name
+            if source.is_file():
+                destination = mount_point / "zephyr" / name
+                destination.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source, destination)
+
+    def prune_build_dirs(self, max_size_mb: int | None = None) -> int:
+        """Remove least recently used build directories beyond the size limit.
+
+        Directories locked by a running build are kept.
+
+        Args:
+            max_size_mb: Size limit, the configured limit if None
+
+        Returns:
+            Number of removed build directories
+        """
+        limit = (
+            (self.build_dirs_max_size_mb if max_size_mb is None else max_size_mb)
+            * 1024
+            * 1024
+        )
+        if not self.build_dirs_root.is_dir():
+            return 0
+
+        entries: list[tuple[float, int, Path]] = []
+        for workspace_dir in self.build_dirs_root.iterdir():
+            if not workspace_dir.is_dir():
+                continue
+            for build_dir in workspace_dir.iterdir():
+                if build_dir.is_dir() and not build_dir.name.startswith("."):
+                    entries.append(
+                        (
+                            build_dir.stat().st_mtime,
+                            _directory_size(build_dir),
+                            build_dir,
+                        )
+                    )
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, build_dir in sorted(entries):
+            if total <= limit:
+                break
+            lock = directory_lock(build_dir)
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                shutil.rmtree(build_dir, ignore_errors=True)
+            finally:
+                lock.release()
+            total -= size
+            removed += 1
+            logger.debug("preserved_build_dir_evicted", path=str(build_dir))
+
+        if removed:
+            logger.info(
+                "preserved_build_dirs_pruned",
+                removed=removed,
+                remaining_mb=round(total / 1024 / 1024, 1),
+            )
+        return removed
+
+
+def create_incremental_build_cache(
+    cache_root: Path, config: FirmwareBuildCacheConfig
+) -> IncrementalBuildCache | None:
+    """Create the incremental build cache below a cache root.
+
+    Args:
+        cache_root: Glovebox cache root directory
+        config: Build cache settings from the user config
+
+    Returns:
+        IncrementalBuildCache, or None if neither ccache nor preserved
+        build directories are enabled
+    """
+    if not config.ccache and not config.preserve_build_dirs:
+        return None
+    return IncrementalBuildCache(
+        cache_root / "incremental",
+        ccache=config.ccache,
+        ccache_max_size_mb=config.ccache_max_size_mb,
+        preserve_build_dirs=config.preserve_build_dirs,
+        build_dirs_max_size_mb=config.build_dirs_max_size_mb,
+    )
@@ -20,6 +20,7 @@ class ArchiveFormat(str, Enum):
     TAR_GZ = "tar.gz"
     TAR_BZ2 = "tar.bz2"
     TAR_XZ = "tar.xz"
+    TAR_ZST = "tar.zst"
 
     @property
     def file_extension(self) -> str:
@@ -29,13 +30,21 @@ class ArchiveFormat(str, Enum):
     @property
     def uses_compression(self) -> bool:
         """Check if this format uses compression."""
-        return self in {self.ZIP, self.TAR_GZ, self.TAR_BZ2, self.TAR_XZ}
+        return self in {
+            self.ZIP,
+            self.TAR_GZ,
+            self.TAR_BZ2,
+            self.TAR_XZ,
+            self.TAR_ZST,
+        }
 
     @property
     def default_compression_level(self) -> int:
         """Get the default compression level for this format."""
         if self == self.ZIP:
             return 6  # zipfile default
+        if self == self.TAR_ZST:
+            return 3  # zstd default
         return 6  # reasonable default for tar formats
 
     @property
@@ -47,9 +56,33 @@ class ArchiveFormat(str, Enum):
             return 9
         if self == self.TAR_XZ:
             return 9
+        if self == self.TAR_ZST:
+            return 19
         return 9  # general max
 
 
+class WorkspaceArchiveEntry(GloveboxBaseModel):
+    """Size and hash of a file in a workspace archive."""
+
+    size: int = Field(ge=0, description="File size in bytes")
+    sha256: str = Field(description="Hex SHA-256 digest of the file content")
+
+
+class WorkspaceArchiveManifest(GloveboxBaseModel):
+    """Manifest of the files in a workspace archive."""
+
+    version: int = Field(default=1, description="Manifest format version")
+    files: dict[str, WorkspaceArchiveEntry] = Field(
+        default_factory=dict,
+        description="Entries by path relative to the workspace",
+    )
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of all files."""
+        return sum(entry.size for entry in self.files.values())
+
+
 class WorkspaceCacheResult(GloveboxBaseModel):
     """Result of workspace cache operations."""
 
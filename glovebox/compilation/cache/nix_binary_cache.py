@@ -0,0 +1,278 @@
+"""Local Nix binary cache for MoErgo builds.
+
+MoErgo builds run nix-build in a fresh container, so every store path
+that is not baked into the toolchain image (the Zephyr SDK for a newer
+branch, Python packages, the firmware derivations themselves) is fetched
+from the network or rebuilt on every compilation. Mounting a volume over
+/nix would hide the Nix installation of the image, so NixBinaryCache
+keeps a `file://` binary cache instead:
+
+- <hash>.narinfo: metadata of one store path, its mtime is the last use
+- nar/<file hash>.nar.zst: compressed contents of a store path
+
+Build containers use the directory as an extra substituter, then copy
+every store path that is new after a successful build into it. Least
+recently used paths are removed beyond a size limit while no build is
+using the cache.
+"""
+
+import os
+import re
+import shlex
+import shutil
+import time
+from pathlib import Path
+
+from glovebox.config.models.firmware import FirmwareNixCacheConfig
+from glovebox.core.cache.locking import CacheLock, directory_lock
+from glovebox.core.structlog_logger import get_struct_logger
+from glovebox.firmware.models import BuildCacheStats
+from glovebox.protocols.docker_adapter_protocol import DockerEnv, DockerVolume
+from glovebox.utils.stream_process import OutputMiddleware
+
+
+logger = get_struct_logger(__name__)
+
+# Where build containers see the cache
+CONTAINER_NIX_CACHE_DIR = "/nix-cache"
+
+_SUBSTITUTER_URL = f"file://{CONTAINER_NIX_CACHE_DIR}"
+
+# Prefer the local cache over cache.nixos.org (40) and cachix (41)
+_CACHE_INFO = "StoreDir: /nix/store\nWantMassQuery: 1\nPriority: 10\n"
+
+_COPY_RE = re.compile(r"copying path '/nix/store/([0-9a-z]{32})-[^']*' from '([^']*)'")
+_BUILD_RE = re.compile(r"\b(?:these (\d+) derivations|this derivation) will be built")
+
+
+def _narinfo_url(narinfo: Path) -> str | None:
+    try:
+        for line in narinfo.read_text().splitlines():
+            if line.startswith("URL:"):
+                return line.partition(":")[2].strip()
+    except OSError:
+        pass
+    return None
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+class NixSubstitutionMiddleware(OutputMiddleware[str]):
+    """Count store paths substituted from the local cache, fetched or built.
+
+    Must come before middlewares that rewrite or drop lines.
+    """
+
+    def __init__(self) -> None:
+        self.hits: list[str] = []
+        self.fetched = 0
+        self.built = 0
+
+    def process(self, line: str, stream_type: str) -> str:
+        copy = _COPY_RE.search(line)
+        if copy:
+            if copy.group(2).startswith(_SUBSTITUTER_URL):
+                self.hits.append(copy.group(1))
+            else:
+                self.fetched += 1
+            return line
+
+        build = _BUILD_RE.search(line)
+        if build:
+            self.built += int(build.group(1) or 1)
+        return line
+
+    def stats(self) -> BuildCacheStats:
+        """Get the hits and misses counted so far."""
+        return BuildCacheStats(
+            nix_cache_hits=len(self.hits),
+            nix_cache_misses=self.fetched + self.built,
+        )
+
+
+class NixBinaryCache:
+    """Binary cache directory of Nix store paths, shared by MoErgo builds."""
+
+    def __init__(self, root: Path, max_size_mb: int = 8192) -> None:
+        """Initialize the cache.
+
+        Args:
+            root: Directory of the binary cache
+            max_size_mb: Size limit of all cached store paths in MB
+        """
+        self.root = root
+        self.max_size_mb = max_size_mb
+
+    @property
+    def nar_dir(self) -> Path:
+        """Directory of the compressed store path contents."""
+        return self.root / "nar"
+
+    def ensure(self) -> None:
+        """Create the cache directory with its nix-cache-info file."""
+        self.nar_dir.mkdir(parents=True, exist_ok=True)
+        info = self.root / "nix-cache-info"
+        if not info.exists():
+            info.write_text(_CACHE_INFO)
+
+    def volume(self) -> DockerVolume:
+        """Get the mount of the cache in build containers."""
+        return (str(self.root), CONTAINER_NIX_CACHE_DIR)
+
+    def environment(self) -> DockerEnv:
+        """Get the environment making Nix substitute from the cache."""
+        return {
+            "NIX_CONFIG": (
+                "extra-experimental-features = nix-command\n"
+                f"extra-substituters = {_SUBSTITUTER_URL}?trusted=true"
+            )
+        }
+
+    def wrap_command(self, command: list[str]) -> list[str]:
+        """Wrap a build command to copy new store paths into the cache.
+
+        Paths are only copied after a successful build, and the exit code
+        of the build command is kept.
+        """
+        script = "\n".join(
+            [
+                "before=$(mktemp)",
+                'nix path-info --all 2>/dev/null | sort > "$before"',
+                shlex.join(command),
+                "status=$?",
+                'if [ "$status" -eq 0 ]; then',
+                '  nix path-info --all 2>/dev/null | sort | comm -13 "$before" - \\',
+                "    | grep -v '\\.drv$' > \"$before.new\"",
+                '  if [ -s "$before.new" ]; then',
+                '    xargs -a "$before.new" nix copy --to '
+                f"'{_SUBSTITUTER_URL}?compression=zstd' \\",
+                '      || echo "Failed to fill the Nix binary cache" >&2',
+                "  fi",
+                "fi",
+                f'chown -R "${{PUID:-0}}:${{PGID:-0}}" {CONTAINER_NIX_CACHE_DIR} '
+                "2>/dev/null",
+                'rm -f "$before" "$before.new"',
+                'exit "$status"',
+            ]
+        )
+        return ["bash", "-c", script]
+
+    def in_use(self) -> CacheLock:
+        """Get the lock to hold while a build container uses the cache.
+
+        Garbage collection is skipped while any process holds it.
+        """
+        return directory_lock(self.root, shared=True)
+
+    def touch(self, store_hashes: list[str]) -> None:
+        """Mark store paths substituted from the cache as recently used."""
+        now = time.time()
+        for store_hash in store_hashes:
+            try:
+                os.utime(self.root / f"{store_hash}.narinfo", (now, now))
+            except OSError:
+                continue
+
+    def usage(self) -> tuple[int, int]:
+        """Get the number of cached store paths and their size in bytes."""
+        if not self.root.is_dir():
+            return 0, 0
+        entries = list(self.root.glob("*.narinfo"))
+        size = sum(_file_size(narinfo) for narinfo in entries)
+        if self.nar_dir.is_dir():
+            size += sum(_file_size(nar) for nar in self.nar_dir.iterdir())
+        return len(entries), size
+
+    def collect_garbage(self, max_size_mb: int | None = None) -> int:
+        """Remove least recently used store paths beyond the size limit.
+
+        Nothing is removed while a process holds in_use().
+
+        Args:
+            max_size_mb: Size limit, the configured limit if None
+
+        Returns:
+            Number of removed store paths
+        """
+        if not self.root.is_dir():
+            return 0
+        cache_lock = directory_lock(self.root)
+        if not cache_lock.acquire(blocking=False):
+            logger.debug("nix_cache_gc_skipped_cache_in_use")
+            return 0
+        try:
+            return self._remove_least_recently_used(
+                (self.max_size_mb if max_size_mb is None else max_size_mb) * 1024 * 1024
+            )
+        finally:
+            cache_lock.release()
+
+    def _remove_least_recently_used(self, limit: int) -> int:
+        entries = []
+        for narinfo in self.root.glob("*.narinfo"):
+            try:
+                mtime = narinfo.stat().st_mtime
+            except OSError:
+                continue
+            url = _narinfo_url(narinfo)
+            nar = self.root / url if url else None
+            size = _file_size(narinfo) + (_file_size(nar) if nar else 0)
+            entries.append((mtime, size, narinfo, nar))
+
+        total = sum(size for _, size, _, _ in entries)
+        removed = 0
+        for _, size, narinfo, nar in sorted(entries, key=lambda entry: entry[0]):
+            if total <= limit:
+                break
+            narinfo.unlink(missing_ok=True)
+            if nar is not None:
+                nar.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        self._remove_orphaned_nars()
+        if removed:
+            logger.info(
+                "nix_cache_pruned",
+                removed=removed,
+                remaining_mb=round(total / 1024 / 1024, 1),
+            )
+        return removed
+
+    def _remove_orphaned_nars(self) -> None:
+        """Remove contents no store path refers to, left by interrupted copies."""
+        if not self.nar_dir.is_dir():
+            return
+        referenced = {
+            url
+            for narinfo in self.root.glob("*.narinfo")
+            if (url := _narinfo_url(narinfo))
+        }
+        for nar in self.nar_dir.iterdir():
+            if f"nar/{nar.name}" not in referenced:
+                if nar.is_dir():
+                    shutil.rmtree(nar, ignore_errors=True)
+                else:
+                    nar.unlink(missing_ok=True)
+
+
+def create_nix_binary_cache(
+    cache_root: Path, config: FirmwareNixCacheConfig
+) -> NixBinaryCache | None:
+    """Create the Nix binary cache below a cache root if enabled.
+
+    Args:
+        cache_root: Glovebox cache root directory
+        config: Nix cache settings from the user config
+
+    Returns:
+        NixBinaryCache instance, or None if the Nix cache is disabled
+    """
+    if not config.enabled:
+        return None
+    return NixBinaryCache(cache_root / "nix-cache", max_size_mb=config.max_size_mb)
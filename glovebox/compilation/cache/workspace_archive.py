@@ -0,0 +1,966 @@
+"""Parallel export and import of workspace archives.
+
+A workspace archive holds the workspace files below workspace/, the export
+metadata and, as its last member, a manifest with the size and SHA-256 of
+every file, so imports can verify files while extracting them.
+
+Worker threads read and hash files ahead of the thread writing the
+archive. For zip archives they also deflate each member, and files larger
+than STREAM_FILE_SIZE are deflated in chunks by the workers, each chunk
+primed with the end of the previous one as pigz does. zstd-compressed tar
+archives are compressed by zstd's own worker threads. The read-ahead is
+bounded by READ_AHEAD_BYTES, so memory use does not grow with the
+workspace.
+
+Imports extract members in the same bounded way: worker threads decompress
+zip members, while tar archives, which can only be read in order, are
+decompressed by the calling thread and written out by the workers. Member
+names are checked against path traversal, and the files are verified
+against the manifest: as they are extracted for zip archives, at the end for
+tar archives whose manifest is their last member.
+
+Optional libraries:
+    zstandard: tar.zst archives (the ``cache`` extra)
+"""
+
+import contextlib
+import hashlib
+import io
+import os
+import stat
+import tarfile
+import time
+import zipfile
+import zlib
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import IO, Any
+
+from pydantic import ValidationError
+
+from glovebox.compilation.cache.models import (
+    ArchiveFormat,
+    WorkspaceArchiveEntry,
+    WorkspaceArchiveManifest,
+    WorkspaceCacheMetadata,
+)
+from glovebox.core.errors import WorkspaceArchiveError
+from glovebox.core.file_operations.models import CopyProgress, CopyProgressCallback
+from glovebox.core.structlog_logger import get_struct_logger
+
+
+logger = get_struct_logger(__name__)
+
+# Member names inside workspace archives
+ARCHIVE_ROOT = "workspace"
+METADATA_NAME = ".glovebox_export_metadata.json"
+MANIFEST_NAME = ".glovebox_manifest.json"
+
+# Files above this size are streamed instead of read into memory at once
+STREAM_FILE_SIZE = 16 * 1024 * 1024
+# Chunk size for reading streamed files and deflating them in parallel
+CHUNK_SIZE = 1024 * 1024
+# Upper bound of file data read ahead of the archive writer
+READ_AHEAD_BYTES = 128 * 1024 * 1024
+
+# Deflate window, also the dictionary size used to prime chunk compressors
+_DEFLATE_WINDOW = 32 * 1024
+# Seconds between progress callbacks
+_PROGRESS_INTERVAL = 0.1
+
+_TAR_COMPRESSION = {
+    ArchiveFormat.TAR: "",
+    ArchiveFormat.TAR_GZ: "gz",
+    ArchiveFormat.TAR_BZ2: "bz2",
+    ArchiveFormat.TAR_XZ: "xz",
+}
+
+
+@dataclass
+class ArchiveExportStats:
+    """Statistics of a workspace archive export."""
+
+    files: int
+    total_bytes: int
+    archive_bytes: int
+    duration_seconds: float
+
+    @property
+    def throughput_mb_s(self) -> float:
+        """Uncompressed MB archived per second."""
+        if self.duration_seconds > 0:
+            return self.total_bytes / (1024 * 1024) / self.duration_seconds
+        return 0.0
+
+
+@dataclass
+class _SourceFile:
+    path: Path
+    name: str
+    size: int
+
+
+@dataclass
+class _PreparedFile:
+    """File read, hashed and possibly deflated by a worker."""
+
+    data: bytes
+    size: int
+    mode: int
+    mtime: float
+    sha256: str
+    crc: int
+    deflated: bool
+
+
+def _default_workers() -> int:
+    return min(8, os.cpu_count() or 1)
+
+
+def _scan_workspace(workspace_path: Path, include_git: bool) -> list[_SourceFile]:
+    """List regular files (following file symlinks) in archive order."""
+    files: list[_SourceFile] = []
+
+    def scan(directory: Path, prefix: str) -> None:
+        with os.scandir(directory) as iterator:
+            entries = sorted(iterator, key=lambda entry: entry.name)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if include_git or entry.name != ".git":
+                    scan(Path(entry.path), f"{prefix}{entry.name}/")
+            elif entry.is_file():
+                files.append(
+                    _SourceFile(
+                        Path(entry.path), prefix + entry.name, entry.stat().st_size
+                    )
+                )
+
+    scan(workspace_path, "")
+    return files
+
+
+def _prepare_file(source: _SourceFile, zip_level: int | None) -> _PreparedFile:
+    """Read and hash a file, deflating it for zip archives."""
+    with source.path.open("rb") as f:
+        data = f.read()
+        file_stat = os.fstat(f.fileno())
+    prepared = _PreparedFile(
+        data=data,
+        size=len(data),
+        mode=file_stat.st_mode,
+        mtime=file_stat.st_mtime,
+        sha256=hashlib.sha256(data).hexdigest(),
+        crc=zlib.crc32(data),
+        deflated=False,
+    )
+    if zip_level is not None:
+        compressor = zlib.compressobj(zip_level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        deflated = compressor.compress(data) + compressor.flush()
+        # Incompressible files are stored as they are
+        if len(deflated) < len(data):
+            prepared.data = deflated
+            prepared.deflated = True
+    return prepared
+
+
+def _deflate_chunk(chunk: bytes, dictionary: bytes, level: int, last: bool) -> bytes:
+    """Deflate one chunk of a file so the chunks can be concatenated."""
+    if dictionary:
+        compressor = zlib.compressobj(
+            level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=dictionary
+        )
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    flush_mode = zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH
+    return compressor.compress(chunk) + compressor.flush(flush_mode)
+
+
+class _HashingReader:
+    """File wrapper hashing what is read through it."""
+
+    def __init__(self, file: IO[bytes]) -> None:
+        self.file = file
+        self.hasher = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.file.read(size)
+        self.hasher.update(data)
+        return data
+
+
+class _ArchiveWriter(ABC):
+    """Writes members of one archive format."""
+
+    @abstractmethod
+    def add_bytes(self, name: str, data: bytes) -> None:
+        """Add a member from memory."""
+
+    @abstractmethod
+    def add_prepared(self, name: str, prepared: _PreparedFile) -> None:
+        """Add a file prepared by a worker."""
+
+    @abstractmethod
+    def add_streamed(
+        self, name: str, path: Path, executor: ThreadPoolExecutor
+    ) -> tuple[int, str]:
+        """Add a large file, returning its size and SHA-256."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Finish the archive."""
+
+
+class _ZipWriter(_ArchiveWriter):
+    """Zip writer taking members deflated by worker threads.
+
+    zipfile has no API for members compressed elsewhere, so their headers
+    are written the way ZipFile.write() writes them.
+    """
+
+    def __init__(self, output_path: Path, level: int) -> None:
+        self.level = level
+        self.archive = zipfile.ZipFile(
+            output_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=level
+        )
+
+    @property
+    def _fp(self) -> IO[bytes]:
+        assert self.archive.fp is not None
+        return self.archive.fp
+
+    def _zip_info(self, name: str, mode: int, mtime: float) -> zipfile.ZipInfo:
+        date_time = max(time.localtime(mtime)[:6], (1980, 1, 1, 0, 0, 0))
+        info = zipfile.ZipInfo(name, date_time=date_time)
+        info.external_attr = (mode & 0xFFFF) << 16
+        return info
+
+    def _register(self, info: zipfile.ZipInfo) -> None:
+        self.archive.filelist.append(info)
+        self.archive.NameToInfo[info.filename] = info
+        self.archive.start_dir = self._fp.tell()
+
+    def add_bytes(self, name: str, data: bytes) -> None:
+        self.archive.writestr(name, data)
+
+    def add_prepared(self, name: str, prepared: _PreparedFile) -> None:
+        info = self._zip_info(name, prepared.mode, prepared.mtime)
+        info.compress_type = (
+            zipfile.ZIP_DEFLATED if prepared.deflated else zipfile.ZIP_STORED
+        )
+        info.file_size = prepared.size
+        info.compress_size = len(prepared.data)
+        info.CRC = prepared.crc
+        info.header_offset = self._fp.tell()
+        self._fp.write(info.FileHeader())
+        self._fp.write(prepared.data)
+        self._register(info)
+
+    def add_streamed(
+        self, name: str, path: Path, executor: ThreadPoolExecutor
+    ) -> tuple[int, str]:
+        hasher = hashlib.sha256()
+        crc = 0
+        size = 0
+        with path.open("rb") as src:
+            file_stat = os.fstat(src.fileno())
+            info = self._zip_info(name, file_stat.st_mode, file_stat.st_mtime)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.file_size = file_stat.st_size
+            # Placeholders until the data is written
+            info.CRC = 0
+            info.compress_size = 0
+            zip64 = file_stat.st_size * 1.05 > zipfile.ZIP64_LIMIT
+            info.header_offset = self._fp.tell()
+            header = info.FileHeader(zip64)
+            self._fp.write(header)
+
+            # Deflate chunks in parallel, writing them in order
+            pending: deque[Future[bytes]] = deque()
+            max_pending = max(2, READ_AHEAD_BYTES // CHUNK_SIZE)
+            dictionary = b""
+            chunk = src.read(CHUNK_SIZE)
+            while chunk:
+                next_chunk = src.read(CHUNK_SIZE)
+                hasher.update(chunk)
+                crc = zlib.crc32(chunk, crc)
+                size += len(chunk)
+                pending.append(
+                    executor.submit(
+                        _deflate_chunk, chunk, dictionary, self.level, not next_chunk
+                    )
+                )
+                dictionary = chunk[-_DEFLATE_WINDOW:]
+                chunk = next_chunk
+                while len(pending) >= max_pending:
+                    self._fp.write(pending.popleft().result())
+            while pending:
+                self._fp.write(pending.popleft().result())
+            if size == 0:
+                # The file was emptied since the scan
+                self._fp.write(_deflate_chunk(b"", b"", self.level, True))
+
+        end = self._fp.tell()
+        info.CRC = crc
+        info.file_size = size
+        info.compress_size = end - info.header_offset - len(header)
+        if not zip64 and max(size, info.compress_size) > zipfile.ZIP64_LIMIT:
+            raise WorkspaceArchiveError(f"{name} grew beyond the zip64 limit")
+        # Rewrite the header with the final sizes and CRC
+        self._fp.seek(info.header_offset)
+        self._fp.write(info.FileHeader(zip64))
+        self._fp.seek(end)
+        self._register(info)
+        return size, hasher.hexdigest()
+
+    def close(self) -> None:
+        self.archive.close()
+
+
+class _TarWriter(_ArchiveWriter):
+    """Tar writer, compressed by tarfile or by zstd worker threads."""
+
+    def __init__(
+        self,
+        output_path: Path,
+        archive_format: ArchiveFormat,
+        level: int,
+        threads: int,
+    ) -> None:
+        self.file = output_path.open("wb")
+        self.zstd_writer: Any = None
+        try:
+            if archive_format == ArchiveFormat.TAR_ZST:
+                try:
+                    import zstandard
+                except ImportError as e:
+                    raise WorkspaceArchiveError(
+                        "tar.zst archives require zstandard"
+                    ) from e
+                self.zstd_writer = zstandard.ZstdCompressor(
+                    level=level, threads=threads
+                ).stream_writer(self.file, closefd=False)
+                self.tar = tarfile.open(fileobj=self.zstd_writer, mode="w|")  # noqa: SIM115
+            else:
+                compression = _TAR_COMPRESSION[archive_format]
+                options: dict[str, int] = {}
+                if compression in ("gz", "bz2"):
+                    options["compresslevel"] = level
+                elif compression == "xz":
+                    options["preset"] = level
+                self.tar = tarfile.open(  # type: ignore[call-overload]  # noqa: SIM115
+                    fileobj=self.file, mode=f"w:{compression}", **options
+                )
+        except BaseException:
+            self.file.close()
+            raise
+
+    def add_bytes(self, name: str, data: bytes) -> None:
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        self.tar.addfile(info, io.BytesIO(data))
+
+    def _tar_info(
+        self, name: str, size: int, mode: int, mtime: float
+    ) -> tarfile.TarInfo:
+        info = tarfile.TarInfo(name)
+        info.size = size
+        info.mode = stat.S_IMODE(mode)
+        info.mtime = int(mtime)
+        return info
+
+    def add_prepared(self, name: str, prepared: _PreparedFile) -> None:
+        info = self._tar_info(name, prepared.size, prepared.mode, prepared.mtime)
+        self.tar.addfile(info, io.BytesIO(prepared.data))
+
+    def add_streamed(
+        self, name: str, path: Path, executor: ThreadPoolExecutor
+    ) -> tuple[int, str]:
+        with path.open("rb") as src:
+            file_stat = os.fstat(src.fileno())
+            info = self._tar_info(
+                name, file_stat.st_size, file_stat.st_mode, file_stat.st_mtime
+            )
+            reader = _HashingReader(src)
+            self.tar.addfile(info, reader)
+        return info.size, reader.hasher.hexdigest()
+
+    def close(self) -> None:
+        try:
+            self.tar.close()
+            if self.zstd_writer is not None:
+                self.zstd_writer.close()
+        finally:
+            self.file.close()
+
+
+def _prepared_files(
+    files: list[_SourceFile], executor: ThreadPoolExecutor, zip_level: int | None
+) -> Iterator[tuple[_SourceFile, _PreparedFile | None]]:
+    """Yield files in order, prepared by workers ahead of the caller.
+
+    Files above STREAM_FILE_SIZE are yielded unprepared for streaming.
+    """
+    window: deque[tuple[_SourceFile, Future[_PreparedFile] | None]] = deque()
+    window_bytes = 0
+    remaining = iter(files)
+    exhausted = False
+    while True:
+        while not exhausted and window_bytes < READ_AHEAD_BYTES:
+            source = next(remaining, None)
+            if source is None:
+                exhausted = True
+            elif source.size > STREAM_FILE_SIZE:
+                window.append((source, None))
+            else:
+                window.append(
+                    (source, executor.submit(_prepare_file, source, zip_level))
+                )
+                window_bytes += source.size
+        if not window:
+            return
+        source, future = window.popleft()
+        if future is None:
+            yield source, None
+        else:
+            window_bytes -= source.size
+            yield source, future.result()
+
+
+def create_workspace_archive(
+    workspace_path: Path,
+    output_path: Path,
+    archive_format: ArchiveFormat,
+    compression_level: int,
+    include_git: bool,
+    metadata: WorkspaceCacheMetadata,
+    progress_callback: CopyProgressCallback | None = None,
+    max_workers: int | None = None,
+) -> ArchiveExportStats:
+    """Archive a workspace with a manifest of file hashes.
+
+    Args:
+        workspace_path: Workspace directory to archive
+        output_path: Archive file to create
+        archive_format: Archive format
+        compression_level: Compression level for the format
+        include_git: Whether to include .git folders
+        metadata: Workspace metadata stored in the archive
+        progress_callback: Optional callback receiving progress and throughput
+        max_workers: Worker threads, a default based on the CPU count if None
+
+    Returns:
+        Statistics of the export
+
+    Raises:
+        WorkspaceArchiveError: If the format is unavailable or a file changes
+            while it is archived
+        OSError: If files cannot be read or the archive cannot be written
+    """
+    start_time = time.monotonic()
+    workers = max_workers or _default_workers()
+    files = _scan_workspace(workspace_path, include_git)
+    total_bytes = sum(source.size for source in files)
+    manifest = WorkspaceArchiveManifest()
+    zip_level = compression_level if archive_format == ArchiveFormat.ZIP else None
+
+    writer: _ArchiveWriter
+    if archive_format == ArchiveFormat.ZIP:
+        writer = _ZipWriter(output_path, compression_level)
+    else:
+        writer = _TarWriter(output_path, archive_format, compression_level, workers)
+
+    report = _progress_reporter(
+        progress_callback, "export", len(files), total_bytes, start_time
+    )
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="archive")
+    try:
+        metadata_json = metadata.model_dump_json(indent=2)
+        writer.add_bytes(METADATA_NAME, metadata_json.encode("utf-8"))
+
+        archived_bytes = 0
+        for number, (source, prepared) in enumerate(
+            _prepared_files(files, executor, zip_level), start=1
+        ):
+            name = f"{ARCHIVE_ROOT}/{source.name}"
+            if prepared is None:
+                size, sha256 = writer.add_streamed(name, source.path, executor)
+            else:
+                writer.add_prepared(name, prepared)
+                sha256 = prepared.sha256
+                size = prepared.size
+            manifest.files[source.name] = WorkspaceArchiveEntry(
+                size=size, sha256=sha256
+            )
+            archived_bytes += size
+            report(number, archived_bytes, source.name, number == len(files))
+
+        writer.add_bytes(MANIFEST_NAME, manifest.model_dump_json().encode("utf-8"))
+        writer.close()
+    except BaseException:
+        executor.shutdown(wait=True, cancel_futures=True)
+        with contextlib.suppress(Exception):
+            writer.close()
+        output_path.unlink(missing_ok=True)
+        raise
+    executor.shutdown()
+
+    stats = ArchiveExportStats(
+        files=len(files),
+        total_bytes=manifest.total_bytes,
+        archive_bytes=output_path.stat().st_size,
+        duration_seconds=time.monotonic() - start_time,
+    )
+    logger.debug(
+        "workspace_archive_created",
+        archive_format=archive_format.value,
+        files=stats.files,
+        total_mb=round(stats.total_bytes / 1024 / 1024, 1),
+        archive_mb=round(stats.archive_bytes / 1024 / 1024, 1),
+        throughput_mb_s=round(stats.throughput_mb_s, 1),
+        workers=workers,
+    )
+    return stats
+
+
+@dataclass
+class ArchiveImportStats:
+    """Statistics of a workspace archive import."""
+
+    files: int
+    total_bytes: int
+    duration_seconds: float
+    verified: bool
+    metadata: WorkspaceCacheMetadata | None = None
+
+    @property
+    def throughput_mb_s(self) -> float:
+        """Uncompressed MB extracted per second."""
+        if self.duration_seconds > 0:
+            return self.total_bytes / (1024 * 1024) / self.duration_seconds
+        return 0.0
+
+
+def _member_path(name: str, strip_root: bool) -> PurePosixPath | None:
+    """Return the path of a member below the target directory.
+
+    Members of exported archives outside ARCHIVE_ROOT are not extracted.
+
+    Returns:
+        Relative path, None if the member is not extracted
+
+    Raises:
+        WorkspaceArchiveError: If the name escapes the target directory
+    """
+    path = PurePosixPath(name)
+    if path.is_absolute() or ".." in path.parts:
+        raise WorkspaceArchiveError(f"Archive member escapes the workspace: {name}")
+    parts = path.parts
+    if strip_root:
+        if parts[:1] != (ARCHIVE_ROOT,):
+            return None
+        parts = parts[1:]
+    if not parts:
+        return None
+    return PurePosixPath(*parts)
+
+
+def _write_stream(path: Path, source: IO[bytes]) -> tuple[int, str]:
+    """Copy a file object to a file, returning its size and SHA-256."""
+    hasher = hashlib.sha256()
+    size = 0
+    with path.open("wb") as dst:
+        while chunk := source.read(CHUNK_SIZE):
+            hasher.update(chunk)
+            dst.write(chunk)
+            size += len(chunk)
+    return size, hasher.hexdigest()
+
+
+def _write_bytes(path: Path, data: bytes, mode: int, mtime: float) -> tuple[int, str]:
+    """Write a file from memory, returning its size and SHA-256."""
+    path.write_bytes(data)
+    _set_attributes(path, mode, mtime)
+    return len(data), hashlib.sha256(data).hexdigest()
+
+
+def _set_attributes(path: Path, mode: int, mtime: float) -> None:
+    """Apply the permission bits and modification time of a member.
+
+    Setuid, setgid and sticky bits are cleared, as tarfile's data filter does.
+    """
+    permissions = mode & 0o777
+    if permissions:
+        path.chmod(permissions)
+    os.utime(path, (mtime, mtime))
+
+
+def _hash_file(path: Path) -> tuple[int, str]:
+    """Return the size and SHA-256 of a file."""
+    hasher = hashlib.sha256()
+    size = 0
+    with path.open("rb") as src:
+        while chunk := src.read(CHUNK_SIZE):
+            hasher.update(chunk)
+            size += len(chunk)
+    return size, hasher.hexdigest()
+
+
+class _Extraction:
+    """State of one archive extraction shared by the format readers."""
+
+    def __init__(
+        self,
+        target_dir: Path,
+        include_git: bool,
+        report: Callable[[int, int, str, bool], None],
+    ) -> None:
+        self.target_dir = target_dir
+        self.real_target = os.path.realpath(target_dir)
+        self.include_git = include_git
+        self.report = report
+        self.strip_root = False
+        self.manifest: WorkspaceArchiveManifest | None = None
+        self.metadata: WorkspaceCacheMetadata | None = None
+        self.files: dict[str, WorkspaceArchiveEntry] = {}
+        self.total_bytes = 0
+        self._directories: set[Path] = set()
+
+    def read_export_member(self, name: str, data: bytes) -> None:
+        """Load the export metadata or manifest of an exported archive."""
+        if name == MANIFEST_NAME:
+            try:
+                self.manifest = WorkspaceArchiveManifest.model_validate_json(data)
+            except ValidationError as e:
+                raise WorkspaceArchiveError(f"Invalid archive manifest: {e}") from e
+            for key, entry in self.files.items():
+                self._verify(key, entry)
+        else:
+            try:
+                self.metadata = WorkspaceCacheMetadata.model_validate_json(data)
+            except ValidationError as e:
+                logger.debug("export_metadata_unreadable", error=str(e))
+
+    def output_path(self, name: str) -> tuple[str, Path] | None:
+        """Validate a member name, returning its manifest key and target path.
+
+        Returns None for members that are skipped.
+        """
+        relative = _member_path(name, self.strip_root)
+        if relative is None or (not self.include_git and ".git" in relative.parts):
+            return None
+        return relative.as_posix(), self.target_dir / relative
+
+    def make_parent(self, path: Path) -> None:
+        """Create the parent directory of a file, once per directory."""
+        parent = path.parent
+        if parent not in self._directories:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._directories.add(parent)
+
+    def check_link(self, path: Path, target: str, name: str) -> None:
+        """Ensure a link created at path resolves inside the target directory."""
+        resolved = os.path.realpath(path.parent / target)
+        if os.path.commonpath([self.real_target, resolved]) != self.real_target:
+            raise WorkspaceArchiveError(
+                f"Archive link escapes the workspace: {name} -> {target}"
+            )
+
+    def record(self, key: str, size: int, sha256: str) -> None:
+        """Record an extracted file, verifying it if the manifest is loaded."""
+        entry = WorkspaceArchiveEntry(size=size, sha256=sha256)
+        if self.manifest is not None:
+            self._verify(key, entry)
+        self.files[key] = entry
+        self.total_bytes += size
+        self.report(len(self.files), self.total_bytes, key, False)
+
+    def _verify(self, key: str, entry: WorkspaceArchiveEntry) -> None:
+        assert self.manifest is not None
+        expected = self.manifest.files.get(key)
+        if expected is None:
+            raise WorkspaceArchiveError(f"{key} is not listed in the archive manifest")
+        if expected != entry:
+            raise WorkspaceArchiveError(f"{key} does not match the archive manifest")
+
+    def finish(self) -> None:
+        """Check that every file in the manifest was extracted."""
+        if self.manifest is not None:
+            expected = set(self.manifest.files)
+            if not self.include_git:
+                expected = {
+                    key for key in expected if ".git" not in PurePosixPath(key).parts
+                }
+            missing = expected - self.files.keys()
+            if missing:
+                raise WorkspaceArchiveError(
+                    f"{len(missing)} files of the archive manifest are missing, "
+                    f"e.g. {min(missing)}"
+                )
+        self.report(len(self.files), self.total_bytes, "", True)
+
+
+def _extract_zip(
+    archive: zipfile.ZipFile,
+    extraction: _Extraction,
+    executor: ThreadPoolExecutor,
+    workers: int,
+) -> None:
+    """Extract a zip archive, decompressing members in worker threads.
+
+    The workers share the archive: ZipFile serializes reads of the
+    underlying file, members are decompressed by the thread reading them.
+    """
+
+    def extract(info: zipfile.ZipInfo, path: Path) -> tuple[int, str]:
+        with archive.open(info) as source:
+            size, sha256 = _write_stream(path, source)
+        mtime = time.mktime((*info.date_time, 0, 0, -1))
+        _set_attributes(path, info.external_attr >> 16, mtime)
+        return size, sha256
+
+    names = archive.NameToInfo
+    if METADATA_NAME in names or MANIFEST_NAME in names:
+        extraction.strip_root = True
+        for name in (METADATA_NAME, MANIFEST_NAME):
+            if name in names:
+                extraction.read_export_member(name, archive.read(name))
+
+    pending: deque[tuple[str, Future[tuple[int, str]]]] = deque()
+    for info in archive.infolist():
+        output = extraction.output_path(info.filename)
+        if output is None:
+            continue
+        key, path = output
+        if info.is_dir():
+            path.mkdir(parents=True, exist_ok=True)
+            continue
+        extraction.make_parent(path)
+        pending.append((key, executor.submit(extract, info, path)))
+        while len(pending) >= workers * 4:
+            key, future = pending.popleft()
+            extraction.record(key, *future.result())
+    while pending:
+        key, future = pending.popleft()
+        extraction.record(key, *future.result())
+
+
+def _open_tar_stream(archive_format: ArchiveFormat, file: IO[bytes]) -> tarfile.TarFile:
+    """Open a tar archive for reading its members in order."""
+    if archive_format == ArchiveFormat.TAR_ZST:
+        try:
+            import zstandard
+        except ImportError as e:
+            raise WorkspaceArchiveError("tar.zst archives require zstandard") from e
+        reader = zstandard.ZstdDecompressor().stream_reader(file)
+        return tarfile.open(fileobj=reader, mode="r|")
+    return tarfile.open(fileobj=file, mode="r|*")
+
+
+def _extract_tar(
+    archive_path: Path,
+    archive_format: ArchiveFormat,
+    extraction: _Extraction,
+    executor: ThreadPoolExecutor,
+    workers: int,
+) -> None:
+    """Extract a tar archive, writing members in worker threads.
+
+    Tar archives are read in order by this thread. Files up to
+    STREAM_FILE_SIZE are read into memory and written by workers, bounded
+    by READ_AHEAD_BYTES; larger files are written by this thread.
+    """
+    pending: deque[tuple[str, int, Future[tuple[int, str]]]] = deque()
+    pending_bytes = 0
+
+    def collect() -> None:
+        nonlocal pending_bytes
+        key, size, future = pending.popleft()
+        pending_bytes -= size
+        extraction.record(key, *future.result())
+
+    with (
+        archive_path.open("rb") as file,
+        _open_tar_stream(archive_format, file) as tar,
+    ):
+        for index, member in enumerate(tar):
+            if index == 0 and member.name == METADATA_NAME:
+                extraction.strip_root = True
+            if extraction.strip_root and member.name in (METADATA_NAME, MANIFEST_NAME):
+                source = tar.extractfile(member)
+                if source is not None:
+                    extraction.read_export_member(member.name, source.read())
+                continue
+
+            output = extraction.output_path(member.name)
+            if output is None:
+                continue
+            key, path = output
+            if member.isdir():
+                path.mkdir(parents=True, exist_ok=True)
+                continue
+            extraction.make_parent(path)
+
+            if member.isreg():
+                source = tar.extractfile(member)
+                assert source is not None
+                if member.size > STREAM_FILE_SIZE:
+                    size, sha256 = _write_stream(path, source)
+                    _set_attributes(path, member.mode, member.mtime)
+                    extraction.record(key, size, sha256)
+                    continue
+                data = source.read()
+                pending.append(
+                    (
+                        key,
+                        len(data),
+                        executor.submit(
+                            _write_bytes, path, data, member.mode, member.mtime
+                        ),
+                    )
+                )
+                pending_bytes += len(data)
+                while pending and (
+                    pending_bytes > READ_AHEAD_BYTES or len(pending) >= workers * 4
+                ):
+                    collect()
+            elif member.issym():
+                extraction.check_link(path, member.linkname, member.name)
+                path.symlink_to(member.linkname)
+            elif member.islnk():
+                link = extraction.output_path(member.linkname)
+                if link is None:
+                    raise WorkspaceArchiveError(
+                        f"Archive link target is not extracted: {member.name}"
+                    )
+                # The linked file may still be written by a worker
+                while pending:
+                    collect()
+                extraction.check_link(path, str(link[1]), member.name)
+                path.hardlink_to(link[1])
+                extraction.record(key, *_hash_file(path))
+            else:
+                raise WorkspaceArchiveError(
+                    f"Unsupported archive member type: {member.name}"
+                )
+        while pending:
+            collect()
+
+
+def extract_workspace_archive(
+    archive_path: Path,
+    target_dir: Path,
+    archive_format: ArchiveFormat,
+    include_git: bool = True,
+    progress_callback: CopyProgressCallback | None = None,
+    max_workers: int | None = None,
+) -> ArchiveImportStats:
+    """Extract a workspace archive, verifying it against its manifest.
+
+    Archives exported by glovebox are extracted without their workspace/
+    prefix, their export metadata and manifest are read instead of being
+    extracted. Other archives are extracted as they are and not verified.
+    The target directory is left as it is on failure, callers extracting
+    into a fresh directory remove it.
+
+    Args:
+        archive_path: Archive file to extract
+        target_dir: Directory to extract into
+        archive_format: Archive format
+        include_git: Whether to extract .git folders
+        progress_callback: Optional callback receiving progress and throughput
+        max_workers: Worker threads, a default based on the CPU count if None
+
+    Returns:
+        Statistics of the import with the export metadata, if any
+
+    Raises:
+        WorkspaceArchiveError: If a member escapes the target directory, a
+            file does not match the manifest or the format is unavailable
+        OSError: If the archive cannot be read or files cannot be written
+    """
+    start_time = time.monotonic()
+    workers = max_workers or _default_workers()
+    target_dir.mkdir(parents=True, exist_ok=True)
+
+    with contextlib.ExitStack() as stack:
+        zip_archive: zipfile.ZipFile | None = None
+        total_files = 0
+        total_bytes = 0
+        if archive_format == ArchiveFormat.ZIP:
+            # Zip archives list their members up front, tar archives do not
+            zip_archive = stack.enter_context(zipfile.ZipFile(archive_path))
+            infos = [info for info in zip_archive.infolist() if not info.is_dir()]
+            total_files = len(infos)
+            total_bytes = sum(info.file_size for info in infos)
+        report = _progress_reporter(
+            progress_callback, "import", total_files, total_bytes, start_time
+        )
+        extraction = _Extraction(target_dir, include_git, report)
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="archive")
+        try:
+            if zip_archive is not None:
+                _extract_zip(zip_archive, extraction, executor, workers)
+            else:
+                _extract_tar(
+                    archive_path, archive_format, extraction, executor, workers
+                )
+            extraction.finish()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    stats = ArchiveImportStats(
+        files=len(extraction.files),
+        total_bytes=extraction.total_bytes,
+        duration_seconds=time.monotonic() - start_time,
+        verified=extraction.manifest is not None,
+        metadata=extraction.metadata,
+    )
+    logger.debug(
+        "workspace_archive_extracted",
+        archive_format=archive_format.value,
+        files=stats.files,
+        total_mb=round(stats.total_bytes / 1024 / 1024, 1),
+        throughput_mb_s=round(stats.throughput_mb_s, 1),
+        verified=stats.verified,
+        workers=workers,
+    )
+    return stats
+
+
+def _progress_reporter(
+    progress_callback: CopyProgressCallback | None,
+    component_name: str,
+    total_files: int,
+    total_bytes: int,
+    start_time: float,
+) -> Callable[[int, int, str, bool], None]:
+    """Create a function reporting progress at most every _PROGRESS_INTERVAL."""
+    last_report = 0.0
+
+    def report(files: int, processed_bytes: int, current_file: str, done: bool) -> None:
+        nonlocal last_report
+        if progress_callback is None:
+            return
+        now = time.monotonic()
+        if not done and now - last_report < _PROGRESS_INTERVAL:
+            return
+        last_report = now
+        progress_callback(
+            CopyProgress(
+                files_processed=files,
+                total_files=total_files,
+                bytes_copied=processed_bytes,
+                total_bytes=total_bytes,
+                current_file=current_file,
+                component_name=component_name,
+                elapsed_seconds=now - start_time,
+            )
+        )
+
+    return report
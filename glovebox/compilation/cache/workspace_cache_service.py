@@ -1,5 +1,6 @@
 """Simplified ZMK workspace cache service with repo and repo+branch caching."""
 
+import contextlib
 import logging
 import shutil
 from datetime import datetime
@@ -24,6 +25,7 @@ from glovebox.compilation.cache.models import (
 from glovebox.config.models.cache import CacheLevel
 from glovebox.config.user_config import UserConfig
 from glovebox.core.cache.cache_manager import CacheManager
+from glovebox.core.cache.locking import create_staging_directory, publish_directory
 from glovebox.core.cache.models import CacheKey
 from glovebox.core.file_operations import (
     CopyProgress,
@@ -236,8 +238,10 @@ class ZmkWorkspaceCacheService:
                     error_message=f"Cached workspace path no longer exists: {metadata.workspace_path}",
                 )
 
-            # Update access time
+            # Update access time (directory mtime is what cache GC ranks by)
             metadata.update_access_time()
+            with contextlib.suppress(OSError):
+                metadata.workspace_path.touch()
 
             # Update cache with new access time
             ttls = self.get_ttls_for_cache_levels()
@@ -291,7 +295,8 @@ class ZmkWorkspaceCacheService:
         archives directly into the cache location, supporting multiple formats.
 
         Args:
-            archive_path: Path to archive file (.zip, .tar.gz, .tar.bz2, .tar.xz)
+            archive_path: Path to archive file (.zip, .tar, .tar.gz, .tar.bz2,
+                .tar.xz, .tar.zst)
             repository: Git repository name
             branch: Git branch name (None for repo-only caching)
             progress_context: Optional progress context (defaults to NoOp if None)
@@ -506,32 +511,30 @@ class ZmkWorkspaceCacheService:
             List of WorkspaceCacheMetadata for all cached workspaces
         """
         try:
-            all_keys = self.cache_manager.keys()
-            workspace_keys = [
-                key
-                for key in all_keys
-                if key.startswith("workspace_repo_")
-                or key.startswith("workspace_repo_branch_")
-            ]
-
             workspaces = []
-            for key in workspace_keys:
+            stale_keys = []
+            # Both repo-only and repo+branch keys share the "workspace_repo_" prefix
+            for key, cached_data in self.cache_manager.iter_items(
+                prefix="workspace_repo_"
+            ):
                 try:
-                    cached_data = self.cache_manager.get(key)
                     if cached_data:
                         metadata = WorkspaceCacheMetadata.from_cache_value(cached_data)
                         # Verify workspace still exists
                         if metadata.workspace_path.exists():
                             workspaces.append(metadata)
                         else:
-                            # Clean up stale entry
-                            self.cache_manager.delete(key)
-                            self.logger.debug("Cleaned up stale cache entry: %s", key)
+                            stale_keys.append(key)
                 except Exception as e:
                     self.logger.warning(
                         "Failed to parse cached metadata for %s: %s", key, e
                     )
 
+            if stale_keys:
+                # Clean up stale entries in one batch
+                self.cache_manager.delete_many(stale_keys)
+                self.logger.debug("Cleaned up stale cache entries: %s", stale_keys)
+
             return workspaces
 
         except Exception as e:
@@ -668,41 +671,26 @@ class ZmkWorkspaceCacheService:
                 #         f"Exporting to {archive_format.value}",
                 #     )
 
-                # Calculate workspace size for progress tracking
-                original_size = self._calculate_directory_size(workspace_path)
-                files_count = sum(1 for _ in workspace_path.rglob("*") if _.is_file())
-
-                # Create the archive
-                from glovebox.cli.commands.cache.workspace_processing import (
-                    create_tar_archive,
-                    create_zip_archive,
+                # Create the archive; sizes come from the files archived
+                from glovebox.compilation.cache.workspace_archive import (
+                    create_workspace_archive,
                 )
 
-                if archive_format == ArchiveFormat.ZIP:
-                    create_zip_archive(
-                        workspace_path,
-                        output_path,
-                        compression_level,
-                        include_git,
-                        metadata,
-                        progress_callback,
-                        progress_context=None,
-                    )
-                else:
-                    create_tar_archive(
-                        workspace_path,
-                        output_path,
-                        archive_format,
-                        compression_level,
-                        include_git,
-                        metadata,
-                        progress_callback,
-                        progress_context=None,
-                    )
+                archive_stats = create_workspace_archive(
+                    workspace_path,
+                    output_path,
+                    archive_format,
+                    compression_level,
+                    include_git,
+                    metadata,
+                    progress_callback,
+                )
 
                 # Calculate final statistics
                 export_duration = time.time() - start_time
-                archive_size = output_path.stat().st_size if output_path.exists() else 0
+                archive_size = archive_stats.archive_bytes
+                original_size = archive_stats.total_bytes
+                files_count = archive_stats.files
                 compression_ratio = (
                     archive_size / original_size if original_size > 0 else 0.0
                 )
@@ -803,6 +791,7 @@ class ZmkWorkspaceCacheService:
         if progress_context is None:
             progress_context = get_noop_progress_context()
 
+        staging_dir: Path | None = None
         try:
             workspace_path = workspace_path.resolve()
 
@@ -817,7 +806,10 @@ class ZmkWorkspaceCacheService:
             self.logger.debug("Generating %s", cache_key)
             cache_base_dir = self.get_cache_directory()
             cached_workspace_dir = cache_base_dir / cache_key
-            cached_workspace_dir.mkdir(parents=True, exist_ok=True)
+
+            # Copy into a private staging directory and publish it atomically,
+            # so concurrent processes never read a partially copied workspace
+            staging_dir = create_staging_directory(cached_workspace_dir)
 
             # Detect workspace components
             detected_components = []
@@ -869,11 +861,7 @@ class ZmkWorkspaceCacheService:
 
             for component_idx, component in enumerate(detected_components):
                 src_component = workspace_path / component
-                dest_component = cached_workspace_dir / component
-
-                # Remove existing if it exists
-                if dest_component.exists():
-                    shutil.rmtree(dest_component)
+                dest_component = staging_dir / component
 
                 # Create enhanced progress callback that updates all progress systems
                 component_progress_callback = None
@@ -968,7 +956,9 @@ class ZmkWorkspaceCacheService:
                 )
 
             # Calculate workspace size
-            workspace_size = self._calculate_directory_size(cached_workspace_dir)
+            workspace_size = self._calculate_directory_size(staging_dir)
+            publish_directory(staging_dir, cached_workspace_dir)
+            staging_dir = None
 
             # Create metadata
             metadata = WorkspaceCacheMetadata(
@@ -1042,6 +1032,8 @@ class ZmkWorkspaceCacheService:
         except Exception as e:
             exc_info = self.logger.isEnabledFor(logging.DEBUG)
             self.logger.error("Failed to cache workspace: %s", e, exc_info=exc_info)
+            if staging_dir is not None:
+                shutil.rmtree(staging_dir, ignore_errors=True)
 
             # Fail the current checkpoint
             progress_context.fail_checkpoint("Copying to Cache")
@@ -1532,6 +1524,8 @@ class ZmkWorkspaceCacheService:
             return "tar.bz2"
         elif suffix == ".xz" and name.endswith(".tar.xz"):
             return "tar.xz"
+        elif suffix == ".zst" and name.endswith(".tar.zst"):
+            return "tar.zst"
         elif suffix in [".tar"]:
             return "tar"
 
@@ -1584,32 +1578,20 @@ class ZmkWorkspaceCacheService:
                 f"Extracting {archive_format} archive directly to cache", "info"
             )
 
-            extracted_bytes = 0
-            total_bytes = 0
-            extracted_files = 0
+            # Extract concurrently, verifying files against the archive manifest
+            from glovebox.compilation.cache.workspace_archive import (
+                extract_workspace_archive,
+            )
 
-            if archive_format == "zip":
-                extracted_bytes, total_bytes, extracted_files = (
-                    self._extract_zip_to_cache(
-                        archive_path, cache_dir, include_git, progress_context
-                    )
-                )
-            elif archive_format.startswith("tar"):
-                extracted_bytes, total_bytes, extracted_files = (
-                    self._extract_tar_to_cache(
-                        archive_path,
-                        archive_format,
-                        cache_dir,
-                        include_git,
-                        progress_context,
-                    )
-                )
-            else:
-                progress_context.fail_checkpoint("Extracting Files")
-                return WorkspaceCacheResult(
-                    success=False,
-                    error_message=f"Unsupported archive format: {archive_format}",
-                )
+            import_stats = extract_workspace_archive(
+                archive_path,
+                cache_dir,
+                ArchiveFormat(archive_format),
+                include_git=include_git,
+                progress_callback=self._extraction_progress_callback(progress_context),
+            )
+            extracted_bytes = import_stats.total_bytes
+            extracted_files = import_stats.files
 
             progress_context.complete_checkpoint("Extracting Files")
             progress_context.log(
@@ -1640,20 +1622,21 @@ class ZmkWorkspaceCacheService:
 
             progress_context.complete_checkpoint("Copying to Cache")
 
-            # Calculate final workspace size
-            workspace_size = self._calculate_directory_size(cache_dir)
-
-            # Create metadata
+            # Create metadata; the size comes from the files extracted
+            export_metadata = import_stats.metadata
             metadata = WorkspaceCacheMetadata(
                 workspace_path=cache_dir,
                 repository=repository,
                 branch=branch,
                 cache_level=cache_level,
                 cached_components=self._detect_workspace_components(cache_dir),
-                size_bytes=workspace_size,
-                notes=f"Extracted from {archive_format} archive, include_git={include_git}",
+                size_bytes=extracted_bytes,
+                notes=(
+                    f"Extracted from {archive_format} archive, "
+                    f"include_git={include_git}, verified={import_stats.verified}"
+                ),
                 # Explicitly provide optional fields to satisfy mypy
-                commit_hash=None,
+                commit_hash=export_metadata.commit_hash if export_metadata else None,
                 keymap_hash=None,
                 config_hash=None,
                 auto_detected=False,
@@ -1737,231 +1720,43 @@ class ZmkWorkspaceCacheService:
                 success=False, error_message=f"Failed to extract archive to cache: {e}"
             )
 
-    def _extract_zip_to_cache(
-        self,
-        archive_path: Path,
-        cache_dir: Path,
-        include_git: bool,
-        progress_context: "ProgressContextProtocol | None" = None,
-    ) -> tuple[int, int, int]:
-        """Extract ZIP archive directly to cache directory.
-
-        Returns:
-            Tuple of (extracted_bytes, total_bytes, extracted_files)
-        """
-        import time
-        import zipfile
-
-        with zipfile.ZipFile(archive_path, "r") as zip_ref:
-            file_list = zip_ref.infolist()
-            total_uncompressed_size = sum(info.file_size for info in file_list)
-
-            extracted_bytes = 0
-            extracted_files = 0
-            start_time = time.time()
-
-            for i, file_info in enumerate(file_list):
-                # Skip .git files if not including git
-                if not include_git and "/.git/" in file_info.filename:
-                    continue
-
-                # Extract file
-                zip_ref.extract(file_info, cache_dir)
-                extracted_bytes += file_info.file_size
-                extracted_files += 1
-
-                # Update progress every 50 files or for last file
-                if progress_context and (
-                    (i + 1) % 50 == 0 or (i + 1) == len(file_list)
-                ):
-                    elapsed_time = time.time() - start_time
-                    speed_mb_s = 0.0
-                    eta_seconds = 0.0
-
-                    if elapsed_time > 0 and extracted_bytes > 0:
-                        speed_mb_s = (extracted_bytes / (1024 * 1024)) / elapsed_time
-                        if speed_mb_s > 0:
-                            remaining_bytes = total_uncompressed_size - extracted_bytes
-                            eta_seconds = remaining_bytes / (speed_mb_s * 1024 * 1024)
-
-                    progress_context.update_progress(
-                        current=extracted_bytes,
-                        total=total_uncompressed_size,
-                        status=f"Extracting to cache: {file_info.filename}",
-                    )
+    def _extraction_progress_callback(
+        self, progress_context: "ProgressContextProtocol"
+    ) -> CopyProgressCallback:
+        """Create a callback forwarding archive extraction progress.
 
-                    progress_context.set_status_info(
-                        {
-                            "current_file": file_info.filename,
-                            "files_remaining": len(file_list) - (i + 1),
-                            "bytes_copied": extracted_bytes,
-                            "total_bytes": total_uncompressed_size,
-                            "transfer_speed": speed_mb_s,
-                            "eta_seconds": eta_seconds,
-                        }
-                    )
-
-            return extracted_bytes, total_uncompressed_size, extracted_files
-
-    def _extract_tar_to_cache(
-        self,
-        archive_path: Path,
-        archive_format: str,
-        cache_dir: Path,
-        include_git: bool,
-        progress_context: "ProgressContextProtocol | None" = None,
-    ) -> tuple[int, int, int]:
-        """Extract TAR archive directly to cache directory.
-
-        Returns:
-            Tuple of (extracted_bytes, total_bytes, extracted_files)
-        """
-        import tarfile
-        import time
-
-        # Determine compression mode and use context manager directly
-        if archive_format == "tar.gz":
-            with tarfile.open(str(archive_path), "r:gz") as tar_ref:
-                members = tar_ref.getmembers()
-                total_uncompressed_size = sum(
-                    member.size for member in members if member.isfile()
-                )
-
-                extracted_bytes = 0
-                extracted_files = 0
-                start_time = time.time()
-
-                for i, member in enumerate(members):
-                    # Skip .git files if not including git
-                    if not include_git and "/.git/" in member.name:
-                        continue
-
-                    # Extract member
-                    tar_ref.extract(member, cache_dir)
-                    if member.isfile():
-                        extracted_bytes += member.size
-                        extracted_files += 1
-
-                    # Update progress every 50 files or for last file
-                    if progress_context and (
-                        (i + 1) % 50 == 0 or (i + 1) == len(members)
-                    ):
-                        elapsed_time = time.time() - start_time
-                        speed_mb_s = 0.0
-                        eta_seconds = 0.0
-
-                        if elapsed_time > 0 and extracted_bytes > 0:
-                            speed_mb_s = (
-                                extracted_bytes / (1024 * 1024)
-                            ) / elapsed_time
-                            if speed_mb_s > 0:
-                                remaining_bytes = (
-                                    total_uncompressed_size - extracted_bytes
-                                )
-                                eta_seconds = remaining_bytes / (
-                                    speed_mb_s * 1024 * 1024
-                                )
-
-                        progress_context.update_progress(
-                            current=extracted_bytes,
-                            total=total_uncompressed_size,
-                            status=f"Extracting to cache: {member.name}",
-                        )
-
-                        progress_context.set_status_info(
-                            {
-                                "current_file": member.name,
-                                "files_remaining": len(members) - (i + 1),
-                                "bytes_copied": extracted_bytes,
-                                "total_bytes": total_uncompressed_size,
-                                "transfer_speed": speed_mb_s,
-                                "eta_seconds": eta_seconds,
-                            }
-                        )
-
-                return extracted_bytes, total_uncompressed_size, extracted_files
-
-        elif archive_format == "tar.bz2":
-            with tarfile.open(str(archive_path), "r:bz2") as tar_ref:
-                # Same logic as above - to avoid code duplication, let's use a helper
-                return self._extract_tar_members(
-                    tar_ref, cache_dir, include_git, progress_context
-                )
-        elif archive_format == "tar.xz":
-            with tarfile.open(str(archive_path), "r:xz") as tar_ref:
-                return self._extract_tar_members(
-                    tar_ref, cache_dir, include_git, progress_context
-                )
-        else:
-            with tarfile.open(str(archive_path), "r") as tar_ref:
-                return self._extract_tar_members(
-                    tar_ref, cache_dir, include_git, progress_context
-                )
-
-    def _extract_tar_members(
-        self,
-        tar_ref: Any,
-        cache_dir: Path,
-        include_git: bool,
-        progress_context: "ProgressContextProtocol | None" = None,
-    ) -> tuple[int, int, int]:
-        """Extract tar file members to cache directory.
+        Args:
+            progress_context: Progress context to update
 
         Returns:
-            Tuple of (extracted_bytes, total_bytes, extracted_files)
+            Callback for extract_workspace_archive
         """
-        import time
-
-        members = tar_ref.getmembers()
-        total_uncompressed_size = sum(
-            member.size for member in members if member.isfile()
-        )
 
-        extracted_bytes = 0
-        extracted_files = 0
-        start_time = time.time()
+        def callback(progress: CopyProgress) -> None:
+            eta_seconds = 0.0
+            if progress.speed_mbps > 0 and progress.total_bytes > 0:
+                remaining_bytes = progress.total_bytes - progress.bytes_copied
+                eta_seconds = remaining_bytes / (progress.speed_mbps * 1024 * 1024)
 
-        for i, member in enumerate(members):
-            # Skip .git files if not including git
-            if not include_git and "/.git/" in member.name:
-                continue
-
-            # Extract member
-            tar_ref.extract(member, cache_dir)
-            if member.isfile():
-                extracted_bytes += member.size
-                extracted_files += 1
-
-            # Update progress every 50 files or for last file
-            if progress_context and ((i + 1) % 50 == 0 or (i + 1) == len(members)):
-                elapsed_time = time.time() - start_time
-                speed_mb_s = 0.0
-                eta_seconds = 0.0
-
-                if elapsed_time > 0 and extracted_bytes > 0:
-                    speed_mb_s = (extracted_bytes / (1024 * 1024)) / elapsed_time
-                    if speed_mb_s > 0:
-                        remaining_bytes = total_uncompressed_size - extracted_bytes
-                        eta_seconds = remaining_bytes / (speed_mb_s * 1024 * 1024)
-
-                progress_context.update_progress(
-                    current=extracted_bytes,
-                    total=total_uncompressed_size,
-                    status=f"Extracting to cache: {member.name}",
-                )
-
-                progress_context.set_status_info(
-                    {
-                        "current_file": member.name,
-                        "files_remaining": len(members) - (i + 1),
-                        "bytes_copied": extracted_bytes,
-                        "total_bytes": total_uncompressed_size,
-                        "transfer_speed": speed_mb_s,
-                        "eta_seconds": eta_seconds,
-                    }
-                )
+            progress_context.update_progress(
+                current=progress.bytes_copied,
+                total=progress.total_bytes,
+                status=f"Extracting to cache: {progress.current_file}",
+            )
+            progress_context.set_status_info(
+                {
+                    "current_file": progress.current_file,
+                    "files_remaining": max(
+                        progress.total_files - progress.files_processed, 0
+                    ),
+                    "bytes_copied": progress.bytes_copied,
+                    "total_bytes": progress.total_bytes,
+                    "transfer_speed": progress.speed_mbps,
+                    "eta_seconds": eta_seconds,
+                }
+            )
 
-        return extracted_bytes, total_uncompressed_size, extracted_files
+        return callback
 
     def _analyze_workspace_structure(self, cache_dir: Path) -> dict[str, Any]:
         """Analyze workspace structure in extracted cache content.
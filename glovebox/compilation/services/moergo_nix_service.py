@@ -4,9 +4,15 @@ with the nix toolchain
 
 import logging
 import tempfile
+from contextlib import nullcontext
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from glovebox.compilation.cache.nix_binary_cache import (
+    NixBinaryCache,
+    NixSubstitutionMiddleware,
+    create_nix_binary_cache,
+)
 from glovebox.compilation.models import (
     CompilationConfigUnion,
     MoergoCompilationConfig,
@@ -14,8 +20,10 @@ from glovebox.compilation.models import (
 from glovebox.compilation.protocols.compilation_protocols import (
     CompilationServiceProtocol,
 )
+from glovebox.config.models.firmware import UserFirmwareConfig
 from glovebox.core.file_operations import CompilationProgressCallback
 from glovebox.firmware.models import (
+    BuildCacheStats,
     BuildResult,
     FirmwareOutputFiles,
     create_build_info_file,
@@ -30,6 +38,7 @@ from glovebox.protocols import (
 
 if TYPE_CHECKING:
     from glovebox.config.profile import KeyboardProfile
+    from glovebox.config.user_config import UserConfig
     from glovebox.layout.models import LayoutData
     from glovebox.protocols.progress_context_protocol import ProgressContextProtocol
 
@@ -43,13 +52,16 @@ class MoergoNixService(CompilationServiceProtocol):
         file_adapter: FileAdapterProtocol,
         session_metrics: MetricsProtocol,
         default_progress_callback: "CompilationProgressCallback | None" = None,
+        user_config: "UserConfig | None" = None,
     ) -> None:
         """Initialize with Docker adapter, file adapter, and session metrics."""
         self.docker_adapter = docker_adapter
         self.file_adapter = file_adapter
         self.session_metrics = session_metrics
         self.default_progress_callback = default_progress_callback
+        self.user_config = user_config
         self.logger = logging.getLogger(__name__)
+        self._last_build_cache_stats: BuildCacheStats | None = None
 
     def compile(
         self,
@@ -347,6 +359,15 @@ class MoergoNixService(CompilationServiceProtocol):
             )
             # Set unified success messages for MoErgo builds
             result.set_success_messages("moergo_nix", was_cached=False)
+            if self._last_build_cache_stats is not None:
+                result.build_cache_stats = self._last_build_cache_stats
+                stats = self._last_build_cache_stats
+                if stats.nix_hit_rate is not None:
+                    result.add_message(
+                        f"Nix cache: {stats.nix_cache_hits} of "
+                        f"{stats.nix_cache_hits + stats.nix_cache_misses} "
+                        f"store paths reused ({stats.nix_hit_rate:.0%})"
+                    )
             return result
 
         except Exception as e:
@@ -590,6 +611,14 @@ class MoergoNixService(CompilationServiceProtocol):
                     board_names = ["Firmware"]
 
             middlewares: list[Any] = []
+            self._last_build_cache_stats = None
+
+            # Count Nix substitutions before the filter rewrites any line
+            nix_cache = self._create_nix_binary_cache()
+            nix_middleware: NixSubstitutionMiddleware | None = None
+            if nix_cache is not None:
+                nix_middleware = NixSubstitutionMiddleware()
+                middlewares.append(nix_middleware)
 
             # Create filter middleware FIRST to clean output before logging
             filter_middleware = create_build_output_filter_middleware(progress_context)
@@ -723,22 +752,32 @@ class MoergoNixService(CompilationServiceProtocol):
                 "REPO": config.repository,
                 "BRANCH": config.branch,
             }
+            volumes = [workspace_path.vol()]
+            command = ["build.sh"]  # Use the build script, not direct nix-build
+            if nix_cache is not None:
+                volumes.append(nix_cache.volume())
+                environment.update(nix_cache.environment())
+                command = nix_cache.wrap_command(command)
 
             try:
-                return_code, _, stderr = self.docker_adapter.run_container(
-                    image=config.image,
-                    volumes=[workspace_path.vol()],
-                    environment=environment,
-                    progress_context=progress_context,
-                    command=["build.sh"],  # Use the build script, not direct nix-build
-                    middleware=create_chained_middleware(middlewares),
-                    user_context=user_context,
-                )
+                with nix_cache.in_use() if nix_cache else nullcontext():
+                    return_code, _, stderr = self.docker_adapter.run_container(
+                        image=config.image,
+                        volumes=volumes,
+                        environment=environment,
+                        progress_context=progress_context,
+                        command=command,
+                        middleware=create_chained_middleware(middlewares),
+                        user_context=user_context,
+                    )
             finally:
                 # Always close the middlewares in reverse order
                 build_log_middleware.close()
                 filter_middleware.close()
 
+            if nix_cache is not None and nix_middleware is not None:
+                self._finish_nix_cache(nix_cache, nix_middleware)
+
             if return_code != 0:
                 self.logger.error("Build failed with exit code %d", return_code)
                 return False
@@ -748,6 +787,42 @@ class MoergoNixService(CompilationServiceProtocol):
             self.logger.error("Docker execution failed: %s", e)
             return False
 
+    def _create_nix_binary_cache(self) -> NixBinaryCache | None:
+        """Create the Nix binary cache if enabled in the user config."""
+        config_data = getattr(self.user_config, "_config", None)
+        cache_root = getattr(config_data, "cache_path", None)
+        firmware_config = getattr(config_data, "firmware", None)
+        if not isinstance(cache_root, Path) or not isinstance(
+            firmware_config, UserFirmwareConfig
+        ):
+            return None
+        nix_cache = create_nix_binary_cache(cache_root, firmware_config.nix_cache)
+        if nix_cache is None:
+            return None
+        try:
+            nix_cache.ensure()
+        except OSError as e:
+            self.logger.warning("Nix binary cache unavailable: %s", e)
+            return None
+        return nix_cache
+
+    def _finish_nix_cache(
+        self, nix_cache: NixBinaryCache, nix_middleware: NixSubstitutionMiddleware
+    ) -> None:
+        """Record cache hits and misses, then prune the cache to its limit."""
+        nix_cache.touch(nix_middleware.hits)
+        stats = nix_middleware.stats()
+        self._last_build_cache_stats = stats
+        self.logger.info(
+            "Nix cache hits: %d, misses: %d",
+            stats.nix_cache_hits,
+            stats.nix_cache_misses,
+        )
+        try:
+            nix_cache.collect_garbage()
+        except OSError as e:
+            self.logger.warning("Failed to prune the Nix binary cache: %s", e)
+
     def _collect_files(
         self,
         workspace_path: Path,
@@ -1035,6 +1110,7 @@ def create_moergo_nix_service(
     file_adapter: FileAdapterProtocol,
     session_metrics: MetricsProtocol,
     default_progress_callback: "CompilationProgressCallback | None" = None,
+    user_config: "UserConfig | None" = None,
 ) -> MoergoNixService:
     """Create Moergo nix service with session metrics for progress tracking.
 
@@ -1043,10 +1119,15 @@ def create_moergo_nix_service(
         file_adapter: File adapter for file operations
         session_metrics: Session metrics for tracking operations
         default_progress_callback: Optional default progress callback for compilation tracking
+        user_config: Optional user config with the Nix cache settings
 
     Returns:
         Configured MoergoNixService instance
     """
     return MoergoNixService(
-        docker_adapter, file_adapter, session_metrics, default_progress_callback
+        docker_adapter,
+        file_adapter,
+        session_metrics,
+        default_progress_callback,
+        user_config=user_config,
     )
@@ -1,11 +1,20 @@
 """Workspace creation service for direct Docker-based ZMK workspace setup."""
 
+import contextlib
 import logging
 import tempfile
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from glovebox.adapters.docker_session import (
+    DockerSessionAdapter,
+    create_docker_session_adapter,
+)
+from glovebox.compilation.cache.git_mirror_store import (
+    GitMirrorStore,
+    create_git_mirror_store,
+)
 from glovebox.compilation.cache.models import (
     WorkspaceCacheMetadata,
     WorkspaceCacheResult,
@@ -15,7 +24,10 @@ from glovebox.compilation.parsers.repository_spec_parser import (
     create_repository_spec_parser,
 )
 from glovebox.config.models.cache import CacheLevel
+from glovebox.config.models.firmware import FirmwareDockerConfig, UserFirmwareConfig
 from glovebox.config.user_config import UserConfig
+from glovebox.core.cache.locking import CacheLock
+from glovebox.core.errors import GitMirrorError
 from glovebox.core.file_operations import (
     CompilationProgressCallback,
     FileCopyService,
@@ -24,6 +36,7 @@ from glovebox.core.file_operations import (
 from glovebox.models.docker import DockerUserContext
 from glovebox.protocols import (
     DockerAdapterProtocol,
+    DockerContainerBackendProtocol,
     FileAdapterProtocol,
     MetricsProtocol,
 )
@@ -85,6 +98,36 @@ class WorkspaceCreationService:
         )
         self.repository_parser = create_repository_spec_parser()
 
+        # Warm container shared by the workspace creation phases, if enabled
+        self.container_sessions = self._create_container_sessions()
+        # Local mirrors of the repositories cloned into workspaces, if enabled
+        self.git_mirror_store = self._create_git_mirror_store()
+
+    def _create_container_sessions(self) -> DockerSessionAdapter | None:
+        """Create warm container sessions if enabled in the user config."""
+        config_data = getattr(self.user_config, "_config", None)
+        docker_config = getattr(getattr(config_data, "firmware", None), "docker", None)
+        if (
+            not isinstance(docker_config, FirmwareDockerConfig)
+            or not docker_config.reuse_containers
+            or not isinstance(self.docker_adapter, DockerContainerBackendProtocol)
+        ):
+            return None
+        return create_docker_session_adapter(
+            self.docker_adapter, idle_timeout=docker_config.container_idle_timeout
+        )
+
+    def _create_git_mirror_store(self) -> GitMirrorStore | None:
+        """Create the git mirror store if enabled in the user config."""
+        config_data = getattr(self.user_config, "_config", None)
+        cache_root = getattr(config_data, "cache_path", None)
+        firmware_config = getattr(config_data, "firmware", None)
+        if not isinstance(cache_root, Path) or not isinstance(
+            firmware_config, UserFirmwareConfig
+        ):
+            return None
+        return create_git_mirror_store(cache_root, firmware_config.git_mirrors)
+
     def create_workspace(
         self,
         repo_spec: str,
@@ -311,6 +354,8 @@ class WorkspaceCreationService:
                         creation_duration_seconds=time.time() - creation_start_time,
                     )
 
+                self._update_git_mirrors(workspace_path)
+
                 # Phase 4: Create metadata and cache workspace
                 if progress_coordinator:
                     # TODO: Enable after refactoring
@@ -356,6 +401,11 @@ class WorkspaceCreationService:
                     creation_duration_seconds=time.time() - creation_start_time,
                 )
 
+            finally:
+                # The workspace is deleted with the temporary directory
+                if self.container_sessions is not None:
+                    self.container_sessions.close_sessions(workspace_path)
+
     def _determine_docker_image(
         self,
         docker_image: str | None,
@@ -431,9 +481,15 @@ class WorkspaceCreationService:
                 repository_spec.branch,
             )
 
+            clone_command = f"git clone {repository_spec.clone_url} zmk-config"
+            if self.git_mirror_store is not None:
+                clone_command = self._mirrored_clone_command(
+                    repository_spec.clone_url, "zmk-config"
+                )
+
             commands = [
                 "cd /workspace",
-                f"git clone {repository_spec.clone_url} zmk-config",
+                clone_command,
                 "cd zmk-config",
                 f"git checkout {repository_spec.branch}",
                 "git status",
@@ -462,9 +518,15 @@ class WorkspaceCreationService:
         try:
             self.logger.info("Updating workspace dependencies")
 
+            west_update = "west update"
+            if self.git_mirror_store is not None:
+                west_update += (
+                    f" --path-cache {self.git_mirror_store.container_path_cache}"
+                )
+
             commands = [
                 "cd /workspace",
-                "west update",
+                west_update,
                 "west zephyr-export",
                 "west status",
             ]
@@ -516,15 +578,26 @@ class WorkspaceCreationService:
 
             noop_progress_context = get_noop_progress_context()
 
-            result = self.docker_adapter.run_container(
-                image=docker_image,
-                volumes=[(str(workspace_path), "/workspace")],
-                environment={},
-                progress_context=noop_progress_context,
-                command=["sh", "-c", "set -xeu; " + " && ".join(commands)],
-                middleware=chained,
-                user_context=user_context,
+            volumes = [(str(workspace_path), "/workspace")]
+            mirrors_in_use: CacheLock | contextlib.nullcontext[None] = (
+                contextlib.nullcontext()
             )
+            if self.git_mirror_store is not None:
+                self.git_mirror_store.root.mkdir(parents=True, exist_ok=True)
+                volumes.append(self.git_mirror_store.volume)
+                mirrors_in_use = self.git_mirror_store.in_use()
+
+            docker_runner = self.container_sessions or self.docker_adapter
+            with mirrors_in_use:
+                result = docker_runner.run_container(
+                    image=docker_image,
+                    volumes=volumes,
+                    environment={},
+                    progress_context=noop_progress_context,
+                    command=["sh", "-c", "set -xeu; " + " && ".join(commands)],
+                    middleware=chained,
+                    user_context=user_context,
+                )
 
             return_code, stdout, stderr = result
 
@@ -544,6 +617,26 @@ class WorkspaceCreationService:
             )
             return False
 
+    def _mirrored_clone_command(self, url: str, destination: str) -> str:
+        """Refresh the mirror of a repository and get a clone command using it."""
+        assert self.git_mirror_store is not None
+        try:
+            self.git_mirror_store.sync_remote(url)
+        except GitMirrorError as e:
+            self.logger.warning("Cloning %s without git mirror: %s", url, e)
+        return self.git_mirror_store.clone_command(url, destination)
+
+    def _update_git_mirrors(self, workspace_path: Path) -> None:
+        """Add the projects of a new workspace to the git mirrors."""
+        if self.git_mirror_store is None:
+            return
+        try:
+            self.git_mirror_store.add_workspace(workspace_path)
+            self.git_mirror_store.collect_garbage()
+        except Exception as e:
+            # Mirrors only speed up later workspaces
+            self.logger.warning("Failed to update git mirrors: %s", e)
+
     def _generate_west_manifest(self, repository_spec: RepositorySpec) -> str:
         """Generate west.yml manifest content for the repository."""
         manifest_data = {
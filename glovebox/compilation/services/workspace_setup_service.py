@@ -12,6 +12,7 @@ from glovebox.compilation.models.west_config import (
     WestManifest,
     WestManifestConfig,
 )
+from glovebox.core.cache.locking import directory_lock
 from glovebox.core.errors import CompilationError
 from glovebox.core.file_operations import (
     CompilationProgress,
@@ -189,7 +190,23 @@ class WorkspaceSetupService:
         workspace_path: Path,
         progress_callback: CompilationProgressCallback | None = None,
     ) -> None:
-        """Restore workspace from cached directory with enhanced progress tracking."""
+        """Restore workspace from cached directory.
+
+        The shared directory lock keeps other processes from replacing or
+        evicting the cached workspace while it is being copied.
+        """
+        with directory_lock(cached_workspace, shared=True):
+            self._copy_cached_workspace(
+                cached_workspace, workspace_path, progress_callback
+            )
+
+    def _copy_cached_workspace(
+        self,
+        cached_workspace: Path,
+        workspace_path: Path,
+        progress_callback: CompilationProgressCallback | None = None,
+    ) -> None:
+        """Copy workspace from cached directory with enhanced progress tracking."""
         import time
 
         # Detect workspace components and calculate sizes
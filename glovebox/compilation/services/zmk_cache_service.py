@@ -15,6 +15,9 @@ from glovebox.compilation.cache.workspace_cache_service import (
 from glovebox.compilation.models import ZmkCompilationConfig
 from glovebox.config.user_config import UserConfig
 from glovebox.core.cache.cache_manager import CacheManager
+from glovebox.core.cache.locking import CacheLock, lock_path_for
+from glovebox.core.cache.models import CacheKey
+from glovebox.core.errors import CacheLockTimeoutError
 from glovebox.protocols import MetricsProtocol
 
 
@@ -27,6 +30,9 @@ if TYPE_CHECKING:
 class ZmkCacheService:
     """Service for ZMK workspace and build caching operations."""
 
+    # Seconds to wait for another process populating the same workspace
+    POPULATION_LOCK_TIMEOUT = 1800.0
+
     def __init__(
         self,
         user_config: UserConfig,
@@ -56,11 +62,20 @@ class ZmkCacheService:
         else:
             self.build_cache_service = build_cache_service
 
+        # Cross-process locks held while this process populates a workspace
+        self._population_locks: list[CacheLock] = []
+
     def get_cached_workspace(
         self, config: ZmkCompilationConfig
     ) -> tuple[Path | None, bool, str | None]:
         """Get cached workspace if available using new simplified cache.
 
+        On a miss, the population lock for the repository and branch is taken
+        before returning, so concurrent processes build the workspace once.
+        Processes that had to wait re-check the cache and use the workspace
+        the lock holder published. The lock is released by cache_workspace or
+        release_workspace_locks.
+
         Returns:
             Tuple of (workspace_path, cache_was_used, cache_type) or (None, False, None) if no cache found
             cache_type: 'repo_branch' or 'repo_only' to distinguish cache types
@@ -68,6 +83,53 @@ class ZmkCacheService:
         if not config.use_cache or not self.workspace_cache_service:
             return None, False, None
 
+        result = self._lookup_cached_workspace(config)
+        if result[1] or not self._acquire_population_lock(config):
+            return result
+
+        # Another process may have populated the cache while we waited
+        result = self._lookup_cached_workspace(config)
+        if result[1]:
+            self.release_workspace_locks()
+        return result
+
+    def release_workspace_locks(self) -> None:
+        """Release workspace population locks held by this service."""
+        for lock in self._population_locks:
+            lock.release()
+        self._population_locks.clear()
+
+    def _acquire_population_lock(self, config: ZmkCompilationConfig) -> bool:
+        """Take the cross-process lock for populating a workspace cache entry.
+
+        Returns:
+            True if the lock is held, False if locking was not possible
+        """
+        try:
+            cache_dir = self.workspace_cache_service.get_cache_directory()  # type: ignore[union-attr]
+            key = CacheKey.from_parts(config.repository, config.branch)
+            lock = CacheLock(
+                lock_path_for(cache_dir / key, f"populate-{key}"),
+                timeout=self.POPULATION_LOCK_TIMEOUT,
+            )
+            lock.acquire()
+        except CacheLockTimeoutError as e:
+            self.logger.warning("workspace_population_lock_timeout", error=str(e))
+            return False
+        except Exception as e:
+            self.logger.debug("workspace_population_lock_unavailable", error=str(e))
+            return False
+
+        self._population_locks.append(lock)
+        return True
+
+    def _lookup_cached_workspace(
+        self, config: ZmkCompilationConfig
+    ) -> tuple[Path | None, bool, str | None]:
+        """Look up cached workspaces, most specific first."""
+        if not self.workspace_cache_service:
+            return None, False, None
+
         # Try repo+branch lookup first (more specific) - check if it has complete dependencies
         cache_result = self.workspace_cache_service.get_cached_workspace(
             config.repository,
@@ -161,7 +223,10 @@ class ZmkCacheService:
                 config.repository, config.branch, "cache_workspace"
             ).inc()
 
-        self._cache_workspace_internal(workspace_path, config, progress_coordinator)
+        try:
+            self._cache_workspace_internal(workspace_path, config, progress_coordinator)
+        finally:
+            self.release_workspace_locks()
 
     def _cache_workspace_internal(
         self,
@@ -271,7 +336,9 @@ class ZmkCacheService:
 
         except Exception as e:
             exc_info = self.logger.isEnabledFor(logging.DEBUG)
-            self.logger.warning("failed_to_cache_workspace", error=str(e), exc_info=exc_info)
+            self.logger.warning(
+                "failed_to_cache_workspace", error=str(e), exc_info=exc_info
+            )
             # TODO: Enable after refactoring
             # if progress_coordinator:
             #     progress_coordinator.update_cache_saving(
@@ -20,9 +20,23 @@ from glovebox.adapters.compilation_progress_middleware import (
     create_compilation_progress_middleware,
 )
 from glovebox.adapters.docker_adapter import LoggerOutputMiddleware
+from glovebox.adapters.docker_session import (
+    DockerSessionAdapter,
+    create_docker_session_adapter,
+)
 from glovebox.compilation.cache.compilation_build_cache_service import (
     CompilationBuildCacheService,
 )
+from glovebox.compilation.cache.git_mirror_store import (
+    GitMirrorStore,
+    create_git_mirror_store,
+)
+from glovebox.compilation.cache.incremental_build_cache import (
+    IncrementalBuild,
+    IncrementalBuildCache,
+    create_incremental_build_cache,
+    workspace_cache_key,
+)
 from glovebox.compilation.cache.workspace_cache_service import (
     ZmkWorkspaceCacheService,
 )
@@ -42,8 +56,10 @@ from glovebox.compilation.services.zmk_cache_service import (
     ZmkCacheService,
     create_zmk_cache_service,
 )
+from glovebox.config.models.firmware import UserFirmwareConfig
 from glovebox.config.user_config import UserConfig
 from glovebox.core.cache.cache_manager import CacheManager
+from glovebox.core.cache.locking import CacheLock, directory_lock
 from glovebox.core.cache.models import CacheKey
 from glovebox.core.file_operations import (
     CompilationProgressCallback,
@@ -51,6 +67,7 @@ from glovebox.core.file_operations import (
     create_copy_service,
 )
 from glovebox.firmware.models import (
+    BuildCacheStats,
     BuildResult,
     FirmwareOutputFiles,
     create_build_info_file,
@@ -58,9 +75,11 @@ from glovebox.firmware.models import (
 from glovebox.models.docker import DockerUserContext
 from glovebox.protocols import (
     DockerAdapterProtocol,
+    DockerContainerBackendProtocol,
     FileAdapterProtocol,
     MetricsProtocol,
 )
+from glovebox.protocols.docker_adapter_protocol import DockerEnv, DockerVolume
 from glovebox.protocols.progress_coordinator_protocol import ProgressCoordinatorProtocol
 from glovebox.utils.build_log_middleware import create_build_log_middleware
 from glovebox.utils.stream_process import (
@@ -130,6 +149,16 @@ class ZmkWestService(CompilationServiceProtocol):
             session_metrics=session_metrics,
         )
 
+        # Warm build containers, if enabled in user config
+        self.container_sessions = self._create_container_sessions()
+
+        # Compiler cache and preserved build directories, if enabled
+        self.incremental_build_cache = self._create_incremental_build_cache()
+        self._last_build_cache_stats: BuildCacheStats | None = None
+
+        # Local mirrors of west projects for new workspaces, if enabled
+        self.git_mirror_store = self._create_git_mirror_store()
+
     def compile(
         self,
         keymap_file: Path,
@@ -285,7 +314,13 @@ class ZmkWestService(CompilationServiceProtocol):
                     keymap_file, config_file, config
                 )
 
+            cached_output_files = None
             if cached_build_path:
+                cached_output_files = self._collect_cached_build_files(
+                    cached_build_path, output_dir
+                )
+
+            if cached_output_files is not None:
                 if cache_operations:
                     cache_operations.labels("lookup", "hit").inc()
 
@@ -294,7 +329,7 @@ class ZmkWestService(CompilationServiceProtocol):
                 )
                 progress_context.complete_checkpoint("Cache Check")
 
-                output_files = self._collect_files(cached_build_path, output_dir)
+                output_files = cached_output_files
 
                 result = BuildResult(
                     success=True,
@@ -422,6 +457,7 @@ class ZmkWestService(CompilationServiceProtocol):
                     success=False,
                     errors=["Compilation failed"],
                     output_files=output_files,  # Include partial artifacts for debugging
+                    build_cache_stats=self._last_build_cache_stats,
                 )
 
             # Cache the successful build result
@@ -478,9 +514,17 @@ class ZmkWestService(CompilationServiceProtocol):
             build_result = BuildResult(
                 success=True,
                 output_files=output_files,
+                build_cache_stats=self._last_build_cache_stats,
             )
             # Set unified success messages for fresh builds
             build_result.set_success_messages("zmk_west", was_cached=False)
+            hit_rate = (
+                self._last_build_cache_stats.hit_rate
+                if self._last_build_cache_stats
+                else None
+            )
+            if hit_rate is not None:
+                build_result.add_message(f"Compiler cache hit rate: {hit_rate:.0%}")
 
             # Record final compilation metrics
             if self.session_metrics:
@@ -507,6 +551,9 @@ class ZmkWestService(CompilationServiceProtocol):
             exc_info = self.logger.isEnabledFor(logging.DEBUG)
             self.logger.error("Compilation failed: %s", e, exc_info=exc_info)
             return BuildResult(success=False, errors=[str(e)])
+        finally:
+            # Failed builds must not keep other processes waiting to populate
+            self.cache_service.release_workspace_locks()
 
     def compile_from_json(
         self,
@@ -646,6 +693,7 @@ class ZmkWestService(CompilationServiceProtocol):
         progress_context: "ProgressContextProtocol | None" = None,
     ) -> bool:
         """Run Docker compilation with intelligent west update logic."""
+        self._last_build_cache_stats = None
         try:
             # Check if Docker image exists, build if not
             if not self._ensure_docker_image(config):
@@ -681,7 +729,12 @@ class ZmkWestService(CompilationServiceProtocol):
 
             # Only run west update if needed based on cache usage and type
             # if not cache_was_used:
-            base_commands.append("west update")
+            west_update = "west update"
+            if self.git_mirror_store is not None:
+                west_update += (
+                    f" --path-cache {self.git_mirror_store.container_path_cache}"
+                )
+            base_commands.append(west_update)
             # else:
             #     self.logger.info("Skipping west update for cached workspace")
 
@@ -712,8 +765,14 @@ class ZmkWestService(CompilationServiceProtocol):
             )
 
             effective_progress_context = progress_context or get_noop_progress_context()
+            build_log_config = self._get_firmware_config().build_log
             build_log_middleware = create_build_log_middleware(
-                output_dir, effective_progress_context
+                output_dir,
+                effective_progress_context,
+                compression=build_log_config.compression,
+                buffer_size=build_log_config.buffer_size,
+                flush_interval=build_log_config.flush_interval,
+                retain=build_log_config.retain,
             )
 
             # Add build log middleware first to capture all output
@@ -812,39 +871,91 @@ class ZmkWestService(CompilationServiceProtocol):
             middlewares.append(LoggerOutputMiddleware(self.logger))
 
             chained = create_chained_middleware(middlewares)
+
+            volumes: list[DockerVolume] = [(str(workspace_path), "/workspace")]
+            environment: DockerEnv = {}  # {"JOBS": "4"},
+            incremental_build: IncrementalBuild | None = None
+            mirrors_lock: CacheLock | None = None
             try:
-                self.logger.debug(
-                    "zmk_docker_run",
-                    image=config.image,
-                    volumes=[(str(workspace_path), "/workspace")],
-                    environment={},  # {"JOBS": "4"},
-                    progress_context=effective_progress_context,
-                    command=["sh", "-c", "set -xeu; " + " && ".join(all_commands)],
-                    middleware=chained,
-                    user_context=user_context,
-                )
-                result: tuple[int, list[str], list[str]] = (
-                    self.docker_adapter.run_container(
+                if self.git_mirror_store is not None:
+                    self.git_mirror_store.root.mkdir(parents=True, exist_ok=True)
+                    volumes.append(self.git_mirror_store.volume)
+                    mirrors_lock = self.git_mirror_store.in_use()
+                    mirrors_lock.acquire()
+
+                if self.incremental_build_cache is not None:
+                    incremental_build = self._prepare_incremental_build(
+                        workspace_path, config
+                    )
+                    volumes.extend(incremental_build.volumes)
+                    environment.update(incremental_build.environment)
+                    build_commands = (
+                        incremental_build.before_commands
+                        + [
+                            " ".join([command, *incremental_build.cmake_args])
+                            for command in build_commands
+                        ]
+                        + incremental_build.after_commands
+                    )
+                    all_commands = base_commands + build_commands
+
+                # A warm container runs dependency update and build as separate
+                # phases, reporting which one failed at no extra startup cost
+                docker_runner: DockerAdapterProtocol = self.docker_adapter
+                phases = [("Build", all_commands)]
+                if self.container_sessions is not None:
+                    docker_runner = self.container_sessions
+                    phases = [
+                        ("Dependency update", base_commands),
+                        ("Build", ["cd /workspace"] + build_commands),
+                    ]
+
+                for phase_name, phase_commands in phases:
+                    command = ["sh", "-c", "set -xeu; " + " && ".join(phase_commands)]
+                    self.logger.debug(
+                        "zmk_docker_run",
+                        phase=phase_name,
                         image=config.image,
-                        volumes=[(str(workspace_path), "/workspace")],
-                        environment={},  # {"JOBS": "4"},
+                        volumes=volumes,
+                        environment=environment,
                         progress_context=effective_progress_context,
-                        command=["sh", "-c", "set -xeu; " + " && ".join(all_commands)],
+                        command=command,
                         middleware=chained,
                         user_context=user_context,
                     )
-                )
-                return_code, stdout, stderr = result
+                    result: tuple[int, list[str], list[str]] = (
+                        docker_runner.run_container(
+                            image=config.image,
+                            volumes=volumes,
+                            environment=environment,
+                            progress_context=effective_progress_context,
+                            command=command,
+                            middleware=chained,
+                            user_context=user_context,
+                        )
+                    )
+                    return_code, stdout, stderr = result
 
-                if return_code != 0:
-                    self.logger.error("Build failed with exit code %d", return_code)
-                    return False
+                    if return_code != 0:
+                        self.logger.error(
+                            "%s failed with exit code %d", phase_name, return_code
+                        )
+                        return False
 
                 self.logger.info("Build completed successfully")
-                return True
             finally:
                 # Always close the build log middleware
                 build_log_middleware.close()
+                if self.container_sessions is not None:
+                    self.container_sessions.close_sessions(workspace_path)
+                if incremental_build is not None:
+                    self._finish_incremental_build(incremental_build)
+                if mirrors_lock is not None:
+                    mirrors_lock.release()
+
+            if not workspace_initialized:
+                self._update_git_mirrors(workspace_path)
+            return True
         except Exception as e:
             self.logger.error("Docker execution failed: %s", e)
             return False
@@ -854,7 +965,8 @@ class ZmkWestService(CompilationServiceProtocol):
     ) -> list[str]:
         """Generate west build commands from build matrix."""
         try:
-            config_path = workspace_path / "config"
+            # Container path, so CMake caches stay valid across workspaces
+            config_path = "/workspace/config"
             app_relative_path = Path("zmk/app")
 
             build_yaml = workspace_path / "build.yaml"
@@ -929,6 +1041,27 @@ class ZmkWestService(CompilationServiceProtocol):
             self.logger.error("Error extracting board info from config: %s", e)
             return {"total_boards": 1, "board_names": []}
 
+    def _collect_cached_build_files(
+        self, cached_build_path: Path, output_dir: Path
+    ) -> FirmwareOutputFiles | None:
+        """Collect firmware files from a cached build.
+
+        The shared directory lock keeps cache GC and concurrent publishers
+        from replacing or evicting the cached build while it is copied.
+
+        Returns:
+            Collected files, or None if the cached build disappeared
+            after it was looked up
+        """
+        with directory_lock(cached_build_path, shared=True):
+            if not cached_build_path.is_dir():
+                self.logger.info(
+                    "Cached build was evicted before it could be used: %s",
+                    cached_build_path,
+                )
+                return None
+            return self._collect_files(cached_build_path, output_dir)
+
     def _collect_files(
         self, workspace_path: Path, output_dir: Path
     ) -> FirmwareOutputFiles:
@@ -1051,6 +1184,86 @@ class ZmkWestService(CompilationServiceProtocol):
 
         return collected_items
 
+    def _get_firmware_config(self) -> UserFirmwareConfig:
+        """Get firmware settings from user config, defaults if unavailable."""
+        config_data = getattr(self.user_config, "_config", None)
+        firmware_config = getattr(config_data, "firmware", None)
+        if isinstance(firmware_config, UserFirmwareConfig):
+            return firmware_config
+        return UserFirmwareConfig()
+
+    def _create_container_sessions(self) -> DockerSessionAdapter | None:
+        """Create warm container sessions if enabled in the user config."""
+        docker_config = self._get_firmware_config().docker
+        if not docker_config.reuse_containers or not isinstance(
+            self.docker_adapter, DockerContainerBackendProtocol
+        ):
+            return None
+        return create_docker_session_adapter(
+            self.docker_adapter, idle_timeout=docker_config.container_idle_timeout
+        )
+
+    def _create_incremental_build_cache(self) -> IncrementalBuildCache | None:
+        """Create the incremental build cache if enabled in the user config."""
+        config_data = getattr(self.user_config, "_config", None)
+        cache_root = getattr(config_data, "cache_path", None)
+        if not isinstance(cache_root, Path):
+            return None
+        return create_incremental_build_cache(
+            cache_root, self._get_firmware_config().build_cache
+        )
+
+    def _create_git_mirror_store(self) -> GitMirrorStore | None:
+        """Create the git mirror store if enabled in the user config."""
+        config_data = getattr(self.user_config, "_config", None)
+        cache_root = getattr(config_data, "cache_path", None)
+        if not isinstance(cache_root, Path):
+            return None
+        return create_git_mirror_store(
+            cache_root, self._get_firmware_config().git_mirrors
+        )
+
+    def _update_git_mirrors(self, workspace_path: Path) -> None:
+        """Add the west projects of a new workspace to the git mirrors."""
+        if self.git_mirror_store is None:
+            return
+        try:
+            self.git_mirror_store.add_workspace(workspace_path)
+            self.git_mirror_store.collect_garbage()
+        except Exception as e:
+            # Mirrors only speed up later workspaces, never fail the build
+            self.logger.warning("Failed to update git mirrors: %s", e)
+
+    def _prepare_incremental_build(
+        self, workspace_path: Path, config: ZmkCompilationConfig
+    ) -> IncrementalBuild:
+        """Set up compiler cache and preserved build directories for a build."""
+        assert self.incremental_build_cache is not None
+        targets = BuildMatrix.from_yaml(workspace_path / "build.yaml").targets
+
+        # Key on the image ID so a re-pulled toolchain starts new build directories
+        image_parts = config.image.split(":")
+        image_id = self.docker_adapter.image_id(
+            image_parts[0], image_parts[1] if len(image_parts) > 1 else "latest"
+        )
+        return self.incremental_build_cache.prepare(
+            workspace_path,
+            workspace_cache_key(
+                config.repository, config.branch, image_id or config.image
+            ),
+            targets,
+        )
+
+    def _finish_incremental_build(self, incremental_build: IncrementalBuild) -> None:
+        """Record cache statistics; cache failures never fail the build."""
+        assert self.incremental_build_cache is not None
+        try:
+            self._last_build_cache_stats = self.incremental_build_cache.finish(
+                incremental_build
+            )
+        except Exception as e:
+            self.logger.warning("Failed to finish incremental build cache: %s", e)
+
     def _ensure_docker_image(self, config: ZmkCompilationConfig) -> bool:
         """Ensure Docker image exists, pull if not found."""
         try:
@@ -5,12 +5,17 @@ This module provides enhanced configuration loading capabilities that support
 include directives, recursive loading, and configuration composition.
 """
 
+import hashlib
+import os
+import pickle
+import time
 from pathlib import Path
 from typing import Any
 
 import yaml
 from pydantic import ValidationError
 
+from glovebox.config import models as config_models
 from glovebox.config.models import KeyboardConfig
 from glovebox.core.errors import ConfigError
 from glovebox.core.structlog_logger import get_struct_logger
@@ -18,28 +23,98 @@ from glovebox.core.structlog_logger import get_struct_logger
 
 logger = get_struct_logger(__name__)
 
+# Files modified this recently are not trusted to be unchanged when their
+# mtime and size match, since a second write may land in the same tick
+_RACY_WINDOW_NS = 2_000_000_000
+
+# A file's identity for cache validation: path, mtime in ns and size
+FileStamp = tuple[str, int, int]
+
+
+def _file_stamp(path: Path) -> FileStamp | None:
+    """Get the path, mtime and size of a file, None if it cannot be read."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+def get_file_stamps(paths: list[Path]) -> list[FileStamp] | None:
+    """Get the stamps validating a cache entry built from some files.
+
+    Args:
+        paths: Files the cached value was built from
+
+    Returns:
+        Stamps of the files, or None if a file is missing or was modified
+        too recently to trust its stamp, in which case nothing should be cached
+    """
+    stamps = []
+    racy_after = time.time_ns() - _RACY_WINDOW_NS
+    for path in paths:
+        stamp = _file_stamp(path)
+        if stamp is None or stamp[1] > racy_after:
+            logger.debug("file_stamp_untrusted", recent_file=str(path))
+            return None
+        stamps.append(stamp)
+    return stamps
+
+
+def find_changed_file(stamps: list[FileStamp]) -> str | None:
+    """Get the first file whose stamp changed, None if none did."""
+    for path, mtime_ns, size in stamps:
+        if _file_stamp(Path(path)) != (path, mtime_ns, size):
+            return path
+    return None
+
+
+def _model_source_files() -> list[Path]:
+    """Get the source files of the config models.
+
+    They are part of every cache entry so that model changes invalidate
+    configs pickled by an older version of the models.
+    """
+    return sorted(Path(config_models.__file__).parent.glob("*.py"))
+
 
 class IncludeConfigLoader:
-    """Configuration loader with include directive support."""
+    """Configuration loader with include directive support.
+
+    With a cache directory, the merged and validated KeyboardConfig is
+    pickled together with the path, mtime and size of every file it was
+    built from. Later loads stat those files and unpickle the config if none
+    changed, skipping YAML parsing, include merging and validation.
+    """
 
-    def __init__(self, search_paths: list[Path]):
+    def __init__(self, search_paths: list[Path], cache_dir: Path | None = None):
         """Initialize the loader with search paths.
 
         Args:
             search_paths: List of paths to search for configuration files
+            cache_dir: Optional directory caching merged and validated
+                configurations
         """
         self.search_paths = search_paths
+        self.cache_dir = cache_dir
         self._loading_stack: list[Path] = []  # For cycle detection
         self._loaded_files: dict[Path, dict[str, Any]] = {}  # File cache
+        # Each loaded file with all files it includes, directly or not
+        self._file_dependencies: dict[Path, list[Path]] = {}
 
     def load_keyboard_config(
-        self, keyboard_name: str, base_path: Path | None = None
+        self,
+        keyboard_name: str,
+        base_path: Path | None = None,
+        loaded_files: list[Path] | None = None,
     ) -> KeyboardConfig:
         """Load a keyboard configuration with include support.
 
         Args:
             keyboard_name: Name of the keyboard to load
             base_path: Base path for relative include resolution
+            loaded_files: Optional list to track all files the configuration
+                was built from, also filled when it comes from the cache
 
         Returns:
             Typed KeyboardConfig object
@@ -52,8 +127,12 @@ class IncludeConfigLoader:
         if not config_file:
             raise ConfigError(f"Keyboard configuration not found: {keyboard_name}")
 
-        # Track all files that will be loaded
-        loaded_files: list[Path] = []
+        cache_file = self._cache_file(keyboard_name, config_file, base_path)
+        if loaded_files is None:
+            loaded_files = []
+        cached_config = self._get_cached_config(cache_file, loaded_files)
+        if cached_config is not None:
+            return cached_config
 
         # Load the raw configuration with includes resolved
         raw_config = self._load_config_with_includes(
@@ -92,10 +171,95 @@ class IncludeConfigLoader:
                 len(loaded_files),
                 file_list,
             )
-            return typed_config
         except ValidationError as e:
             raise ConfigError(f"Invalid keyboard configuration format: {e}") from e
 
+        self._store_cached_config(cache_file, typed_config, loaded_files)
+        return typed_config
+
+    def _cache_file(
+        self, keyboard_name: str, config_file: Path, base_path: Path | None
+    ) -> Path | None:
+        """Get the cache file for a keyboard configuration.
+
+        Source files are validated separately, so the file name only covers
+        the inputs that decide which files get loaded.
+        """
+        if self.cache_dir is None:
+            return None
+
+        from glovebox import __version__
+
+        key_parts = [
+            __version__,
+            keyboard_name,
+            str(config_file.resolve()),
+            str(base_path),
+            *(str(path) for path in self.search_paths),
+        ]
+        digest = hashlib.sha256("\0".join(key_parts).encode()).hexdigest()
+        return self.cache_dir / f"{keyboard_name}-{digest[:32]}.pickle"
+
+    def _get_cached_config(
+        self, cache_file: Path | None, loaded_files: list[Path]
+    ) -> KeyboardConfig | None:
+        """Get a cached configuration if none of its files changed.
+
+        On a hit, the configuration's source files are added to loaded_files.
+        """
+        if cache_file is None:
+            return None
+
+        try:
+            with cache_file.open("rb") as f:
+                stamps = pickle.load(f)
+                changed_file = find_changed_file(stamps)
+                if changed_file is not None:
+                    logger.debug(
+                        "keyboard_config_cache_stale", changed_file=changed_file
+                    )
+                    return None
+                config = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("keyboard_config_cache_unreadable", error=str(e))
+            return None
+        if not isinstance(config, KeyboardConfig):
+            return None
+
+        logger.debug("keyboard_config_cache_hit", keyboard=config.keyboard)
+        model_files = {str(path) for path in _model_source_files()}
+        loaded_files.extend(
+            Path(path) for path, _, _ in stamps if path not in model_files
+        )
+        return config
+
+    def _store_cached_config(
+        self, cache_file: Path | None, config: KeyboardConfig, loaded_files: list[Path]
+    ) -> None:
+        """Cache a configuration along with the stamps of its source files."""
+        if cache_file is None:
+            return
+
+        stamps = get_file_stamps([*loaded_files, *_model_source_files()])
+        if stamps is None:
+            logger.debug("keyboard_config_not_cached", keyboard=config.keyboard)
+            return
+
+        # Stamps come first so a stale entry is detected before the config
+        # is unpickled; write atomically for concurrent glovebox processes
+        tmp_file = cache_file.with_name(f".{cache_file.name}.{os.getpid()}")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_file.open("wb") as f:
+                pickle.dump(stamps, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_file.replace(cache_file)
+        except Exception as e:
+            logger.debug("keyboard_config_cache_store_failed", error=str(e))
+            tmp_file.unlink(missing_ok=True)
+
     def _find_config_file(self, keyboard_name: str) -> Path | None:
         """Find a configuration file by name.
 
@@ -188,13 +352,13 @@ class IncludeConfigLoader:
 
         # Return cached config if available
         if config_file in self._loaded_files:
-            if config_file not in loaded_files:
-                loaded_files.append(config_file)
+            for path in self._file_dependencies[config_file]:
+                if path not in loaded_files:
+                    loaded_files.append(path)
             return self._loaded_files[config_file]
 
-        # Track this file as being loaded
-        if config_file not in loaded_files:
-            loaded_files.append(config_file)
+        # Track this file and everything it includes
+        file_dependencies = [config_file]
 
         # Add to loading stack for cycle detection
         self._loading_stack.append(config_file)
@@ -214,11 +378,15 @@ class IncludeConfigLoader:
             # Process includes if present (support both "include" and "includes")
             if "include" in raw_config or "includes" in raw_config:
                 raw_config = self._process_includes(
-                    raw_config, config_file, base_path, loaded_files
+                    raw_config, config_file, base_path, file_dependencies
                 )
 
             # Cache the processed configuration
             self._loaded_files[config_file] = raw_config
+            self._file_dependencies[config_file] = file_dependencies
+            for path in file_dependencies:
+                if path not in loaded_files:
+                    loaded_files.append(path)
 
             return raw_config
 
@@ -391,16 +559,21 @@ class IncludeConfigLoader:
     def clear_cache(self) -> None:
         """Clear the loaded file cache."""
         self._loaded_files.clear()
+        self._file_dependencies.clear()
         logger.debug("Cleared include loader cache")
 
 
-def create_include_loader(search_paths: list[Path]) -> IncludeConfigLoader:
+def create_include_loader(
+    search_paths: list[Path], cache_dir: Path | None = None
+) -> IncludeConfigLoader:
     """Create an include configuration loader.
 
     Args:
         search_paths: List of paths to search for configuration files
+        cache_dir: Optional directory caching merged and validated
+            configurations
 
     Returns:
         IncludeConfigLoader instance
     """
-    return IncludeConfigLoader(search_paths)
+    return IncludeConfigLoader(search_paths, cache_dir=cache_dir)
@@ -233,6 +233,8 @@ def create_keyboard_profile(
     keyboard_name: str,
     firmware_version: str | None = None,
     user_config: Optional["UserConfig"] = None,
+    search_paths: list[Path] | None = None,
+    loaded_files: list[Path] | None = None,
 ) -> "KeyboardProfile":  # Forward reference
     """Create a KeyboardProfile for the given keyboard and optional firmware.
 
@@ -243,6 +245,10 @@ def create_keyboard_profile(
         keyboard_name: Name of the keyboard
         firmware_version: Version of firmware to use (optional)
         user_config: Optional user configuration instance
+        search_paths: Keyboard search paths, from initialize_search_paths()
+            if not given
+        loaded_files: Optional list to track the files the keyboard
+            configuration was built from
 
     Returns:
         KeyboardProfile configured for the keyboard and firmware
@@ -253,7 +259,7 @@ def create_keyboard_profile(
     """
     # Delegate to the include-aware implementation
     return create_keyboard_profile_with_includes(
-        keyboard_name, firmware_version, user_config
+        keyboard_name, firmware_version, user_config, search_paths, loaded_files
     )
 
 
@@ -299,8 +305,42 @@ def clear_cache() -> None:
     logger.debug("Cleared keyboard configuration cache")
 
 
+def _get_keyboard_config_cache_dir(
+    user_config: Optional["UserConfig"] = None,
+) -> Path | None:
+    """Get the directory caching merged keyboard configurations.
+
+    The cache honours the same switches as the other glovebox caches:
+    GLOVEBOX_CACHE_GLOBAL, GLOVEBOX_CACHE_KEYBOARD_CONFIG and a disabled
+    cache strategy in the user configuration.
+
+    Args:
+        user_config: Optional user configuration providing the cache location
+
+    Returns:
+        Cache directory, or None if caching is disabled
+    """
+    disabled_values = ("false", "0", "disabled")
+    for env_var in ("GLOVEBOX_CACHE_GLOBAL", "GLOVEBOX_CACHE_KEYBOARD_CONFIG"):
+        if os.environ.get(env_var, "").lower() in disabled_values:
+            return None
+
+    config_data = getattr(user_config, "_config", None)
+    cache_path = getattr(config_data, "cache_path", None)
+    if not isinstance(cache_path, Path):
+        from glovebox.utils.xdg import get_xdg_cache_dir
+
+        cache_path = get_xdg_cache_dir()
+    elif getattr(config_data, "cache_strategy", None) == "disabled":
+        return None
+    return cache_path / "keyboard_config"
+
+
 def load_keyboard_config_with_includes(
-    keyboard_name: str, user_config: Optional["UserConfig"] = None
+    keyboard_name: str,
+    user_config: Optional["UserConfig"] = None,
+    search_paths: list[Path] | None = None,
+    loaded_files: list[Path] | None = None,
 ) -> KeyboardConfig:
     """Load a keyboard configuration with include directive support.
 
@@ -311,6 +351,9 @@ def load_keyboard_config_with_includes(
     Args:
         keyboard_name: Name of the keyboard to load
         user_config: Optional user configuration instance
+        search_paths: Keyboard search paths, from initialize_search_paths()
+            if not given
+        loaded_files: Optional list to track all loaded files
 
     Returns:
         Typed KeyboardConfig object with includes resolved
@@ -321,19 +364,24 @@ def load_keyboard_config_with_includes(
     from glovebox.config.include_loader import create_include_loader
 
     # Initialize search paths
-    search_paths = initialize_search_paths(user_config)
+    if search_paths is None:
+        search_paths = initialize_search_paths(user_config)
 
     # Create include loader
-    loader = create_include_loader(search_paths)
+    loader = create_include_loader(
+        search_paths, cache_dir=_get_keyboard_config_cache_dir(user_config)
+    )
 
     # Load configuration with include support
-    return loader.load_keyboard_config(keyboard_name)
+    return loader.load_keyboard_config(keyboard_name, loaded_files=loaded_files)
 
 
 def create_keyboard_profile_with_includes(
     keyboard_name: str,
     firmware_version: str | None = None,
     user_config: Optional["UserConfig"] = None,
+    search_paths: list[Path] | None = None,
+    loaded_files: list[Path] | None = None,
 ) -> "KeyboardProfile":
     """Create a KeyboardProfile with include directive support.
 
@@ -345,6 +393,9 @@ def create_keyboard_profile_with_includes(
         keyboard_name: Name of the keyboard
         firmware_version: Version of firmware to use (optional)
         user_config: Optional user configuration instance
+        search_paths: Keyboard search paths, from initialize_search_paths()
+            if not given
+        loaded_files: Optional list to track all loaded files
 
     Returns:
         KeyboardProfile configured for the keyboard and firmware
@@ -357,7 +408,9 @@ def create_keyboard_profile_with_includes(
     from glovebox.config.profile import KeyboardProfile
 
     # Load keyboard configuration with include support
-    keyboard_config = load_keyboard_config_with_includes(keyboard_name, user_config)
+    keyboard_config = load_keyboard_config_with_includes(
+        keyboard_name, user_config, search_paths, loaded_files
+    )
 
     # trying to get the latest firmware, the first in the list
     if not firmware_version and len(keyboard_config.firmwares):
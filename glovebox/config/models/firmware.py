@@ -1,7 +1,7 @@
 """Firmware configuration models."""
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import Field, field_validator
 
@@ -104,6 +104,26 @@ class FirmwareDockerConfig(GloveboxBaseModel):
         default="/tmp", description="Home directory path inside container"
     )
 
+    # Warm container reuse
+    reuse_containers: bool = Field(
+        default=False,
+        description="Run build phases in one long-lived container via docker exec",
+    )
+    container_idle_timeout: float = Field(
+        default=300.0,
+        ge=1.0,
+        description="Seconds an unused build container is kept before removal",
+    )
+
+    # Build output streaming
+    output_overflow: Literal["block", "drop", "coalesce"] = Field(
+        default="block",
+        description=(
+            "What happens to build output lines arriving while output processing "
+            "is behind: block waits, drop discards them, coalesce keeps the latest"
+        ),
+    )
+
     # Advanced options
     force_manual: bool = Field(
         default=False,
@@ -140,8 +160,96 @@ class FirmwareDockerConfig(GloveboxBaseModel):
         return v
 
 
+class FirmwareBuildLogConfig(GloveboxBaseModel):
+    """Build log capture settings for firmware compilation."""
+
+    compression: Literal["none", "gzip", "zstd"] = Field(
+        default="none",
+        description="Compression of build logs (zstd requires zstandard)",
+    )
+    buffer_size: int = Field(
+        default=64 * 1024,
+        ge=0,
+        description="Characters of output buffered before writing the log",
+    )
+    flush_interval: float = Field(
+        default=1.0,
+        ge=0.0,
+        description="Seconds output may stay buffered (0 writes every line)",
+    )
+    retain: int = Field(
+        default=1,
+        ge=1,
+        description="Number of build logs kept per output directory",
+    )
+
+
+class FirmwareBuildCacheConfig(GloveboxBaseModel):
+    """Incremental build settings for ZMK west compilation."""
+
+    ccache: bool = Field(
+        default=False,
+        description="Mount a managed ccache store into build containers",
+    )
+    ccache_max_size_mb: int = Field(
+        default=2048,
+        ge=1,
+        description="Size limit of the ccache store in MB",
+    )
+    preserve_build_dirs: bool = Field(
+        default=False,
+        description="Keep per-board build directories between compiles",
+    )
+    build_dirs_max_size_mb: int = Field(
+        default=4096,
+        ge=1,
+        description="Size limit of preserved build directories in MB",
+    )
+
+
+class FirmwareGitMirrorConfig(GloveboxBaseModel):
+    """Local git mirror settings for ZMK workspace creation."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Clone repositories and west projects from local mirrors",
+    )
+    max_size_mb: int = Field(
+        default=8192,
+        ge=1,
+        description="Size limit of the git mirror store in MB",
+    )
+    refresh_interval: int = Field(
+        default=3600,
+        ge=0,
+        description="Seconds before a mirror is fetched from its remote again",
+    )
+
+
+class FirmwareNixCacheConfig(GloveboxBaseModel):
+    """Local Nix binary cache settings for MoErgo builds."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Keep Nix store paths of MoErgo builds in a local binary cache",
+    )
+    max_size_mb: int = Field(
+        default=8192,
+        ge=1,
+        description="Size limit of the Nix binary cache in MB",
+    )
+
+
 class UserFirmwareConfig(GloveboxBaseModel):
     """Firmware-related configuration settings."""
 
     flash: FirmwareFlashConfig = Field(default_factory=FirmwareFlashConfig)
     docker: FirmwareDockerConfig = Field(default_factory=FirmwareDockerConfig)
+    build_log: FirmwareBuildLogConfig = Field(default_factory=FirmwareBuildLogConfig)
+    build_cache: FirmwareBuildCacheConfig = Field(
+        default_factory=FirmwareBuildCacheConfig
+    )
+    git_mirrors: FirmwareGitMirrorConfig = Field(
+        default_factory=FirmwareGitMirrorConfig
+    )
+    nix_cache: FirmwareNixCacheConfig = Field(default_factory=FirmwareNixCacheConfig)
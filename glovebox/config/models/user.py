@@ -139,6 +139,24 @@ class UserConfigData(BaseSettings):
         default="shared",
         description="Cache strategy: 'shared' (default) or 'disabled'",
     )
+    cache_backend: str = Field(
+        default="tiered",
+        description="Cache backend: 'tiered' (in-memory LRU in front of disk, default) or 'disk'",
+    )
+    cache_gc_max_size_gb: float = Field(
+        default=20.0,
+        ge=0,
+        description="Disk budget in GB shared by all caches (DiskCache, builds and workspaces)",
+    )
+    cache_gc_policy: str = Field(
+        default="lru",
+        description="Cache GC eviction policy: 'lru' (default), 'lfu' or 'size' (size-weighted)",
+    )
+    cache_gc_interval_hours: float = Field(
+        default=24.0,
+        ge=0,
+        description="Run cache GC in the background at startup at most this often (0 disables)",
+    )
 
     # Comprehensive cache TTL configuration
     cache_ttls: CacheTTLConfig = Field(
@@ -263,6 +281,26 @@ class UserConfigData(BaseSettings):
             raise ValueError(f"Cache strategy must be one of {valid_strategies}")
         return lower_v  # Always normalize to lowercase
 
+    @field_validator("cache_backend")
+    @classmethod
+    def validate_cache_backend(cls, v: str) -> str:
+        """Validate cache backend is a recognized value."""
+        valid_backends = ["tiered", "disk"]
+        lower_v = v.strip().lower()
+        if lower_v not in valid_backends:
+            raise ValueError(f"Cache backend must be one of {valid_backends}")
+        return lower_v
+
+    @field_validator("cache_gc_policy")
+    @classmethod
+    def validate_cache_gc_policy(cls, v: str) -> str:
+        """Validate cache GC policy is a recognized value."""
+        valid_policies = ["lru", "lfu", "size"]
+        lower_v = v.strip().lower()
+        if lower_v not in valid_policies:
+            raise ValueError(f"Cache GC policy must be one of {valid_policies}")
+        return lower_v
+
     @field_validator("icon_mode", mode="before")
     @classmethod
     def validate_icon_mode(cls, v: Any) -> "IconMode":
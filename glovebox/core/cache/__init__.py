@@ -18,7 +18,26 @@ from glovebox.core.cache.cache_coordinator import (
 )
 from glovebox.core.cache.cache_manager import CacheManager
 from glovebox.core.cache.diskcache_manager import DiskCacheManager
-from glovebox.core.cache.models import DiskCacheConfig
+from glovebox.core.cache.gc import (
+    DISKCACHE_EVICTION_POLICIES,
+    CacheGarbageCollector,
+    create_cache_gc,
+    run_background_gc,
+)
+from glovebox.core.cache.locking import (
+    CacheLock,
+    create_staging_directory,
+    directory_lock,
+    publish_directory,
+)
+from glovebox.core.cache.memory_cache import MemoryLRUCache
+from glovebox.core.cache.models import (
+    CacheGCConfig,
+    CacheGCResult,
+    DiskCacheConfig,
+    MemoryCacheConfig,
+)
+from glovebox.core.cache.tiered_cache import TieredCacheManager
 from glovebox.utils.xdg import get_xdg_cache_dir
 
 
@@ -86,11 +105,20 @@ def create_cache_from_user_config(
 
     # Use shared cache coordination
     cache_root = getattr(user_config, "cache_path", Path.home() / ".cache" / "glovebox")
+    backend = getattr(user_config, "cache_backend", "disk")
+    gc_policy = getattr(user_config, "cache_gc_policy", None)
+    eviction_policy = (
+        DISKCACHE_EVICTION_POLICIES[gc_policy]
+        if isinstance(gc_policy, str) and gc_policy in DISKCACHE_EVICTION_POLICIES
+        else "least-recently-stored"
+    )
     return get_shared_cache_instance(
         cache_root=cache_root,
         tag=tag,
         enabled=True,
         session_metrics=session_metrics,
+        backend=backend if isinstance(backend, str) else "disk",
+        eviction_policy=eviction_policy,
     )
 
 
@@ -152,6 +180,18 @@ def _create_disabled_cache() -> CacheManager:
 __all__ = [
     "DiskCacheManager",
     "DiskCacheConfig",
+    "MemoryCacheConfig",
+    "MemoryLRUCache",
+    "TieredCacheManager",
+    "CacheGarbageCollector",
+    "CacheGCConfig",
+    "CacheGCResult",
+    "create_cache_gc",
+    "run_background_gc",
+    "CacheLock",
+    "directory_lock",
+    "create_staging_directory",
+    "publish_directory",
     "create_diskcache_manager",
     "create_cache_from_user_config",
     "create_default_cache",
@@ -13,12 +13,18 @@ from glovebox.core.structlog_logger import get_struct_logger
 from .cache_manager import CacheManager
 from .disabled_cache import DisabledCache
 from .diskcache_manager import DiskCacheManager
-from .models import DiskCacheConfig
+from .models import DiskCacheConfig, MemoryCacheConfig
+from .tiered_cache import TieredCacheManager
 
 
 logger = get_struct_logger(__name__)
 
-# Shared cache instances registry
+# Cache backends selectable through get_shared_cache_instance
+CACHE_BACKENDS = ("disk", "tiered")
+
+# Shared cache instances registry. It is per-process on purpose: DiskCache
+# coordinates concurrent processes through SQLite, and the directory caches
+# use the locks in glovebox.core.cache.locking
 _shared_cache_instances: dict[str, CacheManager] = {}
 
 
@@ -29,6 +35,9 @@ def get_shared_cache_instance(
     max_size_gb: int = 2,
     timeout: int = 30,
     session_metrics: Any | None = None,
+    backend: str = "disk",
+    memory_config: MemoryCacheConfig | None = None,
+    eviction_policy: str = "least-recently-stored",
 ) -> CacheManager:
     """Get shared cache instance, creating if needed.
 
@@ -43,13 +52,24 @@ def get_shared_cache_instance(
         max_size_gb: Maximum cache size in GB
         timeout: Cache operation timeout in seconds
         session_metrics: Optional SessionMetrics instance for metrics integration
+        backend: Cache backend, 'disk' (DiskCache only) or 'tiered' (in-memory
+            LRU in front of DiskCache). The first caller for a given cache
+            root and tag decides the backend of the shared instance.
+        memory_config: Memory tier configuration for the 'tiered' backend
+        eviction_policy: DiskCache eviction policy (see DiskCacheConfig)
 
     Returns:
         Shared cache manager instance
+
+    Raises:
+        ValueError: If backend is not a recognized cache backend
     """
     if not enabled:
         return DisabledCache()
 
+    if backend not in CACHE_BACKENDS:
+        raise ValueError(f"Cache backend must be one of {list(CACHE_BACKENDS)}")
+
     # Create cache key for instance coordination
     cache_key = f"{cache_root.resolve()}:{tag or 'default'}"
 
@@ -62,10 +82,19 @@ def get_shared_cache_instance(
             cache_path=cache_dir,
             max_size_bytes=max_size_gb * 1024 * 1024 * 1024,
             timeout=timeout,
+            eviction_policy=eviction_policy,
         )
-        _shared_cache_instances[cache_key] = DiskCacheManager(
-            config, tag=tag, session_metrics=session_metrics
-        )
+        if backend == "tiered":
+            _shared_cache_instances[cache_key] = TieredCacheManager(
+                config,
+                tag=tag,
+                session_metrics=session_metrics,
+                memory_config=memory_config,
+            )
+        else:
+            _shared_cache_instances[cache_key] = DiskCacheManager(
+                config, tag=tag, session_metrics=session_metrics
+            )
     else:
         logger.debug("cache_instance_reused", cache_key=cache_key)
 
@@ -88,8 +117,9 @@ def reset_shared_cache_instances(user_config: Any = None) -> None:
 
     logger.debug("cache_instances_resetting", count=len(_shared_cache_instances))
 
-    # Close all existing cache instances
-    for cache_key, cache_instance in _shared_cache_instances.items():
+    # Close all existing cache instances (snapshot: background startup
+    # threads may register instances concurrently)
+    for cache_key, cache_instance in list(_shared_cache_instances.items()):
         try:
             if hasattr(cache_instance, "close"):
                 cache_instance.close()
@@ -156,7 +186,7 @@ def cleanup_shared_cache_instances() -> dict[str, int]:
     """
     cleanup_results = {}
 
-    for cache_key, cache_instance in _shared_cache_instances.items():
+    for cache_key, cache_instance in list(_shared_cache_instances.items()):
         try:
             if hasattr(cache_instance, "cleanup"):
                 cleanup_count = cache_instance.cleanup()
@@ -195,12 +225,13 @@ def get_aggregated_cache_stats() -> dict[str, Any]:
         "total_error_count": 0,
         "total_operation_count": 0,
         "total_operation_time": 0.0,
+        "total_memory_hit_count": 0,
         "overall_hit_rate": 0.0,
         "overall_avg_operation_time": 0.0,
         "by_tag": {},
     }
 
-    for cache_key, cache_instance in _shared_cache_instances.items():
+    for cache_key, cache_instance in list(_shared_cache_instances.items()):
         try:
             if hasattr(cache_instance, "get_stats"):
                 stats = cache_instance.get_stats()
@@ -214,6 +245,7 @@ def get_aggregated_cache_stats() -> dict[str, Any]:
                 aggregated_stats["total_error_count"] += stats.error_count
                 aggregated_stats["total_operation_count"] += stats.operation_count
                 aggregated_stats["total_operation_time"] += stats.total_operation_time
+                aggregated_stats["total_memory_hit_count"] += stats.memory_hit_count
 
                 # Store per-tag breakdown
                 tag = stats.tag or "default"
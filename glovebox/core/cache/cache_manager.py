@@ -1,5 +1,6 @@
 """Generic cache manager protocol and interface."""
 
+from collections.abc import Iterator
 from typing import Any, Protocol, runtime_checkable
 
 from glovebox.core.cache.models import CacheMetadata, CacheStats
@@ -35,6 +36,26 @@ class CacheManager(Protocol):
         """
         ...
 
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Retrieve multiple values from cache.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Dictionary mapping found keys to their values (missing keys omitted)
+        """
+        ...
+
+    def set_many(self, items: dict[str, Any], ttl: int | None = None) -> None:
+        """Store multiple values in cache.
+
+        Args:
+            items: Mapping of cache keys to values
+            ttl: Time-to-live in seconds applied to every entry (None for no expiration)
+        """
+        ...
+
     def delete(self, key: str) -> bool:
         """Remove value from cache.
 
@@ -107,6 +128,17 @@ class CacheManager(Protocol):
         """
         ...
 
+    def iter_items(self, prefix: str | None = None) -> Iterator[tuple[str, Any]]:
+        """Stream cache entries.
+
+        Args:
+            prefix: Only yield entries whose key starts with this prefix
+
+        Yields:
+            Tuples of (key, value) for non-expired entries
+        """
+        ...
+
     def close(self) -> None:
         """Close the cache and release resources."""
         ...
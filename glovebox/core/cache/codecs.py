@@ -0,0 +1,342 @@
+"""Value codecs for the DiskCache-based cache system.
+
+Cached values are mostly JSON-shaped dictionaries (workspace metadata, session
+metrics, MoErgo layout configs). Encoding them with msgpack or orjson instead of
+pickle makes them smaller on disk and faster to decode.
+
+Every encoded value starts with a short header naming the format version, the
+codec and the compression used, so entries written with one configuration stay
+readable after the configuration changes, and entries written before codecs
+existed (plain pickles) are still returned as-is.
+
+Optional libraries (the ``cache`` extra):
+    msgpack: binary codec for JSON-shaped values
+    orjson: fast JSON codec (falls back to the stdlib json module)
+    zstandard: zstd compression (falls back to zlib)
+"""
+
+import json
+import math
+import pickle
+import zlib
+from typing import Any, Protocol
+
+from glovebox.core.errors import CacheCodecError
+
+
+# Header: magic + format version + codec id + compression id
+_MAGIC = b"GBC"
+FORMAT_VERSION = 1
+_HEADER_SIZE = len(_MAGIC) + 3
+
+CODEC_PICKLE = 1
+CODEC_JSON = 2
+CODEC_MSGPACK = 3
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_ZSTD = 2
+
+
+class ValueCodec(Protocol):
+    """Codec turning cache values into bytes and back."""
+
+    name: str
+    codec_id: int
+
+    def can_encode(self, value: Any) -> bool:
+        """Return True if value round-trips losslessly through this codec."""
+        ...
+
+    def encode(self, value: Any) -> bytes:
+        """Encode value to bytes."""
+        ...
+
+    def decode(self, data: bytes) -> Any:
+        """Decode bytes back to a value."""
+        ...
+
+
+def _is_json_shaped(value: Any) -> bool:
+    """Check that value only contains types that survive a JSON round-trip.
+
+    Tuples, sets, non-string dict keys and arbitrary objects would come back
+    as different types, so such values are left to pickle. So are NaN and
+    infinite floats, which JSON cannot represent (orjson writes them as null).
+    """
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        item_type = type(item)
+        if item_type is dict:
+            for key, nested in item.items():
+                if type(key) is not str:
+                    return False
+                stack.append(nested)
+        elif item_type is list:
+            stack.extend(item)
+        elif item_type is float:
+            if not math.isfinite(item):
+                return False
+        elif item_type not in (str, int, bool) and item is not None:
+            return False
+    return True
+
+
+class PickleCodec:
+    """Pickle codec, able to encode any picklable value."""
+
+    name = "pickle"
+    codec_id = CODEC_PICKLE
+
+    def can_encode(self, value: Any) -> bool:
+        return True
+
+    def encode(self, value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, data: bytes) -> Any:
+        return pickle.loads(data)
+
+
+class JsonCodec:
+    """JSON codec using orjson when installed, stdlib json otherwise."""
+
+    name = "json"
+    codec_id = CODEC_JSON
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError:
+            self._orjson: Any = None
+        else:
+            self._orjson = orjson
+
+    def can_encode(self, value: Any) -> bool:
+        return _is_json_shaped(value)
+
+    def encode(self, value: Any) -> bytes:
+        if self._orjson is not None:
+            return self._orjson.dumps(value)  # type: ignore[no-any-return]
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        if self._orjson is not None:
+            return self._orjson.loads(data)
+        return json.loads(data)
+
+
+class MsgpackCodec:
+    """Msgpack codec (requires the msgpack package)."""
+
+    name = "msgpack"
+    codec_id = CODEC_MSGPACK
+
+    def __init__(self) -> None:
+        import msgpack  # type: ignore[import-untyped]
+
+        self._msgpack = msgpack
+
+    def can_encode(self, value: Any) -> bool:
+        return _is_json_shaped(value)
+
+    def encode(self, value: Any) -> bytes:
+        return self._msgpack.packb(value, use_bin_type=True)  # type: ignore[no-any-return]
+
+    def decode(self, data: bytes) -> Any:
+        return self._msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+def _msgpack_available() -> bool:
+    try:
+        import msgpack  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _orjson_available() -> bool:
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _zstd_available() -> bool:
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def create_value_codec(name: str = "auto") -> ValueCodec:
+    """Create value codec by name.
+
+    Args:
+        name: 'auto' (msgpack, then orjson, then pickle), 'msgpack', 'json'
+            or 'pickle'
+
+    Returns:
+        Value codec instance
+
+    Raises:
+        CacheCodecError: If the codec is unknown or its library is missing
+    """
+    if name == "auto":
+        if _msgpack_available():
+            return MsgpackCodec()
+        if _orjson_available():
+            return JsonCodec()
+        return PickleCodec()
+
+    if name == "pickle":
+        return PickleCodec()
+    if name == "json":
+        return JsonCodec()
+    if name == "msgpack":
+        if not _msgpack_available():
+            raise CacheCodecError("Cache codec 'msgpack' requires the msgpack package")
+        return MsgpackCodec()
+
+    raise CacheCodecError(
+        f"Unknown cache codec '{name}'. Valid codecs: auto, msgpack, json, pickle"
+    )
+
+
+def _resolve_compression(name: str) -> int:
+    """Map compression name to its header id."""
+    if name == "auto":
+        return COMPRESSION_ZSTD if _zstd_available() else COMPRESSION_ZLIB
+    if name == "none":
+        return COMPRESSION_NONE
+    if name == "zlib":
+        return COMPRESSION_ZLIB
+    if name == "zstd":
+        if not _zstd_available():
+            raise CacheCodecError("Cache compression 'zstd' requires zstandard")
+        return COMPRESSION_ZSTD
+    raise CacheCodecError(
+        f"Unknown cache compression '{name}'. Valid values: auto, zstd, zlib, none"
+    )
+
+
+class CacheValueSerializer:
+    """Encode values with a codec, optional compression and a version header."""
+
+    def __init__(
+        self,
+        codec: str = "auto",
+        compression: str = "auto",
+        compress_threshold: int | None = 64 * 1024,
+    ) -> None:
+        """Initialize serializer.
+
+        Args:
+            codec: Codec name used for new values (see create_value_codec)
+            compression: 'auto', 'zstd', 'zlib' or 'none'
+            compress_threshold: Compress encoded values at least this large
+                (None disables compression)
+        """
+        self.codec = create_value_codec(codec)
+        self.compression_id = _resolve_compression(compression)
+        self.compress_threshold = compress_threshold
+        self._pickle = PickleCodec()
+        self._decoders: dict[int, ValueCodec] = {
+            CODEC_PICKLE: self._pickle,
+            self.codec.codec_id: self.codec,
+        }
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode value with header.
+
+        Values the configured codec cannot represent losslessly fall back to
+        pickle, which is recorded in the header.
+        """
+        codec: ValueCodec = self.codec
+        payload = None
+        if codec.codec_id != CODEC_PICKLE and codec.can_encode(value):
+            try:
+                payload = codec.encode(value)
+            except (TypeError, ValueError, OverflowError):
+                payload = None
+        if payload is None:
+            codec = self._pickle
+            payload = codec.encode(value)
+
+        compression_id = COMPRESSION_NONE
+        if (
+            self.compress_threshold is not None
+            and self.compression_id != COMPRESSION_NONE
+            and len(payload) >= self.compress_threshold
+        ):
+            compressed = self._compress(payload)
+            if len(compressed) < len(payload):
+                payload = compressed
+                compression_id = self.compression_id
+
+        header = _MAGIC + bytes((FORMAT_VERSION, codec.codec_id, compression_id))
+        return header + payload
+
+    def loads(self, data: bytes) -> Any:
+        """Decode value produced by dumps.
+
+        Raises:
+            CacheCodecError: If the header names an unsupported version,
+                codec or compression
+        """
+        version, codec_id, compression_id = data[len(_MAGIC) : _HEADER_SIZE]
+        if version != FORMAT_VERSION:
+            raise CacheCodecError(f"Unsupported cache value format version {version}")
+
+        payload = data[_HEADER_SIZE:]
+        if compression_id != COMPRESSION_NONE:
+            payload = self._decompress(payload, compression_id)
+
+        return self._decoder(codec_id).decode(payload)
+
+    @staticmethod
+    def is_encoded(data: Any) -> bool:
+        """Check if data carries a codec header (as opposed to a legacy value)."""
+        return isinstance(data, bytes) and data[: len(_MAGIC)] == _MAGIC
+
+    def _decoder(self, codec_id: int) -> ValueCodec:
+        """Get decoder for codec id, creating it on first use."""
+        decoder = self._decoders.get(codec_id)
+        if decoder is None:
+            try:
+                if codec_id == CODEC_JSON:
+                    decoder = JsonCodec()
+                elif codec_id == CODEC_MSGPACK:
+                    decoder = MsgpackCodec()
+            except ImportError as e:
+                raise CacheCodecError(
+                    f"Cache value requires missing codec library: {e}"
+                ) from e
+            if decoder is None:
+                raise CacheCodecError(f"Unknown cache codec id {codec_id}")
+            self._decoders[codec_id] = decoder
+        return decoder
+
+    def _compress(self, payload: bytes) -> bytes:
+        if self.compression_id == COMPRESSION_ZSTD:
+            import zstandard
+
+            return zstandard.ZstdCompressor().compress(payload)
+        return zlib.compress(payload)
+
+    @staticmethod
+    def _decompress(payload: bytes, compression_id: int) -> bytes:
+        if compression_id == COMPRESSION_ZLIB:
+            return zlib.decompress(payload)
+        if compression_id == COMPRESSION_ZSTD:
+            try:
+                import zstandard
+            except ImportError as e:
+                raise CacheCodecError(
+                    "Cache value is zstd-compressed but zstandard is not installed"
+                ) from e
+            return zstandard.ZstdDecompressor().decompress(payload)
+        raise CacheCodecError(f"Unknown cache compression id {compression_id}")
@@ -1,5 +1,6 @@
 """Disabled cache implementation that performs no caching."""
 
+from collections.abc import Iterator
 from typing import Any
 
 from glovebox.core.cache.cache_manager import CacheManager
@@ -21,6 +22,14 @@ class DisabledCache(CacheManager):
         """No-op set operation."""
         pass
 
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Always return empty dict (no caching)."""
+        return {}
+
+    def set_many(self, items: dict[str, Any], ttl: int | None = None) -> None:
+        """No-op batch set operation."""
+        pass
+
     def delete(self, key: str) -> bool:
         """Always return False (nothing to delete)."""
         return False
@@ -60,6 +69,10 @@ class DisabledCache(CacheManager):
         """Always return empty list (no keys)."""
         return []
 
+    def iter_items(self, prefix: str | None = None) -> Iterator[tuple[str, Any]]:
+        """Always yield nothing (no entries)."""
+        return iter(())
+
     def close(self) -> None:
         """No-op close operation."""
         pass
@@ -2,18 +2,59 @@
 
 import logging
 import time
-from collections.abc import Generator
-from contextlib import contextmanager
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
 from typing import Any
 
 import diskcache  # type: ignore[import-untyped]
 
 from glovebox.core.cache.cache_manager import CacheManager
+from glovebox.core.cache.codecs import CacheValueSerializer
 from glovebox.core.cache.models import CacheMetadata, CacheStats, DiskCacheConfig
 from glovebox.core.structlog_logger import get_struct_logger
 
 
+# Keys per SQL statement for batch operations (below SQLite's variable limit)
+_BATCH_SIZE = 500
+
+
+class CodecDisk(diskcache.Disk):  # type: ignore[misc,no-any-unimported]
+    """DiskCache serialization using glovebox value codecs instead of pickle.
+
+    Values without a codec header (written before codecs were introduced)
+    are returned exactly as DiskCache stored them.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        codec: str = "auto",
+        compression: str = "auto",
+        compress_threshold: int | None = 64 * 1024,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(directory, **kwargs)
+        self.serializer = CacheValueSerializer(
+            codec=codec,
+            compression=compression,
+            compress_threshold=compress_threshold,
+        )
+
+    def store(
+        self, value: Any, read: bool, key: Any = diskcache.core.UNKNOWN
+    ) -> tuple[int, int, str | None, Any]:
+        if not read:
+            value = self.serializer.dumps(value)
+        return super().store(value, read, key=key)  # type: ignore[no-any-return]
+
+    def fetch(self, mode: int, filename: str | None, value: Any, read: bool) -> Any:
+        data = super().fetch(mode, filename, value, read)
+        if not read and self.serializer.is_encoded(data):
+            return self.serializer.loads(data)
+        return data
+
+
 class DiskCacheManager(CacheManager):
     """Cache manager implementation using DiskCache library.
 
@@ -52,7 +93,11 @@ class DiskCacheManager(CacheManager):
             directory=str(self.config.cache_path),
             size_limit=self.config.max_size_bytes,
             timeout=self.config.timeout,
-            # Use default eviction policy (least-recently-stored)
+            eviction_policy=self.config.eviction_policy,
+            disk=CodecDisk,
+            disk_codec=self.config.codec,
+            disk_compression=self.config.compression,
+            disk_compress_threshold=self.config.compress_threshold_bytes,
         )
 
         # Statistics tracking (DiskCache doesn't provide all stats we need)
@@ -136,6 +181,63 @@ class DiskCacheManager(CacheManager):
             if self._cache_operation_duration:
                 self._cache_operation_duration.observe(duration)  # type: ignore[unreachable]
 
+    def _record_hit(self) -> None:
+        """Record a cache hit in stats and metrics."""
+        self._stats.hit_count += 1
+
+        # Track cache hit in metrics
+        if self._cache_hit_miss_counter:
+            self._cache_hit_miss_counter.labels(  # type: ignore[unreachable]
+                tag=self.tag or "default", result="hit"
+            ).inc()
+
+    def _record_miss(self, key: str) -> None:
+        """Record a cache miss in stats and metrics."""
+        self._stats.miss_count += 1
+        self.logger.debug("cache_miss", key=key)
+
+        # Track cache miss in metrics
+        if self._cache_hit_miss_counter:
+            self._cache_hit_miss_counter.labels(  # type: ignore[unreachable]
+                tag=self.tag or "default", result="miss"
+            ).inc()
+
+    def _get_entry(self, key: str, default: Any = None) -> tuple[Any, float | None]:
+        """Retrieve value and its absolute expiry time from DiskCache.
+
+        Args:
+            key: Cache key to retrieve
+            default: Default value if key not found
+
+        Returns:
+            Tuple of (cached value or default, expiry timestamp or None)
+        """
+        try:
+            # DiskCache.get() returns default if key not found or expired
+            value, expire_time = self._cache.get(key, default=default, expire_time=True)
+
+            if value is not default:
+                self._record_hit()
+            else:
+                self._record_miss(key)
+
+            return value, expire_time
+
+        except Exception as e:
+            self._stats.error_count += 1
+
+            # Track error in metrics
+            if self._cache_errors_counter:
+                self._cache_errors_counter.labels(  # type: ignore[unreachable]
+                    operation="get", tag=self.tag or "default"
+                ).inc()
+
+            exc_info = self.logger.isEnabledFor(logging.DEBUG)
+            self.logger.warning(
+                "cache_get_error", key=key, error=str(e), exc_info=exc_info
+            )
+            return default, None
+
     def get(self, key: str, default: Any = None) -> Any:
         """Retrieve value from cache.
 
@@ -147,44 +249,94 @@ class DiskCacheManager(CacheManager):
             Cached value or default
         """
         with self._measure_operation("get"):
-            try:
-                # DiskCache.get() returns default if key not found or expired
-                value = self._cache.get(key, default=default)
+            value, _ = self._get_entry(key, default)
+            return value
 
-                if value is not default:
-                    self._stats.hit_count += 1
+    def _fetch_many(self, keys: list[str]) -> dict[str, tuple[Any, float | None]]:
+        """Fetch several entries with one SELECT per batch of keys.
 
-                    # Track cache hit in metrics
-                    if self._cache_hit_miss_counter:
-                        self._cache_hit_miss_counter.labels(  # type: ignore[unreachable]
-                            tag=self.tag or "default", result="hit"
-                        ).inc()
-                else:
-                    self._stats.miss_count += 1
-                    self.logger.debug("cache_miss", key=key)
+        Args:
+            keys: Cache keys to fetch
 
-                    # Track cache miss in metrics
-                    if self._cache_hit_miss_counter:
-                        self._cache_hit_miss_counter.labels(  # type: ignore[unreachable]
-                            tag=self.tag or "default", result="miss"
-                        ).inc()
+        Returns:
+            Dictionary mapping found keys to (value, expiry timestamp or None)
+        """
+        results: dict[str, tuple[Any, float | None]] = {}
+        unique_keys = list(dict.fromkeys(keys))
+
+        # Policies tracking access need the row update done in the same transaction
+        update_column = diskcache.core.EVICTION_POLICY[self._cache.eviction_policy][
+            "get"
+        ]
+        transaction = self._cache.transact() if update_column else nullcontext()
+
+        with transaction:
+            for start in range(0, len(unique_keys), _BATCH_SIZE):
+                chunk = unique_keys[start : start + _BATCH_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = self._cache._sql(
+                    "SELECT rowid, key, expire_time, mode, filename, value"
+                    f" FROM Cache WHERE key IN ({placeholders}) AND raw = 1"
+                    " AND (expire_time IS NULL OR expire_time > ?)",
+                    (*chunk, time.time()),
+                ).fetchall()
+
+                rowids = []
+                for rowid, db_key, expire_time, mode, filename, db_value in rows:
+                    try:
+                        value = self._cache._disk.fetch(mode, filename, db_value, False)
+                    except OSError:
+                        # Entry was deleted before its value file could be read
+                        continue
+                    results[db_key] = (value, expire_time)
+                    rowids.append(rowid)
+
+                if update_column and rowids:
+                    self._cache._sql(
+                        f"UPDATE Cache SET {update_column.format(now=time.time())}"
+                        f" WHERE rowid IN ({', '.join('?' * len(rowids))})",
+                        rowids,
+                    )
+
+        return results
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Retrieve multiple values from cache in a single query.
 
-                return value
+        Args:
+            keys: Cache keys to retrieve
 
+        Returns:
+            Dictionary mapping found keys to their values (missing keys omitted)
+        """
+        with self._measure_operation("get_many"):
+            try:
+                entries = self._fetch_many(keys)
             except Exception as e:
                 self._stats.error_count += 1
 
                 # Track error in metrics
                 if self._cache_errors_counter:
                     self._cache_errors_counter.labels(  # type: ignore[unreachable]
-                        operation="get", tag=self.tag or "default"
+                        operation="get_many", tag=self.tag or "default"
                     ).inc()
 
                 exc_info = self.logger.isEnabledFor(logging.DEBUG)
                 self.logger.warning(
-                    "cache_get_error", key=key, error=str(e), exc_info=exc_info
+                    "cache_get_many_error",
+                    key_count=len(keys),
+                    error=str(e),
+                    exc_info=exc_info,
                 )
-                return default
+                return {}
+
+            for key in keys:
+                if key in entries:
+                    self._record_hit()
+                else:
+                    self._record_miss(key)
+
+            return {key: value for key, (value, _) in entries.items()}
 
     def set(self, key: str, value: Any, ttl: int | None = None) -> None:
         """Store value in cache.
@@ -217,6 +369,37 @@ class DiskCacheManager(CacheManager):
                 )
                 raise
 
+    def set_many(self, items: dict[str, Any], ttl: int | None = None) -> None:
+        """Store multiple values in cache within one transaction.
+
+        Args:
+            items: Mapping of cache keys to values
+            ttl: Time-to-live in seconds applied to every entry (None for no expiration)
+        """
+        with self._measure_operation("set_many"):
+            try:
+                with self._cache.transact():
+                    for key, value in items.items():
+                        self._cache.set(key, value, expire=ttl)
+
+            except Exception as e:
+                self._stats.error_count += 1
+
+                # Track error in metrics
+                if self._cache_errors_counter:
+                    self._cache_errors_counter.labels(  # type: ignore[unreachable]
+                        operation="set_many", tag=self.tag or "default"
+                    ).inc()
+
+                exc_info = self.logger.isEnabledFor(logging.DEBUG)
+                self.logger.warning(
+                    "cache_set_many_error",
+                    key_count=len(items),
+                    error=str(e),
+                    exc_info=exc_info,
+                )
+                raise
+
     def delete(self, key: str) -> bool:
         """Remove value from cache.
 
@@ -238,7 +421,7 @@ class DiskCacheManager(CacheManager):
             return False
 
     def delete_many(self, keys: list[str]) -> int:
-        """Remove multiple values from cache.
+        """Remove multiple values from cache within one transaction.
 
         Args:
             keys: List of cache keys to remove
@@ -247,9 +430,20 @@ class DiskCacheManager(CacheManager):
             Number of keys successfully deleted
         """
         deleted_count = 0
-        for key in keys:
-            if self.delete(key):
-                deleted_count += 1
+        try:
+            with self._cache.transact():
+                for key in keys:
+                    if self._cache.delete(key):
+                        deleted_count += 1
+
+        except Exception as e:
+            # The transaction was rolled back, nothing was deleted
+            deleted_count = 0
+            self._stats.error_count += 1
+            self.logger.warning(
+                "cache_delete_many_error", key_count=len(keys), error=str(e)
+            )
+            return deleted_count
 
         self.logger.debug(
             "cache_keys_deleted", deleted_count=deleted_count, total_keys=len(keys)
@@ -268,6 +462,8 @@ class DiskCacheManager(CacheManager):
                 miss_count=self._stats.miss_count,
                 eviction_count=self._stats.eviction_count,
                 error_count=self._stats.error_count,
+                tag=self.tag,
+                memory_hit_count=self._stats.memory_hit_count,
             )
             self.logger.info("cache_cleared")
 
@@ -358,17 +554,13 @@ class DiskCacheManager(CacheManager):
             return self._stats
 
     def cleanup(self) -> int:
-        """Remove expired entries and enforce size limits.
-
-        DiskCache handles this automatically, but we can force eviction.
+        """Remove expired entries and enforce the size limit.
 
         Returns:
-            Number of entries removed (not available from DiskCache)
+            Number of entries removed
         """
         try:
-            # DiskCache handles cleanup automatically
-            # We can call evict() to force cleanup if needed
-            evicted: int = self._cache.evict()
+            evicted: int = self._cache.expire() + self._cache.cull()
             self._stats.eviction_count += evicted
 
             if evicted > 0:
@@ -396,6 +588,52 @@ class DiskCacheManager(CacheManager):
             self.logger.warning("cache_keys_error", error=str(e))
             return []
 
+    def iter_items(self, prefix: str | None = None) -> Iterator[tuple[str, Any]]:
+        """Stream cache entries, optionally restricted to a key prefix.
+
+        Entries are read in pages of rows rather than one query per key, so
+        scanning thousands of entries costs a handful of SQLite round-trips.
+
+        Args:
+            prefix: Only yield entries whose key starts with this prefix
+
+        Yields:
+            Tuples of (key, value) for non-expired entries
+        """
+        select = (
+            "SELECT rowid, key, mode, filename, value FROM Cache"
+            " WHERE rowid > ? AND raw = 1"
+            " AND (expire_time IS NULL OR expire_time > ?)"
+        )
+        if prefix:
+            select += " AND substr(key, 1, ?) = ?"
+        select += " ORDER BY rowid LIMIT ?"
+
+        last_rowid = 0
+        while True:
+            params: tuple[Any, ...] = (last_rowid, time.time())
+            if prefix:
+                params += (len(prefix), prefix)
+
+            try:
+                rows = self._cache._sql(select, (*params, _BATCH_SIZE)).fetchall()
+            except Exception as e:
+                self._stats.error_count += 1
+                self.logger.warning("cache_iter_items_error", error=str(e))
+                return
+
+            for rowid, db_key, mode, filename, db_value in rows:
+                last_rowid = rowid
+                try:
+                    value = self._cache._disk.fetch(mode, filename, db_value, False)
+                except OSError:
+                    # Entry was deleted before its value file could be read
+                    continue
+                yield db_key, value
+
+            if len(rows) < _BATCH_SIZE:
+                return
+
     def close(self) -> None:
         """Close the cache and release resources."""
         try:
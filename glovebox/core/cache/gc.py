@@ -0,0 +1,482 @@
+"""Unified garbage collection for all on-disk Glovebox caches.
+
+The cache root holds three kinds of data that used to be pruned separately:
+
+- DiskCache databases, one directory per tag (``<cache_root>/<tag>/cache.db``)
+- cached compilation builds (``<cache_root>/compilation/builds/<key>``)
+- cached ZMK workspaces (``<cache_root>/workspace/<key>``)
+
+CacheGarbageCollector enforces one byte budget across all of them. Expired
+DiskCache entries are dropped first. Then DiskCache entries and whole
+build/workspace directories are ranked together by the configured policy and
+evicted until the total fits the budget. Finally, fragmented DiskCache
+databases are compacted with VACUUM.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import diskcache  # type: ignore[import-untyped]
+
+from glovebox.core.cache.diskcache_manager import CodecDisk
+from glovebox.core.cache.locking import (
+    LOCK_DIR_NAME,
+    STAGING_PREFIX,
+    TRASH_PREFIX,
+    CacheLock,
+    directory_lock,
+)
+from glovebox.core.cache.models import CacheGCConfig, CacheGCResult, GCCandidate
+from glovebox.core.structlog_logger import get_struct_logger
+
+
+if TYPE_CHECKING:
+    from glovebox.config.user_config import UserConfig
+
+
+logger = get_struct_logger(__name__)
+
+GC_POLICIES = ("lru", "lfu", "size")
+
+# DiskCache eviction policy that keeps the statistics each GC policy ranks by.
+# DiskCache entries are ranked by store time rather than access time:
+# 'least-recently-used' would turn every cache read into a write transaction
+# and make concurrent processes contend for the SQLite write lock. Only 'lfu'
+# pays that cost, since access counts cannot be derived otherwise.
+DISKCACHE_EVICTION_POLICIES = {
+    "lru": "least-recently-stored",
+    "lfu": "least-frequently-used",
+    "size": "least-recently-stored",
+}
+
+# Staging directories older than this belong to crashed writers
+_STALE_STAGING_SECONDS = 24 * 3600
+
+# Timestamp file recording the last background GC run
+_LAST_RUN_FILE = ".gc_last_run"
+
+# Lock file (in the cache root's lock directory) held during background GC
+_LOCK_FILE = "gc.lock"
+
+# Entry point of the detached GC process, optionally given a config file
+_GC_PROCESS_CODE = (
+    "import sys\n"
+    "from glovebox.config import create_user_config\n"
+    "from glovebox.core.cache.gc import run_background_gc\n"
+    "run_background_gc(create_user_config(*sys.argv[1:2]))\n"
+)
+
+# VACUUM databases when at least this share of their pages is free
+_VACUUM_FREE_RATIO = 0.25
+
+
+class CacheGarbageCollector:
+    """Enforce a global byte budget across DiskCache tags and cache directories."""
+
+    def __init__(
+        self,
+        cache_root: Path,
+        config: CacheGCConfig | None = None,
+        directory_roots: list[Path] | None = None,
+    ) -> None:
+        """Initialize garbage collector.
+
+        Args:
+            cache_root: Root directory holding all caches
+            config: GC configuration (defaults used when None)
+            directory_roots: Directories whose immediate subdirectories are
+                evictable units (defaults to the build and workspace caches)
+
+        Raises:
+            ValueError: If the configured policy is not a recognized policy
+        """
+        self.cache_root = cache_root
+        self.config = config or CacheGCConfig()
+        if self.config.policy not in GC_POLICIES:
+            raise ValueError(f"Cache GC policy must be one of {list(GC_POLICIES)}")
+
+        if directory_roots is None:
+            directory_roots = [
+                cache_root / "compilation" / "builds",
+                cache_root / "workspace",
+            ]
+        self.directory_roots = directory_roots
+
+    def collect(self, dry_run: bool = False) -> CacheGCResult:
+        """Run one garbage collection pass.
+
+        Args:
+            dry_run: Only report what would be evicted
+
+        Returns:
+            Result describing the usage before and after, and what was evicted
+        """
+        if not dry_run:
+            self._remove_trash()
+
+        caches = self._open_caches()
+        try:
+            expired = 0
+            if not dry_run:
+                for cache in caches.values():
+                    expired += cache.expire()
+
+            candidates: list[GCCandidate] = []
+            total_bytes = 0
+            for cache_dir, cache in caches.items():
+                total_bytes += cache.volume()
+                candidates.extend(self._entry_candidates(cache_dir, cache))
+
+            for directory in self._directory_candidates():
+                total_bytes += directory.size_bytes
+                candidates.append(directory)
+
+            evicted = self._select_evictions(candidates, total_bytes)
+
+            result = CacheGCResult(
+                policy=self.config.policy,
+                budget_bytes=self.config.max_total_bytes,
+                total_bytes_before=total_bytes,
+                total_bytes_after=total_bytes,
+                expired_entries=expired,
+                evicted=evicted,
+                dry_run=dry_run,
+            )
+            if dry_run:
+                result.total_bytes_after = total_bytes - result.reclaimed_bytes
+                return result
+
+            evicted_from: set[Path] = set()
+            for candidate in evicted:
+                if candidate.key is None:
+                    self._evict_directory(candidate)
+                else:
+                    evicted_from.add(candidate.location)
+
+            for cache_dir in evicted_from:
+                self._evict_entries(
+                    caches[cache_dir],
+                    [c.key for c in evicted if c.location == cache_dir],
+                )
+
+            for cache_dir, cache in caches.items():
+                if self._compact(
+                    cache, force=self.config.vacuum or cache_dir in evicted_from
+                ):
+                    result.vacuumed_databases += 1
+
+            result.total_bytes_after = sum(
+                cache.volume() for cache in caches.values()
+            ) + sum(d.size_bytes for d in self._directory_candidates())
+
+            logger.info(
+                "cache_gc_completed",
+                policy=result.policy,
+                total_bytes_before=result.total_bytes_before,
+                total_bytes_after=result.total_bytes_after,
+                expired_entries=result.expired_entries,
+                evicted_entries=result.evicted_entries,
+                evicted_directories=result.evicted_directories,
+                vacuumed_databases=result.vacuumed_databases,
+            )
+            return result
+
+        finally:
+            for cache in caches.values():
+                cache.close()
+
+    def _select_evictions(
+        self, candidates: list[GCCandidate], total_bytes: int
+    ) -> list[GCCandidate]:
+        """Pick candidates in policy order until the total fits the budget."""
+        excess = total_bytes - self.config.max_total_bytes
+        if excess <= 0:
+            return []
+
+        now = time.time()
+        protected_after = now - self.config.min_age_seconds
+        eligible = [c for c in candidates if c.last_access <= protected_after]
+
+        if self.config.policy == "lfu":
+            eligible.sort(key=lambda c: (c.access_count, c.last_access))
+        elif self.config.policy == "size":
+            eligible.sort(key=lambda c: -c.size_bytes * max(now - c.last_access, 1.0))
+        else:
+            eligible.sort(key=lambda c: c.last_access)
+
+        selected = []
+        for candidate in eligible:
+            if excess <= 0:
+                break
+            selected.append(candidate)
+            excess -= candidate.size_bytes
+        return selected
+
+    def _open_caches(self) -> dict[Path, Any]:
+        """Open every DiskCache database directly under the cache root."""
+        caches: dict[Path, Any] = {}
+        if not self.cache_root.is_dir():
+            return caches
+
+        for cache_dir in sorted(self.cache_root.iterdir()):
+            if not (cache_dir / "cache.db").is_file():
+                continue
+            try:
+                caches[cache_dir] = diskcache.Cache(str(cache_dir), disk=CodecDisk)
+            except Exception as e:
+                logger.warning(
+                    "cache_gc_open_failed", cache_dir=str(cache_dir), error=str(e)
+                )
+        return caches
+
+    def _entry_candidates(self, cache_dir: Path, cache: Any) -> list[GCCandidate]:
+        """List DiskCache entries with their size and access statistics."""
+        rows = cache._sql(
+            "SELECT key, raw, store_time, access_count,"
+            " CASE WHEN filename IS NULL THEN COALESCE(length(value), 0)"
+            " ELSE size END + length(key)"
+            " FROM Cache"
+        ).fetchall()
+        return [
+            GCCandidate(
+                location=cache_dir,
+                key=cache._disk.get(db_key, raw),
+                size_bytes=size,
+                last_access=store_time,
+                access_count=access_count,
+            )
+            for db_key, raw, store_time, access_count, size in rows
+        ]
+
+    def _directory_candidates(self) -> list[GCCandidate]:
+        """List cached build and workspace directories."""
+        candidates = []
+        for root in self.directory_roots:
+            if not root.is_dir():
+                continue
+            for directory in root.iterdir():
+                # Hidden directories hold locks, staging and trash
+                if (
+                    directory.name.startswith(".")
+                    or directory.is_symlink()
+                    or not directory.is_dir()
+                ):
+                    continue
+                # Cache services touch directories on every hit; atime is not
+                # used because walking the directory to size it updates it
+                candidates.append(
+                    GCCandidate(
+                        location=directory,
+                        size_bytes=_directory_size(directory),
+                        last_access=directory.stat().st_mtime,
+                    )
+                )
+        return candidates
+
+    def _evict_entries(self, cache: Any, keys: list[Any]) -> None:
+        """Delete DiskCache entries in one transaction."""
+        with cache.transact():
+            for key in keys:
+                cache.delete(key)
+
+    def _evict_directory(self, candidate: GCCandidate) -> None:
+        """Delete a cached directory, renaming it out of the way first.
+
+        Directories that another process is reading or publishing are
+        skipped, the next run will reconsider them.
+        """
+        directory = candidate.location
+        lock = directory_lock(directory)
+        if not lock.acquire(blocking=False):
+            logger.debug("cache_gc_directory_busy", directory=str(directory))
+            return
+
+        # Renaming first means an interrupted GC never leaves a half-deleted
+        # workspace that still looks valid
+        trash = directory.with_name(f"{TRASH_PREFIX}{uuid.uuid4().hex[:8]}")
+        try:
+            directory.rename(trash)
+        except OSError as e:
+            logger.warning(
+                "cache_gc_evict_failed", directory=str(directory), error=str(e)
+            )
+            return
+        finally:
+            lock.release()
+
+        shutil.rmtree(trash, ignore_errors=True)
+        logger.debug(
+            "cache_gc_directory_evicted",
+            directory=str(directory),
+            size_bytes=candidate.size_bytes,
+        )
+
+    def _remove_trash(self) -> None:
+        """Delete leftovers of interrupted GC runs and crashed cache writers."""
+        stale_before = time.time() - _STALE_STAGING_SECONDS
+        for root in self.directory_roots:
+            if not root.is_dir():
+                continue
+            for trash in root.glob(f"{TRASH_PREFIX}*"):
+                shutil.rmtree(trash, ignore_errors=True)
+            for staging in root.glob(f"{STAGING_PREFIX}*"):
+                if staging.stat().st_mtime < stale_before:
+                    shutil.rmtree(staging, ignore_errors=True)
+
+    def _compact(self, cache: Any, force: bool) -> bool:
+        """VACUUM a DiskCache database if forced or fragmented.
+
+        Returns:
+            True if the database was vacuumed
+        """
+        ((page_count,),) = cache._sql("PRAGMA page_count").fetchall()
+        ((free_pages,),) = cache._sql("PRAGMA freelist_count").fetchall()
+        if not force and (
+            page_count == 0 or free_pages / page_count < _VACUUM_FREE_RATIO
+        ):
+            return False
+
+        try:
+            cache._sql("VACUUM")
+        except Exception as e:
+            # Another process holding the database only postpones compaction
+            logger.debug("cache_gc_vacuum_skipped", error=str(e))
+            return False
+        return True
+
+
+def _directory_size(directory: Path) -> int:
+    """Total size of files below directory, without following symlinks."""
+    total = 0
+    for dirpath, _dirnames, filenames in os.walk(directory):
+        for filename in filenames:
+            try:
+                total += (Path(dirpath) / filename).lstat().st_size
+            except OSError:
+                continue
+    return total
+
+
+def create_cache_gc(
+    user_config: "UserConfig",
+    max_total_bytes: int | None = None,
+    policy: str | None = None,
+    vacuum: bool = False,
+) -> CacheGarbageCollector:
+    """Create a garbage collector from user configuration.
+
+    Args:
+        user_config: User configuration instance
+        max_total_bytes: Override for the configured byte budget
+        policy: Override for the configured eviction policy
+        vacuum: VACUUM every DiskCache database
+
+    Returns:
+        Configured CacheGarbageCollector instance
+    """
+    config_data = user_config._config
+    config = CacheGCConfig(
+        max_total_bytes=(
+            max_total_bytes
+            if max_total_bytes is not None
+            else int(config_data.cache_gc_max_size_gb * 1024 * 1024 * 1024)
+        ),
+        policy=policy or config_data.cache_gc_policy,
+        vacuum=vacuum,
+    )
+    return CacheGarbageCollector(config_data.cache_path, config)
+
+
+def _background_gc_due(user_config: "UserConfig") -> bool:
+    """Check whether the configured interval passed since the last GC run."""
+    config_data = user_config._config
+    interval_seconds = config_data.cache_gc_interval_hours * 3600
+    if interval_seconds <= 0 or config_data.cache_strategy == "disabled":
+        return False
+
+    stamp = config_data.cache_path / _LAST_RUN_FILE
+    try:
+        return time.time() - stamp.stat().st_mtime >= interval_seconds
+    except FileNotFoundError:
+        return True
+
+
+def _background_gc_lock(user_config: "UserConfig") -> CacheLock:
+    """Lock held while a background GC runs."""
+    return CacheLock(user_config._config.cache_path / LOCK_DIR_NAME / _LOCK_FILE)
+
+
+def run_background_gc(user_config: "UserConfig") -> CacheGCResult | None:
+    """Run cache GC if the configured interval has passed since the last run.
+
+    The run holds an exclusive lock, so concurrent Glovebox processes do not
+    all collect at once. The last-run timestamp is written only after a
+    completed collection, so an interrupted run is retried next time.
+
+    Args:
+        user_config: User configuration instance
+
+    Returns:
+        GC result, or None if GC was not due, is disabled or already running
+    """
+    if not _background_gc_due(user_config):
+        return None
+
+    lock = _background_gc_lock(user_config)
+    if not lock.acquire(blocking=False):
+        logger.debug("cache_gc_already_running")
+        return None
+
+    try:
+        # Another process may have finished a run while we checked
+        if not _background_gc_due(user_config):
+            return None
+        result = create_cache_gc(user_config).collect()
+        stamp = user_config._config.cache_path / _LAST_RUN_FILE
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        stamp.touch()
+        return result
+    finally:
+        lock.release()
+
+
+def start_background_gc(user_config: "UserConfig") -> bool:
+    """Start cache GC in a detached process if it is due.
+
+    GC walks every cache directory and may VACUUM databases, which takes
+    longer than most commands run. A detached process keeps running after
+    the command that started it exits.
+
+    Args:
+        user_config: User configuration instance
+
+    Returns:
+        True if a GC process was started
+    """
+    if not _background_gc_due(user_config):
+        return False
+
+    # Don't start another process while one is collecting
+    lock = _background_gc_lock(user_config)
+    if not lock.acquire(blocking=False):
+        return False
+    lock.release()
+
+    command = [sys.executable, "-c", _GC_PROCESS_CODE]
+    if user_config.config_file_path:
+        command.append(str(user_config.config_file_path))
+    subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    logger.debug("cache_gc_process_started")
+    return True
@@ -0,0 +1,291 @@
+"""Cross-process coordination for directory-based caches.
+
+DiskCache databases are already safe to share between processes through
+SQLite, but the workspace and build caches are plain directories. This module
+provides what concurrent Glovebox processes need to share them:
+
+- CacheLock: a lock file held with fcntl (shared or exclusive). On systems
+  without fcntl it falls back to an O_EXCL lock file whose owner is recorded,
+  so locks left behind by crashed processes can be recovered.
+- publish_directory: populate a staging directory, then swap it into place
+  with renames so readers never see a half-written cache entry.
+"""
+
+import contextlib
+import json
+import os
+import shutil
+import socket
+import time
+import uuid
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any
+
+from glovebox.core.errors import CacheLockTimeoutError
+from glovebox.core.structlog_logger import get_struct_logger
+
+
+try:
+    import fcntl
+
+    _HAS_FCNTL = True
+except ImportError:  # pragma: no cover - Windows
+    _HAS_FCNTL = False
+
+
+logger = get_struct_logger(__name__)
+
+# Lock files for cache directories live in this hidden sibling directory
+LOCK_DIR_NAME = ".locks"
+
+# Hidden prefixes for directories that are not published cache entries
+STAGING_PREFIX = ".staging-"
+TRASH_PREFIX = ".gc-trash-"
+
+
+class CacheLock:
+    """Cross-process lock backed by a lock file.
+
+    Exclusive locks are held by one process at a time. Shared locks may be
+    held by many processes at once and exclude exclusive holders (on systems
+    without fcntl every lock is exclusive).
+    """
+
+    def __init__(
+        self,
+        lock_path: Path,
+        shared: bool = False,
+        timeout: float | None = 600.0,
+        stale_after: float = 3600.0,
+        poll_interval: float = 0.1,
+    ) -> None:
+        """Initialize lock.
+
+        Args:
+            lock_path: Lock file path (created on first use)
+            shared: Take a shared instead of an exclusive lock
+            timeout: Seconds to wait in a blocking acquire (None waits forever)
+            stale_after: Seconds after which a lock file left by a process
+                that cannot be checked is treated as stale (fallback only)
+            poll_interval: Seconds between attempts while waiting
+        """
+        self.lock_path = lock_path
+        self.shared = shared
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self.poll_interval = poll_interval
+        self.waited_seconds = 0.0
+        self._file: IO[str] | None = None
+        self._owns_fallback_file = False
+
+    @property
+    def locked(self) -> bool:
+        """Whether this instance currently holds the lock."""
+        return self._file is not None or self._owns_fallback_file
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """Acquire the lock.
+
+        Args:
+            blocking: Wait until the lock is available (up to timeout)
+
+        Returns:
+            True if acquired, False if not blocking and the lock is held
+
+        Raises:
+            CacheLockTimeoutError: If waiting exceeded the timeout
+        """
+        if self.locked:
+            return True
+
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        start = time.monotonic()
+        while True:
+            if self._try_acquire():
+                self.waited_seconds = time.monotonic() - start
+                if self.waited_seconds > self.poll_interval:
+                    logger.debug(
+                        "cache_lock_acquired_after_wait",
+                        lock_path=str(self.lock_path),
+                        waited_seconds=round(self.waited_seconds, 2),
+                    )
+                return True
+
+            if not blocking:
+                return False
+
+            waited = time.monotonic() - start
+            if self.timeout is not None and waited >= self.timeout:
+                raise CacheLockTimeoutError(
+                    f"Timed out after {waited:.0f}s waiting for cache lock {self.lock_path}"
+                )
+            time.sleep(self.poll_interval)
+
+    def release(self) -> None:
+        """Release the lock if held."""
+        if self._file is not None:
+            # Closing the file drops the fcntl lock
+            self._file.close()
+            self._file = None
+        if self._owns_fallback_file:
+            with contextlib.suppress(FileNotFoundError):
+                self.lock_path.unlink()
+            self._owns_fallback_file = False
+
+    def _try_acquire(self) -> bool:
+        """Make one attempt to take the lock."""
+        if not _HAS_FCNTL:
+            return self._try_acquire_fallback()
+
+        lock_file = self.lock_path.open("a+")
+        mode = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+        try:
+            fcntl.flock(lock_file.fileno(), mode | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+
+        if not self.shared:
+            # Owner details are informational; the kernel releases fcntl
+            # locks of dead processes by itself
+            lock_file.seek(0)
+            lock_file.truncate()
+            lock_file.write(json.dumps(_owner_info()))
+            lock_file.flush()
+        self._file = lock_file
+        return True
+
+    def _try_acquire_fallback(self) -> bool:
+        """Take the lock by exclusively creating the lock file."""
+        try:
+            fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            if self._is_stale():
+                logger.warning(
+                    "cache_lock_stale_removed", lock_path=str(self.lock_path)
+                )
+                with contextlib.suppress(FileNotFoundError):
+                    self.lock_path.unlink()
+            return False
+
+        with os.fdopen(fd, "w") as lock_file:
+            lock_file.write(json.dumps(_owner_info()))
+        self._owns_fallback_file = True
+        return True
+
+    def _is_stale(self) -> bool:
+        """Check if the lock file belongs to a process that no longer runs."""
+        try:
+            owner = json.loads(self.lock_path.read_text())
+            age = time.time() - self.lock_path.stat().st_mtime
+        except (OSError, ValueError):
+            return False
+
+        if owner.get("host") == socket.gethostname() and isinstance(
+            owner.get("pid"), int
+        ):
+            return not _pid_alive(owner["pid"])
+        return age > self.stale_after
+
+    def __enter__(self) -> "CacheLock":
+        """Acquire the lock, waiting up to the timeout."""
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Release the lock."""
+        self.release()
+
+    def __del__(self) -> None:
+        self.release()
+
+
+def _owner_info() -> dict[str, Any]:
+    """Describe the current process for lock files."""
+    return {"pid": os.getpid(), "host": socket.gethostname(), "time": time.time()}
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check if a process with pid exists on this host."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def lock_path_for(directory: Path, name: str | None = None) -> Path:
+    """Get the lock file path guarding a cache directory.
+
+    Args:
+        directory: Cache entry directory
+        name: Lock name (defaults to the directory name)
+
+    Returns:
+        Path of the lock file in the hidden lock directory next to directory
+    """
+    return directory.parent / LOCK_DIR_NAME / f"{name or directory.name}.lock"
+
+
+def directory_lock(
+    directory: Path, shared: bool = False, timeout: float | None = 600.0
+) -> CacheLock:
+    """Create the lock guarding a cache entry directory.
+
+    Readers copying out of a cache entry hold it shared, publishing and
+    eviction hold it exclusively.
+
+    Args:
+        directory: Cache entry directory
+        shared: Create a shared (reader) lock
+        timeout: Seconds to wait when acquiring
+
+    Returns:
+        Unacquired CacheLock instance
+    """
+    return CacheLock(lock_path_for(directory), shared=shared, timeout=timeout)
+
+
+def create_staging_directory(target: Path) -> Path:
+    """Create a private staging directory next to a cache entry.
+
+    Args:
+        target: Cache entry directory that will be published
+
+    Returns:
+        Empty hidden directory on the same filesystem as target
+    """
+    staging = target.with_name(f"{STAGING_PREFIX}{target.name}-{uuid.uuid4().hex[:8]}")
+    staging.mkdir(parents=True)
+    return staging
+
+
+def publish_directory(staging: Path, target: Path) -> None:
+    """Atomically replace target with a fully populated staging directory.
+
+    The swap happens under the exclusive directory lock, so it waits for
+    readers copying out of the previous version. The previous version is
+    deleted after the lock is released.
+
+    Args:
+        staging: Directory created with create_staging_directory
+        target: Cache entry directory to publish to
+    """
+    previous = None
+    with directory_lock(target):
+        if target.exists():
+            previous = target.with_name(f"{TRASH_PREFIX}{uuid.uuid4().hex[:8]}")
+            target.rename(previous)
+        staging.rename(target)
+
+    if previous is not None:
+        shutil.rmtree(previous, ignore_errors=True)
+    logger.debug("cache_directory_published", target=str(target))
@@ -0,0 +1,163 @@
+"""Bounded in-process LRU store used as the hot tier of the cache system."""
+
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+from glovebox.core.cache.models import MemoryCacheConfig
+
+
+class _MemoryEntry(NamedTuple):
+    """Serialized value with its absolute expiry time."""
+
+    payload: bytes
+    expire_at: float | None
+
+
+class MemoryLRUCache:
+    """Thread-safe LRU store bounded by entry count and serialized size.
+
+    Values are kept pickled so every ``get`` returns a fresh copy, matching
+    the semantics of the disk tier (callers may mutate what they receive
+    without corrupting the cached value) and giving an exact byte size for
+    the size bound.
+    """
+
+    def __init__(self, config: MemoryCacheConfig | None = None) -> None:
+        """Initialize memory store.
+
+        Args:
+            config: Memory tier configuration (defaults used when None)
+        """
+        self.config = config or MemoryCacheConfig()
+        self._entries: OrderedDict[str, _MemoryEntry] = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        self.eviction_count = 0
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Look up a key.
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            Tuple of (found, value); value is None when not found
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+
+            if entry.expire_at is not None and entry.expire_at <= time.time():
+                self._remove(key)
+                return False, None
+
+            self._entries.move_to_end(key)
+            payload = entry.payload
+
+        return True, pickle.loads(payload)
+
+    def set(self, key: str, value: Any, expire_at: float | None = None) -> bool:
+        """Store a value, evicting least recently used entries as needed.
+
+        Args:
+            key: Cache key to store under
+            value: Value to store
+            expire_at: Absolute expiry timestamp (None for no expiration)
+
+        Returns:
+            True if the value was stored, False if it was skipped
+        """
+        if self.config.max_ttl is not None:
+            ttl_bound = time.time() + self.config.max_ttl
+            expire_at = ttl_bound if expire_at is None else min(expire_at, ttl_bound)
+
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # Unpicklable values are served from the disk tier only
+            self.discard(key)
+            return False
+
+        with self._lock:
+            self._remove(key)
+            if len(payload) > self.config.max_entry_size_bytes:
+                return False
+
+            self._entries[key] = _MemoryEntry(payload, expire_at)
+            self._size_bytes += len(payload)
+
+            while self._entries and (
+                len(self._entries) > self.config.max_entries
+                or self._size_bytes > self.config.max_size_bytes
+            ):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.eviction_count += 1
+
+        return True
+
+    def discard(self, key: str) -> bool:
+        """Remove a key if present.
+
+        Args:
+            key: Cache key to remove
+
+        Returns:
+            True if key was present
+        """
+        with self._lock:
+            return self._remove(key)
+
+    def contains(self, key: str) -> bool:
+        """Check if a non-expired entry exists for key."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            if entry.expire_at is not None and entry.expire_at <= time.time():
+                self._remove(key)
+                return False
+            return True
+
+    def purge_expired(self) -> int:
+        """Drop all expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        with self._lock:
+            expired = [
+                key
+                for key, entry in self._entries.items()
+                if entry.expire_at is not None and entry.expire_at <= now
+            ]
+            for key in expired:
+                self._remove(key)
+        return len(expired)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        """Total serialized size of stored entries."""
+        return self._size_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> bool:
+        """Remove key while holding the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._size_bytes -= len(entry.payload)
+        return True
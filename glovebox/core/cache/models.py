@@ -1,7 +1,7 @@
 """Data models for DiskCache-based cache system."""
 
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -14,13 +14,25 @@ class DiskCacheConfig:
         cache_path: Directory for cache storage
         max_size_bytes: Maximum cache size in bytes (default: 2GB)
         timeout: Operation timeout in seconds (default: 30)
-        eviction_policy: Eviction policy, always 'least-recently-stored' for DiskCache
+        eviction_policy: DiskCache eviction policy ('least-recently-stored',
+            'least-recently-used', 'least-frequently-used' or 'none'). The
+            LRU and LFU policies also keep access times and counts up to date,
+            which the cache GC uses to rank entries.
+        codec: Value codec, 'auto' (msgpack, then orjson, then pickle),
+            'msgpack', 'json' or 'pickle'
+        compression: Compression for large values, 'auto' (zstd, then zlib),
+            'zstd', 'zlib' or 'none'
+        compress_threshold_bytes: Compress encoded values at least this large
+            (None disables compression)
     """
 
     cache_path: Path | str
     max_size_bytes: int = 2 * 1024 * 1024 * 1024  # 2GB default
     timeout: int = 30
     eviction_policy: str = "least-recently-stored"  # DiskCache default
+    codec: str = "auto"
+    compression: str = "auto"
+    compress_threshold_bytes: int | None = 64 * 1024  # 64KB default
 
     def __post_init__(self) -> None:
         """Ensure cache_path is a Path object."""
@@ -28,6 +40,98 @@ class DiskCacheConfig:
             object.__setattr__(self, "cache_path", Path(self.cache_path))
 
 
+@dataclass
+class MemoryCacheConfig:
+    """Configuration for the in-process LRU tier placed in front of DiskCache.
+
+    Args:
+        max_entries: Maximum number of entries kept in memory (default: 1024)
+        max_size_bytes: Maximum serialized size of all entries (default: 16MB)
+        max_entry_size_bytes: Entries larger than this stay disk-only (default: 1MB)
+        max_ttl: Upper bound in seconds on how long an entry is served from
+            memory before it is re-read from disk, so writes made by other
+            processes become visible (None for no bound)
+    """
+
+    max_entries: int = 1024
+    max_size_bytes: int = 16 * 1024 * 1024  # 16MB default
+    max_entry_size_bytes: int = 1024 * 1024  # 1MB default
+    max_ttl: int | None = 60
+
+
+@dataclass
+class CacheGCConfig:
+    """Configuration for the unified cache garbage collector.
+
+    Args:
+        max_total_bytes: Byte budget shared by all DiskCache tags, cached
+            builds and cached workspaces (default: 20GB)
+        policy: Eviction order, 'lru' (least recently used first), 'lfu'
+            (least frequently used first) or 'size' (size-weighted: large,
+            long-unused entries first). DiskCache entries are ranked by
+            store time, directories by their last use.
+        min_age_seconds: Entries used more recently than this are never
+            evicted (default: 1 hour)
+        vacuum: VACUUM every DiskCache database, not only fragmented ones
+    """
+
+    max_total_bytes: int = 20 * 1024 * 1024 * 1024  # 20GB default
+    policy: str = "lru"
+    min_age_seconds: float = 3600.0
+    vacuum: bool = False
+
+
+@dataclass
+class GCCandidate:
+    """Evictable unit found by the cache GC.
+
+    Either a single DiskCache entry (key set) or a cached build/workspace
+    directory (key None).
+    """
+
+    location: Path
+    size_bytes: int
+    last_access: float
+    access_count: int = 0
+    key: str | None = None
+
+    @property
+    def kind(self) -> str:
+        """Return 'entry' for DiskCache entries, 'directory' otherwise."""
+        return "directory" if self.key is None else "entry"
+
+
+@dataclass
+class CacheGCResult:
+    """Outcome of a cache GC run."""
+
+    policy: str
+    budget_bytes: int
+    total_bytes_before: int
+    total_bytes_after: int
+    expired_entries: int = 0
+    evicted: list[GCCandidate] = field(default_factory=list)
+    vacuumed_databases: int = 0
+    dry_run: bool = False
+
+    @property
+    def evicted_entries(self) -> int:
+        """Number of DiskCache entries evicted."""
+        return sum(1 for candidate in self.evicted if candidate.key is not None)
+
+    @property
+    def evicted_directories(self) -> int:
+        """Number of build/workspace directories evicted."""
+        return sum(1 for candidate in self.evicted if candidate.key is None)
+
+    @property
+    def reclaimed_bytes(self) -> int:
+        """Bytes freed (estimated from entry sizes during dry runs)."""
+        if self.dry_run:
+            return sum(candidate.size_bytes for candidate in self.evicted)
+        return max(self.total_bytes_before - self.total_bytes_after, 0)
+
+
 @dataclass
 class CacheStats:
     """Cache performance statistics compatible with old cache interface."""
@@ -42,6 +146,11 @@ class CacheStats:
     operation_count: int = 0
     total_operation_time: float = 0.0
     tag: str | None = None
+    # Memory tier fields (only populated by tiered caches)
+    memory_hit_count: int = 0
+    memory_entries: int = 0
+    memory_size_bytes: int = 0
+    memory_eviction_count: int = 0
 
     @property
     def hit_rate(self) -> float:
@@ -56,6 +165,14 @@ class CacheStats:
         """Calculate cache miss rate as percentage."""
         return 100.0 - self.hit_rate
 
+    @property
+    def memory_hit_rate(self) -> float:
+        """Calculate percentage of requests served by the memory tier."""
+        total_requests = self.hit_count + self.miss_count
+        if total_requests == 0:
+            return 0.0
+        return (self.memory_hit_count / total_requests) * 100.0
+
     @property
     def avg_operation_time(self) -> float:
         """Calculate average operation time in seconds."""
@@ -77,6 +194,11 @@ class CacheStats:
             "hit_rate": self.hit_rate,
             "miss_rate": self.miss_rate,
             "avg_operation_time": self.avg_operation_time,
+            "memory_hit_count": self.memory_hit_count,
+            "memory_entries": self.memory_entries,
+            "memory_size_bytes": self.memory_size_bytes,
+            "memory_eviction_count": self.memory_eviction_count,
+            "memory_hit_rate": self.memory_hit_rate,
             "tag": self.tag,
         }
 
@@ -0,0 +1,211 @@
+"""Two-tier cache manager: in-process LRU in front of DiskCache."""
+
+import time
+from typing import Any
+
+from glovebox.core.cache.diskcache_manager import DiskCacheManager
+from glovebox.core.cache.memory_cache import MemoryLRUCache
+from glovebox.core.cache.models import CacheStats, DiskCacheConfig, MemoryCacheConfig
+
+
+class TieredCacheManager(DiskCacheManager):
+    """DiskCache manager with a bounded in-memory LRU tier.
+
+    Reads are served from memory when possible and fall back to DiskCache,
+    promoting hits into memory with their remaining TTL. Writes go through
+    to disk first so the disk tier always stays authoritative.
+    """
+
+    def __init__(
+        self,
+        config: DiskCacheConfig,
+        tag: str | None = None,
+        session_metrics: Any | None = None,
+        memory_config: MemoryCacheConfig | None = None,
+    ) -> None:
+        """Initialize tiered cache manager.
+
+        Args:
+            config: Disk tier configuration
+            tag: Optional tag for cache isolation (for metrics tracking)
+            session_metrics: Optional SessionMetrics instance for metrics integration
+            memory_config: Memory tier configuration (defaults used when None)
+        """
+        super().__init__(config, tag=tag, session_metrics=session_metrics)
+        self._memory = MemoryLRUCache(memory_config)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Retrieve value from memory, falling back to disk.
+
+        Args:
+            key: Cache key to retrieve
+            default: Default value if key not found
+
+        Returns:
+            Cached value or default
+        """
+        with self._measure_operation("get"):
+            found, value = self._memory.get(key)
+            if found:
+                self._stats.memory_hit_count += 1
+                self._record_hit()
+                return value
+
+            value, expire_time = self._get_entry(key, default)
+            if value is not default:
+                self._memory.set(key, value, expire_at=expire_time)
+            return value
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """Store value on disk and in memory (write-through).
+
+        Args:
+            key: Cache key to store under
+            value: Value to cache
+            ttl: Time-to-live in seconds (None for no expiration)
+        """
+        try:
+            super().set(key, value, ttl=ttl)
+        except Exception:
+            # Never serve a value from memory that disk failed to store
+            self._memory.discard(key)
+            raise
+
+        expire_at = time.time() + ttl if ttl is not None else None
+        self._memory.set(key, value, expire_at=expire_at)
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Retrieve multiple values, reading only memory misses from disk.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Dictionary mapping found keys to their values (missing keys omitted)
+        """
+        results: dict[str, Any] = {}
+        disk_keys = []
+        for key in keys:
+            found, value = self._memory.get(key)
+            if found:
+                results[key] = value
+            else:
+                disk_keys.append(key)
+
+        memory_hits = len(keys) - len(disk_keys)
+        self._stats.memory_hit_count += memory_hits
+        for _ in range(memory_hits):
+            self._record_hit()
+
+        if disk_keys:
+            with self._measure_operation("get_many"):
+                try:
+                    entries = self._fetch_many(disk_keys)
+                except Exception as e:
+                    self._stats.error_count += 1
+                    self.logger.warning(
+                        "cache_get_many_error",
+                        key_count=len(disk_keys),
+                        error=str(e),
+                    )
+                    return results
+
+            for key in disk_keys:
+                if key in entries:
+                    value, expire_time = entries[key]
+                    self._record_hit()
+                    self._memory.set(key, value, expire_at=expire_time)
+                    results[key] = value
+                else:
+                    self._record_miss(key)
+
+        return results
+
+    def set_many(self, items: dict[str, Any], ttl: int | None = None) -> None:
+        """Store multiple values on disk and in memory (write-through).
+
+        Args:
+            items: Mapping of cache keys to values
+            ttl: Time-to-live in seconds applied to every entry (None for no expiration)
+        """
+        try:
+            super().set_many(items, ttl=ttl)
+        except Exception:
+            for key in items:
+                self._memory.discard(key)
+            raise
+
+        expire_at = time.time() + ttl if ttl is not None else None
+        for key, value in items.items():
+            self._memory.set(key, value, expire_at=expire_at)
+
+    def delete(self, key: str) -> bool:
+        """Remove value from both tiers.
+
+        Args:
+            key: Cache key to remove
+
+        Returns:
+            True if key was removed from disk, False if not found
+        """
+        self._memory.discard(key)
+        return super().delete(key)
+
+    def delete_many(self, keys: list[str]) -> int:
+        """Remove multiple values from both tiers.
+
+        Args:
+            keys: List of cache keys to remove
+
+        Returns:
+            Number of keys removed from disk
+        """
+        for key in keys:
+            self._memory.discard(key)
+        return super().delete_many(keys)
+
+    def clear(self) -> None:
+        """Clear all entries from both tiers."""
+        self._memory.clear()
+        super().clear()
+
+    def exists(self, key: str) -> bool:
+        """Check if key exists in either tier.
+
+        Args:
+            key: Cache key to check
+
+        Returns:
+            True if key exists and is not expired
+        """
+        return self._memory.contains(key) or super().exists(key)
+
+    def get_stats(self) -> CacheStats:
+        """Get cache statistics including memory tier figures.
+
+        Returns:
+            Current cache statistics
+        """
+        stats = super().get_stats()
+        stats.memory_entries = len(self._memory)
+        stats.memory_size_bytes = self._memory.size_bytes
+        stats.memory_eviction_count = self._memory.eviction_count
+        return stats
+
+    def cleanup(self) -> int:
+        """Remove expired entries from both tiers.
+
+        Returns:
+            Number of disk entries removed
+        """
+        self._memory.purge_expired()
+        return super().cleanup()
+
+    def close(self) -> None:
+        """Drop the memory tier and close the disk tier."""
+        self._memory.clear()
+        super().close()
+
+    def __enter__(self) -> "TieredCacheManager":
+        """Context manager entry."""
+        return self
@@ -55,12 +55,54 @@ class BuildError(GloveboxError):
     pass
 
 
+class BuildLogError(BuildError):
+    """Exception raised for errors writing or reading build logs."""
+
+    pass
+
+
 class FlashError(GloveboxError):
     """Exception raised for errors in firmware flashing."""
 
     pass
 
 
+class CacheError(GloveboxError):
+    """Exception raised for errors in cache operations."""
+
+    pass
+
+
+class CacheCodecError(CacheError):
+    """Exception raised when a cached value cannot be encoded or decoded."""
+
+    pass
+
+
+class CacheLockTimeoutError(CacheError):
+    """Exception raised when waiting for a cache lock times out."""
+
+    pass
+
+
+class GitMirrorError(CacheError):
+    """Exception raised when a git mirror cannot be created or updated."""
+
+    pass
+
+
+class WorkspaceArchiveError(CacheError):
+    """Exception raised when a workspace archive cannot be written or read."""
+
+    pass
+
+
+class ServerError(GloveboxError):
+    """Exception raised for errors talking to the glovebox compile server."""
+
+    pass
+
+
 class ConfigError(GloveboxError):
     """Exception raised for errors in configuration handling."""
 
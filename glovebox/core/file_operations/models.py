@@ -16,6 +16,7 @@ class CopyProgress:
     total_bytes: int
     current_file: str
     component_name: str = ""  # For component-level operations
+    elapsed_seconds: float = 0.0  # Time since the operation started
 
     @property
     def file_progress_percent(self) -> float:
@@ -34,7 +35,8 @@ class CopyProgress:
     @property
     def speed_mbps(self) -> float:
         """Calculate copy speed in MB/s."""
-        # Speed calculation would be handled externally with timing
+        if self.elapsed_seconds > 0:
+            return self.bytes_copied / (1024 * 1024) / self.elapsed_seconds
         return 0.0
 
 
@@ -0,0 +1,276 @@
+"""File watching with inotify on Linux and a polling fallback elsewhere."""
+
+import contextlib
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from glovebox.core.structlog_logger import get_struct_logger
+
+
+logger = get_struct_logger(__name__)
+
+# inotify event masks from <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+
+# Editors save in place, by rename, or by delete and recreate
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+# struct inotify_event header: wd, mask, cookie, len
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    """Get a cheap change signature for a file, None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def content_digest(paths: Iterable[Path]) -> str:
+    """Hash the content of files so saves that change nothing can be skipped.
+
+    Missing files hash differently from empty ones.
+
+    Args:
+        paths: Files to hash, in a stable order
+
+    Returns:
+        Hex SHA-256 digest over all file contents
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        try:
+            content = Path(path).read_bytes()
+        except OSError:
+            digest.update(b"\0missing\0")
+            continue
+        digest.update(len(content).to_bytes(8, "little"))
+        digest.update(content)
+    return digest.hexdigest()
+
+
+class PollingFileWatcher:
+    """Detect file changes by comparing modification times and sizes."""
+
+    def __init__(self, paths: Iterable[Path], interval: float = 0.5) -> None:
+        """Initialize the watcher.
+
+        Args:
+            paths: Files to watch
+            interval: Seconds between checks
+        """
+        self.paths = [Path(path).resolve() for path in paths]
+        self.interval = interval
+        self._signatures = {path: _file_signature(path) for path in self.paths}
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """Wait for changes.
+
+        Args:
+            timeout: Seconds to wait, None to wait until something changes
+
+        Returns:
+            Paths that changed, empty if the timeout expired first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = set()
+            for path in self.paths:
+                signature = _file_signature(path)
+                if signature != self._signatures[path]:
+                    self._signatures[path] = signature
+                    changed.add(path)
+            if changed:
+                return changed
+
+            if deadline is None:
+                time.sleep(self.interval)
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return set()
+            time.sleep(min(self.interval, remaining))
+
+    def close(self) -> None:
+        """Release watcher resources."""
+
+
+class InotifyFileWatcher:
+    """Detect file changes with Linux inotify.
+
+    The parent directories are watched rather than the files themselves so
+    that atomic saves, which replace the file, keep being noticed.
+    """
+
+    def __init__(self, paths: Iterable[Path]) -> None:
+        """Initialize the watcher.
+
+        Args:
+            paths: Files to watch
+
+        Raises:
+            OSError: If inotify is unavailable or a watch cannot be added
+        """
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+
+        self._libc.inotify_add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+
+        self.paths = {Path(path).resolve() for path in paths}
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self._directories: dict[int, Path] = {}
+        try:
+            for directory in {path.parent for path in self.paths}:
+                wd = self._libc.inotify_add_watch(
+                    self._fd, os.fsencode(directory), _WATCH_MASK
+                )
+                if wd < 0:
+                    errno = ctypes.get_errno()
+                    raise OSError(
+                        errno, f"Cannot watch {directory}: {os.strerror(errno)}"
+                    )
+                self._directories[wd] = directory
+        except OSError:
+            os.close(self._fd)
+            raise
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """Wait for changes.
+
+        Args:
+            timeout: Seconds to wait, None to wait until something changes
+
+        Returns:
+            Paths that changed, empty if the timeout expired first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = (
+                None if deadline is None else max(0.0, deadline - time.monotonic())
+            )
+            readable, _, _ = select.select([self._fd], [], [], remaining)
+            if not readable:
+                return set()
+
+            changed = self._read_events()
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+
+    def _read_events(self) -> set[Path]:
+        """Read pending events and map them to watched paths."""
+        try:
+            buffer = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed: set[Path] = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buffer):
+            wd, mask, _, name_length = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size
+            name = buffer[offset : offset + name_length].rstrip(b"\0")
+            offset += name_length
+
+            if mask & _IN_Q_OVERFLOW:
+                # Events were dropped, so any file may have changed
+                return set(self.paths)
+            directory = self._directories.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if path in self.paths:
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        """Release the inotify file descriptor."""
+        if self._fd >= 0:
+            with contextlib.suppress(OSError):
+                os.close(self._fd)
+            self._fd = -1
+
+
+FileWatcher = PollingFileWatcher | InotifyFileWatcher
+
+
+def create_file_watcher(
+    paths: Iterable[Path], poll_interval: float = 0.5, polling: bool = False
+) -> FileWatcher:
+    """Create the best available watcher for the given files.
+
+    Args:
+        paths: Files to watch
+        poll_interval: Seconds between checks when polling
+        polling: Always poll instead of using inotify
+
+    Returns:
+        InotifyFileWatcher on Linux when available, else PollingFileWatcher
+    """
+    paths = list(paths)
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyFileWatcher(paths)
+        except OSError as e:
+            logger.debug("inotify_unavailable_using_polling", error=str(e))
+    return PollingFileWatcher(paths, interval=poll_interval)
+
+
+def watch_files(
+    paths: Iterable[Path],
+    on_change: Callable[[set[Path]], None],
+    debounce: float = 0.3,
+    stop_event: threading.Event | None = None,
+    watcher: FileWatcher | None = None,
+) -> None:
+    """Call on_change whenever watched files change, until stopped.
+
+    Bursts of events, such as an editor writing a file in several steps,
+    are collapsed into one call once no further event arrives for
+    `debounce` seconds.
+
+    Args:
+        paths: Files to watch
+        on_change: Called with the set of changed paths
+        debounce: Quiet period in seconds before on_change is called
+        stop_event: Event that ends watching when set; watch until
+            interrupted if not given
+        watcher: Watcher to use instead of create_file_watcher(paths)
+    """
+    active_watcher = watcher or create_file_watcher(paths)
+    stop = stop_event or threading.Event()
+    try:
+        while not stop.is_set():
+            changed = active_watcher.wait(timeout=0.5)
+            if not changed:
+                continue
+            while more := active_watcher.wait(timeout=debounce):
+                changed |= more
+            on_change(changed)
+    finally:
+        active_watcher.close()
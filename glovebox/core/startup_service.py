@@ -61,6 +61,9 @@ class StartupService:
         # Don't wait for threads to complete - let them run in background
         self.logger.debug("background_threads_started", thread_count=2)
 
+        # Cache GC outlives short commands, so it runs in its own process
+        self._safe_start_cache_gc()
+
     def _safe_check_zmk_updates(self) -> None:
         """Safely check for ZMK updates, handling stdout issues during shutdown."""
         with contextlib.suppress(Exception):
@@ -73,6 +76,16 @@ class StartupService:
             # Silently ignore errors during shutdown
             self._check_glovebox_updates()
 
+    def _safe_start_cache_gc(self) -> None:
+        """Start opportunistic cache GC, ignoring any failure."""
+        try:
+            from glovebox.core.cache.gc import start_background_gc
+
+            start_background_gc(self.user_config)
+        except Exception as e:
+            # Cache GC is best-effort - don't interrupt user workflow
+            self.logger.debug("background_cache_gc_failed", error=str(e))
+
     def _check_zmk_updates(self) -> None:
         """Check for ZMK firmware updates and notify user if available."""
         try:
@@ -0,0 +1,293 @@
+"""Shell completion served from a precomputed completion index.
+
+This module is the ``glovebox-complete`` entry point. It only uses the
+standard library and must not import other glovebox modules: importing
+Typer, pydantic or diskcache costs more than a keypress is worth. The index
+it reads is written by glovebox.cli.helpers.completion_index.
+
+Bash setup::
+
+    complete -o default -C glovebox-complete glovebox
+
+Bash then runs ``glovebox-complete <command> <word> <previous word>`` with
+the command line in COMP_LINE and COMP_POINT. When no candidate applies,
+nothing is printed and bash falls back to file name completion.
+"""
+
+import json
+import os
+import shlex
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+
+INDEX_VERSION = 1
+INDEX_FILE_NAME = "completion_index.json"
+
+# Minimum seconds between background rebuilds started by the completer
+REBUILD_INTERVAL = 60
+
+PROFILE_OPTIONS = frozenset({"--profile", "-p"})
+FIELD_OPTIONS = frozenset(
+    {"--field", "--get", "--set", "--merge", "--append", "--unset"}
+)
+LAYER_OPTIONS = frozenset({"--layer"})
+
+# Maximum candidates for library references, matching the CLI completers
+MAX_LIBRARY_COMPLETIONS = 20
+
+
+def get_completion_index_path() -> Path:
+    """Get the completion index location.
+
+    The index lives in the XDG cache directory rather than the configurable
+    cache path, because reading the user configuration is what this module
+    avoids.
+    """
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "glovebox" / INDEX_FILE_NAME
+
+
+def load_completion_index(index_path: Path | None = None) -> dict[str, Any] | None:
+    """Load the completion index.
+
+    Returns:
+        Index data, or None if missing, unreadable or of another version
+    """
+    try:
+        index = json.loads((index_path or get_completion_index_path()).read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        return None
+    return index
+
+
+def source_stamp(path: Path) -> int | None:
+    """Modification time of an index source, None if it does not exist."""
+    try:
+        return Path(path).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def is_index_fresh(index: dict[str, Any]) -> bool:
+    """Check that no source of the index changed since it was built.
+
+    Sources are the keyboard search directories and configuration files,
+    the library index and the command definitions.
+    """
+    keyboard_path_env = os.environ.get("GLOVEBOX_KEYBOARD_PATH", "")
+    if index.get("keyboard_path_env") != keyboard_path_env:
+        return False
+    return all(
+        source_stamp(Path(path)) == stamp
+        for path, stamp in index.get("sources", {}).items()
+    )
+
+
+def write_completion_index(
+    index: dict[str, Any], index_path: Path | None = None
+) -> None:
+    """Atomically write the completion index."""
+    index_path = index_path or get_completion_index_path()
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_name(f".{index_path.name}.{os.getpid()}")
+    tmp_path.write_text(json.dumps(index, separators=(",", ":")))
+    tmp_path.replace(index_path)
+
+
+def request_rebuild(index_path: Path | None = None) -> None:
+    """Rebuild the index in a detached background process.
+
+    Rebuilds are rate limited with a stamp file, so repeated key presses do
+    not start a process each.
+    """
+    index_path = index_path or get_completion_index_path()
+    stamp = index_path.with_name(f".{index_path.name}.rebuild")
+    try:
+        if time.time() - stamp.stat().st_mtime < REBUILD_INTERVAL:
+            return
+    except OSError:
+        pass
+
+    try:
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        stamp.touch()
+        subprocess.Popen(
+            [sys.executable, "-m", "glovebox.cli.helpers.completion_index"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+def _profile_candidates(index: dict[str, Any], incomplete: str) -> list[str]:
+    """Complete keyboard and keyboard/firmware profile names."""
+    profiles: dict[str, list[str]] = index.get("profiles", {})
+    if "/" in incomplete:
+        keyboard, _ = incomplete.split("/", 1)
+        return sorted(
+            f"{keyboard}/{firmware}"
+            for firmware in profiles.get(keyboard, [])
+            if f"{keyboard}/{firmware}".startswith(incomplete)
+        )
+
+    candidates = []
+    for keyboard, firmwares in profiles.items():
+        if keyboard.startswith(incomplete):
+            candidates.append(keyboard)
+            candidates.extend(f"{keyboard}/{firmware}" for firmware in firmwares)
+    return sorted(set(candidates))
+
+
+def _recent_layout(index: dict[str, Any], words: list[str]) -> dict[str, Any] | None:
+    """Find the indexed layout named on the command line, if still current."""
+    layouts: dict[str, dict[str, Any]] = index.get("layouts", {})
+    candidates = [*words]
+    if os.environ.get("GLOVEBOX_JSON_FILE"):
+        candidates.append(os.environ["GLOVEBOX_JSON_FILE"])
+
+    for word in candidates:
+        if not word.endswith(".json"):
+            continue
+        path = Path(word).expanduser().resolve()
+        layout = layouts.get(str(path))
+        if layout and source_stamp(path) == layout.get("mtime_ns"):
+            return layout
+    return None
+
+
+def _field_candidates(
+    index: dict[str, Any], words: list[str], incomplete: str
+) -> list[str]:
+    """Complete layout field paths, comma separated lists included."""
+    fields = list(index.get("fields", []))
+    layout = _recent_layout(index, words)
+    if layout:
+        fields.extend(layout.get("fields", []))
+
+    prefix = ""
+    if "," in incomplete:
+        prefix, incomplete = incomplete.rsplit(",", 1)
+        prefix += ","
+
+    if not incomplete and not prefix:
+        return sorted({f for f in fields if "." not in f and "[" not in f})
+    return sorted({prefix + f for f in fields if f.startswith(incomplete)})
+
+
+def _walk_command_tree(
+    tree: dict[str, Any], words: list[str]
+) -> tuple[dict[str, Any], str | None]:
+    """Find the command node for the words typed so far.
+
+    Returns:
+        Tuple of (command node, option awaiting a value or None)
+    """
+    node = tree
+    pending_option = None
+    for word in words:
+        if pending_option is not None:
+            pending_option = None
+            continue
+        if word.startswith("-"):
+            if "=" not in word and node.get("options", {}).get(word):
+                pending_option = word
+            continue
+        node = node.get("commands", {}).get(word, node)
+    return node, pending_option
+
+
+def complete(index: dict[str, Any], words: list[str], incomplete: str) -> list[str]:
+    """Compute completion candidates.
+
+    Args:
+        index: Completion index data
+        words: Words before the one being completed, without the program name
+        incomplete: Word being completed
+
+    Returns:
+        Matching candidates, empty to fall back to file name completion
+    """
+    node, option = _walk_command_tree(index.get("commands", {}), words)
+
+    if option is None and incomplete.startswith("--") and "=" in incomplete:
+        option, incomplete = incomplete.split("=", 1)
+        candidates = complete_option(index, words, option, incomplete)
+        return [f"{option}={candidate}" for candidate in candidates]
+
+    if option is not None:
+        return complete_option(index, words, option, incomplete)
+
+    if incomplete.startswith("@"):
+        references = sorted(
+            ref for ref in index.get("library", []) if ref.startswith(incomplete)
+        )
+        return references[:MAX_LIBRARY_COMPLETIONS]
+
+    if incomplete.startswith("-"):
+        return sorted(o for o in node.get("options", {}) if o.startswith(incomplete))
+
+    return [name for name in node.get("commands", {}) if name.startswith(incomplete)]
+
+
+def complete_option(
+    index: dict[str, Any], words: list[str], option: str, incomplete: str
+) -> list[str]:
+    """Complete the value of an option."""
+    if option in PROFILE_OPTIONS:
+        return _profile_candidates(index, incomplete)
+    if option in FIELD_OPTIONS:
+        return _field_candidates(index, words, incomplete)
+    if option in LAYER_OPTIONS:
+        layout = _recent_layout(index, words)
+        layers = layout.get("layer_names", []) if layout else []
+        return [name for name in layers if name.startswith(incomplete)]
+    if incomplete.startswith("@"):
+        return complete(index, [], incomplete)
+    return []
+
+
+def _split_command_line(line: str) -> list[str]:
+    """Split a partial command line into words, tolerating open quotes."""
+    try:
+        words = shlex.split(line)
+    except ValueError:
+        words = line.split()
+    if line and line[-1].isspace():
+        words.append("")
+    return words
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print completion candidates for bash ``complete -C``."""
+    argv = sys.argv if argv is None else argv
+    line = os.environ.get("COMP_LINE", " ".join(argv[1:2]))
+    point = int(os.environ.get("COMP_POINT", len(line)))
+    words = _split_command_line(line[:point]) or [""]
+    if len(words) == 1:
+        words.append("")
+    incomplete = words[-1]
+
+    index_path = get_completion_index_path()
+    index = load_completion_index(index_path)
+    if index is None or not is_index_fresh(index):
+        request_rebuild(index_path)
+    if index is None:
+        return 0
+
+    for candidate in complete(index, words[1:-1], incomplete):
+        print(candidate)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
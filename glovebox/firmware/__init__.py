@@ -5,11 +5,17 @@ from glovebox.firmware import registry_init  # noqa: F401
 
 # Import method registry (flasher methods still needed for flash operations)
 from glovebox.firmware.method_registry import flasher_registry
-from glovebox.firmware.models import BuildResult, FirmwareOutputFiles, OutputPaths
+from glovebox.firmware.models import (
+    BuildCacheStats,
+    BuildResult,
+    FirmwareOutputFiles,
+    OutputPaths,
+)
 
 
 __all__ = [
     # Result models
+    "BuildCacheStats",
     "BuildResult",
     "FirmwareOutputFiles",
     "OutputPaths",
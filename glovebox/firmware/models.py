@@ -47,6 +47,33 @@ class FirmwareOutputFiles:
     artifacts_dir: Path | None = None
 
 
+class BuildCacheStats(GloveboxBaseModel):
+    """Compiler cache, build directory and Nix store reuse of a firmware build."""
+
+    compiler_cache_hits: int = Field(default=0, ge=0)
+    compiler_cache_misses: int = Field(default=0, ge=0)
+    reused_build_dirs: int = Field(default=0, ge=0)
+    fresh_build_dirs: int = Field(default=0, ge=0)
+    nix_cache_hits: int = Field(default=0, ge=0)
+    nix_cache_misses: int = Field(default=0, ge=0)
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Fraction of compiler invocations served from the cache."""
+        total = self.compiler_cache_hits + self.compiler_cache_misses
+        if total == 0:
+            return None
+        return self.compiler_cache_hits / total
+
+    @property
+    def nix_hit_rate(self) -> float | None:
+        """Fraction of missing Nix store paths served from the local cache."""
+        total = self.nix_cache_hits + self.nix_cache_misses
+        if total == 0:
+            return None
+        return self.nix_cache_hits / total
+
+
 class BuildResult(GloveboxBaseModel):
     """Result of firmware build operations."""
 
@@ -58,6 +85,7 @@ class BuildResult(GloveboxBaseModel):
     output_files: FirmwareOutputFiles | None = None
     build_id: str | None = None
     build_time_seconds: float | None = None
+    build_cache_stats: BuildCacheStats | None = None
 
     @field_validator("build_time_seconds")
     @classmethod
@@ -0,0 +1,292 @@
+"""Batch compilation of many layouts with a shared profile and worker pool."""
+
+import json
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydantic import ValidationError
+
+from glovebox.core.errors import LayoutError
+from glovebox.core.structlog_logger import get_struct_logger
+from glovebox.layout.models import BatchCompileResult, LayoutData
+
+
+if TYPE_CHECKING:
+    from glovebox.config.profile import KeyboardProfile
+    from glovebox.layout.service import LayoutService
+
+
+logger = get_struct_logger(__name__)
+
+# Characters that make a batch source a glob pattern rather than a path
+_GLOB_CHARS = frozenset("*?[")
+
+
+def collect_batch_inputs(source: str | Path) -> list[Path]:
+    """Resolve a batch source into the layout files it names.
+
+    Args:
+        source: Directory of JSON layouts, glob pattern, or a list file with
+            one layout path per line. Blank lines and lines starting with
+            '#' are skipped; relative paths are resolved against the list
+            file's directory.
+
+    Returns:
+        Sorted, de-duplicated list of layout file paths
+
+    Raises:
+        LayoutError: If the source does not exist or matches no layouts
+    """
+    source_str = str(source)
+    path = Path(source_str).expanduser()
+
+    if path.is_dir():
+        layouts = sorted(path.glob("*.json"))
+    elif path.is_file() and path.suffix.lower() != ".json":
+        layouts = []
+        for line in path.read_text(encoding="utf-8").splitlines():
+            entry = line.strip()
+            if not entry or entry.startswith("#"):
+                continue
+            entry_path = Path(entry).expanduser()
+            if not entry_path.is_absolute():
+                entry_path = path.parent / entry_path
+            layouts.append(entry_path)
+    elif path.is_file():
+        layouts = [path]
+    elif _GLOB_CHARS.intersection(source_str):
+        anchor = Path(path.anchor) if path.is_absolute() else Path()
+        pattern = str(path.relative_to(anchor))
+        layouts = sorted(match for match in anchor.glob(pattern) if match.is_file())
+    else:
+        raise LayoutError(f"Batch source not found: {source_str}")
+
+    unique = list(dict.fromkeys(layouts))
+    if not unique:
+        raise LayoutError(f"No layouts found in batch source: {source_str}")
+    return unique
+
+
+class _BatchWorker:
+    """Per-process compile state: profile, layout service and output settings."""
+
+    def __init__(
+        self,
+        profile: "KeyboardProfile",
+        service: "LayoutService",
+        output_dir: Path,
+        incremental: bool,
+    ) -> None:
+        self.profile = profile
+        self.service = service
+        self.output_dir = output_dir
+        self.incremental = incremental
+
+    def compile(self, layout_path: Path) -> BatchCompileResult:
+        """Compile one layout and write its keymap and config files."""
+        start = time.perf_counter()
+        try:
+            layout_data = json.loads(layout_path.read_text(encoding="utf-8"))
+            try:
+                LayoutData.model_validate(layout_data)
+            except ValidationError as e:
+                raise LayoutError(f"Invalid layout format: {e}") from e
+            result = self.service.compile(
+                layout_data, profile=self.profile, incremental=self.incremental
+            )
+            if not result.success:
+                raise LayoutError("; ".join(result.errors) or "Compilation failed")
+
+            keymap_path = self.output_dir / f"{layout_path.stem}.keymap"
+            conf_path = self.output_dir / f"{layout_path.stem}.conf"
+            keymap_path.write_text(result.keymap_content or "", encoding="utf-8")
+            conf_path.write_text(result.config_content or "", encoding="utf-8")
+        except Exception as e:
+            logger.debug("batch_layout_failed", layout=str(layout_path), error=str(e))
+            return BatchCompileResult(
+                source=layout_path,
+                success=False,
+                error=str(e),
+                duration_seconds=time.perf_counter() - start,
+            )
+
+        return BatchCompileResult(
+            source=layout_path,
+            success=True,
+            keymap_path=keymap_path,
+            conf_path=conf_path,
+            duration_seconds=time.perf_counter() - start,
+        )
+
+
+# Worker state of a pool process, set up once by _init_worker
+_worker: _BatchWorker | None = None
+
+
+def _load_profile(
+    keyboard_name: str, firmware_version: str | None, config_file: str | None
+) -> "KeyboardProfile":
+    """Load a keyboard profile with the given user config file."""
+    from glovebox.config import create_keyboard_profile, create_user_config
+
+    user_config = create_user_config(cli_config_path=config_file)
+    return create_keyboard_profile(keyboard_name, firmware_version, user_config)
+
+
+def _init_worker(
+    keyboard_name: str,
+    firmware_version: str | None,
+    config_file: str | None,
+    service_factory: Callable[[], "LayoutService"],
+    output_dir: Path,
+    incremental: bool,
+) -> None:
+    """Load the profile and layout service once for this pool process."""
+    global _worker
+    profile = _load_profile(keyboard_name, firmware_version, config_file)
+    _worker = _BatchWorker(profile, service_factory(), output_dir, incremental)
+
+
+def _compile_in_worker(layout_path: Path) -> BatchCompileResult:
+    """Compile one layout using the state set up by _init_worker."""
+    if _worker is None:
+        raise LayoutError("Batch worker was not initialized")
+    return _worker.compile(layout_path)
+
+
+class BatchLayoutCompiler:
+    """Compile many layouts against one keyboard profile.
+
+    The profile, behavior registry and template environment are loaded once
+    per worker process and reused for every layout that worker compiles.
+    With a single job everything runs in the calling process, using the
+    already loaded profile if one is given.
+    """
+
+    def __init__(
+        self,
+        keyboard_name: str,
+        firmware_version: str | None,
+        output_dir: Path,
+        service_factory: Callable[[], "LayoutService"],
+        jobs: int = 1,
+        incremental: bool = False,
+        config_file: str | Path | None = None,
+        profile: "KeyboardProfile | None" = None,
+    ) -> None:
+        """Initialize the batch compiler.
+
+        Args:
+            keyboard_name: Keyboard profile to compile against
+            firmware_version: Firmware version of the profile, if any
+            output_dir: Directory receiving <layout>.keymap and <layout>.conf
+            service_factory: Module-level callable creating a LayoutService;
+                it must be picklable when jobs is greater than one
+            jobs: Number of worker processes
+            incremental: Reuse cached keymap sections between layouts
+            config_file: User config file the workers should load
+            profile: Loaded profile to compile against in the calling process
+        """
+        if jobs < 1:
+            raise LayoutError(f"jobs must be at least 1, got {jobs}")
+        self.keyboard_name = keyboard_name
+        self.firmware_version = firmware_version
+        self.output_dir = Path(output_dir)
+        self.service_factory = service_factory
+        self.jobs = jobs
+        self.incremental = incremental
+        self.config_file = str(config_file) if config_file else None
+        self.profile = profile
+
+    def run(self, layouts: list[Path]) -> Iterator[BatchCompileResult]:
+        """Compile the layouts, yielding each result as soon as it is ready.
+
+        Args:
+            layouts: Layout files to compile
+
+        Yields:
+            One BatchCompileResult per layout, in completion order
+
+        Raises:
+            LayoutError: If two layouts would write to the same output files
+        """
+        self._check_output_names(layouts)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        init_args = (
+            self.keyboard_name,
+            self.firmware_version,
+            self.config_file,
+            self.service_factory,
+            self.output_dir,
+            self.incremental,
+        )
+        jobs = min(self.jobs, len(layouts))
+        logger.info("batch_compile_started", layouts=len(layouts), jobs=jobs)
+
+        if jobs <= 1:
+            profile = self.profile or _load_profile(
+                self.keyboard_name, self.firmware_version, self.config_file
+            )
+            worker = _BatchWorker(
+                profile, self.service_factory(), self.output_dir, self.incremental
+            )
+            for layout_path in layouts:
+                yield worker.compile(layout_path)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=init_args,
+        ) as executor:
+            futures = {
+                executor.submit(_compile_in_worker, layout_path): layout_path
+                for layout_path in layouts
+            }
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except Exception as e:
+                    yield BatchCompileResult(
+                        source=futures[future], success=False, error=str(e)
+                    )
+
+    def _check_output_names(self, layouts: list[Path]) -> None:
+        """Reject batches where two layouts share an output file stem."""
+        seen: dict[str, Path] = {}
+        for layout_path in layouts:
+            other = seen.setdefault(layout_path.stem, layout_path)
+            if other != layout_path:
+                raise LayoutError(
+                    f"Layouts {other} and {layout_path} would both write "
+                    f"'{layout_path.stem}' outputs"
+                )
+
+
+def summarize_batch(
+    results: list[BatchCompileResult], elapsed: float
+) -> dict[str, Any]:
+    """Summarize a finished batch with its throughput.
+
+    Args:
+        results: Results of every compiled layout
+        elapsed: Wall-clock seconds the batch took
+
+    Returns:
+        Dictionary with total, succeeded, failed, elapsed_seconds and
+        layouts_per_second
+    """
+    succeeded = sum(1 for result in results if result.success)
+    return {
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "elapsed_seconds": round(elapsed, 3),
+        "layouts_per_second": round(len(results) / elapsed, 2) if elapsed else 0.0,
+    }
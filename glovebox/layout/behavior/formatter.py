@@ -1,7 +1,7 @@
 """Behavior formatting service for converting JSON bindings to DTSI format."""
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from glovebox.config.models.zmk import MACRO_PLACEHOLDER
 from glovebox.core.structlog_logger import StructlogMixin, get_struct_logger
@@ -23,6 +23,14 @@ from .models import (
 
 logger = get_struct_logger(__name__)
 
+# Formatted bindings kept per formatter before the memo is reset
+_FORMAT_CACHE_LIMIT = 4096
+
+
+def _params_key(params: list[LayoutParam]) -> tuple[Any, ...]:
+    """Build a hashable key from nested binding parameters."""
+    return tuple((param.value, _params_key(param.params)) for param in params)
+
 
 class BehaviorFormatterImpl(StructlogMixin):
     """Implementation of behavior formatter."""
@@ -45,7 +53,9 @@ class BehaviorFormatterImpl(StructlogMixin):
         self._keycode_map = keycode_map or {}
         self._behavior_classes: dict[str, type[Behavior]] = {}
         self._modifier_map: dict[str, str] = {}
+        self._modifier_map_version = 0
         self._is_behavior_reference_context = False
+        self._format_cache: dict[tuple[Any, ...], str] = {}
         self._init_behavior_class_map()
         self._init_modifier_map()
 
@@ -59,12 +69,56 @@ class BehaviorFormatterImpl(StructlogMixin):
         """
         self._is_behavior_reference_context = is_behavior_reference_context
 
+    def binding_cache_key(self, binding_data: LayoutBinding) -> tuple[Any, ...]:
+        """Get the key identifying a binding's DTSI output in the current context.
+
+        Two bindings with the same key format to the same string. The key
+        combines the binding structure with the behavior reference context,
+        the modifier map version and, for custom behavior references, the
+        parameter count currently registered for the behavior.
+
+        Args:
+            binding_data: Binding to build the key for
+
+        Returns:
+            Hashable key for the binding
+        """
+        value = binding_data.value
+        registered_params = None
+        if value not in self._behavior_classes and value.startswith("&"):
+            registry_info = self._registry.get_behavior_info(value)
+            if registry_info:
+                registered_params = registry_info.expected_params
+        return (
+            self._is_behavior_reference_context,
+            self._modifier_map_version,
+            registered_params,
+            value,
+            _params_key(binding_data.params),
+        )
+
     def format_binding(self, binding_data: LayoutBinding) -> str:
         """Format a binding dictionary to DTSI string.
 
+        Results are memoized by binding_cache_key, so identical bindings are
+        only formatted once per context.
+
         Args:
             binding_data: KeymapBehavior or dictionary representing a key binding
         """
+        cache_key = self.binding_cache_key(binding_data)
+        cached = self._format_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = self._format_binding(binding_data)
+        if len(self._format_cache) >= _FORMAT_CACHE_LIMIT:
+            self._format_cache.clear()
+        self._format_cache[cache_key] = result
+        return result
+
+    def _format_binding(self, binding_data: LayoutBinding) -> str:
+        """Format a binding without consulting the memo."""
         # Runtime type check is necessary
         # if not isinstance(binding_data, dict):
         #     logger.error(f"Invalid binding data format: {binding_data}")
@@ -231,6 +285,7 @@ class BehaviorFormatterImpl(StructlogMixin):
         else:
             # Use defaults if no configuration is available
             self._modifier_map = default_modifier_map
+        self._modifier_map_version += 1
 
 
 # Behavior classes
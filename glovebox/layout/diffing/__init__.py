@@ -1,6 +1,14 @@
 from glovebox.layout.diffing.diff import LayoutDiffSystem
 from glovebox.layout.diffing.models import BehaviorChanges, LayoutDiff
 from glovebox.layout.diffing.patch import LayoutPatchSystem
+from glovebox.layout.diffing.structural import LayoutChange, iter_layout_changes
 
 
-__all__ = ["LayoutDiffSystem", "LayoutPatchSystem", "BehaviorChanges", "LayoutDiff"]
+__all__ = [
+    "LayoutDiffSystem",
+    "LayoutPatchSystem",
+    "BehaviorChanges",
+    "LayoutDiff",
+    "LayoutChange",
+    "iter_layout_changes",
+]
@@ -1,13 +1,14 @@
-import hashlib
-import json
-from collections import OrderedDict
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-import jsonpatch  # type: ignore
-from deepdiff import DeepDiff
-
 from glovebox.core.structlog_logger import get_struct_logger
+from glovebox.layout.diffing.structural import (
+    BEHAVIOR_SECTIONS,
+    LayoutChange,
+    iter_layout_changes,
+)
 from glovebox.layout.models import LayoutData
 
 
@@ -21,9 +22,6 @@ logger = get_struct_logger(__name__)
 class LayoutDiffSystem:
     """Diff and patch system specifically for LayoutData structures."""
 
-    def __init__(self) -> None:
-        self.diff_engine = DeepDiff
-
     def create_layout_diff(
         self,
         base_layout: LayoutData,
@@ -42,16 +40,7 @@ class LayoutDiffSystem:
         """
         from glovebox.layout.diffing.models import LayoutDiff
 
-        # Convert to dict for comparison
-        base_dict = base_layout.model_dump(
-            mode="json", by_alias=True, exclude_unset=True
-        )
-        modified_dict = modified_layout.model_dump(
-            mode="json", by_alias=True, exclude_unset=True
-        )
-
-        # Create diff data starting with metadata
-        diff_data = {
+        diff_data: dict[str, Any] = {
             # Diff metadata
             "base_version": base_layout.version,
             "modified_version": modified_layout.version,
@@ -59,184 +48,55 @@ class LayoutDiffSystem:
             "modified_uuid": modified_layout.uuid,
             "timestamp": datetime.now(),
             "diff_type": "layout_diff_v2",
-            # Analyze structured lists
-            "layers": self._analyze_layout_changes(base_dict, modified_dict),
-            "holdTaps": self._analyze_behavior_changes(
-                base_dict.get("holdTaps", []), modified_dict.get("holdTaps", [])
-            ),
-            "combos": self._analyze_behavior_changes(
-                base_dict.get("combos", []), modified_dict.get("combos", [])
-            ),
-            "macros": self._analyze_behavior_changes(
-                base_dict.get("macros", []), modified_dict.get("macros", [])
-            ),
-            "inputListeners": self._analyze_behavior_changes(
-                base_dict.get("inputListeners", []),
-                modified_dict.get("inputListeners", []),
-                name_field="code",  # inputListeners use 'code' not 'name'
-            ),
         }
-
-        # Analyze simple fields (excluding layer_names which is handled with layers)
-        simple_fields = [
-            "keyboard",
-            "title",
-            "firmware_api_version",
-            "locale",
-            "uuid",
-            "parent_uuid",
-            "date",
-            "creator",
-            "notes",
-            "tags",
-            "variables",
-            "config_parameters",
-            "version",
-            "base_version_changes",
-            "base_layout",
-            "last_firmware_build",
-        ]
-
-        for field in simple_fields:
-            base_value = base_dict.get(field)
-            modified_value = modified_dict.get(field)
-            if base_value != modified_value:
-                patch = jsonpatch.make_patch(base_value, modified_value)
-                if patch.patch:
-                    diff_data[field] = patch.patch
-
-        # Handle DTSI fields if requested
-        if include_dtsi:
-            import difflib
-
-            for dtsi_field in ["custom_defined_behaviors", "custom_devicetree"]:
-                base_text = base_dict.get(dtsi_field, "")
-                modified_text = modified_dict.get(dtsi_field, "")
-                if base_text != modified_text:
-                    # Create unified diff
-                    diff = "\n".join(
-                        difflib.unified_diff(
-                            base_text.splitlines(keepends=True),
-                            modified_text.splitlines(keepends=True),
-                            fromfile=f"base/{dtsi_field}",
-                            tofile=f"modified/{dtsi_field}",
-                        )
-                    )
-                    if diff:
-                        diff_data[dtsi_field] = diff
-
-        return LayoutDiff.model_validate(diff_data)
-
-    def _analyze_layout_changes(
-        self, base: dict[str, Any], modified: dict[str, Any]
-    ) -> dict[str, Any]:
-        """Enhanced version that stores data needed for applying changes"""
-        changes: dict[str, Any] = {"added": [], "removed": [], "modified": []}
-
-        base_layer_dict = OrderedDict(
-            zip(base.get("layer_names", []), base.get("layers", []), strict=False)
-        )
-        modified_layer_dict = OrderedDict(
-            zip(
-                modified.get("layer_names", []),
-                modified.get("layers", []),
-                strict=False,
+        diff_data.update(
+            self.collect_changes(
+                iter_layout_changes(base_layout, modified_layout, include_dtsi)
             )
         )
+        return LayoutDiff.model_validate(diff_data)
 
-        # Create position mappings
-        base_layer_names = list(base.get("layer_names", []))
-        modified_layer_names = list(modified.get("layer_names", []))
-
-        base_positions = {name: idx for idx, name in enumerate(base_layer_names)}
-        modified_positions = {
-            name: idx for idx, name in enumerate(modified_layer_names)
-        }
-
-        # Store removed layers with their original positions
-        removed_layers = base_layer_dict.keys() - modified_layer_dict.keys()
-        changes["removed"] = [
-            {"name": name, "data": [], "original_position": base_positions.get(name)}
-            for name in removed_layers
-        ]
-
-        # Store added layers with their new positions
-        added_layers = modified_layer_dict.keys() - base_layer_dict.keys()
-        changes["added"] = [
-            {
-                "name": name,
-                "data": modified_layer_dict[name],
-                "new_position": modified_positions.get(name),
-            }
-            for name in added_layers
-        ]
-
-        # Store modifications with position information
-        for k, v in base_layer_dict.items():
-            if k in modified_layer_dict:
-                patch = jsonpatch.make_patch(v, modified_layer_dict[k])
-                original_pos = base_positions.get(k)
-                new_pos = modified_positions.get(k)
-
-                # Store if there are content changes OR position changes
-                if patch.patch or original_pos != new_pos:
-                    change_info = {
-                        k: {
-                            "patch": patch.patch,
-                            "original_position": original_pos,
-                            "new_position": new_pos,
-                            "position_changed": original_pos != new_pos,
-                        }
-                    }
-                    changes["modified"].append(change_info)
-
-        return changes
-
-    def _analyze_behavior_changes(
+    def iter_changes(
         self,
-        base_behaviors: list[dict[str, Any]],
-        modified_behaviors: list[dict[str, Any]],
-        name_field: str = "name",
-    ) -> dict[str, Any]:
-        """Generic method to analyze changes in behavior lists.
+        base_layout: LayoutData,
+        modified_layout: LayoutData,
+        include_dtsi: bool = False,
+    ) -> "Iterator[LayoutChange]":
+        """Stream changes between two layouts without building a LayoutDiff.
+
+        Stops early when the caller stops iterating, so checking whether two
+        layouts differ at all costs no more than finding the first change.
 
         Args:
-            base_behaviors: List of behaviors in base layout
-            modified_behaviors: List of behaviors in modified layout
-            name_field: Field name to use as identifier (default: "name")
+            base_layout: Base layout for comparison
+            modified_layout: Modified layout for comparison
+            include_dtsi: Whether to include custom DTSI fields
 
         Returns:
-            Dictionary with added, removed, and modified behaviors
+            Iterator of changes in layer, behavior, field and DTSI order
         """
-        from collections import OrderedDict
-
-        # Create OrderedDict by name
-        base_dict = OrderedDict(
-            (behavior[name_field], behavior) for behavior in base_behaviors
-        )
-        modified_dict = OrderedDict(
-            (behavior[name_field], behavior) for behavior in modified_behaviors
-        )
-
-        changes: dict[str, Any] = {"added": [], "removed": [], "modified": []}
+        return iter_layout_changes(base_layout, modified_layout, include_dtsi)
 
-        # Find removed behaviors (only store name)
-        removed_names = base_dict.keys() - modified_dict.keys()
-        changes["removed"] = [{"name": name, "data": []} for name in removed_names]
+    @staticmethod
+    def collect_changes(changes: "Iterable[LayoutChange]") -> dict[str, Any]:
+        """Group streamed changes into LayoutDiff fields.
 
-        # Find added behaviors (store full data)
-        added_names = modified_dict.keys() - base_dict.keys()
-        changes["added"] = [
-            {"name": name, "data": modified_dict[name]} for name in added_names
-        ]
-
-        # Find modified behaviors
-        for name in base_dict.keys() & modified_dict.keys():
-            patch = jsonpatch.make_patch(base_dict[name], modified_dict[name])
-            if patch.patch:  # Only store if there are actual changes
-                changes["modified"].append({name: patch.patch})
+        Args:
+            changes: Changes from iter_changes()
 
-        return changes
+        Returns:
+            Dictionary of LayoutDiff fields by alias
+        """
+        collected: dict[str, Any] = {
+            section: {"added": [], "removed": [], "modified": []}
+            for section in ["layers", *BEHAVIOR_SECTIONS]
+        }
+        for change in changes:
+            if change.kind in ("added", "removed", "modified"):
+                collected[change.section][change.kind].append(change.value)
+            else:
+                collected[change.section] = change.value
+        return collected
 
     # def _analyze_layout_changes(
     #     self, base: dict[str, Any], modified: dict[str, Any]
@@ -326,31 +186,29 @@ class LayoutDiffSystem:
         self, layout_dict: dict[str, Any]
     ) -> dict[str, list[dict[str, Any]]]:
         """Create signatures for all bindings to track movements."""
-        signatures: dict[str, list[dict[str, Any]]] = {}
+        signatures: dict[str, list[dict[str, Any]]] = defaultdict(list)
 
         layers = layout_dict.get("layers", [])
         for layer_idx, layer in enumerate(layers):
             for pos_idx, binding in enumerate(layer):
-                # Create signature from binding content
-                sig = self._calculate_binding_signature(binding)
+                signatures[self._calculate_binding_signature(binding)].append(
+                    {"layer": layer_idx, "position": pos_idx, "binding": binding}
+                )
 
-                position_info = {
-                    "layer": layer_idx,
-                    "position": pos_idx,
-                    "binding": binding,
-                }
-
-                if sig not in signatures:
-                    signatures[sig] = []
-                signatures[sig].append(position_info)
-
-        return signatures
+        return dict(signatures)
 
     def _calculate_binding_signature(self, binding: dict[str, Any]) -> str:
-        """Calculate a unique signature for a binding."""
-        # Create a deterministic string representation
-        content = json.dumps(binding, sort_keys=True)
-        return hashlib.md5(content.encode()).hexdigest()[:16]
+        """Calculate a unique signature for a binding.
+
+        The signature is the binding in ZMK notation, e.g. "&mt(LSHIFT,A)",
+        which identifies it as well as a hash of its JSON would.
+        """
+        params = binding.get("params") or []
+        value = str(binding.get("value"))
+        if not params:
+            return value
+        inner = ",".join(self._calculate_binding_signature(p) for p in params)
+        return f"{value}({inner})"
 
     def _calculate_diff_statistics(self, patch: list[dict[str, Any]]) -> dict[str, int]:
         """Calculate statistics about the diff."""
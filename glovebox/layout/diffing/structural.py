@@ -0,0 +1,370 @@
+"""Structural diff engine for layouts.
+
+Layouts are compared along their natural structure instead of as generic
+JSON documents: layers are aligned by name and their bindings compared
+position by position, behaviors are matched by name through a dict, and
+only values that differ are serialized. Unchanged bindings and behaviors
+are never dumped, so diffing large or mostly identical layouts is cheap.
+
+Changes are produced lazily by iter_layout_changes(). The patches use the
+JSON Patch (RFC 6902) format expected by LayoutPatchSystem.
+"""
+
+import difflib
+from collections.abc import Iterator, Sequence
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel
+
+from glovebox.layout.models import LayoutBinding, LayoutData, LayoutParam
+
+
+# Behavior lists diffed by name, with the key identifying each entry
+BEHAVIOR_SECTIONS: dict[str, tuple[str, str]] = {
+    "holdTaps": ("hold_taps", "name"),
+    "combos": ("combos", "name"),
+    "macros": ("macros", "name"),
+    "inputListeners": ("input_listeners", "code"),
+}
+
+# Simple fields diffed as a whole, by their serialized key
+SIMPLE_FIELDS = (
+    "keyboard",
+    "title",
+    "firmware_api_version",
+    "locale",
+    "uuid",
+    "parent_uuid",
+    "date",
+    "creator",
+    "notes",
+    "tags",
+    "variables",
+    "config_parameters",
+    "version",
+    "base_version_changes",
+    "base_layout",
+    "last_firmware_build",
+)
+
+DTSI_FIELDS = ("custom_defined_behaviors", "custom_devicetree")
+
+# Fields diffed structurally; everything else is dumped once per layout
+_STRUCTURED_FIELDS = {
+    "layers",
+    "hold_taps",
+    "combos",
+    "macros",
+    "input_listeners",
+    "tap_dances",
+    "sticky_keys",
+    "caps_words",
+    "mod_morphs",
+}
+
+
+class LayoutChange(NamedTuple):
+    """One change between two layouts.
+
+    Attributes:
+        section: Serialized field name, e.g. "layers", "holdTaps", "title"
+        kind: "added", "removed" or "modified" for layers and behaviors,
+            "patch" for simple fields and "unified_diff" for DTSI fields
+        value: Change entry in the LayoutDiff format of the section
+    """
+
+    section: str
+    kind: str
+    value: Any
+
+
+def _escape_pointer(token: str) -> str:
+    """Escape a JSON pointer reference token."""
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _to_json(value: Any) -> Any:
+    """Serialize a model the way layouts are dumped; pass JSON values through."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", by_alias=True, exclude_unset=True)
+    return value
+
+
+def _same(base: Any, modified: Any) -> bool:
+    """Check two values for equality, including which model fields are set."""
+    if type(base) is not type(modified) or base != modified:
+        return False
+    if isinstance(base, BaseModel):
+        return bool(base.model_fields_set == modified.model_fields_set)
+    return True
+
+
+def _same_params(base: LayoutBinding | LayoutParam, modified: Any) -> bool:
+    """Compare a binding or parameter tree field by field.
+
+    Much cheaper than pydantic model equality, which dominates diffing
+    layers of mostly unchanged bindings.
+    """
+    if type(base) is not type(modified):
+        return False
+    base_value = base.value
+    modified_value = modified.value
+    if type(base_value) is not type(modified_value) or base_value != modified_value:
+        return False
+    base_params = base.params
+    modified_params = modified.params
+    if len(base_params) != len(modified_params):
+        return False
+    if not base_params:
+        # An explicit empty list serializes differently from an unset one
+        return ("params" in base.model_fields_set) == (
+            "params" in modified.model_fields_set
+        )
+    for base_param, modified_param in zip(base_params, modified_params, strict=True):
+        if not _same_params(base_param, modified_param):
+            return False
+    return True
+
+
+def _same_binding(base: Any, modified: Any) -> bool:
+    """Check two bindings for equality, comparing binding models directly."""
+    if type(base) is LayoutBinding:
+        return _same_params(base, modified)
+    return _same(base, modified)
+
+
+def iter_json_patch(
+    base: Any, modified: Any, path: str = ""
+) -> Iterator[dict[str, Any]]:
+    """Generate JSON Patch operations turning base into modified.
+
+    Dicts are compared key by key and lists position by position, recursing
+    into values that differ; anything else that differs is replaced.
+
+    Args:
+        base: JSON value to patch
+        modified: JSON value to produce
+        path: JSON pointer of the values within the patched document
+
+    Yields:
+        RFC 6902 operations, in an order that applies cleanly
+    """
+    if type(base) is type(modified) and base == modified:
+        return
+
+    if isinstance(base, dict) and isinstance(modified, dict):
+        for key in base:
+            if key not in modified:
+                yield {"op": "remove", "path": f"{path}/{_escape_pointer(key)}"}
+        for key, value in modified.items():
+            key_path = f"{path}/{_escape_pointer(key)}"
+            if key in base:
+                yield from iter_json_patch(base[key], value, key_path)
+            else:
+                yield {"op": "add", "path": key_path, "value": value}
+        return
+
+    if isinstance(base, list) and isinstance(modified, list):
+        common = min(len(base), len(modified))
+        for index in range(common):
+            yield from iter_json_patch(base[index], modified[index], f"{path}/{index}")
+        for index in range(len(base) - 1, common - 1, -1):
+            yield {"op": "remove", "path": f"{path}/{index}"}
+        for index in range(common, len(modified)):
+            yield {"op": "add", "path": f"{path}/{index}", "value": modified[index]}
+        return
+
+    yield {"op": "replace", "path": path, "value": modified}
+
+
+def iter_binding_patch(
+    base: Sequence[Any], modified: Sequence[Any]
+) -> Iterator[dict[str, Any]]:
+    """Generate JSON Patch operations between two layers of bindings.
+
+    Bindings are compared positionally and only differing ones are
+    serialized.
+
+    Args:
+        base: Bindings of the base layer
+        modified: Bindings of the modified layer
+
+    Yields:
+        RFC 6902 operations relative to the layer
+    """
+    common = min(len(base), len(modified))
+    for index in range(common):
+        base_binding = base[index]
+        modified_binding = modified[index]
+        if base_binding is modified_binding or _same_binding(
+            base_binding, modified_binding
+        ):
+            continue
+        yield from iter_json_patch(
+            _to_json(base_binding), _to_json(modified_binding), f"/{index}"
+        )
+    for index in range(len(base) - 1, common - 1, -1):
+        yield {"op": "remove", "path": f"/{index}"}
+    for index in range(common, len(modified)):
+        yield {
+            "op": "add",
+            "path": f"/{index}",
+            "value": _to_json(modified[index]),
+        }
+
+
+def iter_layer_changes(
+    base: LayoutData, modified: LayoutData
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Compare layers aligned by name.
+
+    Args:
+        base: Base layout
+        modified: Modified layout
+
+    Yields:
+        ("removed" | "added" | "modified", entry) pairs in layer order
+    """
+    base_layers = dict(zip(base.layer_names, base.layers, strict=False))
+    modified_layers = dict(zip(modified.layer_names, modified.layers, strict=False))
+    base_positions = {name: index for index, name in enumerate(base.layer_names)}
+    modified_positions = {
+        name: index for index, name in enumerate(modified.layer_names)
+    }
+
+    for name in base_layers:
+        if name not in modified_layers:
+            yield (
+                "removed",
+                {"name": name, "data": [], "original_position": base_positions[name]},
+            )
+
+    for name, bindings in modified_layers.items():
+        if name not in base_layers:
+            yield (
+                "added",
+                {
+                    "name": name,
+                    "data": [_to_json(binding) for binding in bindings],
+                    "new_position": modified_positions[name],
+                },
+            )
+
+    for name, bindings in base_layers.items():
+        if name not in modified_layers:
+            continue
+        patch = list(iter_binding_patch(bindings, modified_layers[name]))
+        original_position = base_positions[name]
+        new_position = modified_positions[name]
+        if patch or original_position != new_position:
+            yield (
+                "modified",
+                {
+                    name: {
+                        "patch": patch,
+                        "original_position": original_position,
+                        "new_position": new_position,
+                        "position_changed": original_position != new_position,
+                    }
+                },
+            )
+
+
+def _item_key(item: Any, name_field: str) -> Any:
+    """Get the identifying key of a behavior, model or dict."""
+    if isinstance(item, dict):
+        return item[name_field]
+    return getattr(item, name_field)
+
+
+def iter_behavior_changes(
+    base_items: Sequence[Any] | None,
+    modified_items: Sequence[Any] | None,
+    name_field: str = "name",
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Compare behaviors matched by name.
+
+    Args:
+        base_items: Behaviors of the base layout
+        modified_items: Behaviors of the modified layout
+        name_field: Key identifying a behavior
+
+    Yields:
+        ("removed" | "added" | "modified", entry) pairs
+    """
+    base_index = {_item_key(item, name_field): item for item in base_items or ()}
+    modified_index = {
+        _item_key(item, name_field): item for item in modified_items or ()
+    }
+
+    for name in base_index:
+        if name not in modified_index:
+            yield "removed", {"name": name, "data": []}
+
+    for name, item in modified_index.items():
+        if name not in base_index:
+            yield "added", {"name": name, "data": _to_json(item)}
+
+    for name, base_item in base_index.items():
+        modified_item = modified_index.get(name)
+        if modified_item is None or _same(base_item, modified_item):
+            continue
+        patch = list(iter_json_patch(_to_json(base_item), _to_json(modified_item)))
+        if patch:
+            yield "modified", {name: patch}
+
+
+def _dump_simple_fields(layout: LayoutData) -> dict[str, Any]:
+    """Dump everything but the structurally diffed fields."""
+    return layout.model_dump(
+        mode="json", by_alias=True, exclude_unset=True, exclude=_STRUCTURED_FIELDS
+    )
+
+
+def iter_layout_changes(
+    base: LayoutData, modified: LayoutData, include_dtsi: bool = False
+) -> Iterator[LayoutChange]:
+    """Stream the changes between two layouts.
+
+    Args:
+        base: Base layout
+        modified: Modified layout
+        include_dtsi: Whether to diff the custom DTSI fields
+
+    Yields:
+        Changes in layer, behavior, simple field and DTSI order
+    """
+    for kind, entry in iter_layer_changes(base, modified):
+        yield LayoutChange("layers", kind, entry)
+
+    for section, (attribute, name_field) in BEHAVIOR_SECTIONS.items():
+        for kind, entry in iter_behavior_changes(
+            getattr(base, attribute), getattr(modified, attribute), name_field
+        ):
+            yield LayoutChange(section, kind, entry)
+
+    base_fields = _dump_simple_fields(base)
+    modified_fields = _dump_simple_fields(modified)
+    for field in SIMPLE_FIELDS:
+        patch = list(
+            iter_json_patch(base_fields.get(field), modified_fields.get(field))
+        )
+        if patch:
+            yield LayoutChange(field, "patch", patch)
+
+    if include_dtsi:
+        for field in DTSI_FIELDS:
+            base_text = base_fields.get(field, "")
+            modified_text = modified_fields.get(field, "")
+            if base_text == modified_text:
+                continue
+            diff = "\n".join(
+                difflib.unified_diff(
+                    base_text.splitlines(keepends=True),
+                    modified_text.splitlines(keepends=True),
+                    fromfile=f"base/{field}",
+                    tofile=f"modified/{field}",
+                )
+            )
+            if diff:
+                yield LayoutChange(field, "unified_diff", diff)
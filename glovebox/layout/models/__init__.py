@@ -35,7 +35,7 @@ from .keymap import (
     KeymapMetadata,
 )
 from .metadata import ConfigParameter, LayoutData, LayoutMetadata
-from .results import KeymapResult, LayoutResult
+from .results import BatchCompileResult, KeymapResult, LayoutResult
 from .types import (
     ConfigValue,
     LayerBindings,
@@ -89,4 +89,5 @@ __all__ = [
     # Result models
     "KeymapResult",
     "LayoutResult",
+    "BatchCompileResult",
 ]
@@ -127,3 +127,14 @@ class LayoutResult(GloveboxBaseModel):
             return False
 
         return True
+
+
+class BatchCompileResult(GloveboxBaseModel):
+    """Result of compiling one layout in a batch."""
+
+    source: Path
+    success: bool
+    keymap_path: Path | None = None
+    conf_path: Path | None = None
+    error: str | None = None
+    duration_seconds: float = 0.0
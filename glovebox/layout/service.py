@@ -7,6 +7,7 @@ from glovebox.layout.formatting import ViewMode
 
 if TYPE_CHECKING:
     from glovebox.config.profile import KeyboardProfile
+    from glovebox.core.cache.cache_manager import CacheManager
 
 from glovebox.core.errors import LayoutError
 from glovebox.layout.behavior.formatter import BehaviorFormatterImpl
@@ -40,6 +41,7 @@ class LayoutService(BaseService):
         component_service: LayoutComponentService,
         layout_service: LayoutDisplayService,
         keymap_parser: ZmkKeymapParser,
+        section_cache: "CacheManager | None" = None,
     ) -> None:
         """Initialize the layout service."""
         super().__init__(service_name="LayoutService", service_version="1.0.0")
@@ -51,15 +53,22 @@ class LayoutService(BaseService):
         self._component_service = component_service
         self._layout_service = layout_service
         self._keymap_parser = keymap_parser
+        self._section_cache = section_cache
 
     def compile(
-        self, layout_data: dict[str, Any], profile: "KeyboardProfile | None" = None
+        self,
+        layout_data: dict[str, Any],
+        profile: "KeyboardProfile | None" = None,
+        incremental: bool = False,
     ) -> LayoutResult:
         """Generate ZMK keymap and config content from keymap data.
 
         Args:
             layout_data: Raw layout data dictionary
             profile: Optional keyboard profile for enhanced compilation
+            incremental: Reuse cached sections whose inputs are unchanged and
+                only regenerate the others. The output is identical to a full
+                compilation.
 
         Returns:
             LayoutResult with compilation status and generated content
@@ -95,60 +104,34 @@ class LayoutService(BaseService):
                     generate_kconfig_conf,
                 )
 
-                # Create behavior management service and prepare behaviors
-                behavior_manager = create_behavior_management_service()
-
-                # Build complete template context with behavior management
-                context = build_template_context(
-                    keymap_data, profile, self._dtsi_generator, behavior_manager
-                )
-
-                # Generate keymap content from template context
-                keymap_parts = []
-
-                # Add includes
-                if context.get("resolved_includes"):
-                    keymap_parts.append(context["resolved_includes"])
-                    keymap_parts.append("")
-
-                # Add layer defines
-                if context.get("layer_defines"):
-                    keymap_parts.append(context["layer_defines"])
-                    keymap_parts.append("")
-
-                # Add custom devicetree
-                if context.get("custom_devicetree"):
-                    keymap_parts.append(context["custom_devicetree"])
-                    keymap_parts.append("")
-
-                # Add behaviors
-                if context.get("user_behaviors_dtsi"):
-                    keymap_parts.append(context["user_behaviors_dtsi"])
-                    keymap_parts.append("")
-
-                # Add macros
-                if context.get("user_macros_dtsi"):
-                    keymap_parts.append(context["user_macros_dtsi"])
-                    keymap_parts.append("")
-
-                # Add combos
-                if context.get("combos_dtsi"):
-                    keymap_parts.append(context["combos_dtsi"])
-                    keymap_parts.append("")
-
-                # Add input listeners
-                if context.get("input_listeners_dtsi"):
-                    keymap_parts.append(context["input_listeners_dtsi"])
-                    keymap_parts.append("")
+                if incremental:
+                    from glovebox.layout.utils.incremental import (
+                        KCONFIG_SECTION,
+                        generate_sections_incremental,
+                    )
 
-                # Add main keymap node
-                if context.get("keymap_node"):
-                    keymap_parts.append(context["keymap_node"])
+                    # Reuse cached sections and regenerate only changed ones
+                    context: dict[str, Any] = generate_sections_incremental(
+                        keymap_data,
+                        profile,
+                        self._dtsi_generator,
+                        self._get_section_cache(),
+                    )
+                    context["custom_devicetree"] = keymap_data.custom_devicetree
+                    config_content = context[KCONFIG_SECTION]
+                else:
+                    # Create behavior management service and prepare behaviors
+                    behavior_manager = create_behavior_management_service()
+
+                    # Build complete template context with behavior management
+                    context = build_template_context(
+                        keymap_data, profile, self._dtsi_generator, behavior_manager
+                    )
 
-                keymap_content = "\n".join(keymap_parts)
+                    # Generate config content
+                    config_content, _ = generate_kconfig_conf(keymap_data, profile)
 
-                # Generate config content
-                config_content, _ = generate_kconfig_conf(keymap_data, profile)
+                keymap_content = self._assemble_keymap(context)
 
             else:
                 # Fallback to basic generation without profile
@@ -183,6 +166,36 @@ class LayoutService(BaseService):
             )
             raise LayoutError(f"Layout compilation failed: {e}") from e
 
+    def _assemble_keymap(self, context: dict[str, Any]) -> str:
+        """Join generated sections into keymap content in their fixed order."""
+        keymap_parts = []
+        for section in (
+            "resolved_includes",
+            "layer_defines",
+            "custom_devicetree",
+            "user_behaviors_dtsi",
+            "user_macros_dtsi",
+            "combos_dtsi",
+            "input_listeners_dtsi",
+        ):
+            if context.get(section):
+                keymap_parts.append(context[section])
+                keymap_parts.append("")
+
+        # Add main keymap node
+        if context.get("keymap_node"):
+            keymap_parts.append(context["keymap_node"])
+
+        return "\n".join(keymap_parts)
+
+    def _get_section_cache(self) -> "CacheManager":
+        """Get the cache for incrementally generated sections."""
+        if self._section_cache is None:
+            from glovebox.core.cache import create_default_cache
+
+            self._section_cache = create_default_cache(tag="layout_sections")
+        return self._section_cache
+
     def validate(self, layout_data: dict[str, Any]) -> bool:
         """Validate layout data.
 
@@ -306,6 +319,7 @@ def create_layout_service(
     behavior_formatter: BehaviorFormatterImpl,
     dtsi_generator: ZmkFileContentGenerator,
     keymap_parser: ZmkKeymapParser | None = None,
+    section_cache: "CacheManager | None" = None,
 ) -> LayoutService:
     """Create a LayoutService instance with explicit dependency injection.
 
@@ -319,6 +333,8 @@ def create_layout_service(
     - BehaviorFormatterImpl(behavior_registry) for behavior_formatter
     - ZmkFileContentGenerator(behavior_formatter) for dtsi_generator
     - create_zmk_keymap_parser() for keymap_parser (optional)
+    - create_default_cache(tag="layout_sections") for section_cache (optional,
+      created on first incremental compile)
     """
     if keymap_parser is None:
         keymap_parser = create_zmk_keymap_parser()
@@ -332,4 +348,5 @@ def create_layout_service(
         component_service=component_service,
         layout_service=layout_service,
         keymap_parser=keymap_parser,
+        section_cache=section_cache,
     )
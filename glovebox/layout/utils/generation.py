@@ -1,6 +1,7 @@
 """Layout generation utilities for configuration and keymap files."""
 
 import logging
+from collections.abc import Collection
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -58,47 +59,64 @@ def generate_config_file(
     return kconfig_settings
 
 
-def build_template_context(
+# Generated DTSI sections, in the order they are generated
+DTSI_SECTIONS = (
+    "resolved_includes",
+    "layer_defines",
+    "user_behaviors_dtsi",
+    "combos_dtsi",
+    "user_macros_dtsi",
+    "input_listeners_dtsi",
+    "keymap_node",
+)
+
+
+def generate_dtsi_sections(
     keymap_data: LayoutData,
     profile: "KeyboardProfile",
     dtsi_generator: "ZmkFileContentGenerator",
     behavior_manager: "BehaviorManagementService | None" = None,
-) -> dict[str, Any]:
-    """Build template context with generated DTSI content.
+    sections: Collection[str] | None = None,
+) -> dict[str, str]:
+    """Generate DTSI sections for a layout.
 
     Args:
         keymap_data: Keymap data model
         profile: Keyboard profile with configuration
         dtsi_generator: DTSI generator for creating template content
         behavior_manager: Optional behavior management service (will create one if None)
+        sections: Names from DTSI_SECTIONS to generate, all sections if None
 
     Returns:
-        Dictionary with template context
+        Dictionary mapping section names to generated content
     """
+    wanted = DTSI_SECTIONS if sections is None else sections
+    generated: dict[str, str] = {}
+    if not wanted:
+        return generated
+
     # Extract data for generation with fallback to empty lists
     layer_names = keymap_data.layer_names
-    layers_data = keymap_data.layers
-    hold_taps_data = keymap_data.hold_taps
-    combos_data = keymap_data.combos
-    macros_data = keymap_data.macros
     input_listeners_data = getattr(keymap_data, "input_listeners", [])
 
-    # Get resolved includes from the profile and format them as #include <>
-    resolved_includes = []
-    if (
-        hasattr(profile.keyboard_config.keymap, "header_includes")
-        and profile.keyboard_config.keymap.header_includes is not None
-    ):
-        # Format bare header names as #include <header_name>
-        resolved_includes = [
-            f"#include <{include}>"
-            for include in profile.keyboard_config.keymap.header_includes
-        ]
-
-    additional_includes = get_required_includes_for_layout(profile, keymap_data)
-    resolved_includes.extend(
-        [f"#include <{include}>" for include in additional_includes]
-    )
+    if "resolved_includes" in wanted:
+        # Get resolved includes from the profile and format them as #include <>
+        resolved_includes = []
+        if (
+            hasattr(profile.keyboard_config.keymap, "header_includes")
+            and profile.keyboard_config.keymap.header_includes is not None
+        ):
+            # Format bare header names as #include <header_name>
+            resolved_includes = [
+                f"#include <{include}>"
+                for include in profile.keyboard_config.keymap.header_includes
+            ]
+
+        additional_includes = get_required_includes_for_layout(profile, keymap_data)
+        resolved_includes.extend(
+            [f"#include <{include}>" for include in additional_includes]
+        )
+        generated["resolved_includes"] = "\n".join(resolved_includes)
 
     # Prepare behaviors using the management service
     if behavior_manager is None:
@@ -115,15 +133,55 @@ def build_template_context(
 
     # Generate DTSI components
     # IMPORTANT: Generate behaviors first so they are registered before keymap generation
-    layer_defines = dtsi_generator.generate_layer_defines(profile, layer_names)
-    behaviors_dtsi = dtsi_generator.generate_behaviors_dtsi(profile, hold_taps_data)
-    combos_dtsi = dtsi_generator.generate_combos_dtsi(profile, combos_data, layer_names)
-    macros_dtsi = dtsi_generator.generate_macros_dtsi(profile, macros_data)
-    input_listeners_dtsi = dtsi_generator.generate_input_listeners_node(
-        profile, input_listeners_data
-    )
+    if "layer_defines" in wanted:
+        generated["layer_defines"] = dtsi_generator.generate_layer_defines(
+            profile, layer_names
+        )
+    if "user_behaviors_dtsi" in wanted:
+        generated["user_behaviors_dtsi"] = dtsi_generator.generate_behaviors_dtsi(
+            profile, keymap_data.hold_taps
+        )
+    if "combos_dtsi" in wanted:
+        generated["combos_dtsi"] = dtsi_generator.generate_combos_dtsi(
+            profile, keymap_data.combos, layer_names
+        )
+    if "user_macros_dtsi" in wanted:
+        generated["user_macros_dtsi"] = dtsi_generator.generate_macros_dtsi(
+            profile, keymap_data.macros
+        )
+    if "input_listeners_dtsi" in wanted:
+        generated["input_listeners_dtsi"] = (
+            dtsi_generator.generate_input_listeners_node(profile, input_listeners_data)
+        )
     # Generate keymap node AFTER behaviors are registered
-    keymap_node = dtsi_generator.generate_keymap_node(profile, layer_names, layers_data)
+    if "keymap_node" in wanted:
+        generated["keymap_node"] = dtsi_generator.generate_keymap_node(
+            profile, layer_names, keymap_data.layers
+        )
+
+    return generated
+
+
+def build_template_context(
+    keymap_data: LayoutData,
+    profile: "KeyboardProfile",
+    dtsi_generator: "ZmkFileContentGenerator",
+    behavior_manager: "BehaviorManagementService | None" = None,
+) -> dict[str, Any]:
+    """Build template context with generated DTSI content.
+
+    Args:
+        keymap_data: Keymap data model
+        profile: Keyboard profile with configuration
+        dtsi_generator: DTSI generator for creating template content
+        behavior_manager: Optional behavior management service (will create one if None)
+
+    Returns:
+        Dictionary with template context
+    """
+    sections = generate_dtsi_sections(
+        keymap_data, profile, dtsi_generator, behavior_manager
+    )
 
     # Get template elements from the keyboard profile
     key_position_header = ""
@@ -141,15 +199,9 @@ def build_template_context(
     # Build and return the template context with defaults for missing values
     context = {
         "keyboard": keymap_data.keyboard,
-        "layer_names": layer_names,
-        "layers": layers_data,
-        "layer_defines": layer_defines,
-        "keymap_node": keymap_node,
-        "user_behaviors_dtsi": behaviors_dtsi,
-        "combos_dtsi": combos_dtsi,
-        "input_listeners_dtsi": input_listeners_dtsi,
-        "user_macros_dtsi": macros_dtsi,
-        "resolved_includes": "\n".join(resolved_includes),
+        "layer_names": keymap_data.layer_names,
+        "layers": keymap_data.layers,
+        **sections,
         "key_position_header": key_position_header,
         "system_behaviors_dts": system_behaviors_dts,
         "custom_defined_behaviors": keymap_data.custom_defined_behaviors or "",
@@ -0,0 +1,159 @@
+"""Incremental keymap generation backed by an on-disk cache of rendered sections."""
+
+from typing import TYPE_CHECKING, Any
+
+from pydantic import TypeAdapter
+
+from glovebox import __version__
+from glovebox.core.cache.models import CacheKey
+from glovebox.core.structlog_logger import get_struct_logger
+from glovebox.layout.models import LayoutData
+from glovebox.layout.utils.generation import (
+    DTSI_SECTIONS,
+    generate_dtsi_sections,
+    generate_kconfig_conf,
+)
+
+
+if TYPE_CHECKING:
+    from glovebox.config.profile import KeyboardProfile
+    from glovebox.core.cache.cache_manager import CacheManager
+    from glovebox.layout.zmk_generator import ZmkFileContentGenerator
+
+
+logger = get_struct_logger(__name__)
+
+# Bump when the rendered output of any section changes for the same input
+SECTION_FORMAT_VERSION = "1"
+
+# Section holding the generated kconfig content
+KCONFIG_SECTION = "kconfig"
+
+# LayoutData fields each generated section is rendered from
+SECTION_INPUTS: dict[str, tuple[str, ...]] = {
+    "resolved_includes": ("layers", "hold_taps", "combos", "macros"),
+    "layer_defines": ("layer_names",),
+    "user_behaviors_dtsi": ("hold_taps",),
+    "combos_dtsi": ("combos", "layer_names"),
+    "user_macros_dtsi": ("macros",),
+    "input_listeners_dtsi": ("input_listeners",),
+    # Bindings are formatted with the behaviors these sections register
+    "keymap_node": ("layer_names", "layers", "hold_taps", "combos", "macros"),
+    KCONFIG_SECTION: ("config_parameters",),
+}
+
+# Rendered sections are kept for a week after they were generated
+SECTION_CACHE_TTL = 7 * 24 * 3600
+
+# Serializers for the input fields, faster than dumping the whole model
+_FIELD_ADAPTERS: dict[str, TypeAdapter[Any]] = {}
+
+
+def _field_fingerprint(keymap_data: LayoutData, field: str) -> str:
+    """Fingerprint a single LayoutData field."""
+    adapter = _FIELD_ADAPTERS.get(field)
+    if adapter is None:
+        adapter = TypeAdapter(LayoutData.model_fields[field].annotation)
+        _FIELD_ADAPTERS[field] = adapter
+    return CacheKey.from_parts(
+        field, adapter.dump_json(getattr(keymap_data, field)).decode()
+    )
+
+
+def profile_fingerprint(profile: "KeyboardProfile") -> str:
+    """Fingerprint the parts of a keyboard profile that affect generated output.
+
+    Args:
+        profile: Keyboard profile used for generation
+
+    Returns:
+        Fingerprint string of the profile
+    """
+    return CacheKey.from_parts(
+        __version__,
+        SECTION_FORMAT_VERSION,
+        profile.keyboard_name,
+        str(profile.firmware_version),
+        profile.keyboard_config.model_dump_json(warnings=False),
+    )
+
+
+def section_fingerprints(
+    keymap_data: LayoutData, profile: "KeyboardProfile"
+) -> dict[str, str]:
+    """Fingerprint every generated section of a layout.
+
+    A section's fingerprint only changes when the profile or one of the
+    layout fields listed for it in SECTION_INPUTS changes.
+
+    Args:
+        keymap_data: Layout data to generate from
+        profile: Keyboard profile used for generation
+
+    Returns:
+        Dictionary mapping section names to fingerprints
+    """
+    profile_key = profile_fingerprint(profile)
+    field_keys = {
+        field: _field_fingerprint(keymap_data, field)
+        for inputs in SECTION_INPUTS.values()
+        for field in inputs
+    }
+    return {
+        section: CacheKey.from_parts(
+            section, profile_key, *(field_keys[field] for field in inputs)
+        )
+        for section, inputs in SECTION_INPUTS.items()
+    }
+
+
+def generate_sections_incremental(
+    keymap_data: LayoutData,
+    profile: "KeyboardProfile",
+    dtsi_generator: "ZmkFileContentGenerator",
+    cache_manager: "CacheManager",
+) -> dict[str, str]:
+    """Generate keymap sections and kconfig, reusing unchanged cached sections.
+
+    Sections whose fingerprint is in the cache are reused as stored; the
+    others are generated and written back. The returned sections match
+    what a full generation produces.
+
+    Args:
+        keymap_data: Layout data to generate from
+        profile: Keyboard profile used for generation
+        dtsi_generator: DTSI generator for sections that changed
+        cache_manager: Cache holding rendered sections
+
+    Returns:
+        Dictionary mapping DTSI_SECTIONS and KCONFIG_SECTION to their content
+    """
+    fingerprints = section_fingerprints(keymap_data, profile)
+    cache_keys = {
+        section: f"layout_section_{section}_{fingerprint}"
+        for section, fingerprint in fingerprints.items()
+    }
+
+    sections: dict[str, str] = {}
+    for section, cache_key in cache_keys.items():
+        cached = cache_manager.get(cache_key)
+        if isinstance(cached, str):
+            sections[section] = cached
+
+    dirty = [section for section in DTSI_SECTIONS if section not in sections]
+    sections.update(
+        generate_dtsi_sections(keymap_data, profile, dtsi_generator, sections=dirty)
+    )
+    if KCONFIG_SECTION not in sections:
+        dirty.append(KCONFIG_SECTION)
+        sections[KCONFIG_SECTION], _ = generate_kconfig_conf(keymap_data, profile)
+
+    for section in dirty:
+        cache_manager.set(cache_keys[section], sections[section], ttl=SECTION_CACHE_TTL)
+
+    logger.debug(
+        "incremental_sections_generated",
+        regenerated=dirty,
+        reused=len(cache_keys) - len(dirty),
+    )
+    return sections
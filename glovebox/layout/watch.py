@@ -0,0 +1,107 @@
+"""Recompile a layout file whenever its content changes."""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from glovebox.core.structlog_logger import get_struct_logger
+from glovebox.layout.models import LayoutResult
+
+
+if TYPE_CHECKING:
+    from glovebox.config.profile import KeyboardProfile
+    from glovebox.layout.service import LayoutService
+
+
+logger = get_struct_logger(__name__)
+
+
+def _digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+class LayoutWatchCompiler:
+    """Compile a layout file and recompile it only when its content changes.
+
+    The profile and layout service stay in memory between compiles. Saves
+    that leave the file content unchanged are skipped, and output files are
+    only rewritten when the generated content differs, so tools watching
+    the outputs are not woken up for nothing.
+    """
+
+    def __init__(
+        self,
+        layout_path: Path,
+        output: Path,
+        profile: "KeyboardProfile",
+        service: "LayoutService",
+        incremental: bool = False,
+    ) -> None:
+        """Initialize the watch compiler.
+
+        Args:
+            layout_path: JSON layout file to compile
+            output: Output base path; .keymap and .conf are written next to it
+            profile: Keyboard profile to compile against
+            service: Layout service used for every compile
+            incremental: Reuse cached keymap sections between compiles
+        """
+        self.layout_path = Path(layout_path)
+        self.keymap_path = Path(output).with_suffix(".keymap")
+        self.conf_path = Path(output).with_suffix(".conf")
+        self.profile = profile
+        self.service = service
+        self.incremental = incremental
+        self.layout_data: dict[str, Any] | None = None
+        self._layout_digest: str | None = None
+        self._output_digests: dict[Path, str] = {}
+
+    def compile_if_changed(self) -> LayoutResult | None:
+        """Compile the layout if its content changed since the last compile.
+
+        Returns:
+            The compile result, or None if the content is unchanged
+        """
+        try:
+            content = self.layout_path.read_bytes()
+        except OSError as e:
+            return LayoutResult(success=False, errors=[f"Cannot read layout: {e}"])
+
+        digest = _digest(content)
+        if digest == self._layout_digest:
+            logger.debug("watch_layout_unchanged", layout=str(self.layout_path))
+            return None
+
+        try:
+            layout_data = json.loads(content)
+        except ValueError as e:
+            return LayoutResult(success=False, errors=[f"Invalid JSON: {e}"])
+
+        try:
+            result = self.service.compile(
+                layout_data, profile=self.profile, incremental=self.incremental
+            )
+        except Exception as e:
+            # Keep watching; the next save may fix the layout
+            logger.warning("watch_compile_failed", error=str(e))
+            return LayoutResult(success=False, errors=[str(e)])
+        if result.success:
+            self.layout_data = layout_data
+            self._layout_digest = digest
+            result.keymap_path = self._write_if_changed(
+                self.keymap_path, result.keymap_content or ""
+            )
+            result.conf_path = self._write_if_changed(
+                self.conf_path, result.config_content or ""
+            )
+        return result
+
+    def _write_if_changed(self, path: Path, content: str) -> Path:
+        """Write content unless the file already holds exactly this content."""
+        digest = _digest(content.encode("utf-8"))
+        if self._output_digests.get(path) != digest or not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+            self._output_digests[path] = digest
+        return path
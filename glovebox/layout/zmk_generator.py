@@ -2,7 +2,7 @@
 
 import re
 from collections.abc import Sequence
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from glovebox.core.structlog_logger import get_struct_logger
 from glovebox.layout.behavior.formatter import BehaviorFormatterImpl
@@ -26,6 +26,9 @@ if TYPE_CHECKING:
 
 logger = get_struct_logger(__name__)
 
+# Formatted layer grids kept per generator before the cache is reset
+_LAYER_CACHE_LIMIT = 256
+
 
 class ZmkFileContentGenerator:
     """Generator for complete ZMK file content from layout data."""
@@ -39,6 +42,7 @@ class ZmkFileContentGenerator:
         self._behavior_formatter = behavior_formatter
         self._behavior_registry = behavior_formatter._registry
         self._layout_formatter = GridLayoutFormatter()
+        self._layer_cache: dict[tuple[Any, ...], list[str]] = {}
 
     def generate_layer_defines(
         self, profile: "KeyboardProfile", layer_names: list[str]
@@ -77,12 +81,6 @@ class ZmkFileContentGenerator:
         if not hold_taps_data:
             return ""
 
-        # Extract key position map from profile for use with hold-tap positions
-        key_position_map = {}
-        # Build a default key position map if needed
-        for i in range(profile.keyboard_config.key_count):
-            key_position_map[f"KEY_{i}"] = i
-
         dtsi_parts = []
 
         for ht in hold_taps_data:
@@ -540,6 +538,9 @@ class ZmkFileContentGenerator:
     ) -> str:
         """Generate ZMK keymap node string from layer data.
 
+        Formatted layer grids are cached by layer content, so regenerating a
+        keymap only formats the layers that changed since the last call.
+
         Args:
             profile: Keyboard profile containing all configuration
             layer_names: List of layer names
@@ -555,6 +556,12 @@ class ZmkFileContentGenerator:
         keymap_compatible = profile.keyboard_config.zmk.compatible_strings.keymap
         dtsi_parts = ["keymap {", f'    compatible = "{keymap_compatible}";']
 
+        # Layer grids depend on the key count and grid formatting of the profile
+        grid_key = (
+            profile.keyboard_config.key_count,
+            profile.keyboard_config.keymap.formatting.model_dump_json(),
+        )
+
         # Process each layer
         for _i, (layer_name, layer_bindings) in enumerate(
             zip(layer_names, layers_data, strict=False)
@@ -567,16 +574,29 @@ class ZmkFileContentGenerator:
             # dtsi_parts.append(f'        label = "{layer_name}";')
             dtsi_parts.append("        bindings = <")
 
-            # Format layer bindings
-            formatted_bindings = []
-            for binding in layer_bindings:
-                formatted_binding = self._behavior_formatter.format_binding(binding)
-                formatted_bindings.append(formatted_binding)
-
-            # Format the bindings using the layout formatter with custom indent for DTSI
-            formatted_grid = self._layout_formatter.generate_layer_layout(
-                formatted_bindings, profile, base_indent=""
+            # Reuse the grid of a layer whose bindings have not changed
+            layer_key = (
+                grid_key,
+                tuple(
+                    self._behavior_formatter.binding_cache_key(binding)
+                    for binding in layer_bindings
+                ),
             )
+            formatted_grid = self._layer_cache.get(layer_key)
+            if formatted_grid is None:
+                # Format layer bindings
+                formatted_bindings = []
+                for binding in layer_bindings:
+                    formatted_binding = self._behavior_formatter.format_binding(binding)
+                    formatted_bindings.append(formatted_binding)
+
+                # Format the bindings using the layout formatter with custom indent for DTSI
+                formatted_grid = self._layout_formatter.generate_layer_layout(
+                    formatted_bindings, profile, base_indent=""
+                )
+                if len(self._layer_cache) >= _LAYER_CACHE_LIMIT:
+                    self._layer_cache.clear()
+                self._layer_cache[layer_key] = formatted_grid
 
             # Add the formatted grid
             dtsi_parts.extend(formatted_grid)
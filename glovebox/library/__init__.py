@@ -19,6 +19,7 @@ from .models import (
     LibrarySource,
     SearchQuery,
     SearchResult,
+    SimilarityMatch,
 )
 from .repository import LibraryRepository, create_library_repository
 from .services import LibraryService, create_library_service
@@ -33,6 +34,7 @@ __all__ = [
     "LibrarySource",
     "SearchQuery",
     "SearchResult",
+    "SimilarityMatch",
     # Fetchers
     "BaseFetcher",
     "FetcherRegistry",
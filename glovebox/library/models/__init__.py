@@ -9,6 +9,7 @@ from .library import (
     SearchQuery,
     SearchResult,
 )
+from .similarity import LayoutFeatures, SimilarityMatch
 
 
 __all__ = [
@@ -19,4 +20,6 @@ __all__ = [
     "LibrarySource",
     "SearchQuery",
     "SearchResult",
+    "LayoutFeatures",
+    "SimilarityMatch",
 ]
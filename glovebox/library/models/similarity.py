@@ -0,0 +1,37 @@
+"""Models for the layout similarity index."""
+
+from pydantic import Field
+
+from glovebox.models.base import GloveboxBaseModel
+
+
+class LayoutFeatures(GloveboxBaseModel):
+    """Compact feature vectors describing one layout."""
+
+    position_hashes: list[int] = Field(
+        default_factory=list,
+        description="Hash of the base layer binding at each key position",
+    )
+    behaviors: list[str] = Field(
+        default_factory=list, description="Sorted behaviors used or defined"
+    )
+    minhash: list[int] = Field(
+        default_factory=list,
+        description="MinHash signature over the bindings of all layers",
+    )
+
+
+class SimilarityMatch(GloveboxBaseModel):
+    """A library layout ranked by similarity to a query layout."""
+
+    uuid: str = Field(description="UUID of the matching library layout")
+    score: float = Field(description="Weighted similarity between 0 and 1")
+    binding_similarity: float = Field(
+        description="Estimated Jaccard similarity of the bindings of all layers"
+    )
+    position_similarity: float = Field(
+        description="Share of base layer positions with the same binding"
+    )
+    behavior_similarity: float = Field(
+        description="Jaccard similarity of the behavior sets"
+    )
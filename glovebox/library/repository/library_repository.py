@@ -9,7 +9,10 @@ from typing import Any
 import yaml
 
 from glovebox.core.structlog_logger import get_struct_logger
-from glovebox.library.models import LibraryEntry, LibrarySource
+from glovebox.library.models import LibraryEntry, LibrarySource, SimilarityMatch
+from glovebox.library.repository.similarity_index import (
+    create_layout_similarity_index,
+)
 
 
 logger = get_struct_logger(__name__)
@@ -28,6 +31,9 @@ class LibraryRepository:
         self.layouts_path = library_path / "layouts"
         self.metadata_path = library_path / "metadata"
         self.index_path = library_path / "index.yaml"
+        self.similarity_index = create_layout_similarity_index(
+            library_path / "similarity_index.json"
+        )
 
         # Ensure directories exist
         self.layouts_path.mkdir(parents=True, exist_ok=True)
@@ -167,6 +173,7 @@ class LibraryRepository:
             # Update index
             self._index[entry.uuid] = self._entry_to_index_data(updated_entry)
             self._save_index()
+            self._index_similarity(entry.uuid, content)
 
             logger.info(
                 "layout_stored",
@@ -183,6 +190,62 @@ class LibraryRepository:
             )
             raise
 
+    def _index_similarity(self, uuid: str, content: dict[str, Any]) -> None:
+        """Add a layout to the similarity index without failing the caller.
+
+        Args:
+            uuid: Layout UUID
+            content: Layout content dictionary
+        """
+        try:
+            self.similarity_index.add(uuid, content)
+        except Exception as e:
+            exc_info = logger.isEnabledFor(logging.DEBUG)
+            logger.warning(
+                "similarity_index_update_failed",
+                uuid=uuid,
+                error=str(e),
+                exc_info=exc_info,
+            )
+
+    def _sync_similarity_index(self) -> None:
+        """Index layouts stored before the similarity index existed."""
+        stale = [
+            uuid for uuid in self.similarity_index.entries if uuid not in self._index
+        ]
+        missing = [uuid for uuid in self._index if uuid not in self.similarity_index]
+        if not stale and not missing:
+            return
+
+        for uuid in stale:
+            self.similarity_index.remove(uuid, persist=False)
+        for uuid in missing:
+            content = self.get_layout_content(uuid)
+            if content is not None:
+                self.similarity_index.add(uuid, content, persist=False)
+        self.similarity_index.save()
+        logger.debug("similarity_index_synced", added=len(missing), removed=len(stale))
+
+    def find_similar_layouts(
+        self,
+        content: dict[str, Any],
+        limit: int = 10,
+        exclude_uuid: str | None = None,
+    ) -> list[SimilarityMatch]:
+        """Find the library layouts most similar to a layout.
+
+        Args:
+            content: Layout content dictionary to compare against
+            limit: Maximum number of results
+            exclude_uuid: UUID to leave out, such as the layout itself
+
+        Returns:
+            Matches ordered from most to least similar
+        """
+        self._sync_similarity_index()
+        exclude = [exclude_uuid] if exclude_uuid else []
+        return self.similarity_index.query(content, limit=limit, exclude=exclude)
+
     def get_entry(self, uuid: str) -> LibraryEntry | None:
         """Get library entry by UUID.
 
@@ -302,6 +365,7 @@ class LibraryRepository:
             # Remove from index
             del self._index[uuid]
             self._save_index()
+            self.similarity_index.remove(uuid)
 
             logger.info("library_entry_removed", uuid=uuid)
             return True
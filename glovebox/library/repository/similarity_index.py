@@ -0,0 +1,354 @@
+"""Similarity index for finding library layouts close to a given layout."""
+
+import hashlib
+import heapq
+import json
+import logging
+import operator
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from glovebox.core.structlog_logger import get_struct_logger
+from glovebox.library.models import LayoutFeatures, SimilarityMatch
+
+
+logger = get_struct_logger(__name__)
+
+INDEX_VERSION = 1
+
+# Number of values in a MinHash signature; the estimation error of the
+# Jaccard similarity is about 1 / sqrt(SIGNATURE_SIZE)
+SIGNATURE_SIZE = 64
+
+# Weights of the feature similarities in the final score
+BINDING_WEIGHT = 0.5
+POSITION_WEIGHT = 0.3
+BEHAVIOR_WEIGHT = 0.2
+
+# Bindings that only pass keys through; layers full of them are not similar
+_PASSTHROUGH_BINDINGS = {"&trans", "&none"}
+
+_EMPTY_BIN = 1 << 64
+
+
+def _stable_hash(token: str, size: int = 4) -> int:
+    """Hash a token to `size` bytes, independently of PYTHONHASHSEED."""
+    return int.from_bytes(
+        hashlib.blake2b(token.encode("utf-8"), digest_size=size).digest(), "little"
+    )
+
+
+def _binding_token(binding: Any) -> str:
+    """Render a binding dict in ZMK notation, e.g. "&mt(LSHIFT,A)"."""
+    if not isinstance(binding, dict):
+        return str(binding)
+    value = str(binding.get("value", ""))
+    params = binding.get("params") or []
+    if not params:
+        return value
+    return f"{value}({','.join(_binding_token(param) for param in params)})"
+
+
+def _layer_bindings(layer: Any) -> list[Any]:
+    """Get the bindings of a layer stored as a list or as a dict."""
+    if isinstance(layer, dict):
+        bindings = layer.get("bindings", [])
+        return bindings if isinstance(bindings, list) else []
+    return layer if isinstance(layer, list) else []
+
+
+def _minhash(hashes: set[int]) -> list[int]:
+    """Compute a one-permutation MinHash signature of 64-bit token hashes.
+
+    Each token is hashed once: the low bits pick a bin and the remaining
+    bits compete for the bin minimum, instead of hashing every token once
+    per signature value. Empty bins borrow the value of the next filled bin,
+    offset by the distance, so equal sets still get equal signatures.
+    """
+    signature = [_EMPTY_BIN] * SIGNATURE_SIZE
+    for value in hashes:
+        slot = value % SIGNATURE_SIZE
+        rest = value // SIGNATURE_SIZE
+        if rest < signature[slot]:
+            signature[slot] = rest
+    if not hashes:
+        return signature
+
+    densified = list(signature)
+    for slot in range(SIGNATURE_SIZE):
+        distance = 1
+        while densified[slot] == _EMPTY_BIN:
+            neighbour = signature[(slot + distance) % SIGNATURE_SIZE]
+            if neighbour != _EMPTY_BIN:
+                densified[slot] = neighbour + distance * _EMPTY_BIN
+            distance += 1
+    return densified
+
+
+def extract_layout_features(content: dict[str, Any]) -> LayoutFeatures:
+    """Turn layout content into compact feature vectors.
+
+    Args:
+        content: Layout content as stored in the library
+
+    Returns:
+        Base layer position hashes, behavior set and MinHash signature
+    """
+    layers = [_layer_bindings(layer) for layer in content.get("layers") or []]
+
+    position_hashes = [
+        _stable_hash(_binding_token(binding)) for binding in (layers or [[]])[0]
+    ]
+
+    behaviors: set[str] = set()
+    shingles: set[int] = set()
+    for layer in layers:
+        for position, binding in enumerate(layer):
+            token = _binding_token(binding)
+            behavior = binding.get("value") if isinstance(binding, dict) else None
+            if isinstance(behavior, str) and behavior:
+                behaviors.add(behavior)
+            if behavior in _PASSTHROUGH_BINDINGS:
+                continue
+            shingles.add(_stable_hash(f"{position}:{token}", size=8))
+
+    for section in ("holdTaps", "combos", "macros"):
+        for behavior_def in content.get(section) or []:
+            if isinstance(behavior_def, dict) and behavior_def.get("name"):
+                behaviors.add(str(behavior_def["name"]))
+
+    return LayoutFeatures(
+        position_hashes=position_hashes,
+        behaviors=sorted(behaviors),
+        minhash=_minhash(shingles),
+    )
+
+
+def _position_similarity(base: list[int], other: list[int]) -> float:
+    longest = max(len(base), len(other))
+    if longest == 0:
+        return 1.0
+    matches: int = sum(map(operator.eq, base, other))
+    return matches / longest
+
+
+def _jaccard(base: list[str], other: list[str]) -> float:
+    base_set, other_set = set(base), set(other)
+    union = base_set | other_set
+    if not union:
+        return 1.0
+    return len(base_set & other_set) / len(union)
+
+
+def _signature_similarity(base: list[int], other: list[int]) -> float:
+    if len(base) != len(other) or not base:
+        return 0.0
+    matches: int = sum(map(operator.eq, base, other))
+    return matches / len(base)
+
+
+def _similarities(
+    query: LayoutFeatures, candidate: LayoutFeatures
+) -> tuple[float, float, float, float]:
+    """Compute the weighted score and binding, position and behavior similarity."""
+    binding = _signature_similarity(query.minhash, candidate.minhash)
+    position = _position_similarity(query.position_hashes, candidate.position_hashes)
+    behavior = _jaccard(query.behaviors, candidate.behaviors)
+    score = (
+        BINDING_WEIGHT * binding
+        + POSITION_WEIGHT * position
+        + BEHAVIOR_WEIGHT * behavior
+    )
+    return score, binding, position, behavior
+
+
+def compare_features(
+    uuid: str, query: LayoutFeatures, candidate: LayoutFeatures
+) -> SimilarityMatch:
+    """Score how similar a candidate layout is to the query layout.
+
+    Args:
+        uuid: UUID of the candidate layout
+        query: Features of the query layout
+        candidate: Features of the candidate layout
+
+    Returns:
+        Similarity match with the weighted score and its components
+    """
+    score, binding, position, behavior = _similarities(query, candidate)
+    return SimilarityMatch(
+        uuid=uuid,
+        score=score,
+        binding_similarity=binding,
+        position_similarity=position,
+        behavior_similarity=behavior,
+    )
+
+
+class LayoutSimilarityIndex:
+    """Persistent index of layout features for nearest neighbour queries.
+
+    Features are extracted once per layout when it is added, so a query only
+    compares short integer vectors instead of diffing full layouts. The index
+    file is loaded on first use.
+    """
+
+    def __init__(self, index_path: Path) -> None:
+        """Initialize the similarity index.
+
+        Args:
+            index_path: JSON file storing the features of indexed layouts
+        """
+        self.index_path = index_path
+        self._entries: dict[str, LayoutFeatures] | None = None
+
+    @property
+    def entries(self) -> dict[str, LayoutFeatures]:
+        """Features of indexed layouts by UUID."""
+        if self._entries is None:
+            self._entries = self._load()
+        return self._entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, uuid: object) -> bool:
+        return uuid in self.entries
+
+    def _load(self) -> dict[str, LayoutFeatures]:
+        """Load indexed features, discarding indexes built differently."""
+        if not self.index_path.exists():
+            return {}
+
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+            if (
+                data.get("version") != INDEX_VERSION
+                or data.get("signature_size") != SIGNATURE_SIZE
+            ):
+                logger.debug("similarity_index_outdated_rebuilding")
+                return {}
+            entries = {
+                uuid: LayoutFeatures.model_validate(features)
+                for uuid, features in data.get("entries", {}).items()
+            }
+            logger.debug("similarity_index_loaded", entry_count=len(entries))
+            return entries
+        except Exception as e:
+            exc_info = logger.isEnabledFor(logging.DEBUG)
+            logger.error(
+                "similarity_index_load_failed_rebuilding",
+                error=str(e),
+                exc_info=exc_info,
+            )
+            return {}
+
+    def save(self) -> None:
+        """Write the index to its file."""
+        data = {
+            "version": INDEX_VERSION,
+            "signature_size": SIGNATURE_SIZE,
+            "entries": {
+                uuid: features.model_dump(mode="json")
+                for uuid, features in self.entries.items()
+            },
+        }
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            self.index_path.write_text(
+                json.dumps(data, separators=(",", ":")), encoding="utf-8"
+            )
+            logger.debug("similarity_index_saved", entry_count=len(self.entries))
+        except Exception as e:
+            exc_info = logger.isEnabledFor(logging.DEBUG)
+            logger.error(
+                "similarity_index_save_failed", error=str(e), exc_info=exc_info
+            )
+
+    def add(
+        self, uuid: str, content: dict[str, Any], persist: bool = True
+    ) -> LayoutFeatures:
+        """Index a layout, replacing any previous features for its UUID.
+
+        Args:
+            uuid: Layout UUID
+            content: Layout content
+            persist: Whether to save the index right away
+
+        Returns:
+            Extracted layout features
+        """
+        features = extract_layout_features(content)
+        self.entries[uuid] = features
+        if persist:
+            self.save()
+        return features
+
+    def remove(self, uuid: str, persist: bool = True) -> bool:
+        """Drop a layout from the index.
+
+        Args:
+            uuid: Layout UUID
+            persist: Whether to save the index right away
+
+        Returns:
+            True if the layout was indexed
+        """
+        if self.entries.pop(uuid, None) is None:
+            return False
+        if persist:
+            self.save()
+        return True
+
+    def query(
+        self,
+        content: dict[str, Any] | LayoutFeatures,
+        limit: int = 10,
+        exclude: Iterable[str] = (),
+    ) -> list[SimilarityMatch]:
+        """Find the indexed layouts most similar to a layout.
+
+        Args:
+            content: Layout content or its precomputed features
+            limit: Maximum number of matches
+            exclude: UUIDs to leave out, such as the query layout itself
+
+        Returns:
+            Matches ordered from most to least similar
+        """
+        query = (
+            content
+            if isinstance(content, LayoutFeatures)
+            else extract_layout_features(content)
+        )
+        excluded = set(exclude)
+        scored = (
+            (_similarities(query, features), uuid)
+            for uuid, features in self.entries.items()
+            if uuid not in excluded
+        )
+        return [
+            SimilarityMatch(
+                uuid=uuid,
+                score=score,
+                binding_similarity=binding,
+                position_similarity=position,
+                behavior_similarity=behavior,
+            )
+            for (score, binding, position, behavior), uuid in heapq.nlargest(
+                limit, scored, key=lambda item: item[0][0]
+            )
+        ]
+
+
+def create_layout_similarity_index(index_path: Path) -> LayoutSimilarityIndex:
+    """Factory function to create a layout similarity index.
+
+    Args:
+        index_path: JSON file storing the index
+
+    Returns:
+        Layout similarity index instance
+    """
+    return LayoutSimilarityIndex(index_path)
@@ -17,6 +17,7 @@ from glovebox.library.models import (
     LibrarySource,
     SearchQuery,
     SearchResult,
+    SimilarityMatch,
 )
 from glovebox.library.repository import LibraryRepository
 from glovebox.moergo.client import MoErgoClient
@@ -50,6 +51,7 @@ class LibraryService:
             cache_root=user_config.cache_path,
             tag="library",
             enabled=user_config.cache_strategy == "shared",
+            backend=user_config.cache_backend,
         )
 
     def fetch_layout(self, request: FetchRequest) -> FetchResult:
@@ -343,6 +345,24 @@ class LibraryService:
         """
         return self.repository.remove_entry(uuid)
 
+    def find_similar_layouts(
+        self,
+        content: dict[str, Any],
+        limit: int = 10,
+        exclude_uuid: str | None = None,
+    ) -> list[SimilarityMatch]:
+        """Find the library layouts most similar to a layout.
+
+        Args:
+            content: Layout content dictionary to compare against
+            limit: Maximum number of results
+            exclude_uuid: UUID to leave out, such as the layout itself
+
+        Returns:
+            Matches ordered from most to least similar
+        """
+        return self.repository.find_similar_layouts(content, limit, exclude_uuid)
+
     def get_library_statistics(self) -> dict[str, Any]:
         """Get library statistics.
 
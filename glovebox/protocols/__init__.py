@@ -10,6 +10,7 @@ from .config_file_adapter_protocol import ConfigFileAdapterProtocol
 from .device_detector_protocol import DeviceDetectorProtocol
 from .docker_adapter_protocol import (
     DockerAdapterProtocol,
+    DockerContainerBackendProtocol,
     DockerEnv,
     DockerResult,
     DockerVolume,
@@ -29,6 +30,7 @@ __all__ = [
     "ConfigFileAdapterProtocol",
     "DeviceDetectorProtocol",
     "DockerAdapterProtocol",
+    "DockerContainerBackendProtocol",
     "DockerEnv",
     "DockerResult",
     "DockerVolume",
@@ -100,6 +100,18 @@ class DockerAdapterProtocol(Protocol):
         """
         ...
 
+    def image_id(self, image_name: str, image_tag: str = "latest") -> str | None:
+        """Get the ID of a local image, which changes whenever its tag is re-pulled.
+
+        Args:
+            image_name: Name of the image
+            image_tag: Tag of the image
+
+        Returns:
+            Image ID, or None if the image is missing or its ID is unknown
+        """
+        ...
+
     def pull_image(
         self,
         image_name: str,
@@ -121,3 +133,64 @@ class DockerAdapterProtocol(Protocol):
             DockerError: If the image fails to pull
         """
         ...
+
+
+@runtime_checkable
+class DockerContainerBackendProtocol(DockerAdapterProtocol, Protocol):
+    """Protocol for Docker operations on long-lived containers."""
+
+    def start_container(
+        self,
+        image: str,
+        volumes: list[DockerVolume],
+        environment: DockerEnv,
+        user_context: DockerUserContext | None = None,
+    ) -> str:
+        """Start a detached container that stays up until removed.
+
+        Args:
+            image: Docker image name/tag to run
+            volumes: List of volume mounts (host_path, container_path)
+            environment: Dictionary of environment variables
+            user_context: Optional user context for Docker --user flag
+
+        Returns:
+            ID of the started container
+
+        Raises:
+            DockerError: If the container fails to start
+        """
+        ...
+
+    def exec_in_container(
+        self,
+        container_id: str,
+        command: list[str],
+        environment: DockerEnv,
+        middleware: OutputMiddleware[T] | None = None,
+        user_context: DockerUserContext | None = None,
+    ) -> ProcessResult[T]:
+        """Run a command in a running container.
+
+        Args:
+            container_id: ID returned by start_container
+            command: Command to run in the container
+            environment: Dictionary of environment variables for the command
+            middleware: Optional middleware for processing output
+            user_context: Optional user context for the command
+
+        Returns:
+            ProcessResult containing (return_code, stdout_lines, stderr_lines)
+
+        Raises:
+            DockerError: If the command cannot be run
+        """
+        ...
+
+    def remove_container(self, container_id: str) -> None:
+        """Stop and remove a container started with start_container.
+
+        Args:
+            container_id: ID returned by start_container
+        """
+        ...
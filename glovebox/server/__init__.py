@@ -0,0 +1,28 @@
+"""Compile server keeping glovebox state warm between requests.
+
+``glovebox serve`` runs a GloveboxServer on a Unix socket. It speaks
+newline-delimited JSON-RPC 2.0 and exposes layout compile, validate, parse
+and diff. The CLI uses a running server transparently through
+get_server_client().
+"""
+
+from glovebox.server.client import (
+    RemoteLayoutService,
+    ServerClient,
+    get_server_client,
+    profile_spec,
+)
+from glovebox.server.daemon import GloveboxServer
+from glovebox.server.handlers import ServerHandlers
+from glovebox.server.protocol import get_default_socket_path
+
+
+__all__ = [
+    "GloveboxServer",
+    "RemoteLayoutService",
+    "ServerClient",
+    "ServerHandlers",
+    "get_default_socket_path",
+    "get_server_client",
+    "profile_spec",
+]
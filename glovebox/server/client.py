@@ -0,0 +1,305 @@
+"""Client for the compile server, used by the CLI when a server is running."""
+
+import json
+import os
+import socket
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from glovebox import __version__
+from glovebox.core.errors import ServerError
+from glovebox.core.structlog_logger import get_struct_logger
+from glovebox.server.protocol import (
+    MAX_MESSAGE_SIZE,
+    NO_SERVER_ENV_VAR,
+    get_default_socket_path,
+    make_request,
+)
+
+
+if TYPE_CHECKING:
+    from glovebox.config.profile import KeyboardProfile
+    from glovebox.config.user_config import UserConfig
+    from glovebox.layout.models import LayoutResult
+    from glovebox.layout.parsers.keymap_parser import KeymapParseResult
+
+
+logger = get_struct_logger(__name__)
+
+# Seconds to wait for a response; compiles of large layouts stay well below
+DEFAULT_TIMEOUT = 60.0
+
+
+def profile_spec(profile: "KeyboardProfile | None") -> str | None:
+    """Format a profile as the 'keyboard/firmware' string the server resolves."""
+    if profile is None:
+        return None
+    if profile.firmware_version:
+        return f"{profile.keyboard_name}/{profile.firmware_version}"
+    return profile.keyboard_name
+
+
+class ServerClient:
+    """JSON-RPC client for a glovebox server on a Unix socket.
+
+    The connection is opened on the first call and reused for later ones.
+    Profiles are sent with the config file and keyboard search paths of
+    this process, so the server resolves them as the CLI would.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        user_config: "UserConfig | None" = None,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            socket_path: Server socket, defaults to get_default_socket_path()
+            timeout: Seconds to wait for connecting and for each response
+            user_config: User configuration of the CLI, used to resolve profiles
+        """
+        self.socket_path = Path(socket_path or get_default_socket_path())
+        self.timeout = timeout
+        self.user_config = user_config
+        self._socket: socket.socket | None = None
+        self._reader: Any = None
+        self._next_id = 1
+
+    def __enter__(self) -> "ServerClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def connect(self) -> socket.socket:
+        """Connect to the server, reusing an open connection.
+
+        Returns:
+            The connected socket
+
+        Raises:
+            ServerError: If no server is listening on the socket
+        """
+        if self._socket is not None:
+            return self._socket
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self.socket_path))
+        except OSError as e:
+            sock.close()
+            raise ServerError(f"No glovebox server on {self.socket_path}: {e}") from e
+        self._socket = sock
+        self._reader = sock.makefile("rb")
+        return sock
+
+    def close(self) -> None:
+        """Close the connection."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def call(self, method: str, params: dict[str, Any] | None = None) -> Any:
+        """Call a server method.
+
+        Args:
+            method: Method name
+            params: Method parameters
+
+        Returns:
+            The method's result
+
+        Raises:
+            ServerError: If the server cannot be reached or returns an error
+        """
+        sock = self.connect()
+        request_id = self._next_id
+        self._next_id += 1
+
+        try:
+            sock.sendall(make_request(request_id, method, params or {}))
+            line = self._reader.readline(MAX_MESSAGE_SIZE + 1)
+        except OSError as e:
+            self.close()
+            raise ServerError(f"Glovebox server connection failed: {e}") from e
+
+        if not line:
+            self.close()
+            raise ServerError("Glovebox server closed the connection")
+
+        response = json.loads(line)
+        if response.get("id") != request_id:
+            self.close()
+            raise ServerError("Glovebox server returned a mismatched response")
+        if "error" in response:
+            error = response["error"]
+            raise ServerError(
+                f"Server {method} failed: {error.get('message')}",
+                context={"code": error.get("code")},
+            )
+        return response.get("result")
+
+    def is_running(self) -> bool:
+        """Check whether a server answers on the socket."""
+        try:
+            self.call("ping")
+        except ServerError:
+            return False
+        finally:
+            self.close()
+        return True
+
+    def ping(self) -> dict[str, Any]:
+        """Get server status."""
+        result: dict[str, Any] = self.call("ping")
+        return result
+
+    def shutdown(self) -> None:
+        """Ask the server to stop."""
+        self.call("shutdown")
+        self.close()
+
+    def profile_params(self, profile: "KeyboardProfile | None") -> dict[str, Any]:
+        """Get the request parameters the server resolves a profile from."""
+        if profile is None:
+            return {"profile": None}
+        from glovebox.config.keyboard_profile import initialize_search_paths
+
+        config_file = self.user_config.config_file_path if self.user_config else None
+        return {
+            "profile": profile_spec(profile),
+            "config_file": str(config_file.resolve()) if config_file else None,
+            "keyboard_paths": [
+                str(path.resolve())
+                for path in initialize_search_paths(self.user_config)
+            ],
+        }
+
+    def compile_layout(
+        self,
+        layout_data: dict[str, Any],
+        profile: "KeyboardProfile | None" = None,
+        incremental: bool = False,
+    ) -> "LayoutResult":
+        """Compile a layout on the server, like LayoutService.compile."""
+        from glovebox.layout.models import LayoutResult
+
+        result = self.call(
+            "layout.compile",
+            {
+                "layout": layout_data,
+                "incremental": incremental,
+                **self.profile_params(profile),
+            },
+        )
+        return LayoutResult.model_validate(result)
+
+    def validate_layout(self, layout_data: dict[str, Any]) -> bool:
+        """Validate a layout on the server, like LayoutService.validate."""
+        return bool(self.call("layout.validate", {"layout": layout_data}))
+
+    def parse_keymap(
+        self,
+        keymap_file: Path,
+        mode: str,
+        method: str,
+        profile: "KeyboardProfile | None" = None,
+    ) -> "KeymapParseResult":
+        """Parse a keymap file on the server, like ZmkKeymapParser.parse_keymap."""
+        from glovebox.layout.parsers.keymap_parser import KeymapParseResult
+
+        result = self.call(
+            "layout.parse",
+            {
+                "keymap_file": str(Path(keymap_file).resolve()),
+                "mode": mode,
+                "method": method,
+                **self.profile_params(profile),
+            },
+        )
+        return KeymapParseResult.model_validate(result)
+
+    def diff_layouts(
+        self,
+        layout1_data: dict[str, Any],
+        layout2_data: dict[str, Any],
+        output_format: str = "text",
+        include_dtsi: bool = False,
+        detailed: bool = False,
+    ) -> dict[str, Any]:
+        """Compare layouts on the server, like LayoutComparisonService."""
+        result: dict[str, Any] = self.call(
+            "layout.diff",
+            {
+                "layout1": layout1_data,
+                "layout2": layout2_data,
+                "output_format": output_format,
+                "include_dtsi": include_dtsi,
+                "detailed": detailed,
+            },
+        )
+        return result
+
+
+class RemoteLayoutService:
+    """Stand-in for LayoutService that compiles and validates on a server."""
+
+    def __init__(self, client: ServerClient) -> None:
+        """Initialize with a connected client."""
+        self.client = client
+
+    def compile(
+        self,
+        layout_data: dict[str, Any],
+        profile: "KeyboardProfile | None" = None,
+        incremental: bool = False,
+    ) -> "LayoutResult":
+        """Compile a layout on the server."""
+        return self.client.compile_layout(layout_data, profile, incremental)
+
+    def validate(self, layout_data: dict[str, Any]) -> bool:
+        """Validate a layout on the server."""
+        return self.client.validate_layout(layout_data)
+
+
+def get_server_client(
+    socket_path: Path | None = None, user_config: "UserConfig | None" = None
+) -> ServerClient | None:
+    """Get a connected client if a glovebox server is running.
+
+    This is cheap when no server runs: it only checks for the socket file.
+    Set GLOVEBOX_NO_SERVER=1 to never use a running server.
+
+    Args:
+        socket_path: Server socket, defaults to get_default_socket_path()
+        user_config: User configuration of the CLI, used to resolve profiles
+
+    Returns:
+        Connected ServerClient, or None if no server is reachable
+    """
+    if os.environ.get(NO_SERVER_ENV_VAR, "").lower() in ("1", "true", "yes"):
+        return None
+
+    path = socket_path or get_default_socket_path()
+    if not path.exists():
+        return None
+
+    client = ServerClient(path, user_config=user_config)
+    try:
+        info = client.ping()
+    except ServerError as e:
+        logger.debug("server_unreachable", socket=str(path), error=str(e))
+        client.close()
+        return None
+
+    # A server started from another glovebox version may generate differently
+    if info.get("version") != __version__:
+        logger.debug("server_version_mismatch", server_version=info.get("version"))
+        client.close()
+        return None
+    return client
@@ -0,0 +1,174 @@
+"""Long-lived compile server listening on a Unix socket."""
+
+import contextlib
+import json
+import os
+import socketserver
+import threading
+from pathlib import Path
+from typing import Any
+
+from glovebox.core.errors import ServerError
+from glovebox.core.structlog_logger import get_struct_logger
+from glovebox.server.handlers import ServerHandlers
+from glovebox.server.protocol import (
+    INTERNAL_ERROR,
+    INVALID_PARAMS,
+    INVALID_REQUEST,
+    JSONRPC_VERSION,
+    MAX_MESSAGE_SIZE,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    make_error,
+    make_result,
+)
+
+
+logger = get_struct_logger(__name__)
+
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+    """Answer newline-delimited JSON-RPC requests on one connection."""
+
+    server: "_UnixServer"
+
+    def handle(self) -> None:
+        while True:
+            line = self.rfile.readline(MAX_MESSAGE_SIZE + 1)
+            if not line:
+                return
+            if len(line) > MAX_MESSAGE_SIZE:
+                self.wfile.write(make_error(None, INVALID_REQUEST, "Request too large"))
+                return
+            if not line.strip():
+                continue
+
+            self.wfile.write(self.server.glovebox.handle_message(line))
+            self.wfile.flush()
+
+            if self.server.glovebox.handlers.shutdown_requested:
+                # shutdown() blocks until serve_forever returns, so it cannot
+                # run on the thread that is serving this request
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix stream server that knows the GloveboxServer it belongs to."""
+
+    daemon_threads = True
+    glovebox: "GloveboxServer"
+
+
+class GloveboxServer:
+    """Compile server keeping profiles, parsers and templates warm.
+
+    Each connection gets its own thread so an idle editor connection does
+    not block the CLI, but requests are dispatched one at a time so the
+    shared layout service and its caches are never used concurrently.
+    """
+
+    def __init__(self, socket_path: Path, handlers: ServerHandlers) -> None:
+        """Initialize the server.
+
+        Args:
+            socket_path: Unix socket path to listen on
+            handlers: Method handlers holding the warm state
+        """
+        self.socket_path = Path(socket_path)
+        self.handlers = handlers
+        self._server: _UnixServer | None = None
+        self._dispatch_lock = threading.Lock()
+
+    def handle_message(self, line: bytes) -> bytes:
+        """Answer one encoded JSON-RPC request.
+
+        Args:
+            line: Request line
+
+        Returns:
+            Encoded response line
+        """
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return make_error(None, PARSE_ERROR, f"Invalid JSON: {e}")
+
+        if not isinstance(request, dict) or request.get("jsonrpc") != JSONRPC_VERSION:
+            return make_error(None, INVALID_REQUEST, "Not a JSON-RPC 2.0 request")
+
+        request_id = request.get("id")
+        method = request.get("method")
+        params: Any = request.get("params") or {}
+        if not isinstance(method, str) or not isinstance(params, dict):
+            return make_error(request_id, INVALID_REQUEST, "Invalid method or params")
+        if method not in self.handlers.methods:
+            return make_error(request_id, METHOD_NOT_FOUND, f"Unknown method: {method}")
+
+        try:
+            with self._dispatch_lock:
+                result = self.handlers.dispatch(method, params)
+        except (ServerError, ValueError, TypeError) as e:
+            return make_error(request_id, INVALID_PARAMS, str(e))
+        except Exception as e:
+            logger.error("server_request_failed", method=method, error=str(e))
+            return make_error(request_id, INTERNAL_ERROR, str(e))
+
+        logger.debug("server_request_handled", method=method)
+        return make_result(request_id, result)
+
+    def bind(self) -> socketserver.UnixStreamServer:
+        """Create the listening socket.
+
+        A stale socket file left by a server that is no longer running is
+        replaced; a live one is not.
+
+        Returns:
+            The bound socket server
+
+        Raises:
+            ServerError: If another server is already listening on the socket
+        """
+        from glovebox.server.client import ServerClient
+
+        if self.socket_path.exists():
+            if ServerClient(self.socket_path).is_running():
+                raise ServerError(
+                    f"A glovebox server is already running on {self.socket_path}"
+                )
+            self.socket_path.unlink()
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        # Only the owning user may connect
+        old_umask = os.umask(0o177)
+        try:
+            server = _UnixServer(str(self.socket_path), _ConnectionHandler)
+        finally:
+            os.umask(old_umask)
+        server.glovebox = self
+        self._server = server
+        return server
+
+    def serve_forever(self) -> None:
+        """Serve requests until a shutdown request or stop() is received."""
+        server = self._server or self.bind()
+
+        logger.info("server_started", socket=str(self.socket_path), pid=os.getpid())
+        try:
+            server.serve_forever()
+        finally:
+            self.close()
+            logger.info("server_stopped", requests=self.handlers.request_count)
+
+    def stop(self) -> None:
+        """Stop serve_forever from another thread."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def close(self) -> None:
+        """Close the listening socket and remove the socket file."""
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+        with contextlib.suppress(FileNotFoundError):
+            self.socket_path.unlink()
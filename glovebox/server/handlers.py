@@ -0,0 +1,259 @@
+"""Request handlers for the compile server, holding warm profiles and services."""
+
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from glovebox import __version__
+from glovebox.core.errors import ServerError
+from glovebox.core.structlog_logger import get_struct_logger
+
+
+if TYPE_CHECKING:
+    from glovebox.config.include_loader import FileStamp
+    from glovebox.config.profile import KeyboardProfile
+    from glovebox.config.user_config import UserConfig
+    from glovebox.layout.comparison.service import LayoutComparisonService
+    from glovebox.layout.parsers.keymap_parser import ZmkKeymapParser
+    from glovebox.layout.service import LayoutService
+
+
+logger = get_struct_logger(__name__)
+
+# Profile string, client config file and client keyboard search paths
+ProfileKey = tuple[str, str | None, tuple[str, ...] | None]
+
+
+class ServerHandlers:
+    """Dispatch server methods against long-lived glovebox state.
+
+    Keyboard profiles are resolved with the config file and keyboard search
+    paths of the requesting client, and kept until one of the files they
+    were loaded from changes. The layout service, keymap parser and
+    comparison service are created on first use and then shared by every
+    request.
+    """
+
+    def __init__(
+        self,
+        user_config: "UserConfig",
+        service_factory: Callable[[], "LayoutService"],
+        parser_factory: Callable[[], "ZmkKeymapParser"] | None = None,
+    ) -> None:
+        """Initialize handlers.
+
+        Args:
+            user_config: User configuration of the server, used for profiles
+                of clients that do not send their own config file
+            service_factory: Callable creating the shared LayoutService
+            parser_factory: Callable creating the shared keymap parser
+        """
+        self.user_config = user_config
+        self.service_factory = service_factory
+        self.parser_factory = parser_factory
+        self.started_at = time.monotonic()
+        self.request_count = 0
+        self.shutdown_requested = False
+
+        self._profiles: dict[
+            ProfileKey, tuple[KeyboardProfile, list[FileStamp] | None]
+        ] = {}
+        self._service: LayoutService | None = None
+        self._parser: ZmkKeymapParser | None = None
+        self._comparison_service: LayoutComparisonService | None = None
+
+        self.methods: dict[str, Callable[[dict[str, Any]], Any]] = {
+            "ping": self.ping,
+            "shutdown": self.shutdown,
+            "layout.compile": self.compile_layout,
+            "layout.validate": self.validate_layout,
+            "layout.parse": self.parse_keymap,
+            "layout.diff": self.diff_layouts,
+        }
+
+    def dispatch(self, method: str, params: dict[str, Any]) -> Any:
+        """Run a server method.
+
+        Args:
+            method: Method name
+            params: Method parameters
+
+        Returns:
+            JSON-serializable method result
+
+        Raises:
+            KeyError: If the method does not exist
+        """
+        handler = self.methods[method]
+        self.request_count += 1
+        return handler(params)
+
+    @property
+    def service(self) -> "LayoutService":
+        """Shared layout service."""
+        if self._service is None:
+            self._service = self.service_factory()
+        return self._service
+
+    @property
+    def parser(self) -> "ZmkKeymapParser":
+        """Shared keymap parser."""
+        if self._parser is None:
+            if self.parser_factory is None:
+                from glovebox.layout import create_zmk_keymap_parser
+
+                self.parser_factory = create_zmk_keymap_parser
+            self._parser = self.parser_factory()
+        return self._parser
+
+    @property
+    def comparison_service(self) -> "LayoutComparisonService":
+        """Shared layout comparison service."""
+        if self._comparison_service is None:
+            from glovebox.adapters import create_file_adapter
+            from glovebox.layout.comparison import create_layout_comparison_service
+
+            self._comparison_service = create_layout_comparison_service(
+                self.user_config, create_file_adapter()
+            )
+        return self._comparison_service
+
+    def get_profile(self, params: dict[str, Any]) -> "KeyboardProfile | None":
+        """Resolve the profile of a request, reusing it while its files are unchanged.
+
+        Args:
+            params: Request parameters with the 'keyboard' or 'keyboard/firmware'
+                string in 'profile', and optionally the client's 'config_file'
+                and 'keyboard_paths'
+
+        Returns:
+            The resolved profile, or None if the request has no profile
+        """
+        from glovebox.config.include_loader import find_changed_file
+
+        profile = params.get("profile")
+        if not profile:
+            return None
+        config_file = params.get("config_file")
+        keyboard_paths = params.get("keyboard_paths")
+        key: ProfileKey = (
+            profile,
+            config_file,
+            None if keyboard_paths is None else tuple(keyboard_paths),
+        )
+
+        cached = self._profiles.get(key)
+        if cached is not None:
+            keyboard_profile, stamps = cached
+            if stamps is not None and find_changed_file(stamps) is None:
+                return keyboard_profile
+
+        keyboard_profile, stamps = self._load_profile(key)
+        self._profiles[key] = (keyboard_profile, stamps)
+        return keyboard_profile
+
+    def _load_profile(
+        self, key: ProfileKey
+    ) -> tuple["KeyboardProfile", "list[FileStamp] | None"]:
+        """Resolve a profile with the stamps of the files it was loaded from."""
+        from glovebox.config import create_keyboard_profile, create_user_config
+        from glovebox.config.include_loader import get_file_stamps
+
+        profile, config_file, keyboard_paths = key
+        user_config = self.user_config
+        loaded_files: list[Path] = []
+        if config_file is not None:
+            loaded_files.append(Path(config_file))
+            if Path(config_file) != user_config.config_file_path:
+                user_config = create_user_config(cli_config_path=config_file)
+
+        keyboard_name, _, firmware_version = profile.partition("/")
+        keyboard_profile = create_keyboard_profile(
+            keyboard_name,
+            firmware_version or None,
+            user_config,
+            search_paths=(
+                None
+                if keyboard_paths is None
+                else [Path(path) for path in keyboard_paths]
+            ),
+            loaded_files=loaded_files,
+        )
+        logger.debug(
+            "server_profile_loaded",
+            profile=profile,
+            config_file=config_file,
+            files=len(loaded_files),
+        )
+        # Recently modified files are stamped on a later request instead
+        return keyboard_profile, get_file_stamps(loaded_files)
+
+    def ping(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Report server status."""
+        return {
+            "version": __version__,
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.monotonic() - self.started_at, 3),
+            "requests": self.request_count,
+            "profiles": sorted({profile for profile, _, _ in self._profiles}),
+        }
+
+    def shutdown(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Ask the server to stop after answering this request."""
+        self.shutdown_requested = True
+        return {"stopping": True}
+
+    def compile_layout(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Compile a layout, mirroring LayoutService.compile."""
+        result = self.service.compile(
+            _require(params, "layout"),
+            profile=self.get_profile(params),
+            incremental=bool(params.get("incremental", False)),
+        )
+        return result.model_dump(mode="json")
+
+    def validate_layout(self, params: dict[str, Any]) -> bool:
+        """Validate a layout, mirroring LayoutService.validate."""
+        return self.service.validate(_require(params, "layout"))
+
+    def parse_keymap(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Parse a keymap file, mirroring ZmkKeymapParser.parse_keymap."""
+        from glovebox.layout.parsers.keymap_parser import ParsingMethod, ParsingMode
+
+        result = self.parser.parse_keymap(
+            keymap_file=Path(_require(params, "keymap_file")),
+            mode=ParsingMode(params.get("mode", ParsingMode.TEMPLATE_AWARE.value)),
+            profile=self.get_profile(params),
+            method=ParsingMethod(params.get("method", ParsingMethod.AST.value)),
+        )
+        return result.model_dump(mode="json", exclude={"extracted_sections"})
+
+    def diff_layouts(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Compare two layouts, mirroring LayoutComparisonService.compare_layouts."""
+        layout1 = _require(params, "layout1")
+        layout2 = _require(params, "layout2")
+
+        with tempfile.TemporaryDirectory(prefix="glovebox_diff_") as temp_dir:
+            layout1_path = Path(temp_dir) / "layout1.json"
+            layout2_path = Path(temp_dir) / "layout2.json"
+            layout1_path.write_text(json.dumps(layout1), encoding="utf-8")
+            layout2_path.write_text(json.dumps(layout2), encoding="utf-8")
+
+            return self.comparison_service.compare_layouts(
+                layout1_path=layout1_path,
+                layout2_path=layout2_path,
+                output_format=params.get("output_format", "text"),
+                include_dtsi=bool(params.get("include_dtsi", False)),
+                detailed=bool(params.get("detailed", False)),
+            )
+
+
+def _require(params: dict[str, Any], name: str) -> Any:
+    """Get a required parameter."""
+    if name not in params:
+        raise ServerError(f"Missing required parameter '{name}'")
+    return params[name]
@@ -0,0 +1,79 @@
+"""Wire protocol for the compile server: JSON-RPC 2.0, one message per line."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from glovebox.utils.xdg import get_xdg_cache_dir
+
+
+JSONRPC_VERSION = "2.0"
+
+# Environment variable overriding the server socket path
+SOCKET_ENV_VAR = "GLOVEBOX_SERVER_SOCKET"
+
+# Environment variable that stops the CLI from using a running server
+NO_SERVER_ENV_VAR = "GLOVEBOX_NO_SERVER"
+
+# JSON-RPC error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+# Largest request or response line accepted, in bytes
+MAX_MESSAGE_SIZE = 64 * 1024 * 1024
+
+
+def get_default_socket_path() -> Path:
+    """Get the Unix socket path the server listens on.
+
+    Returns:
+        $GLOVEBOX_SERVER_SOCKET if set, otherwise server.sock in
+        $XDG_RUNTIME_DIR/glovebox or the glovebox cache directory
+    """
+    env_path = os.environ.get(SOCKET_ENV_VAR)
+    if env_path:
+        return Path(env_path).expanduser()
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "glovebox" / "server.sock"
+    return get_xdg_cache_dir() / "server.sock"
+
+
+def encode_message(message: dict[str, Any]) -> bytes:
+    """Encode a message as a single JSON line."""
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def make_request(request_id: int, method: str, params: dict[str, Any]) -> bytes:
+    """Encode a JSON-RPC request."""
+    return encode_message(
+        {
+            "jsonrpc": JSONRPC_VERSION,
+            "id": request_id,
+            "method": method,
+            "params": params,
+        }
+    )
+
+
+def make_result(request_id: Any, result: Any) -> bytes:
+    """Encode a successful JSON-RPC response."""
+    return encode_message(
+        {"jsonrpc": JSONRPC_VERSION, "id": request_id, "result": result}
+    )
+
+
+def make_error(request_id: Any, code: int, message: str) -> bytes:
+    """Encode a JSON-RPC error response."""
+    return encode_message(
+        {
+            "jsonrpc": JSONRPC_VERSION,
+            "id": request_id,
+            "error": {"code": code, "message": message},
+        }
+    )
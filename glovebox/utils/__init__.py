@@ -33,5 +33,6 @@ from glovebox.utils.error_utils import (
 from glovebox.utils.stream_process import (
     DefaultOutputMiddleware,
     OutputMiddleware,
+    StreamPipelineOptions,
     run_command,
 )
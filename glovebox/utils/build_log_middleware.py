@@ -4,9 +4,15 @@ import logging
 from datetime import datetime
 from pathlib import Path
 from threading import Lock
-from typing import TYPE_CHECKING, Any, TextIO
+from typing import TYPE_CHECKING, Any
 
 from glovebox.core.structlog_logger import get_struct_logger
+from glovebox.utils.build_log_sink import (
+    BuildLogCompression,
+    BuildLogSink,
+    create_build_log_sink,
+)
+from glovebox.utils.line_classifier import LineClassifier, get_build_line_classifier
 from glovebox.utils.stream_process import OutputMiddleware
 
 
@@ -29,6 +35,9 @@ class BuildLogCaptureMiddleware(OutputMiddleware[str]):
     - Stream type indication (stdout/stderr)
     - Original command output
 
+    Lines are buffered and written in blocks by a BuildLogSink; error lines
+    are written right away so a crashed build still logs its failure.
+
     Thread-safe for concurrent access to the log file.
     """
 
@@ -38,6 +47,11 @@ class BuildLogCaptureMiddleware(OutputMiddleware[str]):
         progress_context: "ProgressContextProtocol",
         include_timestamps: bool = True,
         include_stream_type: bool = True,
+        compression: BuildLogCompression = "none",
+        buffer_size: int = 64 * 1024,
+        flush_interval: float = 1.0,
+        retain: int = 1,
+        classifier: LineClassifier | None = None,
     ) -> None:
         """Initialize build log capture middleware.
 
@@ -46,12 +60,24 @@ class BuildLogCaptureMiddleware(OutputMiddleware[str]):
             include_timestamps: Whether to include timestamps in log entries
             include_stream_type: Whether to indicate stream type (stdout/stderr)
             progress_context: Progress context for file writing progress updates
+            compression: "none", "gzip" or "zstd"; compressed logs get a
+                .gz or .zst suffix
+            buffer_size: Write the log once this many characters are buffered
+            flush_interval: Write buffered lines waiting this many seconds
+            retain: Number of build logs to keep, including this one
+            classifier: Classifier finding error lines, shared with the
+                other build output middlewares by default
         """
         self.log_file_path = log_file_path
         self.include_timestamps = include_timestamps
         self.include_stream_type = include_stream_type
         self.progress_context = progress_context
-        self._file_handle: TextIO | None = None
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.retain = retain
+        self.classifier = classifier or get_build_line_classifier()
+        self._sink: BuildLogSink | None = None
         self._lock = Lock()
         self._lines_written = 0
         self._initialize_log_file()
@@ -59,19 +85,25 @@ class BuildLogCaptureMiddleware(OutputMiddleware[str]):
     def _initialize_log_file(self) -> None:
         """Initialize the log file and write header."""
         try:
-            # Ensure parent directory exists
-            self.log_file_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Open log file for writing
-            self._file_handle = self.log_file_path.open("w", encoding="utf-8")
+            self._sink = create_build_log_sink(
+                self.log_file_path,
+                compression=self.compression,
+                buffer_size=self.buffer_size,
+                flush_interval=self.flush_interval,
+                retain=self.retain,
+            )
+            # Compressed logs are written with a suffix
+            self.log_file_path = self._sink.path
 
             # Write log header
             timestamp = datetime.now().isoformat()
-            self._file_handle.write(f"# Build Log - {timestamp}\n")
-            self._file_handle.write(f"# Log file: {self.log_file_path}\n")
-            self._file_handle.write("# Format: [timestamp] [stream] output\n")
-            self._file_handle.write("# ==========================================\n\n")
-            self._file_handle.flush()
+            self._sink.write(
+                f"# Build Log - {timestamp}\n"
+                f"# Log file: {self.log_file_path}\n"
+                "# Format: [timestamp] [stream] output\n"
+                "# ==========================================\n\n",
+                urgent=True,
+            )
 
             logger.debug("Initialized build log file: %s", self.log_file_path)
 
@@ -92,7 +124,9 @@ class BuildLogCaptureMiddleware(OutputMiddleware[str]):
                 exc_info=exc_info,
             )
             self.progress_context.log(f"ERROR: Failed to initialize build log: {e}")
-            self._file_handle = None
+            if self._sink is not None:
+                self._sink.close()
+            self._sink = None
 
     def process(self, line: str, stream_type: str) -> str:
         """Process a line of output and write it to the log file.
@@ -104,11 +138,12 @@ class BuildLogCaptureMiddleware(OutputMiddleware[str]):
         Returns:
             The original line (unmodified for chaining)
         """
-        if self._file_handle is None:
+        if self._sink is None:
             # Log file initialization failed, just pass through
             return line
 
         try:
+            urgent = "error_keyword" in self.classifier.classify(line.strip())
             with self._lock:
                 # Format log entry
                 log_entry_parts = []
@@ -124,9 +159,8 @@ class BuildLogCaptureMiddleware(OutputMiddleware[str]):
                 log_entry_parts.append(line)
                 log_entry = " ".join(log_entry_parts) + "\n"
 
-                # Write to log file
-                self._file_handle.write(log_entry)
-                self._file_handle.flush()  # Ensure immediate write for real-time monitoring
+                # Buffered, errors are written right away
+                self._sink.write(log_entry, urgent=urgent)
 
                 # Update line counter and progress
                 self._lines_written += 1
@@ -152,12 +186,14 @@ class BuildLogCaptureMiddleware(OutputMiddleware[str]):
         """Close the log file handle."""
         try:
             with self._lock:
-                if self._file_handle:
-                    self._file_handle.write(
-                        f"\n# Build log completed - {datetime.now().isoformat()}\n"
-                    )
-                    self._file_handle.close()
-                    self._file_handle = None
+                if self._sink:
+                    sink, self._sink = self._sink, None
+                    try:
+                        sink.write(
+                            f"\n# Build log completed - {datetime.now().isoformat()}\n"
+                        )
+                    finally:
+                        sink.close()
                     logger.debug("Closed build log file: %s", self.log_file_path)
 
                     # Update progress context
@@ -195,6 +231,10 @@ def create_build_log_middleware(
     log_filename: str = "build.log",
     include_timestamps: bool = True,
     include_stream_type: bool = True,
+    compression: BuildLogCompression = "none",
+    buffer_size: int = 64 * 1024,
+    flush_interval: float = 1.0,
+    retain: int = 1,
 ) -> BuildLogCaptureMiddleware:
     """Factory function to create a build log capture middleware.
 
@@ -204,6 +244,10 @@ def create_build_log_middleware(
         include_timestamps: Whether to include timestamps in log entries
         include_stream_type: Whether to indicate stream type (stdout/stderr)
         progress_context: Progress context for file writing progress updates
+        compression: "none", "gzip" or "zstd"
+        buffer_size: Write the log once this many characters are buffered
+        flush_interval: Write buffered lines waiting this many seconds
+        retain: Number of build logs to keep in artifacts_dir
 
     Returns:
         BuildLogCaptureMiddleware instance
@@ -233,4 +277,8 @@ def create_build_log_middleware(
         progress_context=progress_context,
         include_timestamps=include_timestamps,
         include_stream_type=include_stream_type,
+        compression=compression,
+        buffer_size=buffer_size,
+        flush_interval=flush_interval,
+        retain=retain,
     )
@@ -0,0 +1,468 @@
+"""Buffered, optionally compressed and rotated build log files.
+
+Writing and flushing the build log line by line costs a system call per
+line of compiler output. A BuildLogSink instead collects lines in memory
+and writes them as blocks, when the buffer is full, when it has been
+waiting for flush_interval seconds, when an urgent line such as an error
+arrives, and when the sink is closed or the process exits.
+
+Compressed logs are written as a sequence of independently compressed
+blocks: gzip members or zstd frames. Standard tools read the concatenation
+as one stream, a crash leaves every complete block readable, and a sidecar
+index of block offsets lets readers seek to a line without decompressing
+the blocks before it.
+
+Optional libraries:
+    zstandard: zstd compression (the ``cache`` extra)
+"""
+
+import atexit
+import bisect
+import gzip
+import json
+import logging
+import re
+import threading
+import time
+import weakref
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Literal, Protocol
+
+from glovebox.core.errors import BuildLogError
+from glovebox.core.structlog_logger import get_struct_logger
+
+
+logger = get_struct_logger(__name__)
+
+BuildLogCompression = Literal["none", "gzip", "zstd"]
+
+COMPRESSION_SUFFIXES: dict[str, str] = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+INDEX_SUFFIX = ".idx"
+
+# Sinks with buffered lines, flushed when the interpreter exits
+_open_sinks: "weakref.WeakSet[BuildLogSink]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_sinks() -> None:
+    for sink in list(_open_sinks):
+        sink.flush()
+
+
+class _Decompressor(Protocol):
+    @property
+    def eof(self) -> bool: ...
+
+    @property
+    def unused_data(self) -> bytes: ...
+
+    def decompress(self, data: bytes) -> bytes: ...
+
+
+def _zstd_available() -> bool:
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _compress_block(data: bytes, compression: str) -> bytes:
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return data
+
+
+def _block_decompressor(compression: str) -> _Decompressor:
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise BuildLogError(
+                "Build log is zstd-compressed but zstandard is not installed"
+            ) from e
+        return zstandard.ZstdDecompressor().decompressobj()
+    return zlib.decompressobj(wbits=31)
+
+
+def compression_for_path(path: Path) -> str:
+    """Get the compression of a build log from its file name."""
+    for compression, suffix in COMPRESSION_SUFFIXES.items():
+        if suffix and path.name.endswith(suffix):
+            return compression
+    return "none"
+
+
+def log_path_for(path: Path, compression: str) -> Path:
+    """Get the file a build log is written to with the given compression."""
+    if compression not in COMPRESSION_SUFFIXES:
+        raise BuildLogError(
+            f"Unknown build log compression '{compression}'. "
+            f"Valid values: {', '.join(COMPRESSION_SUFFIXES)}"
+        )
+    return path.with_name(path.name + COMPRESSION_SUFFIXES[compression])
+
+
+def rotate_build_logs(path: Path, retain: int) -> None:
+    """Make room for a new build log, keeping at most `retain` logs.
+
+    The previous build.log becomes build.log.1, build.log.1 becomes
+    build.log.2 and so on, whatever their compression; logs beyond the
+    limit are deleted together with their index files.
+
+    Args:
+        path: Uncompressed path of the new log, e.g. output/build.log
+        retain: Number of logs to keep including the new one
+    """
+    if not path.parent.is_dir():
+        return
+
+    pattern = re.compile(
+        rf"^{re.escape(path.name)}(?:\.(\d+))?"
+        r"(\.gz|\.zst)?(\.idx)?$"
+    )
+    generations: dict[int, list[Path]] = {}
+    for candidate in path.parent.iterdir():
+        match = pattern.match(candidate.name)
+        if match:
+            generation = int(match.group(1) or 0)
+            generations.setdefault(generation, []).append(candidate)
+
+    for generation in sorted(generations, reverse=True):
+        for old_path in generations[generation]:
+            if generation + 1 >= retain:
+                old_path.unlink(missing_ok=True)
+                continue
+            rest = old_path.name[len(path.name) :]
+            if generation:
+                rest = rest[len(f".{generation}") :]
+            old_path.rename(path.with_name(f"{path.name}.{generation + 1}{rest}"))
+
+
+@dataclass(frozen=True)
+class LogBlock:
+    """Location of one flushed block of a compressed build log.
+
+    Attributes:
+        offset: Byte offset of the compressed block in the log file
+        length: Size of the compressed block in bytes
+        first_line: Number of the first line in the block, starting at 0
+        line_count: Number of lines in the block
+    """
+
+    offset: int
+    length: int
+    first_line: int
+    line_count: int
+
+
+class BuildLogSink:
+    """Thread-safe buffered writer for one build log file."""
+
+    def __init__(
+        self,
+        path: Path,
+        compression: BuildLogCompression = "none",
+        buffer_size: int = 64 * 1024,
+        flush_interval: float = 1.0,
+    ) -> None:
+        """Open the log file, replacing any previous content.
+
+        Args:
+            path: Uncompressed path of the log; compressed logs get a
+                .gz or .zst suffix
+            compression: "none", "gzip" or "zstd"
+            buffer_size: Write a block once this many characters are buffered
+            flush_interval: Write buffered lines waiting this many seconds;
+                0 writes every line right away
+
+        Raises:
+            BuildLogError: If the compression is unknown or unavailable
+            OSError: If the log file cannot be created
+        """
+        if compression == "zstd" and not _zstd_available():
+            raise BuildLogError("Build log compression 'zstd' requires zstandard")
+        self.path = log_path_for(path, compression)
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.index_path = (
+            self.path.with_name(self.path.name + INDEX_SUFFIX)
+            if compression != "none"
+            else None
+        )
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._buffer: list[str] = []
+        self._buffered_chars = 0
+        self._buffered_lines = 0
+        self._oldest: float | None = None
+        self._lines_flushed = 0
+        self._blocks_written = 0
+        self._closed = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: BinaryIO = self.path.open("wb")
+        self._index: BinaryIO | None = None
+        if self.index_path is not None:
+            self._index = self.index_path.open("wb")
+
+        self._flusher: threading.Thread | None = None
+        _open_sinks.add(self)
+
+    @property
+    def blocks_written(self) -> int:
+        """Number of blocks written to the file so far."""
+        return self._blocks_written
+
+    def write(self, text: str, urgent: bool = False) -> None:
+        """Buffer complete lines of text.
+
+        Args:
+            text: One or more lines, each ending with a newline
+            urgent: Write the buffer right away, e.g. for error lines
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._buffer.append(text)
+            self._buffered_chars += len(text)
+            self._buffered_lines += text.count("\n")
+            if (
+                urgent
+                or self.flush_interval <= 0
+                or self._buffered_chars >= self.buffer_size
+            ):
+                self._write_block()
+            elif self._oldest is None:
+                self._oldest = time.monotonic()
+                if self._flusher is None:
+                    self._start_flusher()
+                else:
+                    self._wakeup.notify()
+
+    def flush(self) -> None:
+        """Write buffered lines to the file."""
+        with self._lock:
+            if not self._closed:
+                self._write_block()
+
+    def close(self) -> None:
+        """Write buffered lines and close the file."""
+        with self._lock:
+            if self._closed:
+                return
+            try:
+                self._write_block()
+            finally:
+                self._closed = True
+                self._wakeup.notify_all()
+                self._file.close()
+                if self._index is not None:
+                    self._index.close()
+        _open_sinks.discard(self)
+
+    def _start_flusher(self) -> None:
+        """Start the thread writing lines that waited flush_interval."""
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="build-log-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_periodically(self) -> None:
+        with self._lock:
+            while not self._closed:
+                if self._oldest is None:
+                    self._wakeup.wait()
+                    continue
+                remaining = self._oldest + self.flush_interval - time.monotonic()
+                if remaining > 0:
+                    self._wakeup.wait(remaining)
+                    continue
+                try:
+                    self._write_block()
+                except Exception as e:
+                    logger.warning("build_log_flush_failed", error=str(e))
+                    return
+
+    def _write_block(self) -> None:
+        """Write the buffer as one block; the caller holds the lock."""
+        if not self._buffer:
+            return
+
+        data = "".join(self._buffer).encode("utf-8")
+        line_count = self._buffered_lines
+        self._buffer.clear()
+        self._buffered_chars = 0
+        self._buffered_lines = 0
+        self._oldest = None
+
+        block = _compress_block(data, self.compression)
+        offset = self._file.tell()
+        self._file.write(block)
+        self._file.flush()
+
+        if self._index is not None:
+            entry = LogBlock(offset, len(block), self._lines_flushed, line_count)
+            self._index.write(
+                json.dumps(
+                    [entry.offset, entry.length, entry.first_line, entry.line_count]
+                ).encode("utf-8")
+                + b"\n"
+            )
+            self._index.flush()
+
+        self._lines_flushed += line_count
+        self._blocks_written += 1
+
+    def __enter__(self) -> "BuildLogSink":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class BuildLogReader:
+    """Read build logs written by BuildLogSink, including partial ones."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the reader.
+
+        Args:
+            path: Log file, e.g. build.log, build.log.gz or build.log.zst
+        """
+        self.path = path
+        self.compression = compression_for_path(path)
+        self._blocks: list[LogBlock] | None = None
+
+    @property
+    def blocks(self) -> list[LogBlock]:
+        """Complete blocks of a compressed log.
+
+        Uses the index when there is one and scans the log otherwise. A
+        block cut short by a crash is left out.
+        """
+        if self._blocks is None:
+            self._blocks = self._load_index() or self._scan_blocks()
+        return self._blocks
+
+    def _load_index(self) -> list[LogBlock]:
+        index_path = self.path.with_name(self.path.name + INDEX_SUFFIX)
+        if self.compression == "none" or not index_path.exists():
+            return []
+
+        size = self.path.stat().st_size
+        blocks = []
+        for raw in index_path.read_bytes().splitlines():
+            try:
+                offset, length, first_line, line_count = json.loads(raw)
+            except (ValueError, TypeError):
+                break  # Entry cut short by a crash
+            if offset + length > size:
+                break
+            blocks.append(LogBlock(offset, length, first_line, line_count))
+        return blocks
+
+    def _scan_blocks(self) -> list[LogBlock]:
+        if self.compression == "none":
+            return []
+
+        data = self.path.read_bytes()
+        blocks = []
+        offset = 0
+        first_line = 0
+        while offset < len(data):
+            decompressor = _block_decompressor(self.compression)
+            try:
+                text = decompressor.decompress(data[offset:])
+            except (zlib.error, ValueError, RuntimeError):
+                break
+            if not decompressor.eof:
+                break
+            length = len(data) - offset - len(decompressor.unused_data)
+            line_count = text.count(b"\n")
+            blocks.append(LogBlock(offset, length, first_line, line_count))
+            offset += length
+            first_line += line_count
+        return blocks
+
+    def _read_block(self, handle: BinaryIO, block: LogBlock) -> str:
+        handle.seek(block.offset)
+        decompressor = _block_decompressor(self.compression)
+        return decompressor.decompress(handle.read(block.length)).decode(
+            "utf-8", errors="replace"
+        )
+
+    def read_text(self) -> str:
+        """Read the whole log."""
+        if self.compression == "none":
+            return self.path.read_text(encoding="utf-8", errors="replace")
+        with self.path.open("rb") as handle:
+            return "".join(self._read_block(handle, block) for block in self.blocks)
+
+    def read_lines(self, start: int = 0, count: int | None = None) -> list[str]:
+        """Read lines without decompressing the blocks before them.
+
+        Args:
+            start: Number of the first line to read, starting at 0
+            count: Number of lines to read, None for all remaining lines
+
+        Returns:
+            Lines without their newlines
+        """
+        if self.compression == "none":
+            all_lines = self.read_text().splitlines()
+            return all_lines[start : None if count is None else start + count]
+
+        blocks = self.blocks
+        first_lines = [block.first_line for block in blocks]
+        position = max(bisect.bisect_right(first_lines, start) - 1, 0)
+        lines: list[str] = []
+        with self.path.open("rb") as handle:
+            for block in blocks[position:]:
+                block_lines = self._read_block(handle, block).splitlines()
+                skip = max(start - block.first_line, 0)
+                lines.extend(block_lines[skip:])
+                if count is not None and len(lines) >= count:
+                    return lines[:count]
+        return lines
+
+
+def create_build_log_sink(
+    path: Path,
+    compression: BuildLogCompression = "none",
+    buffer_size: int = 64 * 1024,
+    flush_interval: float = 1.0,
+    retain: int = 1,
+) -> BuildLogSink:
+    """Rotate previous logs and open a new build log.
+
+    Args:
+        path: Uncompressed path of the log, e.g. output/build.log
+        compression: "none", "gzip" or "zstd"
+        buffer_size: Write a block once this many characters are buffered
+        flush_interval: Write buffered lines waiting this many seconds
+        retain: Number of logs to keep in the directory, including this one
+
+    Returns:
+        Open build log sink
+    """
+    try:
+        rotate_build_logs(path, retain)
+    except OSError as e:
+        exc_info = logger.isEnabledFor(logging.DEBUG)
+        logger.warning("build_log_rotation_failed", error=str(e), exc_info=exc_info)
+    return BuildLogSink(
+        path,
+        compression=compression,
+        buffer_size=buffer_size,
+        flush_interval=flush_interval,
+    )
@@ -1,10 +1,14 @@
 """Build output filter middleware for cleaning verbose compiler warnings."""
 
 import logging
-import re
 from typing import TYPE_CHECKING
 
 from glovebox.core.structlog_logger import get_struct_logger
+from glovebox.utils.line_classifier import (
+    LineClassification,
+    LineClassifier,
+    get_build_line_classifier,
+)
 from glovebox.utils.stream_process import OutputMiddleware
 
 
@@ -37,6 +41,7 @@ class BuildOutputFilterMiddleware(OutputMiddleware[str]):
         progress_context: "ProgressContextProtocol",
         filter_verbose_warnings: bool = True,
         preserve_important_warnings: bool = True,
+        classifier: LineClassifier | None = None,
     ) -> None:
         """Initialize build output filter middleware.
 
@@ -44,6 +49,8 @@ class BuildOutputFilterMiddleware(OutputMiddleware[str]):
             progress_context: Progress context for status updates
             filter_verbose_warnings: Whether to filter verbose compiler warnings
             preserve_important_warnings: Whether to preserve important warnings
+            classifier: Line classifier with the build output rules (defaults
+                to the shared build line classifier)
         """
         self.progress_context = progress_context
         self.filter_verbose_warnings = filter_verbose_warnings
@@ -58,66 +65,23 @@ class BuildOutputFilterMiddleware(OutputMiddleware[str]):
             0  # Counter for preserving context after important warnings
         )
 
-        # Patterns that indicate verbose warning blocks to filter
-        self.verbose_patterns = [
-            # Only filter specific verbose note messages about macro expansion
-            re.compile(r".*note: in expansion of macro.*"),
-            re.compile(r".*note: in definition of macro.*"),
-            # Filter verbose macro definitions
-            re.compile(r".*#define DT_FOREACH_OKAY_INST.*fn\(\d+\).*"),
-            re.compile(r".*#define UTIL_PRIMITIVE_CAT.*"),
-            re.compile(r".*#define UTIL_CAT.*"),
-            re.compile(r".*#define DT_INST\(.*"),
-            re.compile(r".*#define DT_DRV_INST.*"),
-            re.compile(r".*#define DT_INST_PROP.*"),
-            re.compile(r".*#define __DEBRACKET.*"),
-            re.compile(r".*#define __GET_ARG2_DEBRACKET.*"),
-            re.compile(r".*#define __COND_CODE.*"),
-            re.compile(r".*#define Z_COND_CODE_.*"),
-            re.compile(r".*#define COND_CODE_.*"),
-            re.compile(r".*#define DT_CAT3.*"),
-            re.compile(r".*#define DT_PROP\(.*"),
-            re.compile(r".*#define DT_N_S_macros.*"),  # Macro definitions
-            re.compile(r".*#define DT_N_INST_\d+_.*"),  # Instance definitions
-            # DO NOT filter lines with line numbers and pipes - these show the actual code!
-            # DO NOT filter pointer lines with ^ - these show where the issue is!
-            # DO NOT filter "note: this is the location" - these explain the issue!
-        ]
-
-        # Patterns for important warnings to always preserve
-        self.important_patterns = [
-            re.compile(r".*warning:.*redefined.*"),
-            re.compile(r".*warning:.*deprecated.*"),
-            re.compile(r".*warning:.*defined but not used.*"),
-            re.compile(r".*error:.*"),
-            re.compile(r".*Error:.*"),
-            re.compile(r".*ERROR:.*"),
-            re.compile(r".*WARNING:.*"),
-            re.compile(r".*failed.*"),
-            re.compile(r".*Failed.*"),
-            re.compile(r".*FAILED.*"),
-        ]
-
-        # Pattern to detect start of overflow warning blocks
-        self.overflow_warning_start = re.compile(
-            r".*warning: unsigned conversion from.*changes value from.*"
-        )
+        # Rules are shared with other build output middlewares so each line
+        # is matched once for the whole chain
+        self.classifier = classifier or get_build_line_classifier()
 
-    def _is_verbose_line(self, line: str) -> bool:
+    def _is_verbose_line(self, classification: LineClassification) -> bool:
         """Check if a line is part of verbose compiler output."""
         if not self.filter_verbose_warnings:
             return False
 
-        # Check if line matches any verbose pattern
-        return any(pattern.match(line) for pattern in self.verbose_patterns)
+        return "verbose_output" in classification
 
-    def _is_important_line(self, line: str) -> bool:
+    def _is_important_line(self, classification: LineClassification) -> bool:
         """Check if a line contains important information to preserve."""
         if not self.preserve_important_warnings:
             return False
 
-        # Check if line matches any important pattern
-        return any(pattern.match(line) for pattern in self.important_patterns)
+        return "important_output" in classification
 
     def _flush_blank_buffer(self) -> list[str]:
         """Flush the blank line buffer and return its contents."""
@@ -161,8 +125,10 @@ class BuildOutputFilterMiddleware(OutputMiddleware[str]):
                 return "\n".join(buffered) + "\n" + line
             return line
 
+        classification = self.classifier.classify(line.strip())
+
         # Check for important lines that should always be preserved
-        if self._is_important_line(line):
+        if self._is_important_line(classification):
             self._preserved_count += 1
             # Reset verbose block tracking
             self._in_verbose_block = False
@@ -181,7 +147,7 @@ class BuildOutputFilterMiddleware(OutputMiddleware[str]):
 
         # Check if this starts an overflow warning block (but not if we're preserving context)
         if (
-            self.overflow_warning_start.match(line)
+            "overflow_warning" in classification
             and self._preserve_next_context_lines == 0
         ):
             # Start tracking verbose block
@@ -219,7 +185,7 @@ class BuildOutputFilterMiddleware(OutputMiddleware[str]):
                 "~" in line_stripped or len(line_stripped) < 100
             )
             is_continuation = (
-                self._is_verbose_line(line)
+                self._is_verbose_line(classification)
                 or is_code_snippet
                 or is_pointer_line
                 or line_stripped.startswith("|")
@@ -242,7 +208,10 @@ class BuildOutputFilterMiddleware(OutputMiddleware[str]):
                 return self.process(line, stream_type)
 
         # Check if this is a standalone verbose line (but not if we're preserving context)
-        if self._is_verbose_line(line) and self._preserve_next_context_lines == 0:
+        if (
+            self._is_verbose_line(classification)
+            and self._preserve_next_context_lines == 0
+        ):
             self._filtered_count += 1
             self._last_was_filtered = True
 
@@ -302,6 +271,7 @@ def create_build_output_filter_middleware(
     progress_context: "ProgressContextProtocol",
     filter_verbose_warnings: bool = True,
     preserve_important_warnings: bool = True,
+    classifier: LineClassifier | None = None,
 ) -> BuildOutputFilterMiddleware:
     """Factory function to create a build output filter middleware.
 
@@ -309,6 +279,8 @@ def create_build_output_filter_middleware(
         progress_context: Progress context for status updates
         filter_verbose_warnings: Whether to filter verbose compiler warnings
         preserve_important_warnings: Whether to preserve important warnings
+        classifier: Line classifier with the build output rules (defaults to
+            the shared build line classifier)
 
     Returns:
         BuildOutputFilterMiddleware instance
@@ -337,4 +309,5 @@ def create_build_output_filter_middleware(
         progress_context=progress_context,
         filter_verbose_warnings=filter_verbose_warnings,
         preserve_important_warnings=preserve_important_warnings,
+        classifier=classifier,
     )
@@ -0,0 +1,474 @@
+"""Shared single-pass classification of build output lines.
+
+Build output middlewares each used to run their own list of regexes against
+every line, so a line was matched dozens of times per middleware chain. A
+LineClassifier holds the rules of all interested middlewares and classifies
+a line once for all of them:
+
+- each rule runs at most once per line, when a middleware first asks
+  about it, and rules nobody asks about never run
+- the line is lowercased at most once for all case-insensitive rules,
+  instead of using IGNORECASE patterns, which are slow in ``re``
+- rules may declare prefilter literals, so their pattern only runs when
+  one of them is in the line
+- literal lists compile into one alternation per rule
+- the last classification is reused, so every middleware of a chain that
+  sees the same line reads the same matches
+
+Rules are kept as separate patterns rather than a single alternation with a
+named group per rule: one alternation reports only one rule per position,
+while build lines often match several rules at once (e.g. build start and
+board detection).
+"""
+
+import re
+import threading
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from glovebox.compilation.models.compilation_config import ProgressPhasePatterns
+
+
+@dataclass(frozen=True, slots=True)
+class LineRule:
+    """A named pattern evaluated by a LineClassifier.
+
+    Attributes:
+        name: Name the middlewares look the rule up by
+        pattern: Compiled pattern, searched in the line unless anchored
+        ignore_case: Match against the lowercased line; the pattern and
+            prefilter must then be lowercase
+        anchored: Match at the start of the line instead of searching
+        prefilter: Literals of which one must be in the line for the
+            pattern to run; empty to always run it
+    """
+
+    name: str
+    pattern: re.Pattern[str]
+    ignore_case: bool = False
+    anchored: bool = False
+    prefilter: tuple[str, ...] = ()
+    find: Callable[[str], re.Match[str] | None] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        find = self.pattern.match if self.anchored else self.pattern.search
+        object.__setattr__(self, "find", find)
+
+
+class LineClassification:
+    """Rule matches of one line, evaluated on first use.
+
+    Each rule runs at most once per line, however many middlewares ask
+    about it, and rules nobody asks about never run.
+    """
+
+    __slots__ = ("_lowered", "_matches", "_rules", "line")
+
+    def __init__(self, line: str, rules: Mapping[str, LineRule]) -> None:
+        """Initialize the classification of a line.
+
+        Args:
+            line: Classified line
+            rules: Rules to evaluate by name
+        """
+        self.line = line
+        self._rules = rules
+        self._lowered: str | None = None
+        self._matches: dict[str, re.Match[str] | None] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return self.match(name) is not None
+
+    def match(self, name: str) -> re.Match[str] | None:
+        """Get the match of a rule.
+
+        Args:
+            name: Rule name
+
+        Returns:
+            Match of the rule, None if it does not match the line
+
+        Raises:
+            KeyError: If no rule has the name
+        """
+        matches = self._matches
+        if name in matches:
+            return matches[name]
+
+        # Called for every rule of every line, so kept flat
+        rule = self._rules[name]
+        text = self.line
+        if rule.ignore_case:
+            if self._lowered is None:
+                self._lowered = text.lower()
+            text = self._lowered
+
+        match = None
+        for literal in rule.prefilter:
+            if literal in text:
+                match = rule.find(text)
+                break
+        else:
+            if not rule.prefilter:
+                match = rule.find(text)
+
+        matches[name] = match
+        return match
+
+    @property
+    def names(self) -> list[str]:
+        """Names of all rules matching the line, evaluating every rule."""
+        return [name for name in self._rules if self.match(name) is not None]
+
+
+class LineClassifier:
+    """Evaluate registered rules against a line at most once each."""
+
+    def __init__(self) -> None:
+        """Initialize a classifier without rules."""
+        self._rules: dict[str, LineRule] = {}
+        self._last: LineClassification | None = None
+
+    @property
+    def rules(self) -> tuple[LineRule, ...]:
+        """Registered rules in registration order."""
+        return tuple(self._rules.values())
+
+    def add_pattern(
+        self,
+        name: str,
+        pattern: str,
+        *,
+        ignore_case: bool = False,
+        anchored: bool = False,
+        prefilter: Iterable[str] = (),
+    ) -> None:
+        """Register a regex rule.
+
+        Args:
+            name: Unique rule name
+            pattern: Regular expression, lowercase if ignore_case is set
+            ignore_case: Match against the lowercased line
+            anchored: Match at the start of the line instead of searching
+            prefilter: Literals of which one must be in the line for the
+                pattern to run
+
+        Raises:
+            ValueError: If a rule with the same name is already registered
+        """
+        if name in self._rules:
+            raise ValueError(f"Line rule already registered: {name}")
+
+        self._rules[name] = LineRule(
+            name=name,
+            pattern=re.compile(pattern),
+            ignore_case=ignore_case,
+            anchored=anchored,
+            prefilter=tuple(prefilter),
+        )
+        self._last = None
+
+    def add_literals(
+        self,
+        name: str,
+        literals: Iterable[str],
+        *,
+        ignore_case: bool = False,
+        prefilter: Iterable[str] = (),
+    ) -> None:
+        """Register a rule matching lines that contain any of the literals.
+
+        Args:
+            name: Unique rule name
+            literals: Substrings to look for
+            ignore_case: Look for the substrings regardless of case
+            prefilter: Literals of which one must be in the line for the
+                literals to be looked for, lowercase if ignore_case is set
+        """
+        if ignore_case:
+            literals = [literal.lower() for literal in literals]
+        # One alternation beats a substring check per literal. Longest
+        # first, so the match is the most specific literal.
+        ordered = sorted(set(literals), key=len, reverse=True)
+        self.add_pattern(
+            name,
+            "|".join(map(re.escape, ordered)),
+            ignore_case=ignore_case,
+            prefilter=prefilter,
+        )
+
+    def classify(self, line: str) -> LineClassification:
+        """Classify a line, reusing the classification of a repeated line.
+
+        Middlewares chained on the same output see the same line one after
+        the other, so they all share the rule matches of the first one.
+
+        Args:
+            line: Line to classify, usually stripped
+
+        Returns:
+            Classification evaluating rules on first use
+        """
+        last = self._last
+        if last is not None and last.line == line:
+            return last
+
+        classification = LineClassification(line, self._rules)
+        self._last = classification
+        return classification
+
+
+# Verbose compiler notes and macro definitions filtered from build output
+VERBOSE_OUTPUT_PATTERNS = (
+    r"note: in expansion of macro",
+    r"note: in definition of macro",
+    r"#define DT_FOREACH_OKAY_INST.*fn\(\d+\)",
+    r"#define UTIL_PRIMITIVE_CAT",
+    r"#define UTIL_CAT",
+    r"#define DT_INST\(",
+    r"#define DT_DRV_INST",
+    r"#define DT_INST_PROP",
+    r"#define __DEBRACKET",
+    r"#define __GET_ARG2_DEBRACKET",
+    r"#define __COND_CODE",
+    r"#define Z_COND_CODE_",
+    r"#define COND_CODE_",
+    r"#define DT_CAT3",
+    r"#define DT_PROP\(",
+    r"#define DT_N_S_macros",
+    r"#define DT_N_INST_\d+_",
+)
+
+# Warnings and errors always kept in build output
+IMPORTANT_OUTPUT_PATTERNS = (
+    r"warning:.*redefined",
+    r"warning:.*deprecated",
+    r"warning:.*defined but not used",
+    r"error:",
+    r"Error:",
+    r"ERROR:",
+    r"WARNING:",
+    r"failed",
+    r"Failed",
+    r"FAILED",
+)
+
+# Docker and git output not worth forwarding to the progress display
+DOCKER_NOISE_LITERALS = (
+    "WARNING: The requested image's platform",
+    "Unable to find image",
+    "Pulling from",
+    "Pull complete",
+    "Digest: sha256:",
+    "Status: Downloaded",
+    "remote: Enumerating objects:",
+    "remote: Counting objects:",
+    "remote: Compressing objects:",
+    "Receiving objects:",
+    "Resolving deltas:",
+    "-- Cache files will be written to:",
+    "-- Configuring done",
+    "-- Generating done",
+)
+
+# Build tool output forwarded to the progress display
+BUILD_TOOL_LITERALS = (
+    "[",
+    "Building",
+    "Compiling",
+    "Linking",
+    "west ",
+    "cmake",
+    "ninja",
+    "make",
+    "gcc",
+    "clang",
+    "✓",
+    "✗",
+    "Error",
+    "Warning",
+    "Failed",
+    "Success",
+    "Memory region",
+    "FLASH:",
+    "SRAM:",
+    "Updating",
+    "From https://",
+    "west init",
+    "Initialized",
+    "Importing projects",
+    "projects:",
+    "revision",
+    "manifest:",
+    "Cloning",
+    "repository",
+    "Restoring",
+    "cached",
+    "cache",
+)
+
+CACHE_RESTORE_LITERALS = (
+    "restoring cached",
+    "copying cached",
+    "cache restoration",
+    "cached workspace",
+    "loading cached",
+)
+
+WEST_INIT_LITERALS = (
+    "west init",
+    "initialized empty",
+    "importing projects",
+    "manifest repository",
+    "cloning into",
+    "--- zmk (path: zmk, revision:",
+    "updating zmk",
+)
+
+
+def create_build_line_classifier(
+    progress_patterns: "ProgressPhasePatterns | None" = None,
+) -> LineClassifier:
+    """Create a classifier with the rules of the build output middlewares.
+
+    Args:
+        progress_patterns: Compilation progress patterns (defaults to the
+            standard patterns)
+
+    Returns:
+        Classifier for BuildOutputFilterMiddleware and
+        CompilationProgressMiddleware
+    """
+    if progress_patterns is None:
+        from glovebox.compilation.models.compilation_config import (
+            ProgressPhasePatterns,
+        )
+
+        progress_patterns = ProgressPhasePatterns()
+
+    classifier = LineClassifier()
+
+    # Build output filtering
+    classifier.add_pattern(
+        "verbose_output",
+        "|".join(VERBOSE_OUTPUT_PATTERNS),
+        prefilter=("note: in ", "#define "),
+    )
+    classifier.add_pattern("important_output", "|".join(IMPORTANT_OUTPUT_PATTERNS))
+    classifier.add_pattern(
+        "overflow_warning",
+        r"warning: unsigned conversion from.*changes value from",
+        prefilter=("warning: unsigned",),
+    )
+
+    # Configurable compilation phases
+    classifier.add_pattern(
+        "repo_download", progress_patterns.repo_download_pattern, anchored=True
+    )
+    classifier.add_pattern("build_start", progress_patterns.build_start_pattern)
+    classifier.add_pattern("build_progress", progress_patterns.build_progress_pattern)
+    classifier.add_pattern("build_complete", progress_patterns.build_complete_pattern)
+    classifier.add_pattern("board_detection", progress_patterns.board_detection_pattern)
+    classifier.add_pattern("board_complete", progress_patterns.board_complete_pattern)
+
+    # Completion output of the different ZMK build flavors
+    classifier.add_pattern(
+        "board_complete_output",
+        r"Memory region.*Used Size|Generating zephyr/merged\.hex",
+        prefilter=("Memory region", "merged.hex"),
+    )
+    classifier.add_pattern(
+        "board_complete_status",
+        r"west build.*completed|build complete",
+        ignore_case=True,
+        prefilter=("complete",),
+    )
+    classifier.add_pattern(
+        "build_complete_output",
+        r"Memory region\s+Used Size|FLASH.*region.*overlaps",
+        prefilter=("Memory region", "FLASH"),
+    )
+    classifier.add_pattern(
+        "build_complete_status",
+        r"west build.*completed.*successfully",
+        ignore_case=True,
+        prefilter=("successfully",),
+    )
+
+    # Git clone progress
+    classifier.add_pattern(
+        "git_objects",
+        r"Receiving objects:\s+(\d+)%\s+\((\d+)/(\d+)\),?\s*(?:(\d+(?:\.\d+)?)\s*(KiB|MiB|GiB)/s)?",
+        prefilter=("Receiving objects:",),
+    )
+    classifier.add_pattern(
+        "git_deltas",
+        r"Resolving deltas:\s+(\d+)%\s+\((\d+)/(\d+)\)",
+        prefilter=("Resolving deltas:",),
+    )
+
+    # Workspace initialization
+    classifier.add_literals(
+        "cache_restore", CACHE_RESTORE_LITERALS, ignore_case=True, prefilter=("cach",)
+    )
+    classifier.add_literals("west_init", WEST_INIT_LITERALS, ignore_case=True)
+    classifier.add_pattern(
+        "package_count",
+        r"=== \((\d+) projects?\) ===|(\d+) projects?:"
+        r"|importing (\d+) projects?|processing (\d+) projects?",
+        ignore_case=True,
+        prefilter=("project",),
+    )
+
+    # Forwarding to the progress display
+    classifier.add_literals("docker_noise", DOCKER_NOISE_LITERALS)
+    classifier.add_literals("build_tool_output", BUILD_TOOL_LITERALS)
+    classifier.add_literals(
+        "error_keyword", ("error", "failed", "✗", "fatal"), ignore_case=True
+    )
+    classifier.add_literals(
+        "warning_keyword", ("warning", "warn", "deprecated"), ignore_case=True
+    )
+    classifier.add_literals(
+        "debug_keyword", ("debug", "verbose", "trace"), ignore_case=True
+    )
+
+    return classifier
+
+
+_shared_classifiers: dict[tuple[str, ...], LineClassifier] = {}
+_shared_lock = threading.Lock()
+
+
+def get_build_line_classifier(
+    progress_patterns: "ProgressPhasePatterns | None" = None,
+) -> LineClassifier:
+    """Get the classifier shared by middlewares using the same patterns.
+
+    Middlewares chained on the same output share one classifier, so a line
+    is classified once for all of them.
+
+    Args:
+        progress_patterns: Compilation progress patterns (defaults to the
+            standard patterns)
+
+    Returns:
+        Shared classifier for the given patterns
+    """
+    if progress_patterns is None:
+        from glovebox.compilation.models.compilation_config import (
+            ProgressPhasePatterns,
+        )
+
+        progress_patterns = ProgressPhasePatterns()
+
+    key = tuple(str(value) for value in progress_patterns.model_dump().values())
+    with _shared_lock:
+        classifier = _shared_classifiers.get(key)
+        if classifier is None:
+            classifier = create_build_line_classifier(progress_patterns)
+            _shared_classifiers[key] = classifier
+        return classifier
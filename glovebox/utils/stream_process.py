@@ -24,12 +24,26 @@ Example:
 
 import shlex
 import subprocess
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
 from threading import Thread
-from typing import Any, Generic, TypeAlias, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeAlias, TypeVar, cast
 
+from glovebox.core.structlog_logger import get_struct_logger
+
+
+if TYPE_CHECKING:
+    from glovebox.protocols.metrics_protocol import MetricsProtocol
+
+
+logger = get_struct_logger(__name__)
 
 T = TypeVar("T")  # Type of processed output
 
+OverflowPolicy: TypeAlias = Literal["block", "drop", "coalesce"]
+
 # Type alias for the result of run_command
 ProcessResult: TypeAlias = tuple[int, list[T], list[T]]  # (return_code, stdout, stderr)
 
@@ -186,19 +200,180 @@ def create_chained_middleware(
     return ChainedOutputMiddleware(middleware_chain)
 
 
+@dataclass(frozen=True)
+class StreamPipelineOptions:
+    """How run_command hands output lines from the reader threads to middleware.
+
+    Readers only append lines to a bounded buffer; a dedicated consumer
+    thread takes them in batches and runs the middleware, so slow middleware
+    no longer stalls reading the process output.
+
+    Attributes:
+        max_pending: Lines buffered ahead of the consumer before the overflow
+            policy applies
+        batch_size: Maximum number of lines the consumer takes per hand-off
+        overflow: What happens to a stdout line arriving while the buffer is
+            full: "block" waits for room, "drop" discards the new line and
+            "coalesce" replaces the newest pending stdout line with it, so
+            the consumer skips ahead to the latest output. Stderr lines are
+            never discarded and always wait for room.
+    """
+
+    max_pending: int = 10_000
+    batch_size: int = 256
+    overflow: OverflowPolicy = "block"
+
+    def __post_init__(self) -> None:
+        if self.max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        if self.batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if self.overflow not in ("block", "drop", "coalesce"):
+            raise ValueError(f"Unknown overflow policy: {self.overflow}")
+
+
+class _OutputPipeline(Generic[T]):
+    """Bounded buffer between stream readers and a middleware consumer."""
+
+    def __init__(
+        self, middleware: OutputMiddleware[T], options: StreamPipelineOptions
+    ) -> None:
+        self.options = options
+        # Run chain stages individually so each one can be timed
+        self.stages: list[OutputMiddleware[Any]] = (
+            list(middleware.middleware_chain)
+            if isinstance(middleware, ChainedOutputMiddleware)
+            else [middleware]
+        )
+        self.stage_seconds = [0.0] * len(self.stages)
+        self.outputs: dict[str, list[T]] = {"stdout": [], "stderr": []}
+        self.line_counts = {"stdout": 0, "stderr": 0}
+        self.max_depth = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.failures = 0
+
+        self._pending: deque[tuple[str, str]] = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def put(self, line: str, stream_type: str) -> None:
+        """Queue a line for the consumer; called from the reader threads."""
+        with self._condition:
+            pending = self._pending
+            while len(pending) >= self.options.max_pending:
+                if stream_type == "stdout" and self.options.overflow == "drop":
+                    self.dropped += 1
+                    return
+                if stream_type == "stdout" and self.options.overflow == "coalesce":
+                    for index in range(len(pending) - 1, -1, -1):
+                        if pending[index][1] == "stdout":
+                            pending[index] = (line, stream_type)
+                            self.coalesced += 1
+                            return
+                self._condition.wait()
+
+            pending.append((line, stream_type))
+            depth = len(pending)
+            if depth > self.max_depth:
+                self.max_depth = depth
+            if depth == 1:
+                self._condition.notify_all()
+
+    def close(self) -> None:
+        """Signal that no more lines will be queued."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def consume(self) -> None:
+        """Run the middleware over queued lines until closed and drained."""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                take = min(self.options.batch_size, len(self._pending))
+                batch = [self._pending.popleft() for _ in range(take)]
+                # Readers blocked on a full buffer can continue
+                self._condition.notify_all()
+
+            for line, stream_type in batch:
+                self._process(line, stream_type)
+
+    def _process(self, line: str, stream_type: str) -> None:
+        self.line_counts[stream_type] += 1
+        output: Any = line
+        try:
+            for index, stage in enumerate(self.stages):
+                start = time.perf_counter()
+                output = stage.process(output, stream_type)
+                self.stage_seconds[index] += time.perf_counter() - start
+        except Exception as e:
+            # Keep consuming so the process never blocks on a full pipe
+            self.failures += 1
+            if self.failures == 1:
+                logger.warning(
+                    "output_middleware_failed", stream=stream_type, error=str(e)
+                )
+            return
+        if output is not None:
+            self.outputs[stream_type].append(cast(T, output))
+
+    def record_metrics(self, metrics: "MetricsProtocol") -> None:
+        """Report queue depth, line counts and per-middleware time."""
+        metrics.Histogram(
+            "stream_pipeline_max_queue_depth",
+            "Most lines waiting for output middleware during a command",
+        ).observe(self.max_depth)
+
+        lines = metrics.Counter(
+            "stream_pipeline_lines_total",
+            "Output lines processed by middleware",
+            ["stream"],
+        )
+        for stream_type, count in self.line_counts.items():
+            lines.labels(stream_type).inc(count)
+
+        skipped = metrics.Counter(
+            "stream_pipeline_lines_skipped_total",
+            "Output lines skipped because middleware fell behind",
+            ["reason"],
+        )
+        skipped.labels("dropped").inc(self.dropped)
+        skipped.labels("coalesced").inc(self.coalesced)
+
+        middleware_seconds = metrics.Counter(
+            "stream_middleware_seconds_total",
+            "Time spent in each output middleware",
+            ["middleware"],
+        )
+        for stage, seconds in zip(self.stages, self.stage_seconds, strict=True):
+            middleware_seconds.labels(type(stage).__name__).inc(seconds)
+
+
 def run_command(
     cmd: str | list[str],
     middleware: OutputMiddleware[T] | None = None,
+    options: StreamPipelineOptions | None = None,
+    metrics: "MetricsProtocol | None" = None,
 ) -> ProcessResult[T]:
     """Run a command and process its output through middleware.
 
     This function executes a command as a subprocess and streams its output
-    through the provided middleware for real-time processing. The processed
+    through the provided middleware for real-time processing. One thread per
+    stream reads lines into a bounded buffer and a dedicated consumer thread
+    runs the middleware over them in batches, in arrival order, so slow
+    middleware does not hold up reading the process output. The processed
     outputs are collected and returned along with the exit code.
 
     Args:
         cmd: Command to run, either as a string or list of arguments
         middleware: Optional middleware for processing output (uses DefaultOutputMiddleware if None)
+        options: Buffering and overflow behavior (lossless defaults if None)
+        metrics: Optional session metrics receiving queue depth, line counts
+            and time spent per middleware
 
     Returns:
         Tuple containing:
@@ -217,6 +392,11 @@ def run_command(
                 return f"[{stream_type}] {line}"
 
         rc, stdout, stderr = run_command("ls -l", CustomMiddleware())
+
+        # Let progress lines be skipped when the middleware falls behind
+        rc, stdout, stderr = run_command(
+            "west build", middleware, StreamPipelineOptions(overflow="coalesce")
+        )
         ```
     """
     if middleware is None:
@@ -227,54 +407,54 @@ def run_command(
     if isinstance(cmd, str):
         cmd = shlex.split(cmd)
 
+    pipeline = _OutputPipeline(middleware, options or StreamPipelineOptions())
+
     # Start the process with pipes for stdout and stderr
     process = subprocess.Popen(
         cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1
     )
 
-    def stream_output(stream: Any, stream_type: str) -> list[T]:
-        """Process output from a stream and capture results.
+    def read_stream(stream: Any, stream_type: str) -> None:
+        """Queue every line of a stream for the middleware consumer.
 
         Args:
             stream: Stream to read from (stdout or stderr)
             stream_type: Type of the stream ("stdout" or "stderr")
-
-        Returns:
-            List of processed output lines
         """
-        captured: list[T] = []
         for line in iter(stream.readline, ""):
             if line:
-                stripped_line = line.rstrip()
-                processed = middleware.process(stripped_line, stream_type)
-                if processed is not None:
-                    captured.append(processed)
+                pipeline.put(line.rstrip(), stream_type)
         stream.close()
-        return captured
-
-    # Prepare output collection
-    stdout_lines: list[T] = []
-    stderr_lines: list[T] = []
 
-    # Create and start threads for output processing
+    consumer_thread = Thread(target=pipeline.consume, daemon=True)
     stdout_thread = Thread(
-        target=lambda: stdout_lines.extend(stream_output(process.stdout, "stdout"))
+        target=read_stream, args=(process.stdout, "stdout"), daemon=True
     )
     stderr_thread = Thread(
-        target=lambda: stderr_lines.extend(stream_output(process.stderr, "stderr"))
+        target=read_stream, args=(process.stderr, "stderr"), daemon=True
     )
 
-    stdout_thread.daemon = True
-    stderr_thread.daemon = True
-
+    consumer_thread.start()
     stdout_thread.start()
     stderr_thread.start()
 
     # Wait for process to complete
     return_code = process.wait()
 
-    # Wait for output processing to complete
+    # Wait for the remaining output to be read and processed
     stdout_thread.join()
     stderr_thread.join()
-
-    return return_code, stdout_lines, stderr_lines
+    pipeline.close()
+    consumer_thread.join()
+
+    if metrics is not None:
+        pipeline.record_metrics(metrics)
+    if pipeline.dropped or pipeline.coalesced or pipeline.failures:
+        logger.debug(
+            "stream_pipeline_lines_skipped",
+            dropped=pipeline.dropped,
+            coalesced=pipeline.coalesced,
+            failed=pipeline.failures,
+        )
+
+    return return_code, pipeline.outputs["stdout"], pipeline.outputs["stderr"]
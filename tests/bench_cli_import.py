@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+CLI cold-start import budget check based on ``python -X importtime``.
+Usage: python tests/bench_cli_import.py [--budget-ms 150] [--runs 5]
+
+Imports the CLI the way ``glovebox --help`` and shell completion do and fails
+if the import time glovebox adds on top of typer and rich exceeds the budget,
+or if heavy modules that only command implementations need are imported.
+The baseline is measured in the same run, so the budget does not depend on
+the speed of the machine.
+"""
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass, field
+
+
+# What `glovebox --help` needs before any command runs
+STARTUP_CODE = """
+import typer
+from glovebox.cli.app import app
+from glovebox.cli.commands import register_all_commands
+register_all_commands(app)
+typer.main.get_command(app)
+"""
+
+# What every typer CLI pays, which the lazy command group cannot avoid
+BASELINE_CODE = """
+import typer
+import typer.main
+import rich.console
+"""
+
+# Modules that must stay out of the startup path
+FORBIDDEN_MODULES = [
+    "pydantic",
+    "diskcache",
+    "lark",
+    "deepdiff",
+    "requests",
+    "httpx",
+    "glovebox.compilation",
+    "glovebox.layout",
+    "glovebox.cli.commands.layout",
+    "glovebox.cli.commands.firmware",
+]
+
+
+@dataclass
+class ImportProfile:
+    """Import timings of one interpreter run."""
+
+    total_us: int = 0
+    modules: dict[str, int] = field(default_factory=dict)
+
+    def slowest(self, count: int) -> list[tuple[str, int]]:
+        """Modules with the highest cumulative import time."""
+        return sorted(self.modules.items(), key=lambda item: -item[1])[:count]
+
+
+def profile_startup(code: str = STARTUP_CODE) -> ImportProfile:
+    """Run code in a fresh interpreter and parse its -X importtime output."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    profile = ImportProfile()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        module = name.strip()
+        profile.modules[module] = int(cumulative_us)
+        # Top-level imports are not indented below another module
+        if not name.startswith("  "):
+            profile.total_us += int(cumulative_us)
+    return profile
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=150.0,
+        help="Import time budget on top of the typer and rich baseline",
+    )
+    parser.add_argument(
+        "--runs", type=int, default=5, help="Runs to take the best time from"
+    )
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to report")
+    args = parser.parse_args()
+
+    # Interleave the runs so both see the same system load
+    profiles: list[ImportProfile] = []
+    baselines: list[ImportProfile] = []
+    for _ in range(args.runs):
+        baselines.append(profile_startup(BASELINE_CODE))
+        profiles.append(profile_startup())
+    best = min(profiles, key=lambda p: p.total_us)
+    baseline = min(baselines, key=lambda p: p.total_us)
+    overhead_ms = (best.total_us - baseline.total_us) / 1000
+
+    print(f"CLI startup import time (best of {args.runs}):")
+    print(f"  total: {best.total_us / 1000:.1f} ms")
+    print(f"  typer/rich baseline: {baseline.total_us / 1000:.1f} ms")
+    print(f"  glovebox: {overhead_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print("\nSlowest modules (cumulative):")
+    for module, cumulative_us in best.slowest(args.top):
+        print(f"  {cumulative_us / 1000:8.1f} ms  {module}")
+
+    failed = False
+    forbidden = [
+        name
+        for name in FORBIDDEN_MODULES
+        if any(
+            module == name or module.startswith(f"{name}.") for module in best.modules
+        )
+    ]
+    if forbidden:
+        print(f"\n✗ Heavy modules imported at startup: {', '.join(forbidden)}")
+        failed = True
+
+    if overhead_ms > args.budget_ms:
+        print(f"\n✗ Import time exceeds budget of {args.budget_ms:.0f} ms")
+        failed = True
+
+    if not failed:
+        print("\n✓ CLI startup within import budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of build output line classification over a recorded build log.
+Usage: python tests/bench_line_classifier.py [--log build.log] [--repeat 50]
+
+Runs the build output filter and compilation progress middlewares over a
+multi-board ZMK build log, alone and chained, once with a classifier shared
+by both middlewares and once with a classifier each, and reports the time
+per line and how often each line is classified.
+"""
+
+import argparse
+import logging
+import time
+from pathlib import Path
+
+import structlog
+
+# Loaded first, importing the adapters first is circular
+import glovebox.config
+from glovebox.adapters.compilation_progress_middleware import (
+    CompilationProgressMiddleware,
+)
+from glovebox.cli.components.noop_progress_context import get_noop_progress_context
+from glovebox.utils.build_output_filter_middleware import (
+    BuildOutputFilterMiddleware,
+)
+from glovebox.utils.line_classifier import (
+    LineClassification,
+    LineClassifier,
+    create_build_line_classifier,
+)
+from glovebox.utils.stream_process import OutputMiddleware, create_chained_middleware
+
+
+DEFAULT_LOG = Path(__file__).parent / "test_utils/test_data/zmk_multi_board_build.log"
+
+
+class CountingClassifier(LineClassifier):
+    """Build line classifier counting the lines it classifies from scratch."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        for rule in create_build_line_classifier().rules:
+            self.add_pattern(
+                rule.name,
+                rule.pattern.pattern,
+                ignore_case=rule.ignore_case,
+                anchored=rule.anchored,
+                prefilter=rule.prefilter,
+            )
+        self.classifications = 0
+        self._previous: LineClassification | None = None
+
+    def classify(self, line: str) -> LineClassification:
+        classification = super().classify(line)
+        if classification is not self._previous:
+            self.classifications += 1
+            self._previous = classification
+        return classification
+
+
+def run(middleware: OutputMiddleware[str], lines: list[str], runs: int) -> float:
+    """Best time in seconds to process all lines."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        for line in lines:
+            middleware.process(line, "stdout")
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--log", type=Path, default=DEFAULT_LOG)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING)
+    )
+    lines = args.log.read_text(encoding="utf-8").splitlines() * args.repeat
+    context = get_noop_progress_context()
+
+    def filter_only(classifier: LineClassifier) -> OutputMiddleware[str]:
+        return BuildOutputFilterMiddleware(context, classifier=classifier)
+
+    def progress_only(classifier: LineClassifier) -> OutputMiddleware[str]:
+        return CompilationProgressMiddleware(context, classifier=classifier)
+
+    def chained_shared(classifier: LineClassifier) -> OutputMiddleware[str]:
+        return create_chained_middleware(
+            [filter_only(classifier), progress_only(classifier)]
+        )
+
+    def chained_separate(classifier: LineClassifier) -> OutputMiddleware[str]:
+        other = CountingClassifier()
+        counting.append(other)
+        return create_chained_middleware(
+            [filter_only(classifier), progress_only(other)]
+        )
+
+    print(f"{len(lines)} lines from {args.log.name} x {args.repeat}")
+    print(f"{'scenario':<28} {'us/line':>8} {'classified/line':>16}")
+    for name, factory in [
+        ("filter", filter_only),
+        ("progress", progress_only),
+        ("filter+progress shared", chained_shared),
+        ("filter+progress separate", chained_separate),
+    ]:
+        counting: list[CountingClassifier] = []
+        classifier = CountingClassifier()
+        counting.append(classifier)
+        seconds = run(factory(classifier), lines, args.runs)
+        classifications = sum(item.classifications for item in counting)
+        print(
+            f"{name:<28} {seconds / len(lines) * 1e6:>8.2f} "
+            f"{classifications / args.runs / len(lines):>16.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -241,6 +241,22 @@ def isolated_cli_environment(
         os.chdir(original_cwd)
 
 
+@pytest.fixture(autouse=True)
+def disable_background_cache_gc(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep CLI invocations from starting cache GC processes during tests.
+
+    Every test gets a fresh cache directory, so background GC would always be
+    due and each invoked command would spawn a GC process.
+    """
+    monkeypatch.setenv("GLOVEBOX_CACHE_GC_INTERVAL_HOURS", "0")
+
+
+@pytest.fixture(autouse=True)
+def disable_compile_server(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep CLI invocations from sending work to a developer's running server."""
+    monkeypatch.setenv("GLOVEBOX_NO_SERVER", "1")
+
+
 @pytest.fixture(autouse=True)
 def reset_shared_cache(request: pytest.FixtureRequest) -> Generator[None, None, None]:
     """Reset shared cache instances before each test for isolation.
@@ -8,15 +8,17 @@ import pytest
 
 from glovebox.adapters.docker_adapter import (
     DockerAdapter,
+    DockerStateCache,
     LoggerOutputMiddleware,
     create_chained_docker_middleware,
     create_docker_adapter,
+    get_docker_state_cache,
 )
 from glovebox.cli.components.noop_progress_context import get_noop_progress_context
 from glovebox.core.errors import DockerError
 from glovebox.models.docker import DockerUserContext
 from glovebox.protocols.docker_adapter_protocol import DockerAdapterProtocol
-from glovebox.utils.stream_process import ProcessResult
+from glovebox.utils.stream_process import ProcessResult, StreamPipelineOptions
 
 
 pytestmark = [pytest.mark.docker, pytest.mark.integration]
@@ -36,7 +38,9 @@ def _assert_docker_command_called_with_middleware(
     mock_run_command, expected_cmd, expected_middleware
 ):
     """Helper to assert Docker command was called with expected arguments and custom middleware."""
-    mock_run_command.assert_called_once_with(expected_cmd, expected_middleware)
+    mock_run_command.assert_called_once_with(
+        expected_cmd, expected_middleware, None, None
+    )
 
 
 class TestDockerAdapter:
@@ -475,7 +479,25 @@ class TestDockerAdapter:
             )
 
         assert result == mock_result
-        mock_run.assert_called_once_with(["docker", "version"], mock_middleware)
+        mock_run.assert_called_once_with(
+            ["docker", "version"], mock_middleware, None, None
+        )
+
+    def test_run_with_sudo_fallback_passes_stream_options(self):
+        """Test container output is streamed with the configured options."""
+        options = StreamPipelineOptions(overflow="coalesce")
+        metrics = Mock()
+        adapter = DockerAdapter(session_metrics=metrics, stream_options=options)
+        mock_middleware = Mock()
+
+        with patch(
+            "glovebox.utils.stream_process.run_command", return_value=(0, [], [])
+        ) as mock_run:
+            adapter._run_with_sudo_fallback(["docker", "version"], mock_middleware)
+
+        mock_run.assert_called_once_with(
+            ["docker", "version"], mock_middleware, options, metrics
+        )
 
     def test_run_with_sudo_fallback_permission_denied(self):
         """Test sudo fallback when permission denied error occurs."""
@@ -500,8 +522,10 @@ class TestDockerAdapter:
 
         assert result == sudo_result
         assert mock_run.call_count == 2
-        mock_run.assert_any_call(["docker", "version"], mock_middleware)
-        mock_run.assert_any_call(["sudo", "docker", "version"], mock_middleware)
+        mock_run.assert_any_call(["docker", "version"], mock_middleware, None, None)
+        mock_run.assert_any_call(
+            ["sudo", "docker", "version"], mock_middleware, None, None
+        )
 
     def test_run_with_sudo_fallback_non_permission_error(self):
         """Test sudo fallback doesn't trigger for non-permission errors."""
@@ -524,7 +548,7 @@ class TestDockerAdapter:
 
         # Should only be called once (no sudo retry)
         mock_run.assert_called_once_with(
-            ["docker", "run", "nonexistent"], mock_middleware
+            ["docker", "run", "nonexistent"], mock_middleware, None, None
         )
 
     def test_run_container_uses_sudo_fallback(self):
@@ -834,3 +858,115 @@ class TestChainedMiddleware:
 
         with pytest.raises(ValueError, match="Middleware chain cannot be empty"):
             create_chained_middleware([])
+
+
+class TestDockerStateCache:
+    """Test caching of Docker availability, invocation mode and images."""
+
+    @pytest.fixture
+    def clock(self):
+        """Manually advanced clock."""
+        now = [0.0]
+        clock = Mock(side_effect=lambda: now[0])
+        clock.advance = lambda seconds: now.__setitem__(0, now[0] + seconds)
+        return clock
+
+    @pytest.fixture
+    def socket_path(self, tmp_path):
+        """Stand-in for the Docker daemon socket."""
+        path = tmp_path / "docker.sock"
+        path.touch()
+        return path
+
+    @pytest.fixture
+    def state_cache(self, clock, socket_path):
+        """State cache with a 60 second TTL."""
+        return DockerStateCache(ttl=60, socket_path=socket_path, clock=clock)
+
+    def test_availability_checked_once_per_ttl(self, state_cache, clock):
+        """Test Docker availability is cached until the TTL expires."""
+        adapter = DockerAdapter(state_cache=state_cache)
+
+        with patch("subprocess.run", return_value=Mock(stdout="Docker 25")) as run:
+            assert adapter.is_available()
+            assert adapter.is_available()
+            assert run.call_count == 1
+
+            clock.advance(61)
+            assert adapter.is_available()
+            assert run.call_count == 2
+
+    def test_image_inspected_once_across_adapters(self, state_cache):
+        """Test adapters sharing a cache inspect an image once."""
+        inspect_output = Mock(stdout='[{"Id": "sha256:abc"}]')
+
+        with patch("subprocess.run", return_value=inspect_output) as run:
+            for _ in range(50):
+                assert DockerAdapter(state_cache=state_cache).image_exists(
+                    "zmk", "stable"
+                )
+            assert DockerAdapter(state_cache=state_cache).image_id("zmk", "stable") == (
+                "sha256:abc"
+            )
+
+        commands = [call.args[0] for call in run.call_args_list]
+        assert commands == [
+            ["docker", "--version"],
+            ["docker", "inspect", "zmk:stable"],
+        ]
+
+    def test_pull_forgets_missing_image(self, state_cache):
+        """Test a pulled image is looked up again."""
+        adapter = DockerAdapter(state_cache=state_cache)
+        missing = subprocess.CalledProcessError(1, "docker", stderr="No such object")
+
+        with patch("subprocess.run", side_effect=[Mock(), missing, Mock(stdout="")]):
+            assert not adapter.image_exists("zmk", "stable")
+            assert not adapter.image_exists("zmk", "stable")
+            with patch(
+                "glovebox.utils.stream_process.run_command", return_value=(0, [], [])
+            ):
+                adapter.pull_image("zmk", get_noop_progress_context(), "stable")
+            assert adapter.image_exists("zmk", "stable")
+
+    def test_sudo_mode_is_remembered(self, state_cache):
+        """Test commands go straight to sudo once sudo was needed."""
+        adapter = DockerAdapter(state_cache=state_cache)
+        denied = subprocess.CalledProcessError(1, "docker")
+        denied.stderr = "permission denied while trying to connect"
+
+        with patch("glovebox.utils.stream_process.run_command") as run:
+            run.side_effect = [denied, (0, [], []), (0, [], [])]
+            adapter._run_with_sudo_fallback(["docker", "ps"], Mock())
+            adapter._run_with_sudo_fallback(["docker", "images"], Mock())
+
+        commands = [call.args[0] for call in run.call_args_list]
+        assert commands == [
+            ["docker", "ps"],
+            ["sudo", "docker", "ps"],
+            ["sudo", "docker", "images"],
+        ]
+        assert state_cache.use_sudo is True
+
+    def test_daemon_restart_clears_state(self, state_cache, socket_path):
+        """Test a replaced daemon socket drops all cached state."""
+        state_cache.set_available(True)
+        state_cache.set_image("zmk:stable", True, "sha256:abc")
+        state_cache.use_sudo = True
+
+        socket_path.unlink()
+        socket_path.touch()
+
+        assert state_cache.get_image("zmk:stable") is None
+        assert state_cache.get_available() is None
+        assert state_cache.use_sudo is None
+
+    def test_factory_shares_process_cache(self):
+        """Test adapters from the factory share one state cache."""
+        first = create_docker_adapter()
+        second = create_docker_adapter()
+
+        assert isinstance(first, DockerAdapter)
+        assert isinstance(second, DockerAdapter)
+        assert first.state_cache is second.state_cache is get_docker_state_cache()
+        assert DockerAdapter().state_cache is None
@@ -0,0 +1,215 @@
+"""Tests for warm Docker container sessions."""
+
+import time
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from glovebox.adapters.docker_adapter import DockerAdapter
+from glovebox.adapters.docker_session import (
+    DockerSessionAdapter,
+    FakeContainer,
+    FakeDockerBackend,
+    create_docker_session_adapter,
+)
+from glovebox.cli.components.noop_progress_context import get_noop_progress_context
+from glovebox.core.errors import DockerError
+from glovebox.models.docker import DockerUserContext
+from glovebox.protocols.docker_adapter_protocol import (
+    DockerAdapterProtocol,
+    DockerContainerBackendProtocol,
+)
+from glovebox.utils.stream_process import OutputMiddleware, ProcessResult
+
+
+WORKSPACE = [("/tmp/workspace", "/workspace")]
+
+
+class UpperMiddleware(OutputMiddleware[str]):
+    def process(self, line: str, stream_type: str) -> str:
+        return line.upper()
+
+
+def _run(
+    adapter: DockerSessionAdapter, command: str, **kwargs: Any
+) -> ProcessResult[Any]:
+    return adapter.run_container(
+        image=kwargs.pop("image", "zmk:stable"),
+        volumes=kwargs.pop("volumes", WORKSPACE),
+        environment=kwargs.pop("environment", {}),
+        progress_context=get_noop_progress_context(),
+        command=["sh", "-c", command],
+        **kwargs,
+    )
+
+
+def test_backends_implement_protocols() -> None:
+    assert isinstance(DockerAdapter(), DockerContainerBackendProtocol)
+    assert isinstance(FakeDockerBackend(), DockerContainerBackendProtocol)
+    assert isinstance(DockerSessionAdapter(FakeDockerBackend()), DockerAdapterProtocol)
+
+
+def test_commands_reuse_one_container_per_workspace() -> None:
+    def handler(
+        container: FakeContainer, command: list[str], environment: dict[str, str]
+    ) -> tuple[int, str]:
+        return 0, f"{container.container_id} {environment.get('PHASE', '')}\n"
+
+    backend = FakeDockerBackend(handler)
+    with create_docker_session_adapter(backend) as adapter:
+        phases = ["west init -l config", "west update", "west build"]
+        outputs = [
+            _run(adapter, phase, environment={"PHASE": str(number)})
+            for number, phase in enumerate(phases)
+        ]
+        _run(adapter, "ls", volumes=[("/tmp/other", "/workspace")])
+
+        assert adapter.containers_started == 2
+        assert [output[1] for output in outputs] == [
+            ["fake0001 0"],
+            ["fake0001 1"],
+            ["fake0001 2"],
+        ]
+        first = backend.containers["fake0001"]
+        assert [command[-1] for command in first.commands] == phases
+        assert backend.runs == 0
+
+    assert backend.running == []
+
+
+def test_middleware_processes_command_output() -> None:
+    backend = FakeDockerBackend(lambda container, command, env: (3, "one\ntwo\n"))
+    adapter = DockerSessionAdapter(backend)
+
+    result = _run(adapter, "false", middleware=UpperMiddleware())
+
+    assert result == (3, ["ONE", "TWO"], [])
+    adapter.close()
+
+
+def test_entrypoint_runs_in_a_new_container() -> None:
+    backend = FakeDockerBackend()
+    adapter = DockerSessionAdapter(backend)
+
+    _run(adapter, "echo", entrypoint="/bin/bash")
+
+    assert backend.runs == 1
+    assert adapter.containers_started == 0
+    adapter.close()
+
+
+def test_close_sessions_for_released_workspace() -> None:
+    backend = FakeDockerBackend()
+    adapter = DockerSessionAdapter(backend)
+    _run(adapter, "a")
+    _run(adapter, "b", volumes=[("/tmp/other", "/workspace")])
+
+    adapter.close_sessions("/tmp/workspace")
+
+    assert [container.volumes for container in backend.running] == [
+        [("/tmp/other", "/workspace")]
+    ]
+    _run(adapter, "c")
+    assert adapter.containers_started == 3
+    adapter.close()
+
+
+def test_failed_exec_discards_container() -> None:
+    backend = FakeDockerBackend()
+    adapter = DockerSessionAdapter(backend)
+    _run(adapter, "a")
+    # The container died behind the adapter's back
+    backend.remove_container("fake0001")
+
+    with pytest.raises(DockerError, match="No such container"):
+        _run(adapter, "b")
+
+    assert adapter.sessions == []
+    _run(adapter, "c")
+    assert [c.container_id for c in backend.running] == ["fake0002"]
+    adapter.close()
+
+
+def test_idle_containers_are_reaped() -> None:
+    backend = FakeDockerBackend()
+    adapter = DockerSessionAdapter(backend, idle_timeout=0.05)
+    _run(adapter, "a")
+
+    deadline = time.monotonic() + 5
+    while backend.running and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert backend.running == []
+    assert adapter.sessions == []
+    adapter.close()
+
+
+def test_closed_adapter_rejects_commands() -> None:
+    adapter = DockerSessionAdapter(FakeDockerBackend())
+    adapter.close()
+
+    with pytest.raises(DockerError, match="closed"):
+        _run(adapter, "a")
+
+
+def test_docker_adapter_container_commands() -> None:
+    """DockerAdapter starts idle containers and runs commands with exec."""
+    adapter = DockerAdapter()
+    user_context = DockerUserContext.create_manual(uid=1000, gid=1000, username="u")
+    run_command = Mock(return_value=(0, ["abc123"], []))
+
+    with patch("glovebox.utils.stream_process.run_command", run_command):
+        container_id = adapter.start_container(
+            "zmk:stable", WORKSPACE, {"A": "1"}, user_context
+        )
+        adapter.exec_in_container(
+            container_id, ["west", "build"], {"B": "2"}, user_context=user_context
+        )
+        adapter.remove_container(container_id)
+
+    assert container_id == "abc123"
+    commands = [call.args[0] for call in run_command.call_args_list]
+    assert commands == [
+        [
+            "docker",
+            "run",
+            "--detach",
+            "--rm",
+            "--init",
+            "--user",
+            "1000:1000",
+            "-v",
+            "/tmp/workspace:/workspace",
+            "-e",
+            "A=1",
+            "--entrypoint",
+            "tail",
+            "zmk:stable",
+            "-f",
+            "/dev/null",
+        ],
+        [
+            "docker",
+            "exec",
+            "--user",
+            "1000:1000",
+            "-e",
+            "B=2",
+            "abc123",
+            "west",
+            "build",
+        ],
+        ["docker", "rm", "--force", "abc123"],
+    ]
+
+
+def test_docker_adapter_start_failure() -> None:
+    adapter = DockerAdapter()
+    run_command = Mock(return_value=(125, [], ["Unable to find image"]))
+
+    with (
+        patch("glovebox.utils.stream_process.run_command", run_command),
+        pytest.raises(DockerError, match="Unable to find image"),
+    ):
+        adapter.start_container("missing:latest", [], {})
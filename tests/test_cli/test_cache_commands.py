@@ -391,3 +391,42 @@ class TestCacheDeleteCommand:
         assert cache.get("test_key2") is None
         assert cache.get("other_key") == "value3"  # Should still exist
         cache.close()
+
+
+class TestCacheNixCommands:
+    """Test the cache nix CLI commands."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.runner = CliRunner()
+        reset_shared_cache_instances()
+        register_all_commands(app)
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        reset_shared_cache_instances()
+
+    def test_nix_show_and_prune(self, isolated_cli_environment):
+        """Test showing and clearing the Nix binary cache."""
+        from glovebox.compilation.cache.nix_binary_cache import NixBinaryCache
+        from glovebox.config.user_config import create_user_config
+
+        cache = NixBinaryCache(create_user_config()._config.cache_path / "nix-cache")
+        cache.ensure()
+        (cache.nar_dir / "contents.nar.zst").write_bytes(b"x" * 1024)
+        (cache.root / f"{'a' * 32}.narinfo").write_text("URL: nar/contents.nar.zst\n")
+
+        env = os.environ.copy()
+        result = self.runner.invoke(app, ["cache", "nix", "show"], env=env)
+        assert result.exit_code == 0
+        assert "Nix Binary Cache" in result.stdout
+        assert "Store paths" in result.stdout
+
+        result = self.runner.invoke(app, ["cache", "nix", "prune"], env=env)
+        assert result.exit_code == 0
+        assert "Removed 0 store paths" in result.stdout
+
+        result = self.runner.invoke(app, ["cache", "nix", "prune", "--clear"], env=env)
+        assert result.exit_code == 0
+        assert "Removed 1 store paths" in result.stdout
+        assert cache.usage() == (0, 0)
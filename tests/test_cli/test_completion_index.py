@@ -0,0 +1,348 @@
+"""Tests for the persistent completion index and the glovebox-complete entry point."""
+
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from glovebox.cli.helpers.completion_index import (
+    build_completion_index,
+    get_completion_index,
+    record_layout_completions,
+)
+from glovebox.fast_completion import (
+    INDEX_VERSION,
+    complete,
+    is_index_fresh,
+    load_completion_index,
+    main,
+    write_completion_index,
+)
+
+
+def _touch_later(path):
+    """Move a file's modification time forward by one second."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def index_path(tmp_path, monkeypatch):
+    """Completion index location inside tmp_path."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.delenv("GLOVEBOX_KEYBOARD_PATH", raising=False)
+    monkeypatch.delenv("GLOVEBOX_JSON_FILE", raising=False)
+    return tmp_path / "cache" / "glovebox" / "completion_index.json"
+
+
+@pytest.fixture
+def sample_index():
+    """Index data as written by build_completion_index."""
+    return {
+        "version": INDEX_VERSION,
+        "keyboard_path_env": "",
+        "sources": {},
+        "profiles": {"glove80": ["v25.05", "v25.04"], "corne": ["main"]},
+        "library": ["@my-layout", "@other-layout", "@12345678-uuid"],
+        "fields": ["title", "keyboard", "layers", "layer_names", "variables"],
+        "commands": {
+            "options": {"--help": False, "--debug": False},
+            "commands": {
+                "layout": {
+                    "options": {},
+                    "commands": {
+                        "compile": {
+                            "options": {"--profile": True, "-p": True, "--help": False},
+                        },
+                        "edit": {
+                            "options": {
+                                "--get": True,
+                                "--layer": True,
+                                "--save": False,
+                            },
+                        },
+                    },
+                },
+                "cache": {"options": {}, "commands": {"gc": {"options": {}}}},
+            },
+        },
+        "layouts": {},
+    }
+
+
+@pytest.fixture
+def layout_file(tmp_path):
+    """Layout JSON file with two layers and a variable."""
+    path = tmp_path / "my_layout.json"
+    path.write_text(
+        '{"layer_names": ["Base", "Lower"], "layers": [[], []],'
+        ' "variables": {"tapping_term": 200}}'
+    )
+    return path
+
+
+class TestCompletionIndexBuild:
+    """Test building and refreshing the index."""
+
+    @pytest.fixture
+    def stubbed_sections(self, tmp_path):
+        """Stub everything but profile data and index sources."""
+        source = tmp_path / "glove80.yaml"
+        source.write_text("keyboard: glove80\n")
+        with (
+            patch("glovebox.config.create_user_config"),
+            patch(
+                "glovebox.config.keyboard_profile.initialize_search_paths",
+                return_value=[],
+            ),
+            patch(
+                "glovebox.config.keyboard_profile.get_available_keyboards",
+                return_value=["glove80"],
+            ),
+            patch(
+                "glovebox.config.keyboard_profile.get_available_firmwares",
+                return_value=["v25.05"],
+            ) as mock_firmwares,
+            patch(
+                "glovebox.cli.helpers.completion_index._source_paths",
+                return_value=[source],
+            ),
+            patch(
+                "glovebox.cli.helpers.completion_index._library_references",
+                return_value=["@my-layout"],
+            ),
+            patch(
+                "glovebox.cli.helpers.completion_index._command_tree",
+                return_value={"options": {}},
+            ),
+            patch("glovebox.cli.helpers.completion_index.request_rebuild"),
+        ):
+            yield source, mock_firmwares
+
+    def test_build_contains_all_sections(self, stubbed_sections):
+        """Test a built index holds profiles, library, fields and commands."""
+        source, _ = stubbed_sections
+        index = build_completion_index()
+
+        assert index["version"] == INDEX_VERSION
+        assert index["profiles"] == {"glove80": ["v25.05"]}
+        assert index["library"] == ["@my-layout"]
+        assert "title" in index["fields"]
+        assert index["commands"] == {"options": {}}
+        assert index["sources"][str(source)] == source.stat().st_mtime_ns
+        assert is_index_fresh(index)
+
+    def test_index_stale_after_source_change(self, stubbed_sections):
+        """Test changing a keyboard configuration invalidates the index."""
+        source, _ = stubbed_sections
+        index = build_completion_index()
+
+        _touch_later(source)
+
+        assert not is_index_fresh(index)
+
+    def test_index_stale_after_keyboard_path_change(
+        self, stubbed_sections, monkeypatch
+    ):
+        """Test changing GLOVEBOX_KEYBOARD_PATH invalidates the index."""
+        index = build_completion_index()
+
+        monkeypatch.setenv("GLOVEBOX_KEYBOARD_PATH", "/elsewhere")
+
+        assert not is_index_fresh(index)
+
+    def test_get_rebuilds_only_when_stale(self, stubbed_sections, index_path):
+        """Test the index is written once and rebuilt after a source change."""
+        source, mock_firmwares = stubbed_sections
+
+        get_completion_index()
+        get_completion_index()
+        assert mock_firmwares.call_count == 1
+        assert index_path.exists()
+
+        _touch_later(source)
+        mock_firmwares.return_value = ["v25.05", "v25.06"]
+
+        assert get_completion_index()["profiles"] == {"glove80": ["v25.05", "v25.06"]}
+        assert mock_firmwares.call_count == 2
+
+    def test_get_leaves_command_tree_to_background(self, stubbed_sections, index_path):
+        """Test completion callbacks never import the command modules."""
+        with (
+            patch(
+                "glovebox.cli.helpers.completion_index._command_tree"
+            ) as mock_command_tree,
+            patch(
+                "glovebox.cli.helpers.completion_index.request_rebuild"
+            ) as mock_rebuild,
+        ):
+            index = get_completion_index()
+
+        assert index["commands"] == {}
+        assert not mock_command_tree.called
+        mock_rebuild.assert_called_once_with(index_path)
+
+    def test_command_tree_kept_until_commands_change(self, stubbed_sections):
+        """Test a partial rebuild keeps the previous command tree if current."""
+        from glovebox.cli.helpers.completion_index import _commands_source
+
+        previous = build_completion_index()
+        rebuilt = build_completion_index(previous=previous, include_commands=False)
+        assert rebuilt["commands"] == {"options": {}}
+        assert str(_commands_source()) in rebuilt["sources"]
+
+        previous["sources"][str(_commands_source())] = 0
+        rebuilt = build_completion_index(previous=previous, include_commands=False)
+        assert rebuilt["commands"] == {}
+        assert str(_commands_source()) not in rebuilt["sources"]
+
+    def test_record_layout_completions(self, sample_index, index_path, layout_file):
+        """Test layouts used in completion are added to the index."""
+        write_completion_index(sample_index, index_path)
+
+        record_layout_completions(layout_file)
+
+        layout = load_completion_index(index_path)["layouts"][str(layout_file)]
+        assert layout["layer_names"] == ["Base", "Lower"]
+        assert "variables.tapping_term" in layout["fields"]
+        assert "layers[1]" in layout["fields"]
+
+
+class TestComplete:
+    """Test candidate computation from index data."""
+
+    def test_subcommands(self, sample_index):
+        """Test command names are completed at each level."""
+        assert complete(sample_index, [], "la") == ["layout"]
+        assert complete(sample_index, ["layout"], "") == ["compile", "edit"]
+
+    def test_options(self, sample_index):
+        """Test options of the current command are completed."""
+        result = complete(sample_index, ["layout", "compile"], "--p")
+
+        assert result == ["--profile"]
+
+    def test_profiles(self, sample_index):
+        """Test profile option values."""
+        words = ["layout", "compile", "--profile"]
+
+        assert complete(sample_index, words, "gl") == [
+            "glove80",
+            "glove80/v25.04",
+            "glove80/v25.05",
+        ]
+        assert complete(sample_index, words, "glove80/v25.0") == [
+            "glove80/v25.04",
+            "glove80/v25.05",
+        ]
+
+    def test_profile_with_equals(self, sample_index):
+        """Test --option=value syntax."""
+        result = complete(sample_index, ["layout", "compile"], "--profile=co")
+
+        assert result == ["--profile=corne", "--profile=corne/main"]
+
+    def test_option_value_skipped_when_walking(self, sample_index):
+        """Test option values are not mistaken for subcommands."""
+        words = ["layout", "compile", "-p", "glove80/v25.05"]
+
+        assert complete(sample_index, words, "--h") == ["--help"]
+
+    def test_library_references(self, sample_index):
+        """Test @ references are completed from the library."""
+        result = complete(sample_index, ["layout", "compile"], "@my")
+
+        assert result == ["@my-layout"]
+
+    def test_fields(self, sample_index):
+        """Test field paths, including comma separated lists."""
+        words = ["layout", "edit", "layout.json", "--get"]
+
+        assert complete(sample_index, words, "") == [
+            "keyboard",
+            "layer_names",
+            "layers",
+            "title",
+            "variables",
+        ]
+        assert complete(sample_index, words, "title,key") == ["title,keyboard"]
+
+    def test_recent_layout_fields_and_layers(self, sample_index, layout_file):
+        """Test fields and layers of a recorded layout are offered."""
+        sample_index["layouts"][str(layout_file)] = {
+            "mtime_ns": layout_file.stat().st_mtime_ns,
+            "layer_names": ["Base", "Lower"],
+            "fields": ["variables.tapping_term"],
+        }
+        words = ["layout", "edit", str(layout_file)]
+
+        assert complete(sample_index, [*words, "--get"], "variables.") == [
+            "variables.tapping_term"
+        ]
+        assert complete(sample_index, [*words, "--layer"], "L") == ["Lower"]
+
+        # Modified layouts are ignored until recorded again
+        _touch_later(layout_file)
+        assert complete(sample_index, [*words, "--layer"], "") == []
+
+    def test_unknown_option_value_falls_back(self, sample_index):
+        """Test no candidates for values the index knows nothing about."""
+        assert complete(sample_index, ["layout", "edit", "--save"], "out") == []
+
+
+class TestMain:
+    """Test the glovebox-complete entry point."""
+
+    def test_prints_candidates(self, sample_index, index_path, monkeypatch, capsys):
+        """Test candidates are printed for COMP_LINE."""
+        write_completion_index(sample_index, index_path)
+        monkeypatch.setenv("COMP_LINE", "glovebox layout c")
+        monkeypatch.setenv("COMP_POINT", "17")
+
+        assert main(["glovebox-complete", "glovebox", "c", "layout"]) == 0
+
+        assert capsys.readouterr().out.split() == ["compile"]
+
+    def test_missing_index_requests_rebuild(self, index_path, monkeypatch, capsys):
+        """Test a missing index prints nothing and starts a rebuild."""
+        monkeypatch.setenv("COMP_LINE", "glovebox ")
+
+        with patch("glovebox.fast_completion.request_rebuild") as mock_rebuild:
+            assert main(["glovebox-complete"]) == 0
+
+        mock_rebuild.assert_called_once_with(index_path)
+        assert capsys.readouterr().out == ""
+
+    def test_stale_index_served_while_rebuilding(
+        self, sample_index, index_path, monkeypatch, capsys
+    ):
+        """Test a stale index is still used while a rebuild is requested."""
+        sample_index["sources"] = {str(index_path.parent / "gone.yaml"): 1}
+        write_completion_index(sample_index, index_path)
+        monkeypatch.setenv("COMP_LINE", "glovebox ca")
+
+        with patch("glovebox.fast_completion.request_rebuild") as mock_rebuild:
+            main(["glovebox-complete"])
+
+        mock_rebuild.assert_called_once()
+        assert capsys.readouterr().out.split() == ["cache"]
+
+    def test_imports_no_heavy_modules(self):
+        """Test the entry point loads neither the CLI nor its dependencies."""
+        proc = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, glovebox.fast_completion\n"
+                "print(sorted(m for m in sys.modules"
+                " if m.split('.')[0] in ('typer', 'click', 'pydantic', 'diskcache')"
+                " or m.startswith('glovebox.') and m != 'glovebox.fast_completion'))",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert proc.stdout.strip() == "[]"
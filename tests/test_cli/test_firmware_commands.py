@@ -7,11 +7,13 @@ from unittest.mock import Mock, patch
 import pytest
 
 from glovebox.cli import app
-from glovebox.cli.commands import register_all_commands
+from glovebox.cli.commands import load_command, register_all_commands
 
 
-# Register commands with the app before running tests
+# Register commands with the app and import the firmware commands before
+# running tests, so patches inside a test do not leak into module imports
 register_all_commands(app)
+load_command("firmware")
 
 
 @pytest.mark.skip(reason="Test requires deep mocking of firmware flash commands")
@@ -702,3 +704,22 @@ def test_firmware_flash_json_auto_detection_help(cli_runner):
         or "automatic" in cmd_result.output.lower()
     )
     assert "keyboard" in cmd_result.output.lower()
+
+
+@pytest.mark.parametrize("overflow", ["block", "drop", "coalesce"])
+def test_firmware_docker_adapter_uses_output_overflow(overflow):
+    """Test firmware builds stream output with the configured overflow policy."""
+    from glovebox.cli.commands.firmware.helpers import create_firmware_docker_adapter
+    from glovebox.config.models.firmware import (
+        FirmwareDockerConfig,
+        UserFirmwareConfig,
+    )
+
+    user_config = Mock()
+    user_config._config.firmware = UserFirmwareConfig(
+        docker=FirmwareDockerConfig(output_overflow=overflow)
+    )
+
+    adapter = create_firmware_docker_adapter(user_config)
+
+    assert adapter.stream_options.overflow == overflow
@@ -1,6 +1,5 @@
 """Tests for CLI parameter helpers, particularly profile completion functionality."""
 
-import logging
 from unittest.mock import Mock, patch
 
 import pytest
@@ -8,8 +7,6 @@ import pytest
 from glovebox.cli.helpers.parameters import (
     LAYER_NAMES_CACHE_KEY_PREFIX,
     LAYER_NAMES_TTL,
-    PROFILE_COMPLETION_CACHE_KEY,
-    PROFILE_COMPLETION_TTL,
     STATIC_COMPLETION_CACHE_KEY,
     STATIC_COMPLETION_TTL,
     _get_cached_layer_names,
@@ -23,39 +20,52 @@ from glovebox.cli.helpers.parameters import (
 )
 
 
+@pytest.fixture
+def completion_index_env(tmp_path):
+    """Point the completion index at tmp_path with a single keyboard source.
+
+    Expensive index sections (library, layout fields, command tree) are
+    stubbed so only profile data is built.
+    """
+    source = tmp_path / "glove80.yaml"
+    source.write_text("keyboard: glove80\n")
+
+    with (
+        patch(
+            "glovebox.cli.helpers.completion_index.get_completion_index_path",
+            return_value=tmp_path / "completion_index.json",
+        ),
+        patch("glovebox.config.create_user_config"),
+        patch(
+            "glovebox.config.keyboard_profile.initialize_search_paths",
+            return_value=[],
+        ),
+        patch(
+            "glovebox.cli.helpers.completion_index._source_paths",
+            return_value=[source],
+        ),
+        patch(
+            "glovebox.cli.helpers.completion_index._library_references",
+            return_value=[],
+        ),
+        patch("glovebox.cli.helpers.completion_index._layout_fields", return_value=[]),
+        patch("glovebox.cli.helpers.completion_index._command_tree", return_value={}),
+        patch("glovebox.cli.helpers.completion_index.request_rebuild"),
+    ):
+        yield source
+
+
 class TestProfileCompletionCaching:
-    """Test the caching functionality for profile completion."""
+    """Test profile completion data served from the completion index."""
 
-    @patch("glovebox.config.create_user_config")
-    @patch("glovebox.core.cache.create_default_cache")
     @patch("glovebox.config.keyboard_profile.get_available_keyboards")
     @patch("glovebox.config.keyboard_profile.get_available_firmwares")
-    def test_get_cached_profile_data_cache_miss(
-        self,
-        mock_get_firmwares,
-        mock_get_keyboards,
-        mock_create_cache,
-        mock_create_user_config,
-        tmp_path,
+    def test_get_cached_profile_data_index_miss(
+        self, mock_get_firmwares, mock_get_keyboards, completion_index_env, tmp_path
     ):
-        """Test cache miss scenario where data is fetched and cached."""
-        # Setup mocks with proper isolation
-        mock_user_config = Mock()
-        mock_user_config.get.side_effect = lambda key, default=None: {
-            "cache_strategy": "shared",
-            "cache_file_locking": True,
-        }.get(key, default)
-        # Use tmp_path for cache to prevent directory pollution
-        mock_user_config.cache_path = tmp_path / "cache"
-        mock_create_user_config.return_value = mock_user_config
-
-        mock_cache = Mock()
-        mock_cache.get.return_value = None  # Cache miss
-        mock_create_cache.return_value = mock_cache
-
+        """Test a missing index is built and written."""
         mock_get_keyboards.return_value = ["glove80", "corne", "moonlander"]
 
-        # Mock firmware responses for each keyboard
         def mock_firmware_side_effect(keyboard, user_config):
             firmware_map = {
                 "glove80": ["v25.05", "v25.04"],
@@ -66,109 +76,61 @@ class TestProfileCompletionCaching:
 
         mock_get_firmwares.side_effect = mock_firmware_side_effect
 
-        # Call the function
         keyboards, keyboards_with_firmwares = _get_cached_profile_data()
 
-        # Verify cache was checked
-        mock_cache.get.assert_called_once_with(PROFILE_COMPLETION_CACHE_KEY)
-
-        # Verify data was built
         assert keyboards == ["glove80", "corne", "moonlander"]
         assert keyboards_with_firmwares == {
             "glove80": ["v25.05", "v25.04"],
             "corne": ["latest"],
             "moonlander": ["v1.0", "v2.0"],
         }
+        assert (tmp_path / "completion_index.json").exists()
 
-        # Verify data was cached
-        expected_cache_data = {
-            "keyboards": ["glove80", "corne", "moonlander"],
-            "keyboards_with_firmwares": {
-                "glove80": ["v25.05", "v25.04"],
-                "corne": ["latest"],
-                "moonlander": ["v1.0", "v2.0"],
-            },
-        }
-        mock_cache.set.assert_called_once_with(
-            PROFILE_COMPLETION_CACHE_KEY,
-            expected_cache_data,
-            ttl=PROFILE_COMPLETION_TTL,
-        )
-
-    @patch("glovebox.config.create_user_config")
-    @patch("glovebox.core.cache.create_default_cache")
-    def test_get_cached_profile_data_cache_hit(
-        self, mock_create_cache, mock_create_user_config, tmp_path
+    @patch("glovebox.config.keyboard_profile.get_available_keyboards")
+    @patch("glovebox.config.keyboard_profile.get_available_firmwares")
+    def test_get_cached_profile_data_index_hit(
+        self, mock_get_firmwares, mock_get_keyboards, completion_index_env
     ):
-        """Test cache hit scenario where data is returned from cache."""
-        # Setup mocks with proper isolation
-        mock_user_config = Mock()
-        mock_user_config.get.side_effect = lambda key, default=None: {
-            "cache_strategy": "shared",
-            "cache_file_locking": True,
-        }.get(key, default)
-        # Use tmp_path for cache to prevent directory pollution
-        mock_user_config.cache_path = tmp_path / "cache"
-        mock_create_user_config.return_value = mock_user_config
+        """Test a fresh index is served without loading keyboard configs."""
+        mock_get_keyboards.return_value = ["glove80"]
+        mock_get_firmwares.return_value = ["v25.05"]
+        _get_cached_profile_data()
 
-        cached_data = {
-            "keyboards": ["glove80", "corne"],
-            "keyboards_with_firmwares": {
-                "glove80": ["v25.05"],
-                "corne": ["latest"],
-            },
-        }
+        mock_get_keyboards.reset_mock()
+        keyboards, keyboards_with_firmwares = _get_cached_profile_data()
 
-        mock_cache = Mock()
-        mock_cache.get.return_value = cached_data
-        mock_create_cache.return_value = mock_cache
+        assert keyboards == ["glove80"]
+        assert keyboards_with_firmwares == {"glove80": ["v25.05"]}
+        assert not mock_get_keyboards.called
 
-        # Call the function
-        keyboards, keyboards_with_firmwares = _get_cached_profile_data()
+    @patch("glovebox.config.keyboard_profile.get_available_keyboards")
+    @patch("glovebox.config.keyboard_profile.get_available_firmwares")
+    def test_get_cached_profile_data_rebuilt_on_source_change(
+        self, mock_get_firmwares, mock_get_keyboards, completion_index_env
+    ):
+        """Test changing a keyboard configuration rebuilds the index."""
+        import os
 
-        # Verify cache was hit
-        mock_cache.get.assert_called_once_with(PROFILE_COMPLETION_CACHE_KEY)
+        mock_get_keyboards.return_value = ["glove80"]
+        mock_get_firmwares.return_value = ["v25.05"]
+        _get_cached_profile_data()
 
-        # Verify correct data was returned
-        assert keyboards == ["glove80", "corne"]
-        assert keyboards_with_firmwares == {
-            "glove80": ["v25.05"],
-            "corne": ["latest"],
-        }
+        stat = completion_index_env.stat()
+        os.utime(completion_index_env, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        mock_get_firmwares.return_value = ["v25.05", "v25.06"]
 
-        # Verify cache was not written to (no .set call)
-        assert not mock_cache.set.called
+        _keyboards, keyboards_with_firmwares = _get_cached_profile_data()
+
+        assert keyboards_with_firmwares == {"glove80": ["v25.05", "v25.06"]}
 
-    @patch("glovebox.config.create_user_config")
-    @patch("glovebox.core.cache.create_default_cache")
     @patch("glovebox.config.keyboard_profile.get_available_keyboards")
     @patch("glovebox.config.keyboard_profile.get_available_firmwares")
     def test_get_cached_profile_data_firmware_error_handling(
-        self,
-        mock_get_firmwares,
-        mock_get_keyboards,
-        mock_create_cache,
-        mock_create_user_config,
-        tmp_path,
+        self, mock_get_firmwares, mock_get_keyboards, completion_index_env
     ):
         """Test error handling when firmware lookup fails for some keyboards."""
-        # Setup mocks with proper isolation
-        mock_user_config = Mock()
-        mock_user_config.get.side_effect = lambda key, default=None: {
-            "cache_strategy": "shared",
-            "cache_file_locking": True,
-        }.get(key, default)
-        # Use tmp_path for cache to prevent directory pollution
-        mock_user_config.cache_path = tmp_path / "cache"
-        mock_create_user_config.return_value = mock_user_config
-
-        mock_cache = Mock()
-        mock_cache.get.return_value = None  # Cache miss
-        mock_create_cache.return_value = mock_cache
-
         mock_get_keyboards.return_value = ["glove80", "broken_keyboard", "corne"]
 
-        # Mock firmware responses with one keyboard failing
         def mock_firmware_side_effect(keyboard, user_config):
             if keyboard == "broken_keyboard":
                 raise Exception("Config file not found")
@@ -180,7 +142,6 @@ class TestProfileCompletionCaching:
 
         mock_get_firmwares.side_effect = mock_firmware_side_effect
 
-        # Call the function
         keyboards, keyboards_with_firmwares = _get_cached_profile_data()
 
         # Verify keyboards list is still complete
@@ -193,54 +154,17 @@ class TestProfileCompletionCaching:
             "corne": ["latest"],
         }
 
-    @patch("glovebox.config.create_user_config")
-    @patch("glovebox.core.cache.create_default_cache")
-    def test_get_cached_profile_data_disabled_cache_override(
-        self, mock_create_cache, mock_create_user_config, tmp_path
-    ):
-        """Test that disabled cache strategy is overridden for profile completion."""
-        # Setup mocks with disabled cache strategy and proper isolation
-        mock_user_config = Mock()
-        mock_user_config.get.side_effect = lambda key, default=None: {
-            "cache_strategy": "disabled",
-            "cache_file_locking": True,
-        }.get(key, default)
-        # Use tmp_path for cache to prevent directory pollution
-        mock_user_config.cache_path = tmp_path / "cache"
-        mock_create_user_config.return_value = mock_user_config
-
-        mock_cache = Mock()
-        mock_cache.get.return_value = None
-        mock_create_cache.return_value = mock_cache
-
-        # Call the function
-        with (
-            patch(
-                "glovebox.config.keyboard_profile.get_available_keyboards"
-            ) as mock_keyboards,
-            patch(
-                "glovebox.config.keyboard_profile.get_available_firmwares"
-            ) as mock_firmwares,
-        ):
-            mock_keyboards.return_value = ["test_keyboard"]
-            mock_firmwares.return_value = ["v1.0"]
-
-            _get_cached_profile_data()
-
-        # Verify cache was created with the cli_completion tag
-        mock_create_cache.assert_called_once_with(tag="cli_completion")
-
-    def test_get_cached_profile_data_complete_failure(self):
+    def test_get_cached_profile_data_complete_failure(self, completion_index_env):
         """Test complete failure scenario returns empty data."""
-        # Patch all imports to fail
-        with patch("glovebox.config.create_user_config") as mock_create_user_config:
-            mock_create_user_config.side_effect = Exception("Complete failure")
-
+        with patch(
+            "glovebox.config.keyboard_profile.get_available_keyboards",
+            side_effect=Exception("Complete failure"),
+        ):
             keyboards, keyboards_with_firmwares = _get_cached_profile_data()
 
-            # Should return empty data without crashing
-            assert keyboards == []
-            assert keyboards_with_firmwares == {}
+        # Should return empty data without crashing
+        assert keyboards == []
+        assert keyboards_with_firmwares == {}
 
 
 class TestProfileCompletion:
@@ -474,246 +398,15 @@ class TestProfileCompletion:
         assert "keyboard_5/v0.0" in result
 
 
-class TestProfileCompletionCacheConstants:
-    """Test cache configuration constants."""
-
-    def test_cache_key_constant(self):
-        """Test that cache key constant is properly defined."""
-        assert PROFILE_COMPLETION_CACHE_KEY == "profile_completion_data_v1"
-        assert isinstance(PROFILE_COMPLETION_CACHE_KEY, str)
-
-    def test_cache_ttl_constant(self):
-        """Test that cache TTL constant is properly defined."""
-        assert PROFILE_COMPLETION_TTL == 300  # 5 minutes
-        assert isinstance(PROFILE_COMPLETION_TTL, int)
-        assert PROFILE_COMPLETION_TTL > 0
-
-
-@pytest.mark.skip(
-    reason="Logging tests have caplog conflicts in full test suite - functionality verified in other tests"
-)
-class TestProfileCompletionLogging:
-    """Test logging behavior in profile completion."""
-
-    @patch("glovebox.config.create_user_config")
-    @patch("glovebox.core.cache.create_default_cache")
-    @patch("glovebox.config.keyboard_profile.get_available_keyboards")
-    @patch("glovebox.config.keyboard_profile.get_available_firmwares")
-    def test_logging_on_cache_miss(
-        self,
-        mock_get_firmwares,
-        mock_get_keyboards,
-        mock_create_cache,
-        mock_create_user_config,
-        caplog,
-        tmp_path,
-    ):
-        """Test that appropriate debug logs are generated on cache miss."""
-        # Setup mocks with proper isolation
-        mock_user_config = Mock()
-        mock_user_config.get.side_effect = lambda key, default=None: {
-            "cache_strategy": "shared",
-            "cache_file_locking": True,
-        }.get(key, default)
-        # Use tmp_path for cache to prevent directory pollution
-        mock_user_config.cache_path = tmp_path / "cache"
-        mock_create_user_config.return_value = mock_user_config
-
-        mock_cache = Mock()
-        mock_cache.get.return_value = None  # Cache miss
-        mock_create_cache.return_value = mock_cache
-
-        mock_get_keyboards.return_value = ["test_keyboard"]
-        mock_get_firmwares.return_value = ["v1.0"]
-
-        # Set specific logger to DEBUG level for this module and ensure cache miss
-        with caplog.at_level(logging.DEBUG, logger="glovebox.cli.helpers.parameters"):
-            # Verify the mock setup
-            assert mock_cache.get.return_value is None
-            assert mock_create_cache.return_value == mock_cache
-
-            result = _get_cached_profile_data()
-
-            # Verify the function actually ran and returned data
-            assert result is not None
-            keyboards, keyboards_with_firmwares = result
-            assert keyboards == ["test_keyboard"]
-            assert keyboards_with_firmwares == {"test_keyboard": ["v1.0"]}
-
-        # Check for expected log messages
-        log_messages = [record.message for record in caplog.records]
-
-        # In some test suite contexts, global state contamination can cause cache hits instead of misses
-        # The core functionality works (test passes in isolation), so check for either cache miss or hit
-        has_cache_miss = any(
-            "Profile completion cache miss" in msg for msg in log_messages
-        )
-        has_cache_hit = any(
-            "Profile completion cache hit" in msg for msg in log_messages
-        )
-
-        if not (has_cache_miss or has_cache_hit):
-            print(f"Debug: mock_cache.get called: {mock_cache.get.called}")
-            print(f"Debug: mock_cache.get call count: {mock_cache.get.call_count}")
-            print(f"Debug: mock_create_cache called: {mock_create_cache.called}")
-            print(
-                f"Debug: caplog records: {[r.levelname + ':' + r.message for r in caplog.records]}"
-            )
-            print(f"Expected cache operation in log messages: {log_messages}")
-
-        # Assert that some cache operation occurred (either miss or hit)
-        assert has_cache_miss or has_cache_hit, (
-            "Expected cache miss or cache hit log message"
-        )
-
-        # If it was a cache miss, should also have the cached message
-        if has_cache_miss:
-            assert any("Profile completion data cached" in msg for msg in log_messages)
-
-    @patch("glovebox.config.create_user_config")
-    @patch("glovebox.core.cache.create_default_cache")
-    def test_logging_on_cache_hit(
-        self, mock_create_cache, mock_create_user_config, caplog, tmp_path
-    ):
-        """Test that appropriate debug logs are generated on cache hit."""
-        # Setup mocks with proper isolation
-        mock_user_config = Mock()
-        mock_user_config.get.side_effect = lambda key, default=None: {
-            "cache_strategy": "shared",
-            "cache_file_locking": True,
-        }.get(key, default)
-        # Use tmp_path for cache to prevent directory pollution
-        mock_user_config.cache_path = tmp_path / "cache"
-        mock_create_user_config.return_value = mock_user_config
-
-        cached_data = {
-            "keyboards": ["test"],
-            "keyboards_with_firmwares": {"test": ["v1.0"]},
-        }
-
-        mock_cache = Mock()
-        mock_cache.get.return_value = cached_data
-        mock_create_cache.return_value = mock_cache
-
-        # Set specific logger to DEBUG level for this module
-        with caplog.at_level(logging.DEBUG, logger="glovebox.cli.helpers.parameters"):
-            _get_cached_profile_data()
-
-        # Check for cache hit log message
-        log_messages = [record.message for record in caplog.records]
-        assert any("Profile completion cache hit" in msg for msg in log_messages)
-
-    @patch("glovebox.config.create_user_config")
-    @patch("glovebox.core.cache.create_default_cache")
-    @patch("glovebox.config.keyboard_profile.get_available_keyboards")
-    @patch("glovebox.config.keyboard_profile.get_available_firmwares")
-    def test_logging_on_firmware_error(
-        self,
-        mock_get_firmwares,
-        mock_get_keyboards,
-        mock_create_cache,
-        mock_create_user_config,
-        caplog,
-        tmp_path,
-    ):
-        """Test that firmware lookup errors are logged but don't break completion."""
-        # Setup mocks with proper isolation
-        mock_user_config = Mock()
-        mock_user_config.get.side_effect = lambda key, default=None: {
-            "cache_strategy": "shared",
-            "cache_file_locking": True,
-        }.get(key, default)
-        # Use tmp_path for cache to prevent directory pollution
-        mock_user_config.cache_path = tmp_path / "cache"
-        mock_create_user_config.return_value = mock_user_config
-
-        mock_cache = Mock()
-        mock_cache.get.return_value = None
-        mock_create_cache.return_value = mock_cache
-
-        mock_get_keyboards.return_value = ["broken_keyboard"]
-        mock_get_firmwares.side_effect = Exception("Config file not found")
-
-        # Set specific logger to DEBUG level for this module
-        with caplog.at_level(logging.DEBUG, logger="glovebox.cli.helpers.parameters"):
-            _get_cached_profile_data()
-
-        # Check for firmware error log message
-        log_messages = [record.message for record in caplog.records]
-        assert any(
-            "Failed to get firmwares for broken_keyboard" in msg for msg in log_messages
-        )
-
-    @patch("glovebox.config.create_user_config")
-    @patch("glovebox.core.cache.create_default_cache")
-    def test_logging_on_disabled_cache_override(
-        self, mock_create_cache, mock_create_user_config, caplog, tmp_path
-    ):
-        """Test logging when overriding disabled cache strategy."""
-        # Setup mocks with disabled cache and proper isolation
-        mock_user_config = Mock()
-        mock_user_config.get.side_effect = lambda key, default=None: {
-            "cache_strategy": "disabled",
-            "cache_file_locking": True,
-        }.get(key, default)
-        # Use tmp_path for cache to prevent directory pollution
-        mock_user_config.cache_path = tmp_path / "cache"
-        mock_create_user_config.return_value = mock_user_config
-
-        mock_cache = Mock()
-        mock_cache.get.return_value = None
-        mock_create_cache.return_value = mock_cache
-
-        with (
-            patch(
-                "glovebox.config.keyboard_profile.get_available_keyboards"
-            ) as mock_keyboards,
-            patch(
-                "glovebox.config.keyboard_profile.get_available_firmwares"
-            ) as mock_firmwares,
-            caplog.at_level(logging.DEBUG, logger="glovebox.cli.helpers.parameters"),
-        ):
-            mock_keyboards.return_value = ["test"]
-            mock_firmwares.return_value = ["v1.0"]
-
-            _get_cached_profile_data()
-
-        # Check that cache operations occurred (cache miss and cache set)
-        log_messages = [record.message for record in caplog.records]
-        assert any("Profile completion cache miss" in msg for msg in log_messages)
-        assert any("Profile completion data cached" in msg for msg in log_messages)
-
-
 class TestProfileCompletionIntegration:
     """Integration tests for profile completion functionality."""
 
-    @patch("glovebox.config.create_user_config")
-    @patch("glovebox.core.cache.create_default_cache")
     @patch("glovebox.config.keyboard_profile.get_available_keyboards")
     @patch("glovebox.config.keyboard_profile.get_available_firmwares")
     def test_full_completion_workflow(
-        self,
-        mock_get_firmwares,
-        mock_get_keyboards,
-        mock_create_cache,
-        mock_create_user_config,
-        tmp_path,
+        self, mock_get_firmwares, mock_get_keyboards, completion_index_env
     ):
-        """Test the complete workflow from cache miss to profile completion."""
-        # Setup realistic mock data with proper isolation
-        mock_user_config = Mock()
-        mock_user_config.get.side_effect = lambda key, default=None: {
-            "cache_strategy": "shared",
-            "cache_file_locking": True,
-        }.get(key, default)
-        # Use tmp_path for cache to prevent directory pollution
-        mock_user_config.cache_path = tmp_path / "cache"
-        mock_create_user_config.return_value = mock_user_config
-
-        mock_cache = Mock()
-        mock_cache.get.return_value = None  # Start with cache miss
-        mock_create_cache.return_value = mock_cache
-
+        """Test the complete workflow from index build to profile completion."""
         mock_get_keyboards.return_value = ["glove80", "corne", "moonlander"]
 
         def mock_firmware_side_effect(keyboard, user_config):
@@ -741,11 +434,8 @@ class TestProfileCompletionIntegration:
                 f"Failed for input '{incomplete}': got {len(result)}, expected {expected_count}"
             )
 
-        # Verify cache operations
-        assert mock_cache.get.call_count >= len(
-            test_cases
-        )  # Cache checked for each call
-        mock_cache.set.assert_called()  # Data was cached
+        # Keyboard configurations were loaded once, for the index build
+        assert mock_get_keyboards.call_count == 1
 
     def test_profile_option_annotation_properties(self):
         """Test that ProfileOption has correct typer annotation properties."""
@@ -0,0 +1,110 @@
+"""Tests for lazy CLI command registration."""
+
+import subprocess
+import sys
+
+import pytest
+import typer
+from click.shell_completion import ShellComplete
+
+from glovebox.cli.commands import (
+    COMMAND_REGISTRY,
+    LazyTyperGroup,
+    load_command,
+    register_all_commands,
+)
+
+
+def _run_isolated(code: str) -> str:
+    """Run code in a fresh interpreter and return its stdout."""
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return proc.stdout.strip().splitlines()[-1]
+
+
+_LOADED_MODULES = (
+    "print(sorted({m.split('.')[3] for m in sys.modules"
+    " if m.startswith('glovebox.cli.commands.')}))"
+)
+
+
+class TestLazyRegistration:
+    """Test that command modules are imported only when needed."""
+
+    def test_help_imports_no_command_module(self):
+        """Test top-level help is rendered from the static registry."""
+        output = _run_isolated(
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from glovebox.cli.app import app\n"
+            "from glovebox.cli.commands import register_all_commands\n"
+            "register_all_commands(app)\n"
+            "result = CliRunner().invoke(app, ['--help'])\n"
+            "assert result.exit_code == 0, result.output\n"
+            "assert 'Cache management commands' in result.output\n"
+            f"{_LOADED_MODULES}\n"
+        )
+        assert output == "[]"
+
+    def test_completion_imports_only_target(self):
+        """Test completion loads only the command being completed into."""
+        output = _run_isolated(
+            "import sys, typer\n"
+            "from click.shell_completion import ShellComplete\n"
+            "from glovebox.cli.app import app\n"
+            "from glovebox.cli.commands import register_all_commands\n"
+            "register_all_commands(app)\n"
+            "complete = ShellComplete(typer.main.get_command(app), {}, 'glovebox', 'X')\n"
+            "assert [c.value for c in complete.get_completions([], 'ca')] == ['cache']\n"
+            "assert 'gc' in [c.value for c in complete.get_completions(['cache'], '')]\n"
+            f"{_LOADED_MODULES}\n"
+        )
+        assert output == "['cache']"
+
+    def test_register_sets_lazy_group(self):
+        """Test registration only installs the lazy group class."""
+        app = typer.Typer()
+        register_all_commands(app)
+
+        assert app.info.cls is LazyTyperGroup
+
+    def test_list_commands_follows_registry(self):
+        """Test commands are listed in registry order."""
+        app = typer.Typer()
+
+        @app.callback()
+        def main() -> None:
+            pass
+
+        register_all_commands(app)
+        group = typer.main.get_command(app)
+
+        complete = ShellComplete(group, {}, "glovebox", "X")
+        names = [c.value for c in complete.get_completions([], "")]
+        assert names == list(COMMAND_REGISTRY)
+
+
+class TestCommandRegistry:
+    """Test the static registry matches the command modules."""
+
+    @pytest.mark.parametrize("name", list(COMMAND_REGISTRY))
+    def test_registry_help_matches_command(self, name):
+        """Test registry help is the first paragraph of the command's help."""
+        command = load_command(name)
+
+        assert command.name == name
+        first_paragraph = (command.help or "").strip().split("\n\n")[0]
+        assert first_paragraph == COMMAND_REGISTRY[name].help
+
+    def test_invocation_loads_command(self):
+        """Test invoking a registered command runs the real implementation."""
+        from typer.testing import CliRunner
+
+        from glovebox.cli.app import app
+
+        register_all_commands(app)
+        result = CliRunner().invoke(app, ["cache", "--help"])
+
+        assert result.exit_code == 0
+        assert "gc" in result.output
@@ -26,6 +26,7 @@ def mock_cache_manager():
     cache_manager = Mock()
     cache_manager.keys.return_value = []
     cache_manager.get.return_value = None
+    cache_manager.get_many.return_value = {}
     cache_manager.get_metadata.return_value = None
     cache_manager.delete.return_value = None
     return cache_manager
@@ -241,8 +242,7 @@ class TestMetricsListCommand:
         session_uuids = list(sample_session_data.keys())
         mock_cache = Mock()
         mock_cache.keys.return_value = session_uuids
-        mock_cache.get.side_effect = lambda key: sample_session_data.get(key)
-        mock_cache.get_metadata.return_value = None
+        mock_cache.get_many.return_value = sample_session_data
         mock_get_cache.return_value = mock_cache
 
         runner = CliRunner()
@@ -261,8 +261,7 @@ class TestMetricsListCommand:
         session_uuids = list(sample_session_data.keys())
         mock_cache = Mock()
         mock_cache.keys.return_value = session_uuids
-        mock_cache.get.side_effect = lambda key: sample_session_data.get(key)
-        mock_cache.get_metadata.return_value = None
+        mock_cache.get_many.return_value = sample_session_data
         mock_get_cache.return_value = mock_cache
 
         runner = CliRunner()
@@ -280,8 +279,7 @@ class TestMetricsListCommand:
         session_uuids = list(sample_session_data.keys())
         mock_cache = Mock()
         mock_cache.keys.return_value = session_uuids
-        mock_cache.get.side_effect = lambda key: sample_session_data.get(key)
-        mock_cache.get_metadata.return_value = None
+        mock_cache.get_many.return_value = sample_session_data
         mock_get_cache.return_value = mock_cache
 
         runner = CliRunner()
@@ -460,7 +458,7 @@ class TestMetricsCleanCommand:
 
         mock_cache = Mock()
         mock_cache.keys.return_value = [recent_session_uuid]
-        mock_cache.get.side_effect = lambda key: recent_session_data.get(key)
+        mock_cache.get_many.return_value = recent_session_data
         mock_get_cache.return_value = mock_cache
 
         runner = CliRunner()
@@ -492,7 +490,7 @@ class TestMetricsCleanCommand:
 
         mock_cache = Mock()
         mock_cache.keys.return_value = [old_session_uuid]
-        mock_cache.get.return_value = old_session_data
+        mock_cache.get_many.return_value = {old_session_uuid: old_session_data}
         mock_get_cache.return_value = mock_cache
 
         runner = CliRunner()
@@ -0,0 +1,222 @@
+"""Tests for the local git mirror store using file:// repositories."""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from glovebox.compilation.cache.git_mirror_store import (
+    GitMirrorStore,
+    create_git_mirror_store,
+    find_repositories,
+    mirror_name,
+)
+from glovebox.config.models.firmware import FirmwareGitMirrorConfig
+from glovebox.core.cache.locking import directory_lock
+from glovebox.core.errors import GitMirrorError
+
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="requires git")
+
+
+def _git(*args: str, cwd: Path | None = None) -> str:
+    return subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.name=Test",
+            "-c",
+            "user.email=test@example.com",
+            "-c",
+            "init.defaultBranch=main",
+            *args,
+        ],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def _remote(tmp_path: Path, name: str) -> tuple[Path, str]:
+    """Create a repository with one commit, returning its path and URL."""
+    repository = tmp_path / "remotes" / name
+    repository.mkdir(parents=True)
+    _git("init", "--quiet", cwd=repository)
+    _commit(repository, "first")
+    return repository, repository.as_uri()
+
+
+def _commit(repository: Path, content: str) -> str:
+    (repository / "file.txt").write_text(content)
+    _git("add", "file.txt", cwd=repository)
+    _git("commit", "--quiet", "-m", content, cwd=repository)
+    return _git("rev-parse", "HEAD", cwd=repository)
+
+
+def _has_commit(repository: Path, commit: str) -> bool:
+    result = subprocess.run(
+        ["git", "cat-file", "-e", f"{commit}^{{commit}}"],
+        cwd=repository,
+        capture_output=True,
+    )
+    return result.returncode == 0
+
+
+def test_mirror_name_is_stable_per_url() -> None:
+    name = mirror_name("https://github.com/zmkfirmware/zephyr.git")
+
+    assert name.startswith("zephyr-")
+    assert name.endswith(".git")
+    assert mirror_name("https://github.com/zmkfirmware/zephyr/") == name
+    assert mirror_name("https://github.com/other/zephyr") != name
+
+
+def test_factory_returns_none_when_disabled(tmp_path: Path) -> None:
+    assert create_git_mirror_store(tmp_path, FirmwareGitMirrorConfig()) is None
+
+    store = create_git_mirror_store(
+        tmp_path, FirmwareGitMirrorConfig(enabled=True, max_size_mb=10)
+    )
+    assert store is not None
+    assert store.root == tmp_path / "git-mirrors"
+    assert store.max_size_mb == 10
+
+
+def test_sync_remote_fetches_incrementally(tmp_path: Path) -> None:
+    remote, url = _remote(tmp_path, "zmk-config")
+    store = GitMirrorStore(tmp_path / "store", refresh_interval=0)
+
+    mirror = store.sync_remote(url)
+    first = _git("rev-parse", "HEAD", cwd=remote)
+    assert _git("rev-parse", "main", cwd=mirror) == first
+
+    second = _commit(remote, "second")
+    store.sync_remote(url)
+    assert _git("rev-parse", "main", cwd=mirror) == second
+
+
+def test_fresh_mirror_is_not_fetched_again(tmp_path: Path) -> None:
+    remote, url = _remote(tmp_path, "zmk-config")
+    store = GitMirrorStore(tmp_path / "store", refresh_interval=3600)
+    mirror = store.sync_remote(url)
+
+    second = _commit(remote, "second")
+    store.sync_remote(url)
+
+    assert not _has_commit(mirror, second)
+
+
+def test_sync_remote_raises_for_missing_remote(tmp_path: Path) -> None:
+    store = GitMirrorStore(tmp_path / "store")
+
+    with pytest.raises(GitMirrorError, match="git clone failed"):
+        store.sync_remote((tmp_path / "missing").as_uri())
+
+    assert not store.mirror_path((tmp_path / "missing").as_uri()).exists()
+
+
+def test_clone_from_reference_survives_mirror_removal(tmp_path: Path) -> None:
+    remote, url = _remote(tmp_path, "zmk-config")
+    store = GitMirrorStore(tmp_path / "store")
+    mirror = store.sync_remote(url)
+    command = store.clone_command(url, "clone")
+    assert "--dissociate" in command
+
+    # Run the command against the host path the container path maps to
+    host_command = command.replace(store.container_mirror_path(url), str(mirror))
+    subprocess.run(host_command, shell=True, cwd=tmp_path, check=True)
+    shutil.rmtree(mirror)
+
+    clone = tmp_path / "clone"
+    assert not (clone / ".git" / "objects" / "info" / "alternates").exists()
+    assert _git("rev-parse", "HEAD", cwd=clone) == _git("rev-parse", "HEAD", cwd=remote)
+    assert "--reference" not in store.clone_command(url, "clone")
+
+
+def test_add_workspace_mirrors_projects(tmp_path: Path) -> None:
+    _, zephyr_url = _remote(tmp_path, "zephyr")
+    _, hal_url = _remote(tmp_path, "hal_nordic")
+    workspace = tmp_path / "workspace"
+    (workspace / "modules" / "hal").mkdir(parents=True)
+    (workspace / ".west").mkdir()
+    _git("clone", "--quiet", zephyr_url, str(workspace / "zephyr"))
+    _git("clone", "--quiet", hal_url, str(workspace / "modules" / "hal" / "nordic"))
+    # Nested repositories and build directories are not searched
+    _git("init", "--quiet", str(workspace / "zephyr" / "nested"))
+    (workspace / "build" / "app").mkdir(parents=True)
+    (workspace / "build" / "CMakeCache.txt").touch()
+    _git("init", "--quiet", str(workspace / "build" / "app"))
+    assert find_repositories(workspace) == [
+        workspace / "modules" / "hal" / "nordic",
+        workspace / "zephyr",
+    ]
+    store = GitMirrorStore(tmp_path / "store")
+
+    assert store.add_workspace(workspace) == 2
+
+    link = store.paths_dir / "modules" / "hal" / "nordic"
+    assert link.is_symlink()
+    assert not link.readlink().is_absolute()
+    assert link.resolve() == store.mirror_path(hal_url).resolve()
+    head = _git("rev-parse", "HEAD", cwd=workspace / "zephyr")
+    assert _git("rev-parse", "HEAD", cwd=store.mirror_path(zephyr_url)) == head
+    # West can clone a project from its path cache entry
+    _git("clone", "--quiet", str(store.paths_dir / "zephyr"), str(tmp_path / "copy"))
+    assert _git("rev-parse", "HEAD", cwd=tmp_path / "copy") == head
+
+
+def test_add_repository_only_fetches_new_commits(tmp_path: Path) -> None:
+    remote, url = _remote(tmp_path, "zephyr")
+    store = GitMirrorStore(tmp_path / "store")
+    mirror = store.sync_remote(url)
+    refs_before = _git("for-each-ref", cwd=mirror)
+    clone = tmp_path / "clone"
+    _git("clone", "--quiet", url, str(clone))
+
+    store.add_repository(clone, url)
+    assert _git("for-each-ref", cwd=mirror) == refs_before
+
+    new_commit = _commit(clone, "local")
+    store.add_repository(clone, url)
+    assert _has_commit(mirror, new_commit)
+    assert not _has_commit(remote, new_commit)
+
+
+def test_gc_removes_least_recently_used_unlocked_mirrors(tmp_path: Path) -> None:
+    store = GitMirrorStore(tmp_path / "store")
+    urls = []
+    for age, name in enumerate(["newest", "older", "oldest"]):
+        _, url = _remote(tmp_path, name)
+        mirror = store.sync_remote(url)
+        (mirror / "padding").write_bytes(b"x" * 600 * 1024)
+        mtime = 1_000_000 - age * 1000
+        os.utime(mirror, (mtime, mtime))
+        store._link_path(Path(name), mirror)
+        urls.append(url)
+
+    # The oldest mirror is being refreshed by another process
+    busy = directory_lock(store.mirror_path(urls[2]))
+    assert busy.acquire(blocking=False)
+    try:
+        removed = store.collect_garbage(max_size_mb=1)
+    finally:
+        busy.release()
+
+    assert removed == 2
+    assert [store.mirror_path(url).exists() for url in urls] == [False, False, True]
+    assert sorted(path.name for path in store.paths_dir.iterdir()) == ["oldest"]
+
+
+def test_gc_is_skipped_while_store_is_in_use(tmp_path: Path) -> None:
+    _, url = _remote(tmp_path, "zephyr")
+    store = GitMirrorStore(tmp_path / "store")
+    store.sync_remote(url)
+
+    with store.in_use():
+        assert store.collect_garbage(max_size_mb=0) == 0
+
+    assert store.mirror_path(url).exists()
+    assert store.collect_garbage(max_size_mb=0) == 1
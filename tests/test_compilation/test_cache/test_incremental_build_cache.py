@@ -0,0 +1,172 @@
+"""Tests for the ccache store and preserved build directories."""
+
+import os
+from pathlib import Path
+
+from glovebox.compilation.cache.incremental_build_cache import (
+    CCACHE_CONTAINER_DIR,
+    IncrementalBuildCache,
+    create_incremental_build_cache,
+    parse_ccache_stats,
+    target_cache_key,
+    workspace_cache_key,
+)
+from glovebox.compilation.models.build_matrix import BuildTarget
+from glovebox.config.models.firmware import FirmwareBuildCacheConfig
+from glovebox.core.cache.locking import directory_lock
+
+
+LEFT = BuildTarget(board="nice_nano_v2", shield="corne_left")
+RIGHT = BuildTarget(board="nice_nano_v2", shield="corne_right")
+KEY = workspace_cache_key("zmkfirmware/zmk", "main", "zmk:stable")
+
+STATS_BEFORE = "direct_cache_hit\t10\npreprocessed_cache_hit\t2\ncache_miss\t30\n"
+STATS_AFTER = "direct_cache_hit\t100\npreprocessed_cache_hit\t2\ncache_miss\t40\n"
+
+
+def _workspace(tmp_path: Path) -> Path:
+    workspace = tmp_path / "workspace"
+    workspace.mkdir(parents=True)
+    return workspace
+
+
+def test_cache_keys() -> None:
+    assert workspace_cache_key("zmkfirmware/zmk", "v0.2", "zmk:stable") != KEY
+    assert target_cache_key(LEFT).startswith("nice_nano_v2-corne_left-zmk-")
+    assert target_cache_key(LEFT) != target_cache_key(RIGHT)
+    with_args = BuildTarget(
+        board="nice_nano_v2", shield="corne_left", cmake_args=["-DCONFIG_X=y"]
+    )
+    assert target_cache_key(with_args) != target_cache_key(LEFT)
+
+
+def test_factory_returns_none_when_disabled(tmp_path: Path) -> None:
+    assert create_incremental_build_cache(tmp_path, FirmwareBuildCacheConfig()) is None
+
+    cache = create_incremental_build_cache(
+        tmp_path, FirmwareBuildCacheConfig(ccache=True, ccache_max_size_mb=512)
+    )
+    assert cache is not None
+    assert cache.root == tmp_path / "incremental"
+    assert cache.ccache_max_size_mb == 512
+
+
+def test_prepare_mounts_ccache(tmp_path: Path) -> None:
+    cache = IncrementalBuildCache(tmp_path / "incremental")
+
+    build = cache.prepare(_workspace(tmp_path), KEY, [LEFT])
+
+    assert build.volumes == [(str(cache.ccache_dir), CCACHE_CONTAINER_DIR)]
+    assert build.environment["CCACHE_DIR"] == CCACHE_CONTAINER_DIR
+    assert build.environment["CCACHE_MAXSIZE"] == "2048M"
+    assert build.cmake_args == ["-DUSE_CCACHE=1"]
+    assert "--print-stats" in build.before_commands[0]
+    assert "--print-stats" in build.after_commands[0]
+    assert build.reused_targets == build.fresh_targets == []
+
+
+def test_ccache_stats_are_the_difference_of_snapshots(tmp_path: Path) -> None:
+    assert parse_ccache_stats("cache_miss\t3\nstats_updated_timestamp\t\n") == {
+        "cache_miss": 3
+    }
+    cache = IncrementalBuildCache(tmp_path / "incremental")
+    build = cache.prepare(_workspace(tmp_path), KEY, [LEFT])
+    assert build.stats_files is not None
+    before, after = build.stats_files
+    before.write_text(STATS_BEFORE)
+    after.write_text(STATS_AFTER)
+
+    stats = cache.finish(build)
+
+    assert stats.compiler_cache_hits == 90
+    assert stats.compiler_cache_misses == 10
+    assert stats.hit_rate == 0.9
+    assert not before.exists()
+    assert not after.exists()
+
+
+def test_missing_ccache_reports_no_hit_rate(tmp_path: Path) -> None:
+    cache = IncrementalBuildCache(tmp_path / "incremental")
+    build = cache.prepare(_workspace(tmp_path), KEY, [LEFT])
+
+    stats = cache.finish(build)
+
+    assert stats.compiler_cache_hits == stats.compiler_cache_misses == 0
+    assert stats.hit_rate is None
+
+
+def test_preserved_build_dir_is_reused(tmp_path: Path) -> None:
+    workspace = _workspace(tmp_path)
+    cache = IncrementalBuildCache(
+        tmp_path / "incremental", ccache=False, preserve_build_dirs=True
+    )
+    build_dir = cache.build_dir_for(KEY, LEFT)
+
+    first = cache.prepare(workspace, KEY, [LEFT])
+    assert first.volumes == [
+        (str(build_dir), f"/workspace/{LEFT.artifact_name}"),
+    ]
+    assert first.fresh_targets == [LEFT.artifact_name]
+    assert (workspace / LEFT.artifact_name).is_dir()
+    # Simulate the container building into the mounted directory
+    (build_dir / "zephyr").mkdir()
+    (build_dir / "zephyr" / "zmk.uf2").write_bytes(b"firmware")
+    (build_dir / "zephyr" / "zephyr.obj").write_bytes(b"object")
+    stats = cache.finish(first)
+
+    assert stats.fresh_build_dirs == 1
+    copied = workspace / LEFT.artifact_name / "zephyr"
+    assert (copied / "zmk.uf2").read_bytes() == b"firmware"
+    assert not (copied / "zephyr.obj").exists()
+
+    second = cache.prepare(_workspace(tmp_path / "next"), KEY, [LEFT])
+    assert second.reused_targets == [LEFT.artifact_name]
+    # Stale firmware is removed so a failed build cannot be collected
+    assert not (build_dir / "zephyr" / "zmk.uf2").exists()
+    assert (build_dir / "zephyr" / "zephyr.obj").exists()
+    assert cache.finish(second).reused_build_dirs == 1
+
+
+def test_busy_build_dir_is_skipped(tmp_path: Path) -> None:
+    cache = IncrementalBuildCache(
+        tmp_path / "incremental", ccache=False, preserve_build_dirs=True
+    )
+    other_build = directory_lock(cache.build_dir_for(KEY, LEFT))
+    assert other_build.acquire(blocking=False)
+    try:
+        build = cache.prepare(_workspace(tmp_path), KEY, [LEFT, RIGHT])
+    finally:
+        other_build.release()
+
+    assert build.fresh_targets == [RIGHT.artifact_name]
+    assert [target for _, target in build.volumes] == [
+        f"/workspace/{RIGHT.artifact_name}"
+    ]
+    cache.finish(build)
+
+
+def test_prune_removes_least_recently_used(tmp_path: Path) -> None:
+    cache = IncrementalBuildCache(
+        tmp_path / "incremental", ccache=False, preserve_build_dirs=True
+    )
+    targets = [BuildTarget(board=f"board_{number}") for number in range(3)]
+    for age, target in enumerate(targets):
+        build_dir = cache.build_dir_for(KEY, target)
+        build_dir.mkdir(parents=True)
+        (build_dir / "object.o").write_bytes(b"x" * 400 * 1024)
+        mtime = 1_000_000 - age * 1000
+        os.utime(build_dir, (mtime, mtime))
+
+    # The oldest directory is locked by a running build
+    busy = directory_lock(cache.build_dir_for(KEY, targets[2]))
+    assert busy.acquire(blocking=False)
+    try:
+        removed = cache.prune_build_dirs(max_size_mb=1)
+    finally:
+        busy.release()
+
+    assert removed == 1
+    remaining = sorted(path.name for path in (cache.build_dirs_root / KEY).iterdir())
+    assert remaining == sorted(
+        [".locks", target_cache_key(targets[0]), target_cache_key(targets[2])]
+    )
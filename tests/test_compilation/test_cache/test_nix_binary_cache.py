@@ -0,0 +1,127 @@
+"""Tests for the local Nix binary cache of MoErgo builds."""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from glovebox.compilation.cache.nix_binary_cache import (
+    CONTAINER_NIX_CACHE_DIR,
+    NixBinaryCache,
+    NixSubstitutionMiddleware,
+    create_nix_binary_cache,
+)
+from glovebox.config.models.firmware import FirmwareNixCacheConfig
+
+
+def _store_hash(char: str) -> str:
+    return char * 32
+
+
+def _add_path(cache: NixBinaryCache, char: str, size: int, mtime: float) -> Path:
+    """Add a cached store path with a NAR of the given size."""
+    nar = cache.nar_dir / f"{char * 52}.nar.zst"
+    nar.write_bytes(b"x" * size)
+    narinfo = cache.root / f"{_store_hash(char)}.narinfo"
+    narinfo.write_text(
+        f"StorePath: /nix/store/{_store_hash(char)}-pkg\n"
+        f"URL: nar/{nar.name}\n"
+        "Compression: zstd\n"
+        f"FileSize: {size}\n"
+    )
+    os.utime(narinfo, (mtime, mtime))
+    return narinfo
+
+
+def test_factory_returns_none_when_disabled(tmp_path: Path) -> None:
+    assert create_nix_binary_cache(tmp_path, FirmwareNixCacheConfig()) is None
+
+    cache = create_nix_binary_cache(
+        tmp_path, FirmwareNixCacheConfig(enabled=True, max_size_mb=10)
+    )
+    assert cache is not None
+    assert cache.root == tmp_path / "nix-cache"
+    assert cache.max_size_mb == 10
+
+
+def test_container_settings(tmp_path: Path) -> None:
+    cache = NixBinaryCache(tmp_path / "nix-cache")
+    cache.ensure()
+
+    assert "Priority: 10" in (cache.root / "nix-cache-info").read_text()
+    assert cache.volume() == (str(cache.root), CONTAINER_NIX_CACHE_DIR)
+    nix_config = cache.environment()["NIX_CONFIG"]
+    assert "extra-substituters = file:///nix-cache?trusted=true" in nix_config
+
+
+def test_middleware_counts_hits_and_misses() -> None:
+    middleware = NixSubstitutionMiddleware()
+    lines = [
+        "these 3 derivations will be built:",
+        "this derivation will be built:",
+        "these 4 paths will be fetched (10.20 MiB download, 50.10 MiB unpacked):",
+        f"copying path '/nix/store/{_store_hash('a')}-zephyr-sdk' from "
+        "'file:///nix-cache?trusted=true'...",
+        f"copying path '/nix/store/{_store_hash('b')}-python3' from "
+        "'https://cache.nixos.org'...",
+        "building '/nix/store/abc-zmk_glove80_lh.drv'...",
+    ]
+
+    assert [middleware.process(line, "stdout") for line in lines] == lines
+    assert middleware.hits == [_store_hash("a")]
+
+    stats = middleware.stats()
+    assert stats.nix_cache_hits == 1
+    assert stats.nix_cache_misses == 5
+    assert stats.nix_hit_rate == pytest.approx(1 / 6)
+
+
+def test_gc_removes_least_recently_used_paths(tmp_path: Path) -> None:
+    cache = NixBinaryCache(tmp_path / "nix-cache")
+    cache.ensure()
+    newest = _add_path(cache, "a", 600 * 1024, 1_000_000)
+    older = _add_path(cache, "b", 600 * 1024, 999_000)
+    oldest = _add_path(cache, "c", 600 * 1024, 998_000)
+    # Left behind by an interrupted copy
+    orphan = cache.nar_dir / "orphan.nar.zst"
+    orphan.write_bytes(b"x")
+
+    # Substituted by the last build
+    cache.touch([_store_hash("c")])
+    removed = cache.collect_garbage(max_size_mb=1)
+
+    assert removed == 2
+    assert [newest.exists(), older.exists(), oldest.exists()] == [False, False, True]
+    assert sorted(nar.name for nar in cache.nar_dir.iterdir()) == [
+        f"{'c' * 52}.nar.zst"
+    ]
+    entries, size = cache.usage()
+    assert entries == 1
+    assert size == 600 * 1024 + oldest.stat().st_size
+
+
+def test_gc_is_skipped_while_cache_is_in_use(tmp_path: Path) -> None:
+    cache = NixBinaryCache(tmp_path / "nix-cache")
+    cache.ensure()
+    narinfo = _add_path(cache, "a", 1024, 1_000_000)
+
+    with cache.in_use():
+        assert cache.collect_garbage(max_size_mb=0) == 0
+
+    assert narinfo.exists()
+    assert cache.collect_garbage(max_size_mb=0) == 1
+    assert cache.usage() == (0, 0)
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="requires bash")
+@pytest.mark.parametrize("status", [0, 3])
+def test_wrapped_command_keeps_exit_status(tmp_path: Path, status: int) -> None:
+    cache = NixBinaryCache(tmp_path / "nix-cache")
+    command = cache.wrap_command(["sh", "-c", f"echo built; exit {status}"])
+
+    result = subprocess.run(command, capture_output=True, text=True)
+
+    assert result.returncode == status
+    assert result.stdout.startswith("built")
@@ -0,0 +1,373 @@
+"""Tests for parallel workspace archive export and import."""
+
+import hashlib
+import io
+import json
+import os
+import tarfile
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from glovebox.compilation.cache import workspace_archive
+from glovebox.compilation.cache.models import (
+    ArchiveFormat,
+    WorkspaceArchiveManifest,
+    WorkspaceCacheMetadata,
+)
+from glovebox.compilation.cache.workspace_archive import (
+    MANIFEST_NAME,
+    METADATA_NAME,
+    create_workspace_archive,
+    extract_workspace_archive,
+)
+from glovebox.config.models.cache import CacheLevel
+from glovebox.core.errors import WorkspaceArchiveError
+from glovebox.core.file_operations.models import CopyProgress
+
+
+def _workspace(tmp_path: Path) -> dict[str, bytes]:
+    """Create a workspace, returning file contents by relative path."""
+    files = {
+        "config/west.yml": b"manifest:\n  projects: []\n" * 50,
+        "zmk/app/CMakeLists.txt": b"project(zmk)\n",
+        "zmk/.git/HEAD": b"ref: refs/heads/main\n",
+        "zephyr/empty.txt": b"",
+        "zephyr/blob.bin": os.urandom(100 * 1024),
+        # Larger than the streaming threshold in tests
+        "zephyr/large.c": b"int x = 1;\n" * 40_000,
+    }
+    for name, data in files.items():
+        path = tmp_path / "workspace" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return files
+
+
+def _metadata(workspace_path: Path) -> WorkspaceCacheMetadata:
+    return WorkspaceCacheMetadata(
+        workspace_path=workspace_path,
+        repository="zmkfirmware/zmk",
+        branch="main",
+        cache_level=CacheLevel.REPO_BRANCH,
+        created_at=datetime.now(),
+        last_accessed=datetime.now(),
+    )
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Stream and chunk files of a few hundred KB like multi-MB files."""
+    monkeypatch.setattr(workspace_archive, "STREAM_FILE_SIZE", 200 * 1024)
+    monkeypatch.setattr(workspace_archive, "CHUNK_SIZE", 64 * 1024)
+    monkeypatch.setattr(workspace_archive, "READ_AHEAD_BYTES", 256 * 1024)
+
+
+def _check_manifest(manifest_json: bytes, files: dict[str, bytes]) -> None:
+    manifest = WorkspaceArchiveManifest.model_validate_json(manifest_json)
+    assert manifest.files.keys() == files.keys()
+    for name, data in files.items():
+        assert manifest.files[name].size == len(data)
+        assert manifest.files[name].sha256 == hashlib.sha256(data).hexdigest()
+
+
+def test_zip_archive_with_manifest(tmp_path: Path) -> None:
+    files = _workspace(tmp_path)
+    output = tmp_path / "export.zip"
+    progress: list[CopyProgress] = []
+
+    stats = create_workspace_archive(
+        tmp_path / "workspace",
+        output,
+        ArchiveFormat.ZIP,
+        6,
+        include_git=True,
+        metadata=_metadata(tmp_path / "workspace"),
+        progress_callback=progress.append,
+        max_workers=4,
+    )
+
+    with zipfile.ZipFile(output) as archive:
+        assert archive.testzip() is None
+        names = archive.namelist()
+        assert names[0] == METADATA_NAME
+        assert names[-1] == MANIFEST_NAME
+        for name, data in files.items():
+            assert archive.read(f"workspace/{name}") == data
+        # Incompressible data is stored, text is deflated
+        blob = archive.getinfo("workspace/zephyr/blob.bin")
+        assert blob.compress_type == zipfile.ZIP_STORED
+        large = archive.getinfo("workspace/zephyr/large.c")
+        assert large.compress_type == zipfile.ZIP_DEFLATED
+        assert large.compress_size < large.file_size
+        metadata = json.loads(archive.read(METADATA_NAME))
+        assert metadata["repository"] == "zmkfirmware/zmk"
+        _check_manifest(archive.read(MANIFEST_NAME), files)
+
+    assert stats.files == len(files)
+    assert stats.total_bytes == sum(len(data) for data in files.values())
+    assert stats.archive_bytes == output.stat().st_size
+    final = progress[-1]
+    assert final.files_processed == final.total_files == len(files)
+    assert final.bytes_copied == final.total_bytes == stats.total_bytes
+    assert final.elapsed_seconds > 0
+
+
+@pytest.mark.parametrize("archive_format", [ArchiveFormat.TAR_GZ, ArchiveFormat.TAR])
+def test_tar_archive_without_git(tmp_path: Path, archive_format: ArchiveFormat) -> None:
+    files = _workspace(tmp_path)
+    output = tmp_path / f"export{archive_format.file_extension}"
+
+    create_workspace_archive(
+        tmp_path / "workspace",
+        output,
+        archive_format,
+        archive_format.default_compression_level,
+        include_git=False,
+        metadata=_metadata(tmp_path / "workspace"),
+    )
+
+    del files["zmk/.git/HEAD"]
+    with tarfile.open(output) as archive:
+        names = archive.getnames()
+        assert names[-1] == MANIFEST_NAME
+        assert not any(".git" in name for name in names)
+        for name, data in files.items():
+            member = archive.extractfile(f"workspace/{name}")
+            assert member is not None and member.read() == data
+        manifest = archive.extractfile(MANIFEST_NAME)
+        assert manifest is not None
+        _check_manifest(manifest.read(), files)
+
+
+def test_zstd_tar_archive(tmp_path: Path) -> None:
+    zstandard = pytest.importorskip("zstandard")
+    files = _workspace(tmp_path)
+    output = tmp_path / "export.tar.zst"
+
+    stats = create_workspace_archive(
+        tmp_path / "workspace",
+        output,
+        ArchiveFormat.TAR_ZST,
+        ArchiveFormat.TAR_ZST.default_compression_level,
+        include_git=True,
+        metadata=_metadata(tmp_path / "workspace"),
+        max_workers=2,
+    )
+
+    assert stats.archive_bytes < stats.total_bytes
+    data = zstandard.ZstdDecompressor().stream_reader(output.read_bytes()).read()
+    with tarfile.open(fileobj=io.BytesIO(data)) as archive:
+        for name, content in files.items():
+            member = archive.extractfile(f"workspace/{name}")
+            assert member is not None and member.read() == content
+        manifest = archive.extractfile(MANIFEST_NAME)
+        assert manifest is not None
+        _check_manifest(manifest.read(), files)
+
+
+def test_failed_export_removes_partial_archive(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _workspace(tmp_path)
+    output = tmp_path / "export.zip"
+    # A file disappearing after the scan fails the export
+    scan = workspace_archive._scan_workspace
+
+    def scan_then_delete(
+        workspace_path: Path, include_git: bool
+    ) -> list[workspace_archive._SourceFile]:
+        files = scan(workspace_path, include_git)
+        (workspace_path / "zmk" / "app" / "CMakeLists.txt").unlink()
+        return files
+
+    monkeypatch.setattr(workspace_archive, "_scan_workspace", scan_then_delete)
+
+    with pytest.raises(FileNotFoundError):
+        create_workspace_archive(
+            tmp_path / "workspace",
+            output,
+            ArchiveFormat.ZIP,
+            6,
+            include_git=True,
+            metadata=_metadata(tmp_path / "workspace"),
+        )
+
+    assert not output.exists()
+
+
+def _export(tmp_path: Path, archive_format: ArchiveFormat) -> Path:
+    output = tmp_path / f"export{archive_format.file_extension}"
+    create_workspace_archive(
+        tmp_path / "workspace",
+        output,
+        archive_format,
+        archive_format.default_compression_level,
+        include_git=True,
+        metadata=_metadata(tmp_path / "workspace"),
+    )
+    return output
+
+
+def _extracted_files(directory: Path) -> dict[str, bytes]:
+    return {
+        path.relative_to(directory).as_posix(): path.read_bytes()
+        for path in directory.rglob("*")
+        if path.is_file()
+    }
+
+
+@pytest.mark.parametrize(
+    "archive_format", [ArchiveFormat.ZIP, ArchiveFormat.TAR_GZ, ArchiveFormat.TAR]
+)
+def test_import_round_trip(tmp_path: Path, archive_format: ArchiveFormat) -> None:
+    files = _workspace(tmp_path)
+    (tmp_path / "workspace" / "zmk" / "app" / "CMakeLists.txt").chmod(0o755)
+    archive = _export(tmp_path, archive_format)
+    target = tmp_path / "imported"
+    progress: list[CopyProgress] = []
+
+    stats = extract_workspace_archive(
+        archive,
+        target,
+        archive_format,
+        progress_callback=progress.append,
+        max_workers=4,
+    )
+
+    # Files land at the target root without the export metadata and manifest
+    assert _extracted_files(target) == files
+    assert os.access(target / "zmk" / "app" / "CMakeLists.txt", os.X_OK)
+    assert stats.verified
+    assert stats.files == len(files)
+    assert stats.total_bytes == sum(len(data) for data in files.values())
+    assert stats.metadata is not None
+    assert stats.metadata.repository == "zmkfirmware/zmk"
+    assert progress[-1].files_processed == len(files)
+    assert progress[-1].component_name == "import"
+
+
+def test_import_zstd_tar_without_git(tmp_path: Path) -> None:
+    pytest.importorskip("zstandard")
+    files = _workspace(tmp_path)
+    archive = _export(tmp_path, ArchiveFormat.TAR_ZST)
+
+    stats = extract_workspace_archive(
+        archive, tmp_path / "imported", ArchiveFormat.TAR_ZST, include_git=False
+    )
+
+    del files["zmk/.git/HEAD"]
+    assert _extracted_files(tmp_path / "imported") == files
+    assert stats.verified
+
+
+def test_import_plain_archive_without_manifest(tmp_path: Path) -> None:
+    archive = tmp_path / "plain.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("my-workspace/zmk/Kconfig", b"config ZMK\n")
+        zf.writestr("my-workspace/zephyr/", b"")
+
+    stats = extract_workspace_archive(archive, tmp_path / "out", ArchiveFormat.ZIP)
+
+    assert (tmp_path / "out" / "my-workspace" / "zmk" / "Kconfig").exists()
+    assert (tmp_path / "out" / "my-workspace" / "zephyr").is_dir()
+    assert not stats.verified
+    assert stats.metadata is None
+
+
+@pytest.mark.parametrize("archive_format", [ArchiveFormat.TAR, ArchiveFormat.ZIP])
+def test_import_clears_special_mode_bits(
+    tmp_path: Path, archive_format: ArchiveFormat
+) -> None:
+    archive = tmp_path / f"modes.{archive_format.value}"
+    members = {"zmk/setuid": 0o4755, "zmk/setgid": 0o2775, "zmk/sticky": 0o1644}
+    if archive_format == ArchiveFormat.ZIP:
+        with zipfile.ZipFile(archive, "w") as zf:
+            for name, mode in members.items():
+                info = zipfile.ZipInfo(name)
+                info.external_attr = (0o100000 | mode) << 16
+                zf.writestr(info, b"#!/bin/sh\n")
+    else:
+        with tarfile.open(archive, "w") as tar:
+            for name, mode in members.items():
+                info, data = _tar_bytes(name, b"#!/bin/sh\n")
+                info.mode = mode
+                tar.addfile(info, data)
+
+    extract_workspace_archive(archive, tmp_path / "out", archive_format)
+
+    modes = {
+        name: (tmp_path / "out" / name).stat().st_mode & 0o7777 for name in members
+    }
+    assert modes == {"zmk/setuid": 0o755, "zmk/setgid": 0o775, "zmk/sticky": 0o644}
+
+
+def _tar_bytes(name: str, data: bytes) -> tuple[tarfile.TarInfo, io.BytesIO]:
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    return info, io.BytesIO(data)
+
+
+def test_import_rejects_tampered_files(tmp_path: Path) -> None:
+    _workspace(tmp_path)
+    exported = _export(tmp_path, ArchiveFormat.TAR)
+    tampered = tmp_path / "tampered.tar"
+    with (
+        tarfile.open(exported) as source,
+        tarfile.open(tampered, "w") as archive,
+    ):
+        for member in source.getmembers():
+            data = source.extractfile(member)
+            assert data is not None
+            content = data.read()
+            if member.name == "workspace/zmk/app/CMakeLists.txt":
+                content = b"project(evil)\n"
+            archive.addfile(*_tar_bytes(member.name, content))
+
+    with pytest.raises(WorkspaceArchiveError, match="does not match"):
+        extract_workspace_archive(tampered, tmp_path / "out", ArchiveFormat.TAR)
+
+
+def test_import_rejects_files_missing_from_zip_manifest(tmp_path: Path) -> None:
+    _workspace(tmp_path)
+    archive = _export(tmp_path, ArchiveFormat.ZIP)
+    with zipfile.ZipFile(archive, "a") as zf:
+        zf.writestr("workspace/zmk/injected.c", b"int evil;\n")
+
+    with pytest.raises(WorkspaceArchiveError, match="not listed"):
+        extract_workspace_archive(archive, tmp_path / "out", ArchiveFormat.ZIP)
+
+
+def test_import_rejects_path_traversal(tmp_path: Path) -> None:
+    archive = tmp_path / "evil.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("zmk/ok.txt", b"ok")
+        zf.writestr("../escaped.txt", b"evil")
+
+    with pytest.raises(WorkspaceArchiveError, match="escapes"):
+        extract_workspace_archive(archive, tmp_path / "out", ArchiveFormat.ZIP)
+
+    assert not (tmp_path / "escaped.txt").exists()
+
+
+def test_import_rejects_escaping_symlinks(tmp_path: Path) -> None:
+    archive = tmp_path / "evil.tar"
+    with tarfile.open(archive, "w") as tar:
+        inside = tarfile.TarInfo("zmk/link")
+        inside.type = tarfile.SYMTYPE
+        inside.linkname = "../zephyr"
+        tar.addfile(inside)
+        # Stays inside by name, but resolves through the first link to the
+        # parent of the target
+        nested = tarfile.TarInfo("zmk/link/escape")
+        nested.type = tarfile.SYMTYPE
+        nested.linkname = "../.."
+        tar.addfile(nested)
+
+    (tmp_path / "out" / "zephyr").mkdir(parents=True)
+    with pytest.raises(WorkspaceArchiveError, match="link escapes"):
+        extract_workspace_archive(archive, tmp_path / "out", ArchiveFormat.TAR)
+
+    assert (tmp_path / "out" / "zmk" / "link").is_symlink()
@@ -415,12 +415,6 @@ class TestZmkWorkspaceCacheServiceSimplified:
         tmp_path: Path,
     ):
         """Test listing cached workspaces."""
-        # Mock cache keys
-        mock_cache_manager.keys.return_value = [
-            "workspace_repo_key1",
-            "workspace_repo_branch_key2",
-            "other_cache_key",  # Should be filtered out
-        ]
 
         # Create workspace directories for the test
         workspace1_path = tmp_path / "workspace1"
@@ -442,13 +436,15 @@ class TestZmkWorkspaceCacheServiceSimplified:
             cache_level=CacheLevel.REPO_BRANCH,
         )
 
-        mock_cache_manager.get.side_effect = [
-            metadata1.to_cache_value(),
-            metadata2.to_cache_value(),
+        mock_cache_manager.iter_items.return_value = [
+            ("workspace_repo_key1", metadata1.to_cache_value()),
+            ("workspace_repo_branch_key2", metadata2.to_cache_value()),
         ]
 
         workspaces = service.list_cached_workspaces()
 
+        mock_cache_manager.iter_items.assert_called_once_with(prefix="workspace_repo_")
+        mock_cache_manager.get.assert_not_called()
         assert len(workspaces) == 2
         assert all(ws.repository == "zmkfirmware/zmk" for ws in workspaces)
 
@@ -494,13 +490,11 @@ class TestZmkWorkspaceCacheServiceSimplified:
         cache_key1 = service._generate_cache_key("zmkfirmware/zmk", None)
         cache_key2 = service._generate_cache_key("zmkfirmware/zmk", "main")
 
-        mock_cache_manager.keys.return_value = [
-            cache_key1,
-            cache_key2,
+        mock_cache_manager.iter_items.return_value = [
+            (cache_key1, metadata1.to_cache_value()),
+            (cache_key2, metadata2.to_cache_value()),
         ]
         mock_cache_manager.get.side_effect = [
-            metadata1.to_cache_value(),
-            metadata2.to_cache_value(),
             metadata2.to_cache_value(),  # For the delete operation
         ]
         mock_cache_manager.delete.return_value = True  # Mock successful deletion
@@ -749,6 +743,44 @@ class TestZmkWorkspaceCacheServiceSimplified:
         assert output_path.exists()
         assert result.archive_size_bytes is not None and result.archive_size_bytes > 0
 
+    def test_cache_workspace_from_exported_archive(
+        self,
+        service: ZmkWorkspaceCacheService,
+        mock_cache_manager: Mock,
+        sample_workspace: Path,
+        tmp_path: Path,
+    ):
+        """Test importing an exported archive verifies it and sizes the cache."""
+        from glovebox.compilation.cache.models import ArchiveFormat
+
+        repository = "zmkfirmware/zmk"
+        metadata = self._create_metadata(
+            workspace_path=sample_workspace, repository=repository
+        )
+        mock_cache_manager.get.return_value = metadata.to_cache_value()
+        output_path = tmp_path / "export.tar.gz"
+        export = service.export_cached_workspace(
+            repository=repository,
+            output_path=output_path,
+            archive_format=ArchiveFormat.TAR_GZ,
+            include_git=True,
+        )
+        assert export.success is True
+
+        result = service.cache_workspace_from_archive(output_path, repository)
+
+        assert result.success is True
+        assert result.workspace_path is not None
+        assert (result.workspace_path / "zmk" / ".git" / "HEAD").exists()
+        assert not (result.workspace_path / "workspace").exists()
+        assert result.metadata is not None
+        assert result.metadata.size_bytes == export.original_size_bytes
+        assert result.metadata.commit_hash == "abc123"
+        assert result.metadata.notes is not None
+        assert "verified=True" in result.metadata.notes
+        cached_value = mock_cache_manager.set.call_args.args[1]
+        assert cached_value["workspace_path"] == str(result.workspace_path)
+
     def test_export_archive_format_enum(self):
         """Test ArchiveFormat enum properties."""
         from glovebox.compilation.cache.models import ArchiveFormat
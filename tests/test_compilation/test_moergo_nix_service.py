@@ -1,6 +1,7 @@
 """Tests for MoergoNixService compilation service."""
 
 import logging
+import os
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -723,6 +724,61 @@ class TestMoergoNixServiceRunCompilation:
             assert "REPO" in call_args.kwargs["environment"]
             assert "BRANCH" in call_args.kwargs["environment"]
 
+    def test_run_compilation_uses_nix_cache(
+        self,
+        mock_docker_adapter,
+        mock_file_adapter,
+        mock_session_metrics,
+        sample_moergo_config,
+        isolated_config,
+        tmp_path,
+    ):
+        """Test the Nix binary cache is mounted and its hits are counted."""
+        isolated_config._config.firmware.nix_cache.enabled = True
+        service = MoergoNixService(
+            docker_adapter=mock_docker_adapter,
+            file_adapter=mock_file_adapter,
+            session_metrics=mock_session_metrics,
+            user_config=isolated_config,
+        )
+        nix_cache_dir = isolated_config._config.cache_path / "nix-cache"
+        hit_hash = "a" * 32
+        narinfo = nix_cache_dir / f"{hit_hash}.narinfo"
+        nix_cache_dir.mkdir(parents=True)
+        narinfo.write_text("URL: nar/missing.nar.zst\n")
+        os.utime(narinfo, (1_000_000, 1_000_000))
+
+        def run_container(**kwargs):
+            for line in [
+                f"copying path '/nix/store/{hit_hash}-zephyr-sdk' from "
+                "'file:///nix-cache?trusted=true'...",
+                f"copying path '/nix/store/{'b' * 32}-python3' from "
+                "'https://cache.nixos.org'...",
+                "this derivation will be built:",
+            ]:
+                kwargs["middleware"].process(line, "stdout")
+            return (0, [], [])
+
+        mock_docker_adapter.run_container.side_effect = run_container
+        workspace_path = DockerPath(
+            host_path=tmp_path / "workspace", container_path="/workspace"
+        )
+
+        result = service._run_compilation(
+            workspace_path, sample_moergo_config, tmp_path / "output", Mock()
+        )
+
+        assert result is True
+        call_args = mock_docker_adapter.run_container.call_args
+        assert call_args.kwargs["command"][:2] == ["bash", "-c"]
+        assert "build.sh" in call_args.kwargs["command"][2]
+        assert (str(nix_cache_dir), "/nix-cache") in call_args.kwargs["volumes"]
+        assert "NIX_CONFIG" in call_args.kwargs["environment"]
+        stats = service._last_build_cache_stats
+        assert stats is not None
+        assert (stats.nix_cache_hits, stats.nix_cache_misses) == (1, 2)
+        assert narinfo.stat().st_mtime > 1_000_000
+
     def test_run_compilation_image_ensure_failure(
         self,
         moergo_service,
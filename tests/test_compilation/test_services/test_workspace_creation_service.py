@@ -6,12 +6,18 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from glovebox.adapters.docker_session import FakeDockerBackend
 from glovebox.compilation.parsers.repository_spec_parser import RepositorySpec
 from glovebox.compilation.services.workspace_creation_service import (
     WorkspaceCreationResult,
     WorkspaceCreationService,
     create_workspace_creation_service,
 )
+from glovebox.config.models.firmware import (
+    FirmwareDockerConfig,
+    FirmwareGitMirrorConfig,
+    UserFirmwareConfig,
+)
 from glovebox.config.user_config import UserConfig
 from glovebox.core.file_operations import FileCopyService
 from glovebox.models.docker import DockerUserContext
@@ -582,3 +588,138 @@ class TestCreateWorkspaceCreationService:
         )
 
         assert service.copy_service == mock_copy_service
+
+
+class TestWorkspaceCreationWarmContainer:
+    """Test workspace creation phases sharing a warm container."""
+
+    def test_phases_run_in_one_container(self):
+        """West init, clone and update run as execs in one container."""
+        backend = FakeDockerBackend()
+        user_config = Mock(spec=UserConfig)
+        user_config._config = Mock(
+            firmware=UserFirmwareConfig(
+                docker=FirmwareDockerConfig(reuse_containers=True)
+            )
+        )
+        service = WorkspaceCreationService(
+            docker_adapter=backend,
+            file_adapter=Mock(spec=FileAdapterProtocol),
+            user_config=user_config,
+            session_metrics=Mock(spec=MetricsProtocol),
+            copy_service=Mock(spec=FileCopyService),
+        )
+        assert service.container_sessions is not None
+
+        with patch.object(service, "_create_workspace_metadata", return_value=None):
+            result = service._create_workspace_internal(
+                RepositorySpec(
+                    repository="zmkfirmware/zmk",
+                    organization="zmkfirmware",
+                    repo_name="zmk",
+                    branch="main",
+                    original_spec="zmkfirmware/zmk@main",
+                ),
+                None,
+                "zmkfirmware/zmk-dev-arm:stable",
+                False,
+                None,
+                None,
+                0.0,
+            )
+
+        assert result.success is True
+        assert backend.runs == 0
+        assert len(backend.containers) == 1
+        (container,) = backend.containers.values()
+        commands = [command[-1] for command in container.commands]
+        assert len(commands) == 3
+        assert "west init -l config" in commands[0]
+        assert "git clone" in commands[1]
+        assert "west update" in commands[2]
+        # The container is removed with the temporary workspace
+        assert not container.running
+
+    def test_disabled_by_default(self):
+        """Without reuse_containers every phase runs in a new container."""
+        user_config = Mock(spec=UserConfig)
+        user_config._config = Mock(firmware=UserFirmwareConfig())
+        service = WorkspaceCreationService(
+            docker_adapter=FakeDockerBackend(),
+            file_adapter=Mock(spec=FileAdapterProtocol),
+            user_config=user_config,
+            session_metrics=Mock(spec=MetricsProtocol),
+        )
+
+        assert service.container_sessions is None
+
+
+class TestWorkspaceCreationGitMirrors:
+    """Test workspace creation with the local git mirror store."""
+
+    def test_phases_use_git_mirrors(self, tmp_path):
+        """Clone and west update use the mirrors, which learn the new projects."""
+        docker_adapter = Mock(spec=DockerAdapterProtocol)
+        docker_adapter.run_container.return_value = (0, [], [])
+        user_config = Mock(spec=UserConfig)
+        user_config._config = Mock(
+            cache_path=tmp_path,
+            firmware=UserFirmwareConfig(
+                git_mirrors=FirmwareGitMirrorConfig(enabled=True)
+            ),
+        )
+        service = WorkspaceCreationService(
+            docker_adapter=docker_adapter,
+            file_adapter=Mock(spec=FileAdapterProtocol),
+            user_config=user_config,
+            session_metrics=Mock(spec=MetricsProtocol),
+            copy_service=Mock(spec=FileCopyService),
+        )
+        store = service.git_mirror_store
+        assert store is not None
+        spec = RepositorySpec(
+            repository="zmkfirmware/zmk",
+            organization="zmkfirmware",
+            repo_name="zmk",
+            branch="main",
+            original_spec="zmkfirmware/zmk@main",
+        )
+        store.mirror_path(spec.clone_url).mkdir(parents=True)
+
+        with (
+            patch.object(service, "_create_workspace_metadata", return_value=None),
+            patch.object(store, "sync_remote") as sync_remote,
+            patch.object(store, "add_workspace") as add_workspace,
+            patch.object(store, "collect_garbage") as collect_garbage,
+        ):
+            result = service._create_workspace_internal(
+                spec, None, "zmk:stable", False, None, None, 0.0
+            )
+
+        assert result.success is True
+        sync_remote.assert_called_once_with(spec.clone_url)
+        add_workspace.assert_called_once()
+        collect_garbage.assert_called_once()
+        calls = docker_adapter.run_container.call_args_list
+        assert all(store.volume in call.kwargs["volumes"] for call in calls)
+        commands = [call.kwargs["command"][-1] for call in calls]
+        assert (
+            f"--reference-if-able {store.container_mirror_path(spec.clone_url)}"
+            in (commands[1])
+        )
+        assert "west update --path-cache /git-mirrors/paths" in commands[2]
+
+    def test_disabled_by_default(self):
+        """Without git_mirrors.enabled workspaces clone from the network."""
+        user_config = Mock(spec=UserConfig)
+        user_config._config = Mock(
+            cache_path=Path("/tmp/cache"), firmware=UserFirmwareConfig()
+        )
+        service = WorkspaceCreationService(
+            docker_adapter=Mock(spec=DockerAdapterProtocol),
+            file_adapter=Mock(spec=FileAdapterProtocol),
+            user_config=user_config,
+            session_metrics=Mock(spec=MetricsProtocol),
+        )
+
+        assert service.git_mirror_store is None
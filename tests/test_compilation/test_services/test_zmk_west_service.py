@@ -2,7 +2,7 @@
 
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -243,3 +243,185 @@ class TestZmkWestServiceIntegration:
             assert cached_build is not None
             assert cached_build.exists()
             assert (cached_build / "zmk.uf2").exists()
+
+    def test_cached_build_collected_under_shared_lock(
+        self, mock_docker_adapter, isolated_config, mock_file_adapter, tmp_path
+    ):
+        """Test cache GC cannot evict a cached build while files are copied."""
+        from glovebox.core.cache.locking import directory_lock
+
+        service = create_zmk_west_service(
+            docker_adapter=mock_docker_adapter,
+            user_config=isolated_config,
+            file_adapter=mock_file_adapter,
+            cache_manager=create_default_cache(tag="test"),
+            session_metrics=Mock(),
+        )
+        cached_build = tmp_path / "builds" / "key"
+        cached_build.mkdir(parents=True)
+        evictable_during_copy = []
+
+        def collect_files(workspace_path, output_dir):
+            gc_lock = directory_lock(workspace_path)
+            acquired = gc_lock.acquire(blocking=False)
+            gc_lock.release()
+            evictable_during_copy.append(acquired)
+            return Mock()
+
+        service._collect_files = collect_files  # type: ignore[method-assign]
+
+        assert service._collect_cached_build_files(cached_build, tmp_path / "out")
+        assert evictable_during_copy == [False]
+
+    def test_evicted_cached_build_is_a_miss(
+        self, mock_docker_adapter, isolated_config, mock_file_adapter, tmp_path
+    ):
+        """Test a cached build removed after lookup is treated as a cache miss."""
+        service = create_zmk_west_service(
+            docker_adapter=mock_docker_adapter,
+            user_config=isolated_config,
+            file_adapter=mock_file_adapter,
+            cache_manager=create_default_cache(tag="test"),
+            session_metrics=Mock(),
+        )
+
+        result = service._collect_cached_build_files(
+            tmp_path / "builds" / "gone", tmp_path / "out"
+        )
+
+        assert result is None
+
+    def test_incremental_build_mounts_caches_and_reports_stats(
+        self, mock_docker_adapter, isolated_config, mock_file_adapter, tmp_path
+    ):
+        """Test ccache and preserved build directories are wired into the build."""
+        import re
+
+        from glovebox.compilation.cache.incremental_build_cache import (
+            IncrementalBuildCache,
+        )
+
+        service = create_zmk_west_service(
+            docker_adapter=mock_docker_adapter,
+            user_config=isolated_config,
+            file_adapter=mock_file_adapter,
+            cache_manager=create_default_cache(tag="test"),
+            session_metrics=Mock(),
+        )
+        assert service.incremental_build_cache is None
+        cache = IncrementalBuildCache(
+            tmp_path / "incremental", preserve_build_dirs=True
+        )
+        service.incremental_build_cache = cache
+
+        workspace = tmp_path / "workspace"
+        workspace.mkdir()
+        (workspace / "build.yaml").write_text(
+            "include:\n  - board: nice_nano_v2\n    artifact_name: test_board\n"
+        )
+
+        def run_container(**kwargs):
+            script = kwargs["command"][-1]
+            counters = {"before": 0, "after": 8}
+            for name, phase in re.findall(
+                r"/ccache/(\.stats-\w+-(before|after))", script
+            ):
+                (cache.ccache_dir / name).write_text(
+                    f"direct_cache_hit\t{counters[phase]}\ncache_miss\t2\n"
+                )
+            for host, container in kwargs["volumes"]:
+                if container == "/workspace/test_board":
+                    (Path(host) / "zephyr").mkdir(exist_ok=True)
+                    (Path(host) / "zephyr" / "zmk.uf2").write_bytes(b"firmware")
+            return (0, [], [])
+
+        mock_docker_adapter.run_container.side_effect = run_container
+        zmk_config = ZmkCompilationConfig(
+            repository="zmkfirmware/zmk", branch="main", image_="zmk:stable"
+        )
+
+        assert service._run_compilation(workspace, zmk_config, tmp_path / "out")
+
+        kwargs = mock_docker_adapter.run_container.call_args.kwargs
+        assert (str(cache.ccache_dir), "/ccache") in kwargs["volumes"]
+        assert kwargs["environment"]["CCACHE_DIR"] == "/ccache"
+        script = kwargs["command"][-1]
+        assert "-DZMK_CONFIG=/workspace/config -DUSE_CCACHE=1" in script
+        assert (workspace / "test_board" / "zephyr" / "zmk.uf2").exists()
+        stats = service._last_build_cache_stats
+        assert stats is not None
+        assert stats.compiler_cache_hits == 8
+        assert stats.fresh_build_dirs == 1
+
+    def test_preserved_build_dirs_keyed_on_image_id(
+        self, mock_docker_adapter, isolated_config, mock_file_adapter, tmp_path
+    ):
+        """Test a re-pulled image gets new build directories."""
+        from glovebox.compilation.cache.incremental_build_cache import (
+            workspace_cache_key,
+        )
+
+        service = create_zmk_west_service(
+            docker_adapter=mock_docker_adapter,
+            user_config=isolated_config,
+            file_adapter=mock_file_adapter,
+            cache_manager=create_default_cache(tag="test"),
+            session_metrics=Mock(),
+        )
+        service.incremental_build_cache = Mock()
+        workspace = tmp_path / "workspace"
+        workspace.mkdir()
+        (workspace / "build.yaml").write_text(
+            "include:\n  - board: nice_nano_v2\n    artifact_name: test_board\n"
+        )
+        zmk_config = ZmkCompilationConfig(
+            repository="zmkfirmware/zmk", branch="main", image_="zmk:stable"
+        )
+
+        keys = []
+        for image_id in ["sha256:old", "sha256:new", None]:
+            mock_docker_adapter.image_id.return_value = image_id
+            service._prepare_incremental_build(workspace, zmk_config)
+            keys.append(service.incremental_build_cache.prepare.call_args.args[1])
+
+        mock_docker_adapter.image_id.assert_called_with("zmk", "stable")
+        assert keys == [
+            workspace_cache_key("zmkfirmware/zmk", "main", "sha256:old"),
+            workspace_cache_key("zmkfirmware/zmk", "main", "sha256:new"),
+            workspace_cache_key("zmkfirmware/zmk", "main", "zmk:stable"),
+        ]
+
+    def test_new_workspace_uses_and_fills_git_mirrors(
+        self, mock_docker_adapter, isolated_config, mock_file_adapter, tmp_path
+    ):
+        """Test west update clones from the mirrors, which learn new projects."""
+        from glovebox.compilation.cache.git_mirror_store import GitMirrorStore
+
+        service = create_zmk_west_service(
+            docker_adapter=mock_docker_adapter,
+            user_config=isolated_config,
+            file_adapter=mock_file_adapter,
+            cache_manager=create_default_cache(tag="test"),
+            session_metrics=Mock(),
+        )
+        assert service.git_mirror_store is None
+        store = GitMirrorStore(tmp_path / "git-mirrors")
+        service.git_mirror_store = store
+
+        workspace = tmp_path / "workspace"
+        workspace.mkdir()
+        (workspace / "build.yaml").write_text(
+            "include:\n  - board: nice_nano_v2\n    artifact_name: test_board\n"
+        )
+        mock_docker_adapter.run_container.return_value = (0, [], [])
+        zmk_config = ZmkCompilationConfig(
+            repository="zmkfirmware/zmk", branch="main", image_="zmk:stable"
+        )
+
+        with patch.object(store, "add_workspace") as add_workspace:
+            assert service._run_compilation(workspace, zmk_config, tmp_path / "out")
+
+        kwargs = mock_docker_adapter.run_container.call_args.kwargs
+        assert store.volume in kwargs["volumes"]
+        assert "west update --path-cache /git-mirrors/paths" in kwargs["command"][-1]
+        add_workspace.assert_called_once_with(workspace)
@@ -1,9 +1,12 @@
 """Tests for include directive configuration loading."""
 
+import os
 import tempfile
+import time
 from pathlib import Path
 from textwrap import dedent
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -452,6 +455,115 @@ class TestIncludeConfigLoader:
         assert result.key_count == 99
 
 
+def _age_files(directory: Path, seconds: int = 60) -> None:
+    """Move file mtimes into the past so the on-disk cache trusts them."""
+    past = time.time() - seconds
+    for path in directory.glob("*.yaml"):
+        os.utime(path, (past, past))
+
+
+class TestIncludeLoaderDiskCache:
+    """Tests for caching merged configurations on disk."""
+
+    @pytest.fixture
+    def config_dir(self, tmp_path: Path) -> Path:
+        """Keyboard configuration including a shared base file."""
+        config_dir = tmp_path / "keyboards"
+        config_dir.mkdir()
+        base = {"vendor": "Base Vendor", "key_count": 42}
+        main = {
+            "include": ["base.yaml"],
+            "keyboard": "cached",
+            "description": "Cached keyboard",
+        }
+        (config_dir / "base.yaml").write_text(yaml.dump(base))
+        (config_dir / "cached.yaml").write_text(yaml.dump(main))
+        _age_files(config_dir)
+        return config_dir
+
+    def test_cached_config_skips_yaml_parsing(
+        self, config_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test a second loader reads the merged config from the cache."""
+        cache_dir = tmp_path / "cache"
+        first = IncludeConfigLoader([config_dir], cache_dir=cache_dir)
+        expected = first.load_keyboard_config("cached")
+
+        second = IncludeConfigLoader([config_dir], cache_dir=cache_dir)
+        with patch("yaml.safe_load", side_effect=AssertionError("parsed YAML")):
+            result = second.load_keyboard_config("cached")
+
+        assert result == expected
+        assert result.vendor == "Base Vendor"
+        assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+    def test_changed_include_invalidates_cache(
+        self, config_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test editing an included file is picked up."""
+        cache_dir = tmp_path / "cache"
+        IncludeConfigLoader([config_dir], cache_dir=cache_dir).load_keyboard_config(
+            "cached"
+        )
+
+        base = {"vendor": "Changed Vendor", "key_count": 42}
+        (config_dir / "base.yaml").write_text(yaml.dump(base))
+        result = IncludeConfigLoader(
+            [config_dir], cache_dir=cache_dir
+        ).load_keyboard_config("cached")
+
+        assert result.vendor == "Changed Vendor"
+
+    def test_recently_modified_files_are_not_cached(
+        self, config_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test files modified within the mtime race window are not cached."""
+        cache_dir = tmp_path / "cache"
+        (config_dir / "base.yaml").touch()
+
+        loader = IncludeConfigLoader([config_dir], cache_dir=cache_dir)
+        loader.load_keyboard_config("cached")
+
+        assert not list(cache_dir.glob("*.pickle"))
+
+    def test_corrupt_cache_file_is_ignored(
+        self, config_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test an unreadable cache file falls back to loading the YAML."""
+        cache_dir = tmp_path / "cache"
+        IncludeConfigLoader([config_dir], cache_dir=cache_dir).load_keyboard_config(
+            "cached"
+        )
+        for cache_file in cache_dir.glob("*.pickle"):
+            cache_file.write_bytes(b"not a pickle")
+
+        result = IncludeConfigLoader(
+            [config_dir], cache_dir=cache_dir
+        ).load_keyboard_config("cached")
+
+        assert result.description == "Cached keyboard"
+
+    def test_reused_loader_tracks_nested_includes(
+        self, config_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test files served from memory still record what they include."""
+        other = {"include": ["cached.yaml"], "keyboard": "other"}
+        (config_dir / "other.yaml").write_text(yaml.dump(other))
+        _age_files(config_dir)
+        cache_dir = tmp_path / "cache"
+        loader = IncludeConfigLoader([config_dir], cache_dir=cache_dir)
+        loader.load_keyboard_config("cached")
+        loader.load_keyboard_config("other")
+
+        base = {"vendor": "Changed Vendor", "key_count": 42}
+        (config_dir / "base.yaml").write_text(yaml.dump(base))
+        result = IncludeConfigLoader(
+            [config_dir], cache_dir=cache_dir
+        ).load_keyboard_config("other")
+
+        assert result.vendor == "Changed Vendor"
+
+
 class TestIncludeLoaderFactory:
     """Tests for the include loader factory function."""
 
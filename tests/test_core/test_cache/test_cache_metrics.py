@@ -98,6 +98,11 @@ class TestCacheMetricsIntegration:
             "hit_rate",
             "miss_rate",
             "avg_operation_time",
+            "memory_hit_count",
+            "memory_entries",
+            "memory_size_bytes",
+            "memory_eviction_count",
+            "memory_hit_rate",
             "tag",
         }
 
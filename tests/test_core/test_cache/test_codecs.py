@@ -0,0 +1,180 @@
+"""Tests for cache value codecs."""
+
+import math
+import pickle
+from pathlib import Path
+
+import diskcache  # type: ignore[import-untyped]
+import pytest
+
+from glovebox.core.cache.codecs import (
+    CODEC_JSON,
+    CODEC_MSGPACK,
+    CODEC_PICKLE,
+    COMPRESSION_NONE,
+    COMPRESSION_ZLIB,
+    CacheValueSerializer,
+    create_value_codec,
+)
+from glovebox.core.cache.diskcache_manager import DiskCacheManager
+from glovebox.core.cache.models import DiskCacheConfig
+from glovebox.core.errors import CacheCodecError
+
+
+LAYOUT_LIKE_VALUE = {
+    "title": "Test Layout",
+    "layer_names": ["Base", "Lower", "Upper"],
+    "layers": [
+        [
+            {"value": "&kp", "params": [{"value": f"K{i}", "params": []}]}
+            for i in range(80)
+        ]
+        for _ in range(3)
+    ],
+    "version": 3,
+    "ratio": 0.5,
+    "enabled": True,
+    "notes": None,
+}
+
+
+def _header(data: bytes) -> tuple[int, int, int]:
+    """Return (version, codec id, compression id) from encoded data."""
+    return data[3], data[4], data[5]
+
+
+class TestCacheValueSerializer:
+    """Test CacheValueSerializer encoding."""
+
+    @pytest.mark.parametrize("codec", ["pickle", "json", "msgpack"])
+    def test_round_trip(self, codec):
+        """Test JSON-shaped values round-trip with every codec."""
+        if codec == "msgpack":
+            pytest.importorskip("msgpack")
+        serializer = CacheValueSerializer(codec=codec, compression="none")
+
+        data = serializer.dumps(LAYOUT_LIKE_VALUE)
+
+        assert serializer.is_encoded(data)
+        assert serializer.loads(data) == LAYOUT_LIKE_VALUE
+
+    def test_json_codec_records_codec_id(self):
+        """Test JSON-shaped values are encoded with the configured codec."""
+        serializer = CacheValueSerializer(codec="json", compression="none")
+        data = serializer.dumps(LAYOUT_LIKE_VALUE)
+        assert _header(data) == (1, CODEC_JSON, COMPRESSION_NONE)
+
+    @pytest.mark.parametrize(
+        "value",
+        [(1, 2), {1: "int key"}, Path("/tmp/x"), {"nested": {"tuple": (1,)}}, {1, 2}],
+    )
+    def test_non_json_values_fall_back_to_pickle(self, value):
+        """Test values that would not round-trip through JSON use pickle."""
+        serializer = CacheValueSerializer(codec="json", compression="none")
+        data = serializer.dumps(value)
+
+        assert _header(data)[1] == CODEC_PICKLE
+        assert serializer.loads(data) == value
+
+    @pytest.mark.parametrize("codec", ["json", "msgpack"])
+    @pytest.mark.parametrize("number", [math.inf, -math.inf])
+    def test_non_finite_floats_fall_back_to_pickle(self, codec, number):
+        """Test NaN and infinity are not silently turned into null."""
+        if codec == "msgpack":
+            pytest.importorskip("msgpack")
+        serializer = CacheValueSerializer(codec=codec, compression="none")
+        data = serializer.dumps({"a": number})
+
+        assert _header(data)[1] == CODEC_PICKLE
+        assert serializer.loads(data) == {"a": number}
+
+    def test_nan_round_trips(self):
+        """Test NaN survives encoding (NaN never compares equal to itself)."""
+        serializer = CacheValueSerializer(codec="json", compression="none")
+        data = serializer.dumps({"a": [math.nan]})
+
+        assert _header(data)[1] == CODEC_PICKLE
+        assert math.isnan(serializer.loads(data)["a"][0])
+
+    def test_compression_above_threshold(self):
+        """Test large values are compressed and small ones are not."""
+        serializer = CacheValueSerializer(
+            codec="json", compression="zlib", compress_threshold=1024
+        )
+
+        large = serializer.dumps(LAYOUT_LIKE_VALUE)
+        small = serializer.dumps({"small": 1})
+
+        assert _header(large)[2] == COMPRESSION_ZLIB
+        assert _header(small)[2] == COMPRESSION_NONE
+        assert len(large) < len(pickle.dumps(LAYOUT_LIKE_VALUE))
+        assert serializer.loads(large) == LAYOUT_LIKE_VALUE
+
+    def test_zstd_compression(self):
+        """Test zstd compression when zstandard is installed."""
+        pytest.importorskip("zstandard")
+        serializer = CacheValueSerializer(
+            codec="json", compression="zstd", compress_threshold=0
+        )
+        assert serializer.loads(serializer.dumps(LAYOUT_LIKE_VALUE)) == (
+            LAYOUT_LIKE_VALUE
+        )
+
+    def test_decodes_values_from_other_codec(self):
+        """Test values stay readable after the configured codec changes."""
+        written = CacheValueSerializer(codec="json").dumps(LAYOUT_LIKE_VALUE)
+        reader = CacheValueSerializer(codec="pickle")
+        assert reader.loads(written) == LAYOUT_LIKE_VALUE
+
+    def test_unsupported_version(self):
+        """Test values with an unknown format version are rejected."""
+        serializer = CacheValueSerializer(codec="json")
+        data = bytearray(serializer.dumps({"a": 1}))
+        data[3] = 99
+
+        with pytest.raises(CacheCodecError, match="format version 99"):
+            serializer.loads(bytes(data))
+
+    def test_unknown_codec_name(self):
+        """Test unknown codec names are rejected."""
+        with pytest.raises(CacheCodecError, match="Unknown cache codec"):
+            create_value_codec("yaml")
+
+    def test_auto_prefers_msgpack(self):
+        """Test auto codec selection uses msgpack when available."""
+        pytest.importorskip("msgpack")
+        assert create_value_codec("auto").codec_id == CODEC_MSGPACK
+
+
+class TestDiskCacheCodecIntegration:
+    """Test DiskCacheManager with value codecs."""
+
+    def test_values_stored_without_pickle(self, tmp_path):
+        """Test JSON-shaped values are stored with the configured codec."""
+        config = DiskCacheConfig(cache_path=tmp_path / "cache", codec="json")
+        with DiskCacheManager(config) as manager:
+            manager.set("layout", LAYOUT_LIKE_VALUE)
+
+            ((raw_value,),) = manager._cache._sql(
+                "SELECT value FROM Cache WHERE key = ?", ("layout",)
+            ).fetchall()
+            assert _header(bytes(raw_value))[1] == CODEC_JSON
+            assert manager.get("layout") == LAYOUT_LIKE_VALUE
+            assert manager.get_many(["layout"]) == {"layout": LAYOUT_LIKE_VALUE}
+
+    def test_reads_legacy_pickled_entries(self, tmp_path):
+        """Test entries written by plain DiskCache remain readable."""
+        cache_path = tmp_path / "cache"
+        legacy = diskcache.Cache(str(cache_path))
+        legacy.set("legacy_dict", {"value": 1})
+        legacy.set("legacy_str", "text")
+        legacy.close()
+
+        config = DiskCacheConfig(cache_path=cache_path, codec="json")
+        with DiskCacheManager(config) as manager:
+            assert manager.get("legacy_dict") == {"value": 1}
+            assert manager.get("legacy_str") == "text"
+            assert dict(manager.iter_items()) == {
+                "legacy_dict": {"value": 1},
+                "legacy_str": "text",
+            }
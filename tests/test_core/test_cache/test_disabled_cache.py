@@ -65,6 +65,12 @@ class TestDisabledCache:
         """Test that cleanup returns 0."""
         assert disabled_cache.cleanup() == 0
 
+    def test_batch_operations(self, disabled_cache):
+        """Test that batch operations store and return nothing."""
+        disabled_cache.set_many({"key1": "value1", "key2": "value2"})
+        assert disabled_cache.get_many(["key1", "key2"]) == {}
+        assert list(disabled_cache.iter_items()) == []
+
     def test_close_is_noop(self, disabled_cache):
         """Test that close operation is no-op."""
         # Should not raise any errors
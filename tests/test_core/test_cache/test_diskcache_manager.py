@@ -2,7 +2,7 @@
 
 import time
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -135,6 +135,90 @@ class TestDiskCacheManager:
         deleted_count = cache_manager.delete_many(["missing1", "missing2", "missing3"])
         assert deleted_count == 0
 
+    def test_delete_many_rolled_back_on_error(self, cache_manager):
+        """Test a failed batch delete reports nothing deleted."""
+        cache_manager.set("rollback_key1", "value1")
+        cache_manager.set("rollback_key2", "value2")
+        real_delete = cache_manager._cache.delete
+
+        def failing_delete(key, *args, **kwargs):
+            if key == "rollback_key2":
+                raise RuntimeError("disk error")
+            return real_delete(key, *args, **kwargs)
+
+        with patch.object(cache_manager._cache, "delete", side_effect=failing_delete):
+            deleted_count = cache_manager.delete_many(
+                ["rollback_key1", "rollback_key2"]
+            )
+
+        assert deleted_count == 0
+        assert cache_manager.get("rollback_key1") == "value1"
+
+    def test_get_many(self, cache_manager):
+        """Test batch get returns only found keys."""
+        cache_manager.set("batch_key1", {"value": 1})
+        cache_manager.set("batch_key2", None)
+        cache_manager.set("batch_key3", "x" * 100_000)  # Stored as a file
+
+        result = cache_manager.get_many(
+            ["batch_key1", "batch_key2", "batch_key3", "missing_key"]
+        )
+
+        assert result == {
+            "batch_key1": {"value": 1},
+            "batch_key2": None,
+            "batch_key3": "x" * 100_000,
+        }
+        stats = cache_manager.get_stats()
+        assert stats.hit_count == 3
+        assert stats.miss_count == 1
+
+    def test_get_many_skips_expired(self, cache_manager):
+        """Test batch get ignores expired entries."""
+        cache_manager.set("ttl_key", "value", ttl=1)
+        cache_manager.set("live_key", "value")
+
+        time.sleep(1.1)
+        assert cache_manager.get_many(["ttl_key", "live_key"]) == {"live_key": "value"}
+
+    def test_get_many_large_batch(self, cache_manager):
+        """Test batch get across several SQL batches uses no per-key reads."""
+        items = {f"key_{i}": i for i in range(1200)}
+        cache_manager.set_many(items)
+
+        with patch.object(
+            cache_manager._cache, "get", side_effect=AssertionError("per-key read")
+        ):
+            assert cache_manager.get_many(list(items)) == items
+
+    def test_set_many_with_ttl(self, cache_manager):
+        """Test batch set applies TTL to every entry."""
+        cache_manager.set_many({"a": 1, "b": 2}, ttl=1)
+        assert cache_manager.get_many(["a", "b"]) == {"a": 1, "b": 2}
+
+        time.sleep(1.1)
+        assert cache_manager.get_many(["a", "b"]) == {}
+
+    def test_iter_items(self, cache_manager):
+        """Test streaming scan with prefix filter."""
+        for i in range(600):
+            cache_manager.set(f"workspace_repo_{i}", {"index": i})
+        cache_manager.set("other_key", "ignored")
+
+        items = dict(cache_manager.iter_items(prefix="workspace_repo_"))
+
+        assert len(items) == 600
+        assert items["workspace_repo_42"] == {"index": 42}
+        assert "other_key" not in items
+        assert len(dict(cache_manager.iter_items())) == 601
+
+    def test_iter_items_prefix_is_literal(self, cache_manager):
+        """Test prefix matching does not treat SQL wildcards specially."""
+        cache_manager.set("a%b", 1)
+        cache_manager.set("axb", 2)
+
+        assert dict(cache_manager.iter_items(prefix="a%")) == {"a%b": 1}
+
     def test_exists_with_existing_key(self, cache_manager):
         """Test exists with existing key."""
         cache_manager.set("exists_key", "exists_value")
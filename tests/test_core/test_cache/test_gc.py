@@ -0,0 +1,256 @@
+"""Tests for the unified cache garbage collector."""
+
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from glovebox.core.cache.diskcache_manager import DiskCacheManager
+from glovebox.core.cache.gc import (
+    DISKCACHE_EVICTION_POLICIES,
+    CacheGarbageCollector,
+    _background_gc_lock,
+    create_cache_gc,
+    run_background_gc,
+    start_background_gc,
+)
+from glovebox.core.cache.models import CacheGCConfig, DiskCacheConfig
+
+
+HOUR = 3600
+
+
+def _make_directory(path, size_bytes, age_seconds):
+    """Create a cache directory holding size_bytes, last used age_seconds ago."""
+    path.mkdir(parents=True)
+    (path / "data.bin").write_bytes(b"x" * size_bytes)
+    timestamp = time.time() - age_seconds
+    os.utime(path, (timestamp, timestamp))
+
+
+def _set_entry_times(manager, key, store_time, access_count=0):
+    """Override DiskCache store time and access count for an entry."""
+    manager._cache._sql(
+        "UPDATE Cache SET store_time = ?, access_count = ? WHERE key = ?",
+        (store_time, access_count, key),
+    )
+
+
+@pytest.fixture
+def cache_root(tmp_path):
+    """Cache root with a build and a workspace directory cache."""
+    root = tmp_path / "cache"
+    (root / "compilation" / "builds").mkdir(parents=True)
+    (root / "workspace").mkdir(parents=True)
+    return root
+
+
+def _collector(cache_root, **config):
+    return CacheGarbageCollector(cache_root, CacheGCConfig(**config))
+
+
+class TestCacheGarbageCollector:
+    """Test CacheGarbageCollector eviction."""
+
+    def test_under_budget_evicts_nothing(self, cache_root):
+        """Test nothing is evicted while usage fits the budget."""
+        _make_directory(cache_root / "workspace" / "ws", 1000, 10 * HOUR)
+
+        result = _collector(cache_root, max_total_bytes=10**9).collect()
+
+        assert result.evicted == []
+        assert (cache_root / "workspace" / "ws").exists()
+
+    def test_lru_evicts_oldest_directories_first(self, cache_root):
+        """Test LRU policy evicts least recently used directories."""
+        _make_directory(cache_root / "workspace" / "old", 4000, 30 * HOUR)
+        _make_directory(cache_root / "workspace" / "new", 4000, 2 * HOUR)
+        _make_directory(cache_root / "compilation" / "builds" / "mid", 4000, 10 * HOUR)
+
+        result = _collector(cache_root, max_total_bytes=9000).collect()
+
+        assert [c.location.name for c in result.evicted] == ["old"]
+        assert not (cache_root / "workspace" / "old").exists()
+        assert (cache_root / "workspace" / "new").exists()
+        assert result.total_bytes_after <= 9000
+
+    def test_size_policy_prefers_large_entries(self, cache_root):
+        """Test size-weighted policy evicts large, old directories first."""
+        _make_directory(cache_root / "workspace" / "small_old", 1000, 20 * HOUR)
+        _make_directory(cache_root / "workspace" / "large", 20000, 5 * HOUR)
+
+        result = _collector(cache_root, max_total_bytes=15000, policy="size").collect()
+
+        assert [c.location.name for c in result.evicted] == ["large"]
+
+    def test_recent_entries_are_protected(self, cache_root):
+        """Test entries used within min_age_seconds are never evicted."""
+        _make_directory(cache_root / "workspace" / "in_use", 5000, 60)
+
+        result = _collector(cache_root, max_total_bytes=0).collect()
+
+        assert result.evicted == []
+        assert (cache_root / "workspace" / "in_use").exists()
+
+    def test_dry_run_deletes_nothing(self, cache_root):
+        """Test dry run reports evictions without deleting."""
+        _make_directory(cache_root / "workspace" / "old", 5000, 30 * HOUR)
+
+        result = _collector(cache_root, max_total_bytes=0).collect(dry_run=True)
+
+        assert result.dry_run
+        assert result.evicted_directories == 1
+        assert result.reclaimed_bytes == 5000
+        assert (cache_root / "workspace" / "old").exists()
+
+    def test_removes_interrupted_trash(self, cache_root):
+        """Test directories left by an interrupted run are deleted."""
+        _make_directory(cache_root / "workspace" / ".gc-trash-1234", 100, 0)
+
+        _collector(cache_root).collect()
+
+        assert not (cache_root / "workspace" / ".gc-trash-1234").exists()
+
+    def test_diskcache_entries_share_budget(self, cache_root):
+        """Test DiskCache entries are ranked together with directories."""
+        config = DiskCacheConfig(cache_path=cache_root / "layout", codec="pickle")
+        with DiskCacheManager(config) as manager:
+            manager.set("stale", "x" * 50000)
+            manager.set("fresh", "y" * 50000)
+            _set_entry_times(manager, "stale", time.time() - 40 * HOUR)
+            _set_entry_times(manager, "fresh", time.time() - 2 * HOUR)
+        _make_directory(cache_root / "workspace" / "ws", 50000, 20 * HOUR)
+
+        collector = _collector(cache_root, max_total_bytes=0)
+        usage = collector.collect(dry_run=True).total_bytes_before
+        collector.config.max_total_bytes = usage - 60000
+        result = collector.collect()
+
+        assert [c.key or c.location.name for c in result.evicted] == ["stale", "ws"]
+        assert result.vacuumed_databases == 1
+        assert result.total_bytes_after < usage
+        with DiskCacheManager(config) as manager:
+            assert manager.get("stale") is None
+            assert manager.get("fresh") == "y" * 50000
+
+    def test_lfu_ranks_by_access_count(self, cache_root):
+        """Test LFU policy evicts least frequently used entries first."""
+        config = DiskCacheConfig(
+            cache_path=cache_root / "layout",
+            codec="pickle",
+            eviction_policy="least-frequently-used",
+        )
+        with DiskCacheManager(config) as manager:
+            manager.set("popular", "a" * 20000)
+            manager.set("rare", "b" * 20000)
+            old = time.time() - 10 * HOUR
+            _set_entry_times(manager, "popular", old - HOUR, access_count=50)
+            _set_entry_times(manager, "rare", old, access_count=1)
+
+        collector = _collector(cache_root, max_total_bytes=0, policy="lfu")
+        usage = collector.collect(dry_run=True).total_bytes_before
+        collector.config.max_total_bytes = usage - 10000
+
+        result = collector.collect(dry_run=True)
+
+        assert [c.key for c in result.evicted] == ["rare"]
+
+    def test_expired_entries_removed(self, cache_root):
+        """Test expired DiskCache entries are dropped before ranking."""
+        config = DiskCacheConfig(cache_path=cache_root / "layout")
+        with DiskCacheManager(config) as manager:
+            manager.set("expiring", "value", ttl=1)
+        time.sleep(1.1)
+
+        result = _collector(cache_root).collect()
+
+        assert result.expired_entries == 1
+
+    def test_invalid_policy(self, cache_root):
+        """Test unknown policies are rejected."""
+        with pytest.raises(ValueError, match="Cache GC policy must be one of"):
+            _collector(cache_root, policy="fifo")
+
+
+class TestBackgroundGC:
+    """Test opportunistic background GC scheduling."""
+
+    def _user_config(self, cache_root, interval_hours=24.0):
+        return SimpleNamespace(
+            config_file_path=None,
+            _config=SimpleNamespace(
+                cache_path=cache_root,
+                cache_strategy="shared",
+                cache_gc_max_size_gb=20.0,
+                cache_gc_policy="lru",
+                cache_gc_interval_hours=interval_hours,
+            ),
+        )
+
+    def test_runs_once_per_interval(self, cache_root):
+        """Test background GC runs only when the interval has passed."""
+        user_config = self._user_config(cache_root)
+
+        assert run_background_gc(user_config) is not None
+        assert run_background_gc(user_config) is None
+
+    def test_interrupted_run_is_retried(self, cache_root):
+        """Test the last-run stamp is only written after a completed run."""
+        user_config = self._user_config(cache_root)
+
+        with (
+            patch.object(
+                CacheGarbageCollector, "collect", side_effect=KeyboardInterrupt
+            ),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            run_background_gc(user_config)
+
+        assert run_background_gc(user_config) is not None
+
+    def test_skipped_while_another_run_holds_lock(self, cache_root):
+        """Test concurrent background runs do not both collect."""
+        user_config = self._user_config(cache_root)
+        lock = _background_gc_lock(user_config)
+        assert lock.acquire(blocking=False)
+        try:
+            assert run_background_gc(user_config) is None
+            with patch("glovebox.core.cache.gc.subprocess.Popen") as mock_popen:
+                assert start_background_gc(user_config) is False
+            assert not mock_popen.called
+        finally:
+            lock.release()
+
+    def test_start_runs_detached_process(self, cache_root):
+        """Test GC is started in its own session when due."""
+        user_config = self._user_config(cache_root)
+
+        with patch("glovebox.core.cache.gc.subprocess.Popen") as mock_popen:
+            assert start_background_gc(user_config) is True
+
+        command = mock_popen.call_args.args[0]
+        assert "run_background_gc" in command[2]
+        assert mock_popen.call_args.kwargs["start_new_session"] is True
+
+        run_background_gc(user_config)
+        with patch("glovebox.core.cache.gc.subprocess.Popen") as mock_popen:
+            assert start_background_gc(user_config) is False
+
+    def test_disabled_with_zero_interval(self, cache_root):
+        """Test a zero interval disables background GC."""
+        user_config = self._user_config(cache_root, interval_hours=0)
+        assert run_background_gc(user_config) is None
+
+    def test_lru_keeps_reads_read_only(self):
+        """Test the default policy does not make DiskCache update on reads."""
+        assert DISKCACHE_EVICTION_POLICIES["lru"] == "least-recently-stored"
+
+    def test_create_cache_gc_uses_user_config(self, cache_root):
+        """Test factory reads budget and policy from user config."""
+        collector = create_cache_gc(self._user_config(cache_root), policy="size")
+
+        assert collector.config.max_total_bytes == 20 * 1024**3
+        assert collector.config.policy == "size"
+        assert collector.cache_root == cache_root
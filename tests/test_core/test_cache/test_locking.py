@@ -0,0 +1,170 @@
+"""Tests for cross-process cache locking and atomic directory publishing."""
+
+import json
+import multiprocessing
+import time
+
+import pytest
+
+from glovebox.core.cache import locking
+from glovebox.core.cache.locking import (
+    CacheLock,
+    create_staging_directory,
+    directory_lock,
+    lock_path_for,
+    publish_directory,
+)
+from glovebox.core.errors import CacheLockTimeoutError
+
+
+def _hold_lock(lock_path, ready, release):
+    """Hold an exclusive lock in a child process until told to release."""
+    with CacheLock(lock_path):
+        ready.set()
+        release.wait(10)
+
+
+def _populate_once(lock_path, target, counter_path):
+    """Populate target under the lock unless another process already did."""
+    with CacheLock(lock_path, timeout=10):
+        if target.exists():
+            return
+        with counter_path.open("a") as counter:
+            counter.write("x")
+        staging = create_staging_directory(target)
+        (staging / "data.txt").write_text("content")
+        time.sleep(0.2)
+        publish_directory(staging, target)
+
+
+class TestCacheLock:
+    """Test CacheLock behavior."""
+
+    def test_exclusive_excludes_other_holders(self, tmp_path):
+        """Test a second exclusive lock cannot be taken while one is held."""
+        lock_path = tmp_path / "entry.lock"
+        with CacheLock(lock_path):
+            assert CacheLock(lock_path).acquire(blocking=False) is False
+        assert CacheLock(lock_path).acquire(blocking=False) is True
+
+    def test_shared_locks_coexist(self, tmp_path):
+        """Test many readers share the lock but exclude writers."""
+        lock_path = tmp_path / "entry.lock"
+        with CacheLock(lock_path, shared=True), CacheLock(lock_path, shared=True):
+            assert CacheLock(lock_path).acquire(blocking=False) is False
+
+    def test_timeout(self, tmp_path):
+        """Test blocking acquire gives up after the timeout."""
+        lock_path = tmp_path / "entry.lock"
+        with CacheLock(lock_path), pytest.raises(CacheLockTimeoutError):
+            CacheLock(lock_path, timeout=0.3).acquire()
+
+    def test_waits_for_other_process(self, tmp_path):
+        """Test a waiting process gets the lock once the holder releases it."""
+        lock_path = tmp_path / "entry.lock"
+        ready = multiprocessing.Event()
+        release = multiprocessing.Event()
+        holder = multiprocessing.Process(
+            target=_hold_lock, args=(lock_path, ready, release)
+        )
+        holder.start()
+        try:
+            assert ready.wait(10)
+            waiter = CacheLock(lock_path, timeout=10)
+            assert waiter.acquire(blocking=False) is False
+
+            release.set()
+            assert waiter.acquire() is True
+            waiter.release()
+        finally:
+            release.set()
+            holder.join(10)
+
+    def test_lock_released_when_holder_dies(self, tmp_path):
+        """Test locks of killed processes are recovered."""
+        lock_path = tmp_path / "entry.lock"
+        ready = multiprocessing.Event()
+        release = multiprocessing.Event()
+        holder = multiprocessing.Process(
+            target=_hold_lock, args=(lock_path, ready, release)
+        )
+        holder.start()
+        assert ready.wait(10)
+        holder.kill()
+        holder.join(10)
+
+        assert CacheLock(lock_path, timeout=5).acquire() is True
+
+    def test_fallback_recovers_stale_lock(self, tmp_path, monkeypatch):
+        """Test the lock-file fallback removes locks of dead processes."""
+        monkeypatch.setattr(locking, "_HAS_FCNTL", False)
+        lock_path = tmp_path / "entry.lock"
+        lock_path.write_text(
+            json.dumps({"pid": 2**22 + 1, "host": locking.socket.gethostname()})
+        )
+
+        lock = CacheLock(lock_path, timeout=2)
+        assert lock.acquire() is True
+        assert json.loads(lock_path.read_text())["pid"] == locking.os.getpid()
+        lock.release()
+        assert not lock_path.exists()
+
+    def test_fallback_respects_live_owner(self, tmp_path, monkeypatch):
+        """Test the lock-file fallback does not steal live locks."""
+        monkeypatch.setattr(locking, "_HAS_FCNTL", False)
+        lock_path = tmp_path / "entry.lock"
+        with CacheLock(lock_path):
+            assert CacheLock(lock_path).acquire(blocking=False) is False
+
+
+class TestPublishDirectory:
+    """Test atomic directory publishing."""
+
+    def test_publish_replaces_previous_version(self, tmp_path):
+        """Test publishing swaps in the new content and removes the old."""
+        target = tmp_path / "builds" / "key"
+        target.mkdir(parents=True)
+        (target / "old.txt").write_text("old")
+
+        staging = create_staging_directory(target)
+        (staging / "new.txt").write_text("new")
+        publish_directory(staging, target)
+
+        assert sorted(p.name for p in target.iterdir()) == ["new.txt"]
+        assert not staging.exists()
+        assert [
+            p.name for p in target.parent.iterdir() if not p.name.startswith(".")
+        ] == ["key"]
+
+    def test_publish_waits_for_readers(self, tmp_path):
+        """Test publishing cannot swap a directory a reader holds."""
+        target = tmp_path / "key"
+        target.mkdir()
+        staging = create_staging_directory(target)
+
+        with directory_lock(target, shared=True):
+            writer = CacheLock(lock_path_for(target))
+            assert writer.acquire(blocking=False) is False
+
+        publish_directory(staging, target)
+        assert target.exists()
+
+    def test_concurrent_population_runs_once(self, tmp_path):
+        """Test parallel processes share one population of a cache entry."""
+        target = tmp_path / "workspace" / "key"
+        lock_path = lock_path_for(target, "populate-key")
+        counter_path = tmp_path / "populations"
+
+        workers = [
+            multiprocessing.Process(
+                target=_populate_once, args=(lock_path, target, counter_path)
+            )
+            for _ in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(20)
+
+        assert counter_path.read_text() == "x"
+        assert (target / "data.txt").read_text() == "content"
@@ -0,0 +1,234 @@
+"""Tests for the in-memory LRU tier and TieredCacheManager."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from glovebox.core.cache.cache_coordinator import (
+    get_shared_cache_instance,
+    reset_shared_cache_instances,
+)
+from glovebox.core.cache.diskcache_manager import DiskCacheManager
+from glovebox.core.cache.memory_cache import MemoryLRUCache
+from glovebox.core.cache.models import DiskCacheConfig, MemoryCacheConfig
+from glovebox.core.cache.tiered_cache import TieredCacheManager
+
+
+@pytest.fixture
+def tiered_cache(tmp_path):
+    """Create a tiered cache manager."""
+    config = DiskCacheConfig(cache_path=tmp_path / "tiered", timeout=5)
+    manager = TieredCacheManager(config, tag="test")
+    yield manager
+    manager.close()
+
+
+class TestMemoryLRUCache:
+    """Test the bounded in-process store."""
+
+    def test_returns_copies(self):
+        """Test that mutating a returned value does not affect the cache."""
+        store = MemoryLRUCache()
+        store.set("key", {"items": [1, 2]})
+
+        found, value = store.get("key")
+        assert found
+        value["items"].append(3)
+
+        assert store.get("key") == (True, {"items": [1, 2]})
+
+    def test_evicts_by_entry_count(self):
+        """Test least recently used entries are evicted first."""
+        store = MemoryLRUCache(MemoryCacheConfig(max_entries=2))
+        store.set("a", 1)
+        store.set("b", 2)
+        store.get("a")  # "b" becomes least recently used
+        store.set("c", 3)
+
+        assert store.contains("a")
+        assert not store.contains("b")
+        assert store.contains("c")
+        assert store.eviction_count == 1
+
+    def test_evicts_by_size(self):
+        """Test total serialized size stays within the bound."""
+        store = MemoryLRUCache(
+            MemoryCacheConfig(max_size_bytes=3000, max_entry_size_bytes=3000)
+        )
+        for i in range(5):
+            store.set(f"key{i}", "x" * 1000)
+
+        assert store.size_bytes <= 3000
+        assert len(store) < 5
+        assert store.contains("key4")
+
+    def test_skips_oversized_entries(self):
+        """Test values larger than the per-entry bound are not stored."""
+        store = MemoryLRUCache(MemoryCacheConfig(max_entry_size_bytes=100))
+        assert store.set("big", "x" * 1000) is False
+        assert not store.contains("big")
+        assert store.size_bytes == 0
+
+    def test_expiry(self):
+        """Test expired entries are not served."""
+        store = MemoryLRUCache()
+        store.set("key", "value", expire_at=time.time() - 1)
+        assert store.get("key") == (False, None)
+        assert len(store) == 0
+
+    def test_max_ttl_bounds_expiry(self):
+        """Test entries without TTL still expire after max_ttl."""
+        store = MemoryLRUCache(MemoryCacheConfig(max_ttl=10))
+        store.set("key", "value")
+
+        with patch("time.time", return_value=time.time() + 11):
+            assert store.get("key") == (False, None)
+
+
+class TestTieredCacheManager:
+    """Test TieredCacheManager behavior."""
+
+    def test_is_disk_cache_manager(self, tiered_cache):
+        """Test the tiered cache is a drop-in DiskCacheManager."""
+        assert isinstance(tiered_cache, DiskCacheManager)
+
+    def test_write_through(self, tiered_cache):
+        """Test values are persisted to the disk tier."""
+        tiered_cache.set("key", {"value": 1})
+
+        assert tiered_cache._cache.get("key") == {"value": 1}
+        assert tiered_cache._memory.contains("key")
+
+    def test_repeated_get_served_from_memory(self, tiered_cache):
+        """Test repeated reads do not touch DiskCache."""
+        tiered_cache.set("key", "value")
+
+        with patch.object(
+            tiered_cache._cache, "get", side_effect=AssertionError("disk read")
+        ):
+            for _ in range(3):
+                assert tiered_cache.get("key") == "value"
+
+        stats = tiered_cache.get_stats()
+        assert stats.hit_count == 3
+        assert stats.memory_hit_count == 3
+        assert stats.memory_entries == 1
+        assert stats.memory_size_bytes > 0
+
+    def test_disk_hit_promotes_to_memory(self, tiered_cache):
+        """Test disk hits are promoted into the memory tier."""
+        tiered_cache._cache.set("key", "value")
+        assert not tiered_cache._memory.contains("key")
+
+        assert tiered_cache.get("key") == "value"
+        assert tiered_cache._memory.contains("key")
+
+        stats = tiered_cache.get_stats()
+        assert stats.hit_count == 1
+        assert stats.memory_hit_count == 0
+
+    def test_promotion_keeps_disk_ttl(self, tiered_cache):
+        """Test promoted entries expire together with the disk entry."""
+        tiered_cache._cache.set("key", "value", expire=1)
+        assert tiered_cache.get("key") == "value"
+
+        time.sleep(1.1)
+        assert tiered_cache.get("key", "expired") == "expired"
+
+    def test_set_with_ttl(self, tiered_cache):
+        """Test TTL is honored by the memory tier."""
+        tiered_cache.set("key", "value", ttl=1)
+        assert tiered_cache.get("key") == "value"
+
+        time.sleep(1.1)
+        assert tiered_cache.get("key", "expired") == "expired"
+        assert not tiered_cache.exists("key")
+
+    def test_delete_and_clear(self, tiered_cache):
+        """Test delete and clear drop both tiers."""
+        tiered_cache.set("a", 1)
+        tiered_cache.set("b", 2)
+
+        assert tiered_cache.delete("a") is True
+        assert tiered_cache.get("a") is None
+
+        tiered_cache.clear()
+        assert tiered_cache.get("b") is None
+        assert len(tiered_cache._memory) == 0
+
+    def test_failed_disk_write_not_cached(self, tiered_cache):
+        """Test a failed disk write leaves nothing in memory."""
+        tiered_cache.set("key", "old")
+
+        with (
+            patch.object(DiskCacheManager, "set", side_effect=OSError("full")),
+            pytest.raises(OSError),
+        ):
+            tiered_cache.set("key", "new")
+
+        assert not tiered_cache._memory.contains("key")
+        assert tiered_cache.get("key") == "old"
+
+    def test_get_many_reads_only_memory_misses(self, tiered_cache):
+        """Test batch get only queries disk for keys not in memory."""
+        tiered_cache.set("hot", "memory")
+        tiered_cache._cache.set("cold", "disk")
+
+        with patch.object(
+            tiered_cache, "_fetch_many", wraps=tiered_cache._fetch_many
+        ) as fetch:
+            result = tiered_cache.get_many(["hot", "cold", "missing"])
+
+        fetch.assert_called_once_with(["cold", "missing"])
+        assert result == {"hot": "memory", "cold": "disk"}
+        assert tiered_cache._memory.contains("cold")
+
+        stats = tiered_cache.get_stats()
+        assert stats.hit_count == 2
+        assert stats.memory_hit_count == 1
+        assert stats.miss_count == 1
+
+    def test_set_many_and_delete_many(self, tiered_cache):
+        """Test batch writes and deletes keep both tiers in sync."""
+        tiered_cache.set_many({"a": 1, "b": 2})
+        assert tiered_cache._memory.contains("a")
+        assert tiered_cache._cache.get("b") == 2
+
+        assert tiered_cache.delete_many(["a", "b"]) == 2
+        assert tiered_cache.get_many(["a", "b"]) == {}
+
+    def test_stats_metrics_dict_includes_memory_tier(self, tiered_cache):
+        """Test memory tier stats are exported with the tag."""
+        tiered_cache.set("key", "value")
+        tiered_cache.get("key")
+
+        metrics = tiered_cache.get_stats().to_metrics_dict()
+        assert metrics["tag"] == "test"
+        assert metrics["memory_hit_count"] == 1
+        assert metrics["memory_hit_rate"] == 100.0
+
+
+class TestSharedTieredInstance:
+    """Test backend selection through get_shared_cache_instance."""
+
+    def setup_method(self):
+        reset_shared_cache_instances()
+
+    def teardown_method(self):
+        reset_shared_cache_instances()
+
+    def test_tiered_backend(self, tmp_path):
+        """Test tiered backend creates a TieredCacheManager."""
+        cache = get_shared_cache_instance(tmp_path, tag="library", backend="tiered")
+        assert isinstance(cache, TieredCacheManager)
+
+    def test_disk_backend_default(self, tmp_path):
+        """Test default backend is plain DiskCache."""
+        cache = get_shared_cache_instance(tmp_path, tag="library")
+        assert type(cache) is DiskCacheManager
+
+    def test_invalid_backend(self, tmp_path):
+        """Test unknown backends are rejected."""
+        with pytest.raises(ValueError, match="Cache backend must be one of"):
+            get_shared_cache_instance(tmp_path, tag="library", backend="redis")
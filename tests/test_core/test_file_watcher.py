@@ -0,0 +1,119 @@
+"""Tests for file watching."""
+
+import os
+import sys
+import threading
+
+import pytest
+
+from glovebox.core.file_watcher import (
+    InotifyFileWatcher,
+    PollingFileWatcher,
+    content_digest,
+    watch_files,
+)
+
+
+def _bump(path, content):
+    """Rewrite a file and move its mtime forward so polling sees it."""
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestPollingFileWatcher:
+    """Test the polling watcher."""
+
+    def test_detects_change(self, tmp_path):
+        """Test a modified file is reported."""
+        path = tmp_path / "layout.json"
+        path.write_text("{}")
+        watcher = PollingFileWatcher([path], interval=0.01)
+
+        assert watcher.wait(timeout=0.05) == set()
+        _bump(path, '{"a": 1}')
+        assert watcher.wait(timeout=1) == {path.resolve()}
+        assert watcher.wait(timeout=0.05) == set()
+
+    def test_detects_deletion(self, tmp_path):
+        """Test a deleted file is reported."""
+        path = tmp_path / "layout.json"
+        path.write_text("{}")
+        watcher = PollingFileWatcher([path], interval=0.01)
+
+        path.unlink()
+        assert watcher.wait(timeout=1) == {path.resolve()}
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux")
+class TestInotifyFileWatcher:
+    """Test the inotify watcher."""
+
+    def test_detects_write_and_ignores_siblings(self, tmp_path):
+        """Test writes to the watched file are reported, other files are not."""
+        path = tmp_path / "layout.json"
+        path.write_text("{}")
+        watcher = InotifyFileWatcher([path])
+        try:
+            (tmp_path / "other.json").write_text("{}")
+            assert watcher.wait(timeout=0.1) == set()
+
+            path.write_text('{"a": 1}')
+            assert watcher.wait(timeout=1) == {path.resolve()}
+        finally:
+            watcher.close()
+
+    def test_detects_atomic_rename(self, tmp_path):
+        """Test an editor-style save through a temporary file is reported."""
+        path = tmp_path / "layout.json"
+        path.write_text("{}")
+        watcher = InotifyFileWatcher([path])
+        try:
+            temp = tmp_path / ".layout.json.swp"
+            temp.write_text('{"a": 1}')
+            temp.replace(path)
+            assert path.resolve() in watcher.wait(timeout=1)
+        finally:
+            watcher.close()
+
+
+class TestWatchFiles:
+    """Test the debounced watch loop."""
+
+    def test_burst_collapses_into_one_call(self, tmp_path):
+        """Test several quick changes lead to a single callback."""
+        path = tmp_path / "layout.json"
+        path.write_text("{}")
+        watcher = PollingFileWatcher([path], interval=0.01)
+        stop = threading.Event()
+        calls = []
+
+        def on_change(changed):
+            calls.append(changed)
+            stop.set()
+
+        thread = threading.Thread(
+            target=watch_files,
+            args=([path], on_change),
+            kwargs={"debounce": 0.2, "stop_event": stop, "watcher": watcher},
+        )
+        thread.start()
+        for i in range(3):
+            _bump(path, f'{{"n": {i}}}')
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert calls == [{path.resolve()}]
+
+
+def test_content_digest_tracks_content_only(tmp_path):
+    """Test the digest changes with content but not with timestamps."""
+    path = tmp_path / "layout.json"
+    path.write_text("{}")
+    before = content_digest([path])
+
+    _bump(path, "{}")
+    assert content_digest([path]) == before
+    path.write_text('{"a": 1}')
+    assert content_digest([path]) != before
+    assert content_digest([tmp_path / "missing.json"]) != content_digest([])
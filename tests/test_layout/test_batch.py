@@ -0,0 +1,198 @@
+"""Tests for batch layout compilation."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from glovebox.adapters import create_file_adapter, create_template_adapter
+from glovebox.core.errors import LayoutError
+from glovebox.layout import (
+    ZmkFileContentGenerator,
+    create_behavior_registry,
+    create_grid_layout_formatter,
+    create_layout_component_service,
+    create_layout_display_service,
+    create_layout_service,
+)
+from glovebox.layout.batch import (
+    BatchLayoutCompiler,
+    collect_batch_inputs,
+    summarize_batch,
+)
+from glovebox.layout.behavior.formatter import BehaviorFormatterImpl
+
+
+def _create_service():
+    file_adapter = create_file_adapter()
+    behavior_registry = create_behavior_registry()
+    behavior_formatter = BehaviorFormatterImpl(behavior_registry)
+    return create_layout_service(
+        file_adapter=file_adapter,
+        template_adapter=create_template_adapter(),
+        behavior_registry=behavior_registry,
+        component_service=create_layout_component_service(file_adapter),
+        layout_service=create_layout_display_service(create_grid_layout_formatter()),
+        behavior_formatter=behavior_formatter,
+        dtsi_generator=ZmkFileContentGenerator(behavior_formatter),
+        keymap_parser=Mock(),
+    )
+
+
+def _write_layout(path, key):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {
+                "keyboard": "glove80",
+                "title": path.stem,
+                "layer_names": ["Base"],
+                "layers": [[f"&kp {key}"] * 80],
+            }
+        )
+    )
+    return path
+
+
+@pytest.fixture
+def layouts_dir(tmp_path):
+    """Directory with two valid glove80 layouts."""
+    layouts = tmp_path / "layouts"
+    _write_layout(layouts / "alpha.json", "A")
+    _write_layout(layouts / "beta.json", "B")
+    return layouts
+
+
+class TestCollectBatchInputs:
+    """Test resolving batch sources into layout files."""
+
+    def test_directory(self, layouts_dir):
+        """Test a directory yields its JSON files in sorted order."""
+        (layouts_dir / "notes.txt").write_text("ignored")
+
+        assert collect_batch_inputs(layouts_dir) == [
+            layouts_dir / "alpha.json",
+            layouts_dir / "beta.json",
+        ]
+
+    def test_glob_pattern(self, layouts_dir):
+        """Test a glob pattern yields matching files."""
+        assert collect_batch_inputs(str(layouts_dir / "b*.json")) == [
+            layouts_dir / "beta.json"
+        ]
+
+    def test_list_file(self, layouts_dir, tmp_path):
+        """Test a list file resolves relative entries and skips comments."""
+        list_file = tmp_path / "batch.txt"
+        list_file.write_text(
+            "# nightly layouts\nlayouts/beta.json\n\nlayouts/alpha.json\n"
+            "layouts/beta.json\n"
+        )
+
+        assert collect_batch_inputs(list_file) == [
+            layouts_dir / "beta.json",
+            layouts_dir / "alpha.json",
+        ]
+
+    def test_missing_source(self, tmp_path):
+        """Test a missing source raises LayoutError."""
+        with pytest.raises(LayoutError, match="not found"):
+            collect_batch_inputs(tmp_path / "missing")
+
+
+class TestBatchLayoutCompiler:
+    """Test compiling layouts in a batch."""
+
+    def test_compiles_each_layout(self, layouts_dir, tmp_path):
+        """Test each layout gets its own keymap and config file."""
+        output = tmp_path / "build"
+        compiler = BatchLayoutCompiler(
+            "glove80", None, output, service_factory=_create_service
+        )
+
+        results = list(compiler.run(collect_batch_inputs(layouts_dir)))
+
+        assert [result.success for result in results] == [True, True]
+        assert "&kp A" in (output / "alpha.keymap").read_text()
+        assert "&kp B" in (output / "beta.keymap").read_text()
+        assert (output / "beta.conf").exists()
+
+    def test_failure_does_not_stop_batch(self, layouts_dir, tmp_path):
+        """Test an invalid layout is reported and the rest still compile."""
+        (layouts_dir / "broken.json").write_text("{not json")
+        compiler = BatchLayoutCompiler(
+            "glove80", None, tmp_path / "build", service_factory=_create_service
+        )
+
+        results = {
+            result.source.name: result
+            for result in compiler.run(collect_batch_inputs(layouts_dir))
+        }
+
+        assert not results["broken.json"].success
+        assert results["broken.json"].error
+        assert results["alpha.json"].success
+        assert summarize_batch(list(results.values()), 1.0)["failed"] == 1
+
+    def test_invalid_layout_is_reported_per_file(self, layouts_dir, tmp_path):
+        """Test a layout failing validation is a per-file failure."""
+        (layouts_dir / "invalid.json").write_text(json.dumps({"layers": "oops"}))
+        compiler = BatchLayoutCompiler(
+            "glove80", None, tmp_path / "build", service_factory=_create_service
+        )
+
+        results = {
+            result.source.name: result
+            for result in compiler.run(collect_batch_inputs(layouts_dir))
+        }
+
+        assert not results["invalid.json"].success
+        assert results["invalid.json"].error.startswith("Invalid layout format")
+        assert results["beta.json"].success
+
+    def test_single_job_uses_loaded_profile(self, layouts_dir, tmp_path):
+        """Test a single job compiles with the given profile without reloading it."""
+        from glovebox.config import create_keyboard_profile
+        from glovebox.layout import batch
+
+        profile = create_keyboard_profile("glove80")
+        compiler = BatchLayoutCompiler(
+            "glove80",
+            None,
+            tmp_path / "build",
+            service_factory=_create_service,
+            profile=profile,
+        )
+
+        with patch.object(batch, "_load_profile", side_effect=AssertionError):
+            results = list(compiler.run(collect_batch_inputs(layouts_dir)))
+
+        assert all(result.success for result in results)
+        assert batch._worker is None
+
+    def test_duplicate_output_names_rejected(self, layouts_dir, tmp_path):
+        """Test layouts that would overwrite each other's outputs are rejected."""
+        other = _write_layout(tmp_path / "other" / "alpha.json", "C")
+        compiler = BatchLayoutCompiler(
+            "glove80", None, tmp_path / "build", service_factory=_create_service
+        )
+
+        with pytest.raises(LayoutError, match="alpha"):
+            list(compiler.run([layouts_dir / "alpha.json", other]))
+
+    def test_worker_pool(self, layouts_dir, tmp_path):
+        """Test a process pool produces the same outputs as a single job."""
+        serial = tmp_path / "serial"
+        pooled = tmp_path / "pooled"
+        layouts = collect_batch_inputs(layouts_dir)
+
+        list(BatchLayoutCompiler("glove80", None, serial, _create_service).run(layouts))
+        results = list(
+            BatchLayoutCompiler("glove80", None, pooled, _create_service, jobs=2).run(
+                layouts
+            )
+        )
+
+        assert all(result.success for result in results)
+        for name in ("alpha.keymap", "beta.keymap", "alpha.conf"):
+            assert (pooled / name).read_text() == (serial / name).read_text()
@@ -0,0 +1,181 @@
+"""Tests for the structural layout diff engine."""
+
+import copy
+from typing import Any
+
+import pytest
+
+from glovebox.layout.diffing.diff import LayoutDiffSystem
+from glovebox.layout.diffing.patch import LayoutPatchSystem
+from glovebox.layout.diffing.structural import (
+    LayoutChange,
+    iter_json_patch,
+    iter_layout_changes,
+)
+from glovebox.layout.models import LayoutData
+
+
+def _kp(key: str) -> dict[str, Any]:
+    return {"value": "&kp", "params": [{"value": key, "params": []}]}
+
+
+@pytest.fixture
+def base_data() -> dict[str, Any]:
+    """Layout data with a few layers and behaviors."""
+    return {
+        "keyboard": "glove80",
+        "title": "Base",
+        "layer_names": ["Base", "Lower", "Raise"],
+        "layers": [
+            [_kp("A"), _kp("B"), {"value": "&trans", "params": []}],
+            [_kp("N1"), _kp("N2"), _kp("N3")],
+            [_kp("F1"), _kp("F2"), _kp("F3")],
+        ],
+        "holdTaps": [
+            {"name": "&hm", "bindings": ["&kp", "&kp"], "tappingTermMs": 200},
+            {"name": "&ht", "bindings": ["&kp", "&kp"], "tappingTermMs": 180},
+        ],
+        "macros": [{"name": "&hello", "bindings": [_kp("H"), _kp("I")]}],
+    }
+
+
+def _diff(base: dict[str, Any], modified: dict[str, Any]) -> list[LayoutChange]:
+    return list(
+        iter_layout_changes(
+            LayoutData.model_validate(base), LayoutData.model_validate(modified)
+        )
+    )
+
+
+def test_identical_layouts_have_no_changes(base_data: dict[str, Any]) -> None:
+    """Equal layouts yield nothing."""
+    assert _diff(base_data, copy.deepcopy(base_data)) == []
+
+
+def test_binding_change_patches_only_that_position(base_data: dict[str, Any]) -> None:
+    """Bindings are compared positionally within a layer."""
+    modified = copy.deepcopy(base_data)
+    modified["layers"][1][2] = _kp("N9")
+
+    changes = _diff(base_data, modified)
+
+    assert changes == [
+        LayoutChange(
+            "layers",
+            "modified",
+            {
+                "Lower": {
+                    "patch": [
+                        {"op": "replace", "path": "/2/params/0/value", "value": "N9"}
+                    ],
+                    "original_position": 1,
+                    "new_position": 1,
+                    "position_changed": False,
+                }
+            },
+        )
+    ]
+
+
+def test_layers_are_aligned_by_name(base_data: dict[str, Any]) -> None:
+    """Reordering and adding layers does not diff unrelated bindings."""
+    modified = copy.deepcopy(base_data)
+    modified["layer_names"] = ["Base", "Raise", "Lower", "Mouse"]
+    modified["layers"] = [
+        base_data["layers"][0],
+        base_data["layers"][2],
+        base_data["layers"][1],
+        [_kp("M1")],
+    ]
+
+    changes = _diff(base_data, modified)
+
+    added = [c.value for c in changes if c.kind == "added"]
+    modified_layers = [c.value for c in changes if c.kind == "modified"]
+    assert added == [{"name": "Mouse", "data": [_kp("M1")], "new_position": 3}]
+    assert [list(entry) for entry in modified_layers] == [["Lower"], ["Raise"]]
+    assert all(
+        entry["patch"] == [] and entry["position_changed"]
+        for value in modified_layers
+        for entry in value.values()
+    )
+
+
+def test_behaviors_are_matched_by_name(base_data: dict[str, Any]) -> None:
+    """Behaviors are added, removed and patched by name, not position."""
+    modified = copy.deepcopy(base_data)
+    modified["holdTaps"] = [
+        {"name": "&ht", "bindings": ["&kp", "&kp"], "tappingTermMs": 150},
+        {"name": "&new", "bindings": ["&mo", "&kp"]},
+    ]
+
+    changes = [c for c in _diff(base_data, modified) if c.section == "holdTaps"]
+
+    assert [c.kind for c in changes] == ["removed", "added", "modified"]
+    assert changes[0].value == {"name": "&hm", "data": []}
+    assert changes[1].value["name"] == "&new"
+    assert changes[1].value["data"]["bindings"] == ["&mo", "&kp"]
+    assert changes[2].value == {
+        "&ht": [{"op": "replace", "path": "/tappingTermMs", "value": 150}]
+    }
+
+
+def test_simple_field_changes(base_data: dict[str, Any]) -> None:
+    """Simple fields produce JSON patches relative to the field."""
+    modified = copy.deepcopy(base_data)
+    modified["title"] = "Modified"
+
+    assert _diff(base_data, modified) == [
+        LayoutChange(
+            "title", "patch", [{"op": "replace", "path": "", "value": "Modified"}]
+        )
+    ]
+
+
+def test_changes_are_streamed(base_data: dict[str, Any]) -> None:
+    """Consumers can stop at the first change."""
+    modified = copy.deepcopy(base_data)
+    modified["layers"][0][0] = _kp("Z")
+
+    changes = iter_layout_changes(
+        LayoutData.model_validate(base_data), LayoutData.model_validate(modified)
+    )
+
+    assert next(changes).section == "layers"
+
+
+def test_json_patch_list_operations_apply_in_order() -> None:
+    """List removals run from the end so indices stay valid."""
+    patch = list(iter_json_patch({"a": [1, 2, 3, 4]}, {"a": [1, 5]}))
+
+    assert patch == [
+        {"op": "replace", "path": "/a/1", "value": 5},
+        {"op": "remove", "path": "/a/3"},
+        {"op": "remove", "path": "/a/2"},
+    ]
+
+
+def test_layout_diff_round_trips_through_patch_system(
+    base_data: dict[str, Any],
+) -> None:
+    """Applying the diff to the base layout reproduces the modified layout."""
+    modified = copy.deepcopy(base_data)
+    modified["title"] = "Modified"
+    modified["layers"][0][1] = {
+        "value": "&mt",
+        "params": [{"value": "LSHIFT", "params": []}, {"value": "B", "params": []}],
+    }
+    modified["layers"][2].append(_kp("F4"))
+    modified["holdTaps"][0]["tappingTermMs"] = 220
+    modified["macros"].append({"name": "&bye", "bindings": [_kp("B")]})
+
+    base_layout = LayoutData.model_validate(base_data)
+    modified_layout = LayoutData.model_validate(modified)
+    diff = LayoutDiffSystem().create_layout_diff(base_layout, modified_layout)
+
+    patched = LayoutPatchSystem().apply_patch(base_layout, diff)
+
+    assert patched.title == "Modified"
+    assert patched.layers == modified_layout.layers
+    assert patched.hold_taps == modified_layout.hold_taps
+    assert [macro.name for macro in patched.macros] == ["&hello", "&bye"]
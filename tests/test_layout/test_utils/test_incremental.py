@@ -0,0 +1,242 @@
+"""Tests for incremental keymap generation with cached sections."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from glovebox.adapters import create_file_adapter, create_template_adapter
+from glovebox.config.models import (
+    FormattingConfig,
+    KConfigOption,
+    KeyboardConfig,
+    KeymapSection,
+)
+from glovebox.config.models.zmk import ZmkConfig, ZmkPatterns
+from glovebox.config.profile import KeyboardProfile
+from glovebox.core.cache import create_diskcache_manager
+from glovebox.layout import (
+    ZmkFileContentGenerator,
+    create_behavior_registry,
+    create_grid_layout_formatter,
+    create_layout_component_service,
+    create_layout_display_service,
+    create_layout_service,
+)
+from glovebox.layout.behavior.formatter import BehaviorFormatterImpl
+from glovebox.layout.behavior.models import SystemBehavior
+from glovebox.layout.models import LayoutData
+from glovebox.layout.utils.incremental import section_fingerprints
+
+
+@pytest.fixture
+def profile() -> KeyboardProfile:
+    """Four key keyboard profile with a kconfig option."""
+    keyboard_config = KeyboardConfig(
+        keyboard="test_keyboard",
+        description="Test keyboard",
+        vendor="TestVendor",
+        key_count=4,
+        keymap=KeymapSection(
+            header_includes=["dt-bindings/zmk/keys.h"],
+            formatting=FormattingConfig(key_gap=" ", rows=[[0, 1], [2, 3]]),
+            system_behaviors=[
+                SystemBehavior(
+                    code="&bt",
+                    name="&bt",
+                    description=None,
+                    expected_params=1,
+                    origin="zmk",
+                    params=[],
+                    includes=["dt-bindings/zmk/bt.h"],
+                )
+            ],
+            kconfig_options={
+                "SLEEP": KConfigOption(
+                    name="CONFIG_ZMK_SLEEP",
+                    type="bool",
+                    default=False,
+                    description="Enable sleep",
+                )
+            },
+        ),
+        zmk=ZmkConfig(
+            patterns=ZmkPatterns(
+                layer_define="#define LAYER_{layer_name} {layer_index}"
+            )
+        ),
+        firmwares={},
+    )
+    return KeyboardProfile(keyboard_config, firmware_version=None)
+
+
+@pytest.fixture
+def layout_data() -> dict:
+    """Two layer layout with a hold-tap, combo and kconfig parameter."""
+    return {
+        "keyboard": "test_keyboard",
+        "title": "Incremental",
+        "layer_names": ["Base", "Lower"],
+        "layers": [
+            ["&kp A", "&kp B", "&mo 1", "&hm LSHFT C"],
+            ["&bt BT_CLR", "&kp LC(X)", "&trans", "&trans"],
+        ],
+        "holdTaps": [
+            {
+                "name": "&hm",
+                "description": "Home row mod",
+                "bindings": ["&kp", "&kp"],
+                "tappingTermMs": 200,
+            }
+        ],
+        "combos": [
+            {
+                "name": "esc",
+                "keyPositions": [0, 1],
+                "binding": {"value": "&kp", "params": [{"value": "ESC"}]},
+            }
+        ],
+        "config_parameters": [{"paramName": "SLEEP", "value": True}],
+        "custom_devicetree": "/ { chosen { }; };",
+    }
+
+
+def _create_service(section_cache=None):
+    file_adapter = create_file_adapter()
+    behavior_registry = create_behavior_registry()
+    behavior_formatter = BehaviorFormatterImpl(behavior_registry)
+    return create_layout_service(
+        file_adapter=file_adapter,
+        template_adapter=create_template_adapter(),
+        behavior_registry=behavior_registry,
+        component_service=create_layout_component_service(file_adapter),
+        layout_service=create_layout_display_service(create_grid_layout_formatter()),
+        behavior_formatter=behavior_formatter,
+        dtsi_generator=ZmkFileContentGenerator(behavior_formatter),
+        keymap_parser=Mock(),
+        section_cache=section_cache,
+    )
+
+
+@pytest.fixture
+def section_cache(tmp_path):
+    """Disk cache for rendered sections."""
+    return create_diskcache_manager(tmp_path / "cache", tag="layout_sections")
+
+
+class TestSectionFingerprints:
+    """Test which inputs invalidate which sections."""
+
+    def test_layer_edit_only_changes_layer_sections(self, profile, layout_data):
+        """Test editing a binding leaves unrelated sections untouched."""
+        before = section_fingerprints(LayoutData.model_validate(layout_data), profile)
+        layout_data["layers"][1][2] = "&kp Z"
+        after = section_fingerprints(LayoutData.model_validate(layout_data), profile)
+
+        changed = {section for section in before if before[section] != after[section]}
+        assert changed == {"keymap_node", "resolved_includes"}
+
+    def test_behavior_edit_changes_keymap_node(self, profile, layout_data):
+        """Test editing a hold-tap invalidates the keymap node using it."""
+        before = section_fingerprints(LayoutData.model_validate(layout_data), profile)
+        layout_data["holdTaps"][0]["bindings"] = ["&kp", "&mo"]
+        after = section_fingerprints(LayoutData.model_validate(layout_data), profile)
+
+        changed = {section for section in before if before[section] != after[section]}
+        assert {"keymap_node", "user_behaviors_dtsi"} <= changed
+        assert "kconfig" not in changed
+
+    def test_profile_change_invalidates_all(self, profile, layout_data):
+        """Test a different profile changes every fingerprint."""
+        keymap_data = LayoutData.model_validate(layout_data)
+        before = section_fingerprints(keymap_data, profile)
+        profile.keyboard_config.keymap.formatting.key_gap = "  "
+        after = section_fingerprints(keymap_data, profile)
+
+        assert all(before[section] != after[section] for section in before)
+
+
+class TestIncrementalCompile:
+    """Test LayoutService.compile in incremental mode."""
+
+    def test_output_identical_to_full_compile(
+        self, profile, layout_data, section_cache
+    ):
+        """Test cold and warm incremental compiles match a full compile."""
+        full = _create_service().compile(layout_data, profile=profile)
+
+        service = _create_service(section_cache)
+        cold = service.compile(layout_data, profile=profile, incremental=True)
+        warm = _create_service(section_cache).compile(
+            layout_data, profile=profile, incremental=True
+        )
+
+        assert cold.keymap_content == warm.keymap_content == full.keymap_content
+        assert cold.config_content == warm.config_content == full.config_content
+        assert "CONFIG_ZMK_SLEEP=" in full.config_content
+        assert "/ { chosen { }; };" in full.keymap_content
+
+    def test_unchanged_layout_generates_nothing(
+        self, profile, layout_data, section_cache
+    ):
+        """Test a warm compile of the same layout reuses every section."""
+        _create_service(section_cache).compile(
+            layout_data, profile=profile, incremental=True
+        )
+
+        with (
+            patch.object(ZmkFileContentGenerator, "generate_keymap_node") as keymap,
+            patch("glovebox.layout.utils.incremental.generate_kconfig_conf") as kconfig,
+        ):
+            _create_service(section_cache).compile(
+                layout_data, profile=profile, incremental=True
+            )
+
+        assert not keymap.called
+        assert not kconfig.called
+
+    def test_only_dirty_sections_regenerated(self, profile, layout_data, section_cache):
+        """Test editing a layer regenerates the keymap node but not combos."""
+        _create_service(section_cache).compile(
+            layout_data, profile=profile, incremental=True
+        )
+        layout_data["layers"][0][0] = "&kp Q"
+
+        service = _create_service(section_cache)
+        with patch.object(ZmkFileContentGenerator, "generate_combos_dtsi") as combos:
+            result = service.compile(layout_data, profile=profile, incremental=True)
+
+        full = _create_service().compile(layout_data, profile=profile)
+        assert not combos.called
+        assert result.keymap_content == full.keymap_content
+        assert "&kp Q" in result.keymap_content
+
+    def test_macro_edit_regenerates_keymap_node(
+        self, profile, layout_data, section_cache
+    ):
+        """Test editing a macro without touching layers regenerates the keymap node."""
+        layout_data["macros"] = [
+            {
+                "name": "&greet",
+                "bindings": [{"value": "&kp", "params": [{"value": "H"}]}],
+                "params": ["code"],
+            }
+        ]
+        layout_data["layers"][0][1] = "&greet A"
+        _create_service(section_cache).compile(
+            layout_data, profile=profile, incremental=True
+        )
+        layout_data["macros"][0]["params"] = []
+
+        with patch.object(
+            ZmkFileContentGenerator,
+            "generate_keymap_node",
+            autospec=True,
+            side_effect=ZmkFileContentGenerator.generate_keymap_node,
+        ) as keymap:
+            result = _create_service(section_cache).compile(
+                layout_data, profile=profile, incremental=True
+            )
+
+        full = _create_service().compile(layout_data, profile=profile)
+        assert keymap.called
+        assert result.keymap_content == full.keymap_content
@@ -0,0 +1,112 @@
+"""Tests for recompiling layouts in watch mode."""
+
+import json
+from unittest.mock import Mock
+
+from glovebox.adapters import create_file_adapter, create_template_adapter
+from glovebox.config import create_keyboard_profile
+from glovebox.layout import (
+    ZmkFileContentGenerator,
+    create_behavior_registry,
+    create_grid_layout_formatter,
+    create_layout_component_service,
+    create_layout_display_service,
+    create_layout_service,
+)
+from glovebox.layout.behavior.formatter import BehaviorFormatterImpl
+from glovebox.layout.watch import LayoutWatchCompiler
+
+
+def _create_service():
+    file_adapter = create_file_adapter()
+    behavior_registry = create_behavior_registry()
+    behavior_formatter = BehaviorFormatterImpl(behavior_registry)
+    return create_layout_service(
+        file_adapter=file_adapter,
+        template_adapter=create_template_adapter(),
+        behavior_registry=behavior_registry,
+        component_service=create_layout_component_service(file_adapter),
+        layout_service=create_layout_display_service(create_grid_layout_formatter()),
+        behavior_formatter=behavior_formatter,
+        dtsi_generator=ZmkFileContentGenerator(behavior_formatter),
+        keymap_parser=Mock(),
+    )
+
+
+def _layout(key, title="watched"):
+    return json.dumps(
+        {
+            "keyboard": "glove80",
+            "title": title,
+            "layer_names": ["Base"],
+            "layers": [[f"&kp {key}"] * 80],
+        }
+    )
+
+
+def _compiler(tmp_path, service=None):
+    layout = tmp_path / "layout.json"
+    layout.write_text(_layout("A"))
+    return LayoutWatchCompiler(
+        layout,
+        tmp_path / "build" / "layout",
+        create_keyboard_profile("glove80"),
+        service or _create_service(),
+    )
+
+
+class TestLayoutWatchCompiler:
+    """Test content-hash driven recompilation."""
+
+    def test_compiles_and_skips_unchanged_content(self, tmp_path):
+        """Test the first call compiles and an identical save is skipped."""
+        service = _create_service()
+        service.compile = Mock(wraps=service.compile)
+        compiler = _compiler(tmp_path, service)
+
+        result = compiler.compile_if_changed()
+        assert result is not None and result.success
+        assert "&kp A" in compiler.keymap_path.read_text()
+        assert compiler.conf_path.exists()
+        assert compiler.layout_data is not None
+
+        compiler.layout_path.write_text(_layout("A"))
+        assert compiler.compile_if_changed() is None
+        assert service.compile.call_count == 1
+
+    def test_recompiles_on_change(self, tmp_path):
+        """Test a content change triggers a new compile."""
+        compiler = _compiler(tmp_path)
+        compiler.compile_if_changed()
+
+        compiler.layout_path.write_text(_layout("B"))
+        result = compiler.compile_if_changed()
+
+        assert result is not None and result.success
+        assert "&kp B" in compiler.keymap_path.read_text()
+
+    def test_unchanged_outputs_are_not_rewritten(self, tmp_path):
+        """Test outputs with identical content keep their modification time."""
+        compiler = _compiler(tmp_path)
+        compiler.compile_if_changed()
+        conf_mtime = compiler.conf_path.stat().st_mtime_ns
+
+        compiler.layout_path.write_text(_layout("B"))
+        compiler.compile_if_changed()
+
+        assert compiler.conf_path.stat().st_mtime_ns == conf_mtime
+
+    def test_invalid_json_is_reported_and_retried(self, tmp_path):
+        """Test a broken save fails without losing the last good state."""
+        compiler = _compiler(tmp_path)
+        compiler.compile_if_changed()
+
+        compiler.layout_path.write_text("{not json")
+        result = compiler.compile_if_changed()
+        assert result is not None and not result.success
+        assert "Invalid JSON" in result.errors[0]
+        assert compiler.compile_if_changed() is not None
+
+        compiler.layout_path.write_text(_layout("C"))
+        result = compiler.compile_if_changed()
+        assert result is not None and result.success
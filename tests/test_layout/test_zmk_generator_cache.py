@@ -0,0 +1,139 @@
+"""Tests for binding memoization and layer caching in keymap generation."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from glovebox.config.models.keyboard import FormattingConfig
+from glovebox.layout.behavior.formatter import BehaviorFormatterImpl
+from glovebox.layout.behavior.service import create_behavior_registry
+from glovebox.layout.models import LayoutBinding, SystemBehavior
+from glovebox.layout.zmk_generator import ZmkFileContentGenerator
+
+
+@pytest.fixture
+def profile():
+    """Profile with a four key, two row grid."""
+    mock_profile = Mock()
+    mock_profile.keyboard_config.key_count = 4
+    mock_profile.keyboard_config.keymap.formatting = FormattingConfig(
+        rows=[[0, 1], [2, 3]]
+    )
+    mock_profile.keyboard_config.zmk.compatible_strings.keymap = "zmk,keymap"
+    return mock_profile
+
+
+@pytest.fixture
+def formatter():
+    """Formatter backed by a fresh behavior registry."""
+    return BehaviorFormatterImpl(create_behavior_registry())
+
+
+@pytest.fixture
+def generator(formatter):
+    """Keymap generator using the formatter."""
+    return ZmkFileContentGenerator(formatter)
+
+
+def _layer(*bindings):
+    return [LayoutBinding.from_str(binding) for binding in bindings]
+
+
+class TestFormatBindingMemo:
+    """Test memoized binding formatting."""
+
+    def test_identical_bindings_formatted_once(self, formatter):
+        """Test structurally equal bindings share one formatting call."""
+        with patch.object(
+            formatter, "_format_binding", wraps=formatter._format_binding
+        ) as mock_format:
+            first = formatter.format_binding(LayoutBinding.from_str("&kp LC(X)"))
+            second = formatter.format_binding(LayoutBinding.from_str("&kp LC(X)"))
+            formatter.format_binding(LayoutBinding.from_str("&kp LC(Y)"))
+
+        assert first == second == "&kp LC(X)"
+        assert mock_format.call_count == 2
+
+    def test_reference_context_is_part_of_key(self, formatter):
+        """Test hold-tap reference formatting is not served from keymap results."""
+        binding = LayoutBinding(value="&mo")
+        normal = formatter.format_binding(binding)
+
+        formatter.set_behavior_reference_context(True)
+        try:
+            reference = formatter.format_binding(binding)
+        finally:
+            formatter.set_behavior_reference_context(False)
+
+        assert reference == "&mo"
+        assert normal != reference
+
+    def test_custom_behavior_registration_is_part_of_key(self, formatter):
+        """Test registering a custom behavior changes its formatting."""
+        binding = LayoutBinding.from_str("&my_ht")
+        assert formatter.format_binding(binding) == "&my_ht"
+
+        formatter._registry.register_behavior(
+            SystemBehavior(
+                code="&my_ht",
+                name="&my_ht",
+                description=None,
+                expected_params=2,
+                origin="user_hold_tap",
+                params=[],
+            )
+        )
+
+        assert formatter.format_binding(binding) != "&my_ht"
+
+
+class TestKeymapLayerCache:
+    """Test per-layer output caching in generate_keymap_node."""
+
+    def test_output_unchanged_by_cache(self, generator, profile):
+        """Test cached and uncached generation produce the same keymap."""
+        layers = [
+            _layer("&kp A", "&kp B", "&mo 1", "&trans"),
+            _layer("&kp N1", "&kp LC(X)", "&trans", "&trans"),
+        ]
+        uncached = ZmkFileContentGenerator(
+            BehaviorFormatterImpl(create_behavior_registry())
+        ).generate_keymap_node(profile, ["Base", "Lower"], layers)
+
+        first = generator.generate_keymap_node(profile, ["Base", "Lower"], layers)
+        second = generator.generate_keymap_node(profile, ["Base", "Lower"], layers)
+
+        assert first == second == uncached
+        assert "&kp LC(X)" in first
+
+    def test_only_changed_layer_is_formatted(self, generator, formatter, profile):
+        """Test editing one layer only re-formats that layer."""
+        layers = [
+            _layer("&kp A", "&kp B", "&kp C", "&kp D"),
+            _layer("&kp E", "&kp F", "&kp G", "&kp H"),
+        ]
+        generator.generate_keymap_node(profile, ["Base", "Lower"], layers)
+
+        layers[1] = _layer("&kp E", "&kp F", "&kp G", "&kp Z")
+        with patch.object(
+            formatter, "format_binding", wraps=formatter.format_binding
+        ) as mock_format:
+            result = generator.generate_keymap_node(profile, ["Base", "Lower"], layers)
+
+        formatted = [
+            call.args[0].params[0].value for call in mock_format.call_args_list
+        ]
+        assert formatted == ["E", "F", "G", "Z"]
+        assert "&kp Z" in result
+
+    def test_grid_change_invalidates_layers(self, generator, profile):
+        """Test a different grid layout is not served from the cache."""
+        layers = [_layer("&kp A", "&kp B", "&kp C", "&kp D")]
+        generator.generate_keymap_node(profile, ["Base"], layers)
+
+        profile.keyboard_config.keymap.formatting = FormattingConfig(
+            rows=[[0, 1, 2, 3]]
+        )
+        result = generator.generate_keymap_node(profile, ["Base"], layers)
+
+        assert "&kp A &kp B &kp C &kp D" in result
@@ -0,0 +1,169 @@
+"""Tests for the library layout similarity index."""
+
+import copy
+import json
+import os
+import random
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from glovebox.library.models import LayoutFeatures, LibraryEntry, LibrarySource
+from glovebox.library.repository import create_library_repository
+from glovebox.library.repository.similarity_index import (
+    LayoutSimilarityIndex,
+    extract_layout_features,
+)
+
+
+KEYS = ["A", "B", "C", "D", "E", "F", "G", "H", "N1", "N2", "SPACE", "ENTER"]
+
+
+def _layout(seed: int, layer_count: int = 4) -> dict[str, Any]:
+    rng = random.Random(seed)
+    return {
+        "title": f"Layout {seed}",
+        "layer_names": [f"L{i}" for i in range(layer_count)],
+        "layers": [
+            [
+                {"value": "&kp", "params": [{"value": rng.choice(KEYS), "params": []}]}
+                for _ in range(80)
+            ]
+            for _ in range(layer_count)
+        ],
+        "holdTaps": [{"name": f"&ht{seed}", "bindings": ["&kp", "&kp"]}],
+    }
+
+
+def _mutate(layout: dict[str, Any], changes: int, seed: int = 0) -> dict[str, Any]:
+    rng = random.Random(seed)
+    mutated = copy.deepcopy(layout)
+    for _ in range(changes):
+        layer = rng.choice(mutated["layers"])
+        layer[rng.randrange(len(layer))] = {"value": "&mo", "params": [{"value": 1}]}
+    return mutated
+
+
+def _entry(uuid: str) -> LibraryEntry:
+    return LibraryEntry(
+        uuid=uuid,
+        name=f"layout-{uuid}",
+        source=LibrarySource.LOCAL_FILE,
+        source_reference=f"{uuid}.json",
+        file_path=Path(f"{uuid}.json"),
+        downloaded_at=datetime.now(),
+    )
+
+
+def test_identical_layouts_score_one(tmp_path: Path) -> None:
+    """A layout matches itself on every feature."""
+    index = LayoutSimilarityIndex(tmp_path / "index.json")
+    index.add("a", _layout(1), persist=False)
+
+    [match] = index.query(_layout(1))
+
+    assert match.uuid == "a"
+    assert match.score == pytest.approx(1.0)
+
+
+def test_matches_are_ranked_by_similarity(tmp_path: Path) -> None:
+    """Layouts with fewer changes rank closer to the original."""
+    base = _layout(1)
+    index = LayoutSimilarityIndex(tmp_path / "index.json")
+    index.add("far", _mutate(base, 200), persist=False)
+    index.add("close", _mutate(base, 10), persist=False)
+    index.add("unrelated", _layout(2), persist=False)
+    index.add("medium", _mutate(base, 60), persist=False)
+
+    matches = index.query(base, limit=3)
+
+    assert [match.uuid for match in matches] == ["close", "medium", "far"]
+    assert matches[0].score > matches[1].score > matches[2].score
+
+
+def test_features_ignore_passthrough_bindings(tmp_path: Path) -> None:
+    """Layers of &trans do not make unrelated layouts look alike."""
+    first = _layout(1, layer_count=1)
+    second = _layout(2, layer_count=1)
+    trans_layer = [{"value": "&trans", "params": []}] * 80
+    first["layers"] += [trans_layer] * 5
+    second["layers"] += [trans_layer] * 5
+
+    index = LayoutSimilarityIndex(tmp_path / "index.json")
+    index.add("second", second, persist=False)
+
+    [match] = index.query(first)
+    assert match.binding_similarity < 0.5
+
+
+def test_features_are_stable_across_processes() -> None:
+    """Signatures do not depend on Python's randomized string hashing."""
+    features = extract_layout_features(_layout(3))
+    script = (
+        "import json, random\n"
+        "from glovebox.library.repository.similarity_index import "
+        "extract_layout_features\n"
+        f"print(extract_layout_features(json.loads({json.dumps(json.dumps(_layout(3)))}))"
+        ".model_dump_json())"
+    )
+
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONHASHSEED": "12345"},
+    ).stdout
+
+    assert LayoutFeatures.model_validate_json(output.strip().splitlines()[-1]) == (
+        features
+    )
+    assert features.behaviors == ["&ht3", "&kp"]
+
+
+def test_index_persists_and_reloads(tmp_path: Path) -> None:
+    """The index file is reloaded with the same features."""
+    path = tmp_path / "index.json"
+    index = LayoutSimilarityIndex(path)
+    features = index.add("a", _layout(1))
+
+    reloaded = LayoutSimilarityIndex(path)
+
+    assert "a" in reloaded
+    assert reloaded.entries["a"] == features
+    assert reloaded.remove("a")
+    assert "a" not in LayoutSimilarityIndex(path)
+
+
+def test_repository_updates_index_incrementally(tmp_path: Path) -> None:
+    """Storing and removing layouts keeps the similarity index in step."""
+    repository = create_library_repository(tmp_path)
+    base = _layout(1)
+    repository.store_layout(_mutate(base, 5), _entry("close"))
+    repository.store_layout(_layout(2), _entry("other"))
+
+    assert len(repository.similarity_index) == 2
+
+    matches = repository.find_similar_layouts(base, limit=1)
+    assert [match.uuid for match in matches] == ["close"]
+
+    repository.remove_entry("close")
+    assert "close" not in repository.similarity_index
+
+
+def test_repository_indexes_layouts_stored_before_the_index(tmp_path: Path) -> None:
+    """Layouts missing from the index are indexed on the first query."""
+    repository = create_library_repository(tmp_path)
+    repository.store_layout(_layout(1), _entry("a"))
+    repository.store_layout(_layout(2), _entry("b"))
+    repository.similarity_index.index_path.unlink()
+
+    reopened = create_library_repository(tmp_path)
+    matches = reopened.find_similar_layouts(_layout(1), exclude_uuid="b")
+
+    assert [match.uuid for match in matches] == ["a"]
+    assert len(reopened.similarity_index) == 2
@@ -0,0 +1,331 @@
+"""Tests for the compile server, its client and CLI integration."""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from glovebox.adapters import create_file_adapter, create_template_adapter
+from glovebox.cli.commands.layout.core import CompileLayoutCommand
+from glovebox.config import create_keyboard_profile, create_user_config
+from glovebox.core.errors import ServerError
+from glovebox.layout import (
+    ZmkFileContentGenerator,
+    create_behavior_registry,
+    create_grid_layout_formatter,
+    create_layout_component_service,
+    create_layout_display_service,
+    create_layout_service,
+)
+from glovebox.layout.behavior.formatter import BehaviorFormatterImpl
+from glovebox.server import (
+    GloveboxServer,
+    ServerClient,
+    ServerHandlers,
+    get_server_client,
+    profile_spec,
+)
+from glovebox.server.protocol import METHOD_NOT_FOUND
+
+
+def _create_service():
+    file_adapter = create_file_adapter()
+    behavior_registry = create_behavior_registry()
+    behavior_formatter = BehaviorFormatterImpl(behavior_registry)
+    return create_layout_service(
+        file_adapter=file_adapter,
+        template_adapter=create_template_adapter(),
+        behavior_registry=behavior_registry,
+        component_service=create_layout_component_service(file_adapter),
+        layout_service=create_layout_display_service(create_grid_layout_formatter()),
+        behavior_formatter=behavior_formatter,
+        dtsi_generator=ZmkFileContentGenerator(behavior_formatter),
+        keymap_parser=Mock(),
+    )
+
+
+def _set_mtime(path: Path, offset: float) -> None:
+    """Move a file's mtime out of the window where stamps are not trusted."""
+    mtime = time.time() + offset
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def layout_data():
+    """Single layer glove80 layout."""
+    return {
+        "keyboard": "glove80",
+        "title": "Server",
+        "layer_names": ["Base"],
+        "layers": [["&kp A"] * 79 + ["&kp LC(X)"]],
+    }
+
+
+@pytest.fixture
+def socket_path():
+    """Short socket path; Unix socket paths are limited to about 100 bytes."""
+    socket_dir = Path(tempfile.mkdtemp(prefix="gbx"))
+    yield socket_dir / "server.sock"
+    shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def server(socket_path):
+    """Compile server running on a background thread."""
+    handlers = ServerHandlers(create_user_config(), _create_service)
+    glovebox_server = GloveboxServer(socket_path, handlers)
+    glovebox_server.bind()
+    thread = threading.Thread(target=glovebox_server.serve_forever, daemon=True)
+    thread.start()
+    yield glovebox_server
+    glovebox_server.stop()
+    thread.join(timeout=5)
+
+
+@pytest.fixture
+def client(server):
+    """Client connected to the running server."""
+    with ServerClient(server.socket_path, timeout=30) as server_client:
+        yield server_client
+
+
+class TestServerMethods:
+    """Test methods answered by the server."""
+
+    def test_compile_matches_local(self, client, layout_data):
+        """Test a server compile returns what a local compile produces."""
+        profile = create_keyboard_profile("glove80")
+        local = _create_service().compile(layout_data, profile=profile)
+
+        remote = client.compile_layout(layout_data, profile=profile)
+
+        assert remote.success
+        assert remote.keymap_content == local.keymap_content
+        assert remote.config_content == local.config_content
+
+    def test_profile_loaded_once(self, client, layout_data):
+        """Test repeated requests reuse the resolved profile."""
+        profile = create_keyboard_profile("glove80")
+        with patch(
+            "glovebox.config.create_keyboard_profile",
+            wraps=create_keyboard_profile,
+        ) as mock_create:
+            client.compile_layout(layout_data, profile=profile)
+            client.compile_layout(layout_data, profile=profile)
+
+        assert mock_create.call_count == 1
+        assert client.ping()["profiles"] == [profile_spec(profile)]
+
+    def test_client_sends_its_config_and_keyboard_paths(self, tmp_path):
+        """Test profiles are sent with the client's config file and search paths."""
+        keyboards_dir = tmp_path / "keyboards"
+        keyboards_dir.mkdir()
+        config_file = tmp_path / "glovebox.yaml"
+        config_file.write_text(f"profiles_paths:\n  - {keyboards_dir}\n")
+        user_config = create_user_config(cli_config_path=config_file)
+
+        profile = create_keyboard_profile("glove80")
+
+        params = ServerClient(user_config=user_config).profile_params(profile)
+
+        assert params["profile"] == profile_spec(profile)
+        assert params["config_file"] == str(config_file.resolve())
+        assert str(keyboards_dir.resolve()) in params["keyboard_paths"]
+
+    def test_diff(self, client, layout_data):
+        """Test layouts can be compared on the server."""
+        changed = json.loads(json.dumps(layout_data))
+        changed["layers"][0][0] = "&kp B"
+
+        result = client.diff_layouts(layout_data, changed)
+
+        assert result["has_changes"]
+
+    def test_unknown_method(self, client):
+        """Test unknown methods return a JSON-RPC error."""
+        with pytest.raises(ServerError) as exc_info:
+            client.call("layout.explode")
+
+        assert exc_info.value.context["code"] == METHOD_NOT_FOUND
+        # The connection stays usable after an error response
+        assert client.ping()["requests"] >= 1
+
+    def test_missing_parameter(self, client):
+        """Test missing parameters are reported instead of crashing the server."""
+        with pytest.raises(ServerError, match="layout"):
+            client.call("layout.compile", {})
+
+
+class TestServerLifecycle:
+    """Test binding and stopping the server."""
+
+    def test_refuses_second_server(self, server):
+        """Test a second server cannot take over a live socket."""
+        other = GloveboxServer(server.socket_path, Mock())
+
+        with pytest.raises(ServerError, match="already running"):
+            other.bind()
+
+    def test_replaces_stale_socket(self, socket_path):
+        """Test a socket file without a server behind it is replaced."""
+        socket_path.write_text("")
+        glovebox_server = GloveboxServer(socket_path, Mock())
+
+        glovebox_server.bind()
+        try:
+            assert socket_path.is_socket()
+        finally:
+            glovebox_server.close()
+        assert not socket_path.exists()
+
+    def test_shutdown_request(self, server):
+        """Test a shutdown request stops the server and removes its socket."""
+        ServerClient(server.socket_path).shutdown()
+
+        for _ in range(50):
+            if not server.socket_path.exists():
+                break
+            threading.Event().wait(0.1)
+        assert not server.socket_path.exists()
+
+
+class TestGetServerClient:
+    """Test how the CLI discovers a running server."""
+
+    def test_running_server(self, server, monkeypatch):
+        """Test a client is returned when a server is running."""
+        monkeypatch.delenv("GLOVEBOX_NO_SERVER")
+        client = get_server_client(server.socket_path)
+
+        assert client is not None
+        client.close()
+
+    def test_disabled_by_environment(self, server):
+        """Test GLOVEBOX_NO_SERVER keeps the CLI local."""
+        assert get_server_client(server.socket_path) is None
+
+    def test_no_server(self, socket_path, monkeypatch):
+        """Test no client is returned without a server."""
+        monkeypatch.delenv("GLOVEBOX_NO_SERVER")
+
+        assert get_server_client(socket_path) is None
+
+
+class TestServerProfiles:
+    """Test profiles resolved by the server for each client."""
+
+    @pytest.fixture
+    def keyboards_dir(self, tmp_path):
+        """Copy of the glove80 keyboard files, last modified an hour ago."""
+        keyboards_dir = tmp_path / "keyboards"
+        shutil.copytree(Path(__file__).parents[2] / "keyboards", keyboards_dir)
+        for path in keyboards_dir.rglob("*.yaml"):
+            _set_mtime(path, -3600)
+        return keyboards_dir
+
+    @pytest.fixture
+    def handlers(self, monkeypatch):
+        """Handlers without the on-disk keyboard config cache."""
+        monkeypatch.setenv("GLOVEBOX_CACHE_KEYBOARD_CONFIG", "false")
+        return ServerHandlers(create_user_config(), _create_service)
+
+    def test_reloaded_when_keyboard_file_changes(self, handlers, keyboards_dir):
+        """Test an edited keyboard file replaces the cached profile."""
+        params = {"profile": "glove80", "keyboard_paths": [str(keyboards_dir)]}
+        profile = handlers.get_profile(params)
+        assert handlers.get_profile(params) is profile
+
+        main_file = keyboards_dir / "glove80" / "main.yaml"
+        main_file.write_text(
+            main_file.read_text().replace(
+                "MoErgo Glove80 split ergonomic keyboard", "Edited Glove80"
+            )
+        )
+        _set_mtime(main_file, -60)
+
+        reloaded = handlers.get_profile(params)
+        assert reloaded is not profile
+        assert reloaded.keyboard_config.description == "Edited Glove80"
+        assert handlers.get_profile(params) is reloaded
+
+    def test_resolved_per_client_keyboard_paths(
+        self, handlers, keyboards_dir, tmp_path
+    ):
+        """Test clients with other keyboard paths get their own profile."""
+        main_file = keyboards_dir / "glove80" / "main.yaml"
+        main_file.write_text(
+            main_file.read_text().replace(
+                "MoErgo Glove80 split ergonomic keyboard", "Client Glove80"
+            )
+        )
+        _set_mtime(main_file, -60)
+
+        default = handlers.get_profile({"profile": "glove80"})
+        client = handlers.get_profile(
+            {"profile": "glove80", "keyboard_paths": [str(keyboards_dir)]}
+        )
+
+        assert default.keyboard_config.description != "Client Glove80"
+        assert client.keyboard_config.description == "Client Glove80"
+        assert handlers.ping({})["profiles"] == ["glove80"]
+
+    def test_resolved_with_client_config_file(self, handlers, keyboards_dir, tmp_path):
+        """Test the client's config file is loaded and stamped with the profile."""
+        config_file = tmp_path / "glovebox.yaml"
+        config_file.write_text("profile: glove80/v25.05\n")
+        _set_mtime(config_file, -60)
+        params = {
+            "profile": "glove80",
+            "config_file": str(config_file),
+            "keyboard_paths": [str(keyboards_dir)],
+        }
+
+        with patch(
+            "glovebox.config.create_user_config", wraps=create_user_config
+        ) as mock_config:
+            profile = handlers.get_profile(params)
+            assert handlers.get_profile(params) is profile
+            assert mock_config.call_args.kwargs == {"cli_config_path": str(config_file)}
+
+            config_file.write_text("profile: glove80/v25.05\nlog_level: DEBUG\n")
+            _set_mtime(config_file, -30)
+            assert handlers.get_profile(params) is not profile
+
+        assert mock_config.call_count == 2
+
+
+class TestCompileCommandRemote:
+    """Test the compile command sending its work to a running server."""
+
+    def test_compile_uses_server(self, server, layout_data, tmp_path, monkeypatch):
+        """Test compile writes server output without building a local service."""
+        monkeypatch.delenv("GLOVEBOX_NO_SERVER")
+        monkeypatch.setenv("GLOVEBOX_SERVER_SOCKET", str(server.socket_path))
+        layout_file = tmp_path / "layout.json"
+        layout_file.write_text(json.dumps(layout_data))
+        profile = create_keyboard_profile("glove80")
+
+        command = CompileLayoutCommand()
+        with (
+            patch.object(command, "get_keyboard_profile", return_value=profile),
+            patch.object(command, "create_layout_service") as mock_service,
+        ):
+            command.execute(
+                Mock(obj=None),
+                str(layout_file),
+                str(tmp_path / "out"),
+                None,
+                False,
+                True,
+                "text",
+            )
+
+        assert not mock_service.called
+        assert "&kp LC(X)" in (tmp_path / "out.keymap").read_text()
+        assert (tmp_path / "out.conf").exists()
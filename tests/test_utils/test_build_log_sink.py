@@ -0,0 +1,171 @@
+"""Tests for buffered, compressed and rotated build log files."""
+
+import gzip
+import time
+from pathlib import Path
+
+import pytest
+
+from glovebox.cli.components.noop_progress_context import get_noop_progress_context
+from glovebox.core.errors import BuildLogError
+from glovebox.utils.build_log_middleware import BuildLogCaptureMiddleware
+from glovebox.utils.build_log_sink import (
+    BuildLogReader,
+    BuildLogSink,
+    create_build_log_sink,
+    rotate_build_logs,
+)
+
+
+def _zstd_installed() -> bool:
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+requires_zstd = pytest.mark.skipif(
+    not _zstd_installed(), reason="zstandard not installed"
+)
+
+
+def test_lines_are_buffered_until_flush(tmp_path: Path) -> None:
+    log_file = tmp_path / "build.log"
+    sink = BuildLogSink(log_file, flush_interval=60)
+
+    sink.write("[1/2] Building C object\n")
+    assert log_file.read_text() == ""
+
+    sink.write("error: 'foo' undeclared\n", urgent=True)
+    assert log_file.read_text().splitlines() == [
+        "[1/2] Building C object",
+        "error: 'foo' undeclared",
+    ]
+    assert sink.blocks_written == 1
+
+    sink.write("[2/2] Linking\n")
+    sink.close()
+    assert log_file.read_text().endswith("[2/2] Linking\n")
+
+
+def test_buffer_size_and_interval_flush(tmp_path: Path) -> None:
+    sink = BuildLogSink(tmp_path / "build.log", buffer_size=10, flush_interval=60)
+    sink.write("short\n")
+    assert sink.blocks_written == 0
+    sink.write("long enough\n")
+    assert sink.blocks_written == 1
+    sink.close()
+
+    sink = BuildLogSink(tmp_path / "timed.log", flush_interval=0.05)
+    sink.write("idle\n")
+    deadline = time.monotonic() + 5
+    while sink.blocks_written == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert (tmp_path / "timed.log").read_text() == "idle\n"
+    sink.close()
+
+
+@pytest.mark.parametrize(
+    ("compression", "suffix"),
+    [
+        ("gzip", ".gz"),
+        pytest.param("zstd", ".zst", marks=requires_zstd),
+    ],
+)
+def test_compressed_log_round_trip_and_seek(
+    tmp_path: Path, compression: str, suffix: str
+) -> None:
+    lines = [f"line {number}" for number in range(100)]
+    with BuildLogSink(
+        tmp_path / "build.log",
+        compression=compression,  # type: ignore[arg-type]
+        buffer_size=50,
+    ) as sink:
+        for line in lines:
+            sink.write(line + "\n")
+
+    log_file = tmp_path / f"build.log{suffix}"
+    assert sink.path == log_file
+    assert (tmp_path / f"build.log{suffix}.idx").exists()
+
+    reader = BuildLogReader(log_file)
+    assert len(reader.blocks) > 1
+    assert reader.read_text().splitlines() == lines
+    assert reader.read_lines(57, 3) == ["line 57", "line 58", "line 59"]
+    assert reader.read_lines(98) == ["line 98", "line 99"]
+
+    if compression == "gzip":
+        # Concatenated gzip members read as one stream by standard tools
+        assert gzip.decompress(log_file.read_bytes()).decode().splitlines() == lines
+
+
+def test_truncated_log_is_readable_up_to_last_block(tmp_path: Path) -> None:
+    sink = BuildLogSink(tmp_path / "build.log", compression="gzip", flush_interval=60)
+    sink.write("first block\n", urgent=True)
+    sink.write("second block\n", urgent=True)
+    sink.close()
+
+    # Simulate a crash in the middle of writing the second block
+    log_file = tmp_path / "build.log.gz"
+    data = log_file.read_bytes()
+    log_file.write_bytes(data[:-5])
+
+    assert BuildLogReader(log_file).read_text() == "first block\n"
+
+    # Without the index the blocks are found by scanning
+    (tmp_path / "build.log.gz.idx").unlink()
+    assert BuildLogReader(log_file).read_text() == "first block\n"
+
+
+def test_rotation_keeps_retained_logs(tmp_path: Path) -> None:
+    output_dir = tmp_path / "output"
+    log_file = output_dir / "build.log"
+    for number in range(4):
+        with create_build_log_sink(log_file, compression="gzip", retain=3) as sink:
+            sink.write(f"build {number}\n")
+
+    names = sorted(path.name for path in output_dir.iterdir())
+    assert names == [
+        "build.log.1.gz",
+        "build.log.1.gz.idx",
+        "build.log.2.gz",
+        "build.log.2.gz.idx",
+        "build.log.gz",
+        "build.log.gz.idx",
+    ]
+    assert BuildLogReader(output_dir / "build.log.2.gz").read_text() == "build 1\n"
+    assert BuildLogReader(output_dir / "build.log.gz").read_text() == "build 3\n"
+
+    # Keeping a single log removes all previous ones
+    log_file.write_text("plain\n")
+    rotate_build_logs(log_file, retain=1)
+    assert list(output_dir.iterdir()) == []
+
+
+def test_unknown_compression_is_rejected(tmp_path: Path) -> None:
+    with pytest.raises(BuildLogError, match="Unknown build log compression"):
+        BuildLogSink(tmp_path / "build.log", compression="lz4")  # type: ignore[arg-type]
+
+
+def test_middleware_flushes_error_lines(tmp_path: Path) -> None:
+    middleware = BuildLogCaptureMiddleware(
+        tmp_path / "build.log",
+        get_noop_progress_context(),
+        compression="gzip",
+        flush_interval=60,
+    )
+    assert middleware.log_file_path == tmp_path / "build.log.gz"
+
+    middleware.process("[1/3] Building C object", "stdout")
+    middleware.process("FAILED: zephyr/zmk.elf", "stderr")
+    text = BuildLogReader(middleware.log_file_path).read_text()
+    assert "[STDERR] FAILED: zephyr/zmk.elf" in text
+
+    middleware.process("[3/3] Linking", "stdout")
+    assert "[3/3] Linking" not in BuildLogReader(tmp_path / "build.log.gz").read_text()
+
+    middleware.close()
+    text = BuildLogReader(middleware.log_file_path).read_text()
+    assert "[3/3] Linking" in text
+    assert "# Build log completed" in text
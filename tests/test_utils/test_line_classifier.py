@@ -0,0 +1,151 @@
+"""Tests for shared build output line classification."""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from glovebox.adapters.compilation_progress_middleware import (
+    CompilationProgressMiddleware,
+)
+from glovebox.compilation.models.compilation_config import MoergoCompilationConfig
+from glovebox.utils.build_output_filter_middleware import (
+    BuildOutputFilterMiddleware,
+)
+from glovebox.utils.line_classifier import (
+    LineClassification,
+    LineClassifier,
+    create_build_line_classifier,
+    get_build_line_classifier,
+)
+from glovebox.utils.stream_process import create_chained_middleware
+
+
+BUILD_LOG = Path(__file__).parent / "test_data" / "zmk_multi_board_build.log"
+
+
+class CountingClassifier(LineClassifier):
+    """Classifier counting the lines it classifies from scratch."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        for rule in create_build_line_classifier().rules:
+            self.add_pattern(
+                rule.name,
+                rule.pattern.pattern,
+                ignore_case=rule.ignore_case,
+                anchored=rule.anchored,
+                prefilter=rule.prefilter,
+            )
+        self.classified: list[str] = []
+        self._previous: LineClassification | None = None
+
+    def classify(self, line: str) -> LineClassification:
+        classification = super().classify(line)
+        if classification is not self._previous:
+            self.classified.append(line)
+            self._previous = classification
+        return classification
+
+
+def test_rules_are_evaluated_on_demand_and_once() -> None:
+    """A rule runs when first asked about and its match is reused."""
+    classifier = LineClassifier()
+    classifier.add_pattern("progress", r"\[(\d+)/(\d+)\]")
+    classifier.add_pattern("never", r"unused", prefilter=("unused",))
+
+    classification = classifier.classify("[3/10] Building C object")
+    first = classification.match("progress")
+
+    assert first is not None
+    assert first.groups() == ("3", "10")
+    assert classification.match("progress") is first
+    assert classifier.classify("[3/10] Building C object") is classification
+    assert classifier.classify("[4/10] Building C object") is not classification
+    assert classification.names == ["progress"]
+
+
+def test_ignore_case_rules_match_the_lowercased_line() -> None:
+    classifier = LineClassifier()
+    classifier.add_literals("error", ("Error", "FATAL"), ignore_case=True)
+    classifier.add_pattern(
+        "count", r"(\d+) projects?", ignore_case=True, prefilter=("project",)
+    )
+
+    classification = classifier.classify("FATAL: 12 Projects failed")
+
+    assert "error" in classification
+    match = classification.match("count")
+    assert match is not None
+    assert match.group(1) == "12"
+    assert "error" not in classifier.classify("all good")
+
+
+def test_prefilter_skips_the_pattern() -> None:
+    classifier = LineClassifier()
+    # The pattern alone would match; the missing prefilter literal wins
+    classifier.add_pattern("rule", r"define", prefilter=("#define",))
+
+    assert "rule" not in classifier.classify("undefined reference")
+    assert "rule" in classifier.classify("#define FOO 1")
+
+
+def test_anchored_rules_match_at_line_start() -> None:
+    classifier = LineClassifier()
+    classifier.add_pattern("repo", r"From https://(\S+)", anchored=True)
+
+    assert "repo" in classifier.classify("From https://github.com/zmk")
+    assert "repo" not in classifier.classify("fetched From https://github.com/zmk")
+
+
+def test_rule_names_are_checked() -> None:
+    classifier = LineClassifier()
+    classifier.add_pattern("rule", "a")
+
+    with pytest.raises(ValueError, match="already registered"):
+        classifier.add_literals("rule", ("b",))
+    with pytest.raises(KeyError):
+        classifier.classify("a").match("missing")
+
+
+def test_shared_classifier_per_progress_patterns() -> None:
+    default = get_build_line_classifier()
+    moergo = get_build_line_classifier(MoergoCompilationConfig().progress_patterns)
+
+    assert get_build_line_classifier() is default
+    assert moergo is not default
+    assert "build_start" in moergo.classify("nix-build starting")
+    assert "build_start" not in default.classify("nix-build starting")
+
+
+def test_chained_middlewares_classify_each_line_once() -> None:
+    """Filter and progress middlewares share one classification per line."""
+    progress_context = Mock()
+    classifier = CountingClassifier()
+    filter_middleware = BuildOutputFilterMiddleware(
+        progress_context, classifier=classifier
+    )
+    progress_middleware = CompilationProgressMiddleware(
+        progress_context, classifier=classifier
+    )
+    chain = create_chained_middleware([filter_middleware, progress_middleware])
+
+    lines = BUILD_LOG.read_text(encoding="utf-8").splitlines()
+    output = [chain.process(line, "stdout") for line in lines]
+
+    non_blank = [line.strip() for line in lines if line.strip()]
+    assert len(classifier.classified) <= len(non_blank)
+
+    # Verbose macro notes are dropped, warnings worth reading are kept
+    assert not any("note: in expansion of macro" in line for line in output)
+    assert any('"MACRO_PLACEHOLDER" redefined' in line for line in output)
+    assert any("defined but not used" in line for line in output)
+
+    logged = [call.args[0] for call in progress_context.log.call_args_list]
+    assert "Building glove80_lh" in logged
+    assert "Building glove80_rh" in logged
+    assert "Downloading zmkfirmware/zmk" in logged
+    assert logged.count("Board build completed") >= 2
+    assert "Compilation completed successfully" in logged
+    progress_context.update_progress.assert_any_call(287, 312)
+    progress_context.update_progress.assert_any_call(212, 298)
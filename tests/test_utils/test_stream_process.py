@@ -0,0 +1,154 @@
+"""Tests for streamed subprocess output processing."""
+
+import sys
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from glovebox.utils.stream_process import (
+    ChainedOutputMiddleware,
+    OutputMiddleware,
+    StreamPipelineOptions,
+    _OutputPipeline,
+    run_command,
+)
+
+
+class RecordingMiddleware(OutputMiddleware[str]):
+    """Middleware that records lines and optionally slows down."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.lines: list[tuple[str, str]] = []
+        self.threads: set[str] = set()
+
+    def process(self, line: str, stream_type: str) -> str:
+        if self.delay:
+            time.sleep(self.delay)
+        self.lines.append((line, stream_type))
+        self.threads.add(threading.current_thread().name)
+        return line
+
+
+class UpperMiddleware(OutputMiddleware[str]):
+    def process(self, line: str, stream_type: str) -> str:
+        return line.upper()
+
+
+class FailingMiddleware(OutputMiddleware[str]):
+    def process(self, line: str, stream_type: str) -> str:
+        if line == "boom":
+            raise RuntimeError("middleware bug")
+        return line
+
+
+def _python(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+def test_run_command_processes_both_streams_in_order() -> None:
+    """Lines of each stream keep their order through the middleware chain."""
+    recorder = RecordingMiddleware()
+    chain = ChainedOutputMiddleware([UpperMiddleware(), recorder])
+
+    return_code, stdout, stderr = run_command(
+        _python(
+            "import sys\n"
+            "for i in range(50): print(f'out {i}')\n"
+            "print('err', file=sys.stderr)\n"
+            "sys.exit(3)"
+        ),
+        chain,
+    )
+
+    assert return_code == 3
+    assert stdout == [f"OUT {i}" for i in range(50)]
+    assert stderr == ["ERR"]
+    assert threading.current_thread().name not in recorder.threads
+
+
+def test_middleware_failure_does_not_stop_processing() -> None:
+    """A middleware error skips that line; later lines are still processed."""
+    _, stdout, _ = run_command(
+        _python("print('before'); print('boom'); print('after')"),
+        FailingMiddleware(),
+    )
+
+    assert stdout == ["before", "after"]
+
+
+def test_slow_middleware_does_not_hold_up_the_process() -> None:
+    """With dropping enabled, the process finishes before the middleware would."""
+    recorder = RecordingMiddleware(delay=0.01)
+    options = StreamPipelineOptions(max_pending=5, batch_size=5, overflow="drop")
+
+    start = time.monotonic()
+    _, stdout, _ = run_command(
+        _python("for i in range(500): print(i)"), recorder, options
+    )
+
+    # 500 lines at 10ms each would take 5s if every line were processed
+    assert time.monotonic() - start < 4
+    assert 0 < len(stdout) < 500
+    assert stdout == sorted(stdout, key=int)
+
+
+def test_drop_policy_discards_new_stdout_lines() -> None:
+    """When full, new stdout lines are dropped and counted."""
+    pipeline = _OutputPipeline(
+        RecordingMiddleware(), StreamPipelineOptions(max_pending=2, overflow="drop")
+    )
+    for line in ["a", "b", "c", "d"]:
+        pipeline.put(line, "stdout")
+    pipeline.close()
+    pipeline.consume()
+
+    assert pipeline.outputs["stdout"] == ["a", "b"]
+    assert pipeline.dropped == 2
+    assert pipeline.max_depth == 2
+
+
+def test_coalesce_policy_keeps_the_latest_stdout_line() -> None:
+    """When full, the newest pending stdout line is replaced."""
+    pipeline = _OutputPipeline(
+        RecordingMiddleware(),
+        StreamPipelineOptions(max_pending=2, overflow="coalesce"),
+    )
+    for line in ["[1/4]", "[2/4]", "[3/4]", "[4/4]"]:
+        pipeline.put(line, "stdout")
+    pipeline.close()
+    pipeline.consume()
+
+    assert pipeline.outputs["stdout"] == ["[1/4]", "[4/4]"]
+    assert pipeline.coalesced == 2
+
+
+def test_metrics_report_queue_depth_and_middleware_time() -> None:
+    """Session metrics receive pipeline statistics per middleware."""
+    metrics = MagicMock()
+
+    run_command(
+        _python("print('x')"),
+        ChainedOutputMiddleware([UpperMiddleware(), RecordingMiddleware()]),
+        metrics=metrics,
+    )
+
+    metrics.Histogram.return_value.observe.assert_called_once_with(1)
+    label_calls = [
+        call.args for call in metrics.Counter.return_value.labels.call_args_list
+    ]
+    assert ("UpperMiddleware",) in label_calls
+    assert ("RecordingMiddleware",) in label_calls
+    assert ("stdout",) in label_calls
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"max_pending": 0}, {"batch_size": 0}, {"overflow": "discard"}],
+)
+def test_invalid_pipeline_options(kwargs: dict[str, object]) -> None:
+    """Options are validated on creation."""
+    with pytest.raises(ValueError):
+        StreamPipelineOptions(**kwargs)  # type: ignore[arg-type]